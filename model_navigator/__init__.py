@@ -14,25 +14,28 @@
 
 from model_navigator.__version__ import __version__  # noqa: F401
 from model_navigator.converter.config import TensorRTPrecision  # noqa: F401
-from model_navigator.framework_api import commands, config, pipelines  # noqa: F401
-from model_navigator.framework_api.constants import NAV_PACKAGE_FORMAT_VERSION  # noqa: F401
+from model_navigator.framework_api import commands, config, contrib, onnx, pipelines  # noqa: F401
 from model_navigator.framework_api.commands.performance import MeasurementMode, ProfilerConfig  # noqa: F401
+from model_navigator.framework_api.constants import NAV_PACKAGE_FORMAT_VERSION  # noqa: F401
+from model_navigator.framework_api.load import load  # noqa: F401
 from model_navigator.framework_api.logger import LOGGER  # noqa: F401
 from model_navigator.framework_api.package_descriptor import profile, save  # noqa: F401
-from model_navigator.framework_api.package_utils import is_jax_available, is_tf_available, is_torch_available
+from model_navigator.framework_api.package_utils import (
+    is_jax_available,
+    is_tf_available,
+    is_torch_available,
+    lazy_modules_getattr,
+)
 from model_navigator.framework_api.utils import Framework, JitType, RuntimeProvider, Status  # noqa: F401
 from model_navigator.model import Format  # noqa: F401
 from model_navigator.tensor import TensorSpec  # noqa: F401
 
-if is_torch_available():
-    from model_navigator.framework_api import torch  # noqa: F401
-
-if is_tf_available():
-    from model_navigator.framework_api import tensorflow  # noqa: F401
-
-if is_tf_available() and is_jax_available():
-    from model_navigator.framework_api import jax  # noqa: F401
-
-from model_navigator.framework_api import contrib  # noqa: F401 pylint: disable=wrong-import-position
-from model_navigator.framework_api import onnx  # noqa: F401
-from model_navigator.framework_api.load import load  # noqa: F401
+# framework APIs are imported on the first use, so importing the package does not import the frameworks
+__getattr__ = lazy_modules_getattr(
+    __name__,
+    {
+        "torch": ("model_navigator.framework_api.torch", is_torch_available),
+        "tensorflow": ("model_navigator.framework_api.tensorflow", is_tf_available),
+        "jax": ("model_navigator.framework_api.jax", lambda: is_tf_available() and is_jax_available()),
+    },
+)
@@ -25,6 +25,7 @@ import click
 from model_navigator.cli.spec import (
     BatchingConfigCli,
     ComparatorConfigCli,
+    ConversionCacheConfigCli,
     ConversionSetConfigCli,
     DatasetProfileConfigCli,
     ModelConfigCli,
@@ -35,6 +36,7 @@ from model_navigator.common.config import BatchingConfig
 from model_navigator.constants import MODEL_NAVIGATOR_DIR
 from model_navigator.converter import (
     ComparatorConfig,
+    ConversionCacheConfig,
     ConversionLaunchMode,
     ConversionResult,
     Converter,
@@ -51,6 +53,7 @@ from model_navigator.triton import DeviceKind, TritonModelInstancesConfig
 from model_navigator.utils import Workspace, tensorrt
 from model_navigator.utils.cli import clean_workspace_if_needed, common_options, options_from_config
 from model_navigator.utils.config import YamlConfigFile
+from model_navigator.utils.conversion_cache import ConversionCache
 from model_navigator.utils.devices import get_available_device_kinds, get_gpus
 from model_navigator.utils.docker import DockerBuilder, DockerImage
 from model_navigator.utils.environment import EnvironmentStore, get_env
@@ -73,6 +76,7 @@ def _run_locally(
     batching_config: BatchingConfig,
     comparator_config: ComparatorConfig,
     dataset_profile_config: DatasetProfileConfig,
+    conversion_cache_config: ConversionCacheConfig,
     device_kinds: List[DeviceKind],
     package: Optional[NavPackage],
     random_seed: int,
@@ -81,7 +85,12 @@ def _run_locally(
     if not os.environ.get(_RUN_BY_MODEL_NAVIGATOR):
         clean_workspace_if_needed(workspace, override_workspace)
 
-    converter = Converter(workspace=workspace, verbose=verbose)
+    conversion_cache = None
+    if conversion_cache_config.conversion_cache_dir:
+        conversion_cache = ConversionCache(
+            conversion_cache_config.conversion_cache_dir, max_size=conversion_cache_config.conversion_cache_max_size
+        )
+    converter = Converter(workspace=workspace, verbose=verbose, conversion_cache=conversion_cache)
     conversion_results = []
     for conversion_config in conversion_set_config:
         if package:
@@ -119,6 +128,7 @@ def _run_in_docker(
     batching_config: Optional[BatchingConfig] = None,
     comparator_config: Optional[ComparatorConfig] = None,
     dataset_profile_config: Optional[DatasetProfileConfig] = None,
+    conversion_cache_config: Optional[ConversionCacheConfig] = None,
     instances_config: Optional[TritonModelInstancesConfig] = None,
     framework_docker_image: str,
     model_format: Format,
@@ -138,6 +148,7 @@ def _run_in_docker(
         config_file.save_config(batching_config)
         config_file.save_config(comparator_config)
         config_file.save_config(dataset_profile_config)
+        config_file.save_config(conversion_cache_config)
         config_file.save_config(instances_config)
 
     framework = FORMAT2FRAMEWORK[model_format]
@@ -188,6 +199,9 @@ def _run_in_docker(
     required_paths = [workspace.path, src_model_config.model_path.parent, cwd]
     if package:
         required_paths.append(package.path)
+    if conversion_cache_config and conversion_cache_config.conversion_cache_dir:
+        conversion_cache_config.conversion_cache_dir.mkdir(parents=True, exist_ok=True)
+        required_paths.append(conversion_cache_config.conversion_cache_dir)
     required_paths = sorted({p.resolve() for p in required_paths})
 
     env = {"PYTHONPATH": cwd.resolve().as_posix(), _RUN_BY_MODEL_NAVIGATOR: 1}
@@ -273,6 +287,7 @@ def convert(
     batching_config = BatchingConfig.from_dict(kwargs)
     comparator_config = ComparatorConfig.from_dict(kwargs)
     dataset_profile_config = DatasetProfileConfig.from_dict(kwargs)
+    conversion_cache_config = ConversionCacheConfig.from_dict(kwargs)
     instances_config = TritonModelInstancesConfig.from_dict(kwargs)
 
     # Deprecation handling
@@ -315,6 +330,7 @@ def convert(
             batching_config=batching_config,
             comparator_config=comparator_config,
             dataset_profile_config=dataset_profile_config,
+            conversion_cache_config=conversion_cache_config,
             instances_config=instances_config,
             framework_docker_image=framework_docker_image,
             model_format=src_model.format,
@@ -335,6 +351,7 @@ def convert(
                     **dataclasses.asdict(comparator_config),
                     **dataclasses.asdict(src_model_signature_config),
                     **dataclasses.asdict(dataset_profile_config),
+                    **dataclasses.asdict(conversion_cache_config),
                     "workspace_path": workspace_path,
                     "override_workspace": override_workspace,
                     "output_path": output_path,
@@ -353,6 +370,7 @@ def convert(
             batching_config=batching_config,
             comparator_config=comparator_config,
             dataset_profile_config=dataset_profile_config,
+            conversion_cache_config=conversion_cache_config,
             device_kinds=device_kinds,
             verbose=verbose,
             package=package,
@@ -396,6 +414,7 @@ def convert(
 @options_from_config(ComparatorConfig, ComparatorConfigCli)
 @options_from_config(BatchingConfig, BatchingConfigCli)
 @options_from_config(DatasetProfileConfig, DatasetProfileConfigCli)
+@options_from_config(ConversionCacheConfig, ConversionCacheConfigCli)
 @options_from_config(TritonModelInstancesConfig, TritonModelInstancesConfigCli)
 @click.pass_context
 def convert_cmd(
@@ -14,6 +14,7 @@
 import dataclasses
 import logging
 from pathlib import Path
+from typing import Optional
 
 import click
 
@@ -22,7 +23,7 @@ from model_navigator.cli.utils import get_dataloader
 from model_navigator.converter.config import DatasetProfileConfig
 from model_navigator.log import init_logger, log_dict
 from model_navigator.model import ModelSignatureConfig
-from model_navigator.perf_analyzer.profiling_data import create_profiling_data
+from model_navigator.perf_analyzer.profiling_data import ProfilingDataFormat, create_profiling_data
 from model_navigator.utils.cli import common_options, options_from_config
 from model_navigator.validators import run_command_validators
 
@@ -33,6 +34,21 @@ LOGGER = logging.getLogger("profiling_data")
 @common_options
 @click.option("-o", "--data-output-path", help="Path to output json file", type=click.Path(writable=True))
 @click.option("-i", "--iterations", help="Number of samples", type=click.INT, default=128, show_default=True)
+@click.option("--max-samples", help="Maximal number of samples written", type=click.INT, default=None)
+@click.option(
+    "--deduplicate-samples",
+    help="Skip samples with the same content as one of the previous samples",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--data-format",
+    help="Format of profiling data. 'json' - single JSON file; "
+    "'binary' - directory with binary file for each input containing the first sample.",
+    type=click.Choice([item.value for item in ProfilingDataFormat]),
+    default=ProfilingDataFormat.JSON.value,
+    show_default=True,
+)
 @options_from_config(DatasetProfileConfig, DatasetProfileConfigCli)
 @click.pass_context
 def create_profiling_data_cmd(
@@ -41,6 +57,9 @@ def create_profiling_data_cmd(
     verbose: bool,
     data_output_path: str,
     iterations: int,
+    max_samples: Optional[int],
+    deduplicate_samples: bool,
+    data_format: str,
     **kwargs,
 ):
     init_logger(verbose=verbose)
@@ -64,6 +83,9 @@ def create_profiling_data_cmd(
                 **{
                     "workspace_path": workspace_path,
                     "iterations": iterations,
+                    "max_samples": max_samples,
+                    "deduplicate_samples": deduplicate_samples,
+                    "data_format": data_format,
                     "data_output_path": data_output_path,
                     "verbose": verbose,
                 },
@@ -78,4 +100,7 @@ def create_profiling_data_cmd(
     create_profiling_data(
         dataloader=dataloader,
         output_path=Path(data_output_path),
+        max_samples=max_samples,
+        deduplicate=deduplicate_samples,
+        data_format=ProfilingDataFormat(data_format),
     )
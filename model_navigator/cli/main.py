@@ -17,39 +17,33 @@ import logging
 import click
 
 from model_navigator import __version__ as navigator_version
-from model_navigator.cli.analyze import analyze_cmd
-from model_navigator.cli.convert_model import convert_cmd
-from model_navigator.cli.create_profiling_data import create_profiling_data_cmd
-from model_navigator.cli.download_file import download_cmd
-from model_navigator.cli.helm_chart_create import helm_chart_create_cmd
-from model_navigator.cli.optimize import optimize_cmd
-from model_navigator.cli.profile import profile_cmd
-from model_navigator.cli.run import run_cmd
-from model_navigator.cli.select import select_cmd
-from model_navigator.cli.triton_config_model import config_model_on_triton_cmd
-from model_navigator.cli.triton_evaluate_model import triton_evaluate_model_cmd
+from model_navigator.utils.cli import LazyGroup
 
 LOGGER = logging.getLogger("model-navigator")
 
-
-@click.group(name="Triton Model Navigator")
+# commands modules are imported only for the invoked command
+COMMANDS = {
+    "analyze": "model_navigator.cli.analyze:analyze_cmd",
+    "profile": "model_navigator.cli.profile:profile_cmd",
+    "convert": "model_navigator.cli.convert_model:convert_cmd",
+    "create-profiling-data": "model_navigator.cli.create_profiling_data:create_profiling_data_cmd",
+    "triton-config-model": "model_navigator.cli.triton_config_model:config_model_on_triton_cmd",
+    "helm-chart-create": "model_navigator.cli.helm_chart_create:helm_chart_create_cmd",
+    "run": "model_navigator.cli.run:run_cmd",
+    "optimize": "model_navigator.cli.optimize:optimize_cmd",
+    "download-model": "model_navigator.cli.download_file:download_cmd",
+    "triton-evaluate-model": "model_navigator.cli.triton_evaluate_model:triton_evaluate_model_cmd",
+    "select": "model_navigator.cli.select:select_cmd",
+}
+
+
+@click.group(name="Triton Model Navigator", cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option(navigator_version)
 def cli():
     pass
 
 
 def main():
-    cli.add_command(cmd=analyze_cmd)
-    cli.add_command(cmd=profile_cmd)
-    cli.add_command(cmd=convert_cmd)
-    cli.add_command(cmd=create_profiling_data_cmd)
-    cli.add_command(cmd=config_model_on_triton_cmd)
-    cli.add_command(cmd=helm_chart_create_cmd)
-    cli.add_command(cmd=run_cmd)
-    cli.add_command(cmd=optimize_cmd)
-    cli.add_command(cmd=download_cmd)
-    cli.add_command(cmd=triton_evaluate_model_cmd)
-    cli.add_command(cmd=select_cmd)
     cli(max_content_width=160)
 
 
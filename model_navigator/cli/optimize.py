@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import logging
 import pathlib
 import shutil
+import socket
 import sys
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import click
 
@@ -25,6 +29,7 @@ from model_navigator.cli.helm_chart_create import helm_chart_create_cmd
 from model_navigator.cli.profile import profile_cmd
 from model_navigator.cli.spec import (
     ComparatorConfigCli,
+    ConversionCacheConfigCli,
     ConversionSetConfigCli,
     DatasetProfileConfigCli,
     ModelAnalyzerAnalysisConfigCli,
@@ -40,10 +45,11 @@ from model_navigator.cli.spec import (
 from model_navigator.cli.triton_config_model import config_model_on_triton_cmd
 from model_navigator.cli.triton_evaluate_model import triton_evaluate_model_cmd
 from model_navigator.common.config import BatchingConfig, TensorRTCommonConfig
-from model_navigator.configurator import Configurator, TritonConfiguratorResult, log_configuration_error
+from model_navigator.configurator import Configurator, TritonConfiguratorResult, Variant, log_configuration_error
 from model_navigator.converter import (
     FORMAT2FRAMEWORK,
     ComparatorConfig,
+    ConversionCacheConfig,
     ConversionLaunchMode,
     ConversionResult,
     ConversionSetConfig,
@@ -91,6 +97,7 @@ LOGGER = logging.getLogger("optimize")
 @cli.options_from_config(ConversionSetConfig, ConversionSetConfigCli)
 @cli.options_from_config(ComparatorConfig, ComparatorConfigCli)
 @cli.options_from_config(DatasetProfileConfig, DatasetProfileConfigCli)
+@cli.options_from_config(ConversionCacheConfig, ConversionCacheConfigCli)
 @cli.options_from_config(TritonCustomBackendParametersConfig, TritonCustomBackendParametersConfigCli)
 @cli.options_from_config(TritonModelInstancesConfig, TritonModelInstancesConfigCli)
 @cli.options_from_config(TensorRTCommonConfig, TensorRTCommonConfigCli)
@@ -155,6 +162,7 @@ def optimize_cmd(
     tensorrt_common_config = TensorRTCommonConfig.from_dict(kwargs)
     comparator_config = ComparatorConfig.from_dict(kwargs)
     dataset_profile_config = DatasetProfileConfig.from_dict(kwargs)
+    conversion_cache_config = ConversionCacheConfig.from_dict(kwargs)
     instances_config = TritonModelInstancesConfig.from_dict(kwargs)
     backend_config = TritonCustomBackendParametersConfig.from_dict(kwargs)
     triton_config = RunTritonConfig.from_dict(kwargs)
@@ -188,6 +196,7 @@ def optimize_cmd(
         **dataclass2dict(comparator_config),
         **dataclass2dict(src_model_signature_config),
         **dataclass2dict(dataset_profile_config),
+        **dataclass2dict(conversion_cache_config),
         **dataclass2dict(instances_config),
         **dataclass2dict(backend_config),
         **dataclass2dict(triton_config),
@@ -228,6 +237,8 @@ def optimize_cmd(
     # deploy and pre-check of model correctness with perf_analyzer
     interim_model_repository = workspace.path / "interim-model-store"
     final_model_repository = workspace.path / "final-model-store"
+    # variants of the model share its files, so they are stored once and linked into the model stores
+    model_blobs_dir = workspace.path / "model-blobs"
 
     interim_model_repository.mkdir(parents=True, exist_ok=True)
     final_model_repository.mkdir(parents=True, exist_ok=True)
@@ -235,6 +246,7 @@ def optimize_cmd(
     config_results = _configure_models_on_triton(
         ctx=ctx,
         output_model_store=interim_model_repository,
+        model_blobs_dir=model_blobs_dir,
         converted_models=succeeded_models,
         instances_config=instances_config,
         backend_config=backend_config,
@@ -352,11 +364,21 @@ def _obtain_conversion_config(
     return new_conversion_set_config
 
 
-def _get_triton_server(*, triton_docker_image: str, gpus: List, analyzer_config: ModelAnalyzerTritonConfig):
+def _get_triton_server(
+    *,
+    triton_docker_image: str,
+    gpus: List,
+    analyzer_config: ModelAnalyzerTritonConfig,
+    ports: Optional[Dict[str, int]] = None,
+):
     triton_config = TritonServerConfig()
     triton_config["model-repository"] = analyzer_config.model_repository.resolve().as_posix()
     triton_config["model-control-mode"] = "explicit"
     triton_config["strict-model-config"] = "false"
+    if ports:
+        triton_config["http-port"] = ports["http"]
+        triton_config["grpc-port"] = ports["grpc"]
+        triton_config["metrics-port"] = ports["metrics"]
 
     if analyzer_config.triton_launch_mode == TritonLaunchMode.LOCAL:
         triton_server = TritonServerFactory.create_server_local(
@@ -377,6 +399,100 @@ def _get_triton_server(*, triton_docker_image: str, gpus: List, analyzer_config:
     return triton_server
 
 
+def _get_free_ports() -> Dict[str, int]:
+    """Ports for Triton server evaluated concurrently with other servers."""
+    with contextlib.ExitStack() as stack:
+        ports = {}
+        for name in ("http", "grpc", "metrics"):
+            sock = stack.enter_context(socket.socket(socket.AF_INET, socket.SOCK_STREAM))
+            sock.bind(("", 0))
+            ports[name] = sock.getsockname()[1]
+    return ports
+
+
+class _GpuScheduler:
+    """
+    Assign GPUs to model variants evaluated in parallel.
+
+    Each GPU is used by a single Triton server at a time; variants wait until the required number of GPUs is free.
+    """
+
+    def __init__(self, gpus: List[str]):
+        self._gpus = list(gpus)
+        self._free_gpus = list(gpus)
+        self._condition = threading.Condition()
+
+    @property
+    def max_parallel(self) -> int:
+        return max(1, len(self._gpus))
+
+    @contextlib.contextmanager
+    def acquire(self, num_required_gpus: Optional[int]):
+        if not self._gpus:
+            yield []
+            return
+
+        count = min(num_required_gpus or 1, len(self._gpus))
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._free_gpus) >= count)
+            gpus, self._free_gpus = self._free_gpus[:count], self._free_gpus[count:]
+        try:
+            yield gpus
+        finally:
+            with self._condition:
+                self._free_gpus.extend(gpus)
+                self._condition.notify_all()
+
+
+def _is_server_live(triton_server) -> bool:
+    if not triton_server.is_alive():
+        return False
+    try:
+        return triton_server.create_grpc_client().client.is_server_live()
+    except Exception:
+        return False
+
+
+class _TritonServerPool:
+    """
+    Triton servers reused between evaluated model variants - one server per set of GPUs.
+
+    Servers run in explicit model control mode, so the variants are loaded and unloaded without restarting the server.
+    The server is restarted only when it is not live anymore (e.g. a variant crashed it) or was stopped
+    to collect the logs of a failed variant.
+    """
+
+    def __init__(self, create_server: Callable[[List[str]], object]):
+        self._create_server = create_server
+        self._servers: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def get_server(self, gpus: List[str]):
+        """Return running server for given GPUs. GPUs have to be acquired from `_GpuScheduler` before."""
+        key = tuple(gpus)
+        with self._lock:
+            # GPUs are used by a single variant at a time, so servers on other sets containing them are idle
+            idle_keys = [other_key for other_key in self._servers if other_key != key and set(other_key) & set(key)]
+            for idle_key in idle_keys:
+                LOGGER.debug(f"Stopping Triton server on GPUs {list(idle_key)} to release GPUs {gpus}")
+                self._servers.pop(idle_key).stop()
+            triton_server = self._servers.get(key)
+            if triton_server is None:
+                triton_server = self._servers[key] = self._create_server(list(gpus))
+
+        if not _is_server_live(triton_server):
+            LOGGER.debug(f"Starting Triton server on GPUs {gpus}")
+            triton_server.stop()
+            triton_server.start()
+        return triton_server
+
+    def close(self):
+        with self._lock:
+            for triton_server in self._servers.values():
+                triton_server.stop()
+            self._servers.clear()
+
+
 def _collect_triton_environment(workspace: Workspace, triton_config: RunTritonConfig):
     if triton_config.triton_launch_mode == TritonLaunchMode.LOCAL:
         environment_info = get_env()
@@ -393,6 +509,7 @@ def _configure_models_on_triton(
     ctx,
     converted_models: List,
     output_model_store: pathlib.Path,
+    model_blobs_dir: pathlib.Path,
     batching_config: BatchingConfig,
     instances_config: TritonModelInstancesConfig,
     backend_config: TritonCustomBackendParametersConfig,
@@ -409,117 +526,72 @@ def _configure_models_on_triton(
     gpus = get_gpus(gpus=gpus)
     _collect_triton_environment(workspace=workspace, triton_config=triton_config)
 
-    triton_server = _get_triton_server(
-        triton_docker_image=triton_docker_image,
-        gpus=gpus,
-        analyzer_config=ModelAnalyzerTritonConfig.from_dict(
-            {**dataclass2dict(triton_config), **{"model_repository": output_model_store}}
-        ),
-    )
-
-    config_results = []
-
     configurator = Configurator()
 
     LOGGER.info("Running Triton Model Configurator for converted models")
     for model in converted_models:
         LOGGER.info(f"\t- {model.name}")
 
+    variants_to_evaluate = []
     for model_to_deploy in converted_models:
         LOGGER.info(f"Running triton model configuration variants generation for {model_to_deploy.name}")
         for variant in configurator.get_models_variants(model_to_deploy, device_kinds=device_kinds):
-            LOGGER.info(f"Generated model variant {variant.name} for Triton evaluation.")
-            model_to_deploy_config = ModelConfig(variant.name, model_to_deploy.path)
-            model_signature_config_updated = _get_model_signature_config(model_to_deploy, model_signature_config)
-            model_config_path = None
-            error_logs = []
-            try:
-                if variant.num_required_gpus is not None and len(gpus) < variant.num_required_gpus:
-                    LOGGER.warning(
-                        f"  Variant {variant.name} requires {variant.num_required_gpus} gpus "
-                        f"  while only {len(gpus)} is available."
-                    )
-                    continue
-
-                triton_server.set_gpus(gpus[: variant.num_required_gpus])
-                triton_server.start()
-                triton_client = triton_server.create_grpc_client()
-                triton_client_config = TritonClientConfig(server_url=triton_client.server_url)
-                # other Triton related configuration are forwarded with ctx.forward
-                LOGGER.debug(f"  [{variant.name}] Load on Triton")
-                config_result = ctx.forward(
-                    config_model_on_triton_cmd,
-                    **dataclass2dict(batching_config),
-                    **dataclass2dict(instances_config),
-                    **dataclass2dict(model_to_deploy_config),
-                    **dataclass2dict(variant.optimization_config),
-                    **dataclass2dict(triton_client_config),
-                    **dataclass2dict(backend_config),
-                    **dataclass2dict(tensorrt_common_config),
-                    model_repository=output_model_store,
-                    load_model=True,
-                )
-                if config_result.status.state != State.SUCCEEDED:
-                    error_logs.append(config_result.status.message)
-                    continue
-
-                model_config_path = pathlib.Path(config_result.model_dir_in_model_store)
-
-                LOGGER.debug(f"  [{variant.name}] Run inference requests.")
-                evaluate_result = ctx.forward(
-                    triton_evaluate_model_cmd,
-                    **dataclass2dict(triton_client_config),
-                    **dataclass2dict(dataset_profile_config),
-                    **dataclass2dict(perf_measurement_config),
-                    **dataclass2dict(model_signature_config_updated),
-                    model_name=model_to_deploy_config.model_name,
-                    model_version=model_to_deploy_config.model_version,
+            if variant.num_required_gpus is not None and len(gpus) < variant.num_required_gpus:
+                LOGGER.warning(
+                    f"  Variant {variant.name} requires {variant.num_required_gpus} gpus "
+                    f"  while only {len(gpus)} is available."
                 )
-                if evaluate_result.status.state != State.SUCCEEDED:
-                    error_logs.append(evaluate_result.log)
-                    continue
-            finally:
-                triton_server.stop()
+                continue
+            LOGGER.info(f"Generated model variant {variant.name} for Triton evaluation.")
+            variants_to_evaluate.append((model_to_deploy, variant))
+
+    # variants are evaluated in parallel on separate Triton servers - one per each GPU
+    scheduler = _GpuScheduler(gpus)
+    parallel = scheduler.max_parallel > 1 and len(variants_to_evaluate) > 1
+    if parallel:
+        LOGGER.info(f"Evaluating {len(variants_to_evaluate)} model variants on {len(gpus)} GPUs in parallel")
+
+    def _create_server(variant_gpus: List[str]):
+        return _get_triton_server(
+            triton_docker_image=triton_docker_image,
+            gpus=variant_gpus,
+            analyzer_config=ModelAnalyzerTritonConfig.from_dict(
+                {**dataclass2dict(triton_config), **{"model_repository": output_model_store}}
+            ),
+            # servers running in parallel cannot share the default ports
+            ports=_get_free_ports() if parallel else None,
+        )
 
-                if error_logs:
-                    server_log = triton_server.logs()
-                    LOGGER.debug(server_log)
-
-                    log_file = log_configuration_error(
-                        workspace=workspace.path,
-                        model=model_to_deploy,
-                        variant=variant,
-                        server_log=server_log,
-                        errors=error_logs,
-                    )
-                    status = Status(
-                        state=State.FAILED,
-                        log_path=log_file.as_posix(),
-                        message=f"Unable to evaluate model {variant.name}. Details can be found in logfile: {log_file.absolute()}",
-                    )
-                else:
-                    status = Status(
-                        state=State.SUCCEEDED,
-                        message=f"Model {variant.name} successfully loaded.",
-                    )
-
-                config_result = TritonConfiguratorResult(
-                    status=status,
-                    model=model_to_deploy,
-                    model_config_name=variant.name,
-                    model_config_path=model_config_path,
-                    batching_config=batching_config,
-                    backend_config=backend_config,
-                    instances_config=instances_config,
-                    tensorrt_common_config=tensorrt_common_config,
-                    dataset_profile_config=dataset_profile_config,
-                    perf_measurement_config=perf_measurement_config,
-                    optimization_config=variant.optimization_config,
-                    triton_config=triton_config,
-                    model_signature_config=model_signature_config_updated,
-                )
+    server_pool = _TritonServerPool(_create_server)
+
+    def _evaluate(model_to_deploy: Model, variant: Variant):
+        with scheduler.acquire(variant.num_required_gpus) as variant_gpus:
+            return _evaluate_model_variant_on_triton(
+                ctx=ctx,
+                model_to_deploy=model_to_deploy,
+                variant=variant,
+                output_model_store=output_model_store,
+                model_blobs_dir=model_blobs_dir,
+                batching_config=batching_config,
+                instances_config=instances_config,
+                backend_config=backend_config,
+                tensorrt_common_config=tensorrt_common_config,
+                dataset_profile_config=dataset_profile_config,
+                perf_measurement_config=perf_measurement_config,
+                model_signature_config=model_signature_config,
+                triton_config=triton_config,
+                server_pool=server_pool,
+                gpus=variant_gpus,
+                workspace=workspace,
+                parallel=parallel,
+            )
 
-                config_results.append(config_result)
+    try:
+        with ThreadPoolExecutor(max_workers=scheduler.max_parallel if parallel else 1) as executor:
+            futures = [executor.submit(_evaluate, model, variant) for model, variant in variants_to_evaluate]
+            config_results = [future.result() for future in futures]
+    finally:
+        server_pool.close()
 
     results_store = ResultsStore(workspace)
     results_store.dump("configure_models_on_triton", config_results)
@@ -527,6 +599,136 @@ def _configure_models_on_triton(
     return config_results
 
 
+def _evaluate_model_variant_on_triton(
+    ctx,
+    model_to_deploy: Model,
+    variant: Variant,
+    output_model_store: pathlib.Path,
+    model_blobs_dir: pathlib.Path,
+    batching_config: BatchingConfig,
+    instances_config: TritonModelInstancesConfig,
+    backend_config: TritonCustomBackendParametersConfig,
+    tensorrt_common_config: TensorRTCommonConfig,
+    dataset_profile_config: DatasetProfileConfig,
+    perf_measurement_config: PerfMeasurementConfig,
+    model_signature_config: ModelSignatureConfig,
+    triton_config: RunTritonConfig,
+    server_pool: _TritonServerPool,
+    gpus: List,
+    workspace: Workspace,
+    parallel: bool = False,
+) -> TritonConfiguratorResult:
+    """Deploy model variant on the Triton server running on given GPUs, check it with perf_analyzer and unload it."""
+    # profiling data generated for each variant cannot be shared between variants evaluated in parallel
+    evaluation_workspace_path = workspace.path / ".triton-evaluation" / variant.name if parallel else workspace.path
+
+    model_to_deploy_config = ModelConfig(variant.name, model_to_deploy.path)
+    model_signature_config_updated = _get_model_signature_config(model_to_deploy, model_signature_config)
+    model_config_path = None
+    error_logs = []
+    triton_server = None
+    try:
+        LOGGER.debug(f"  [{variant.name}] Evaluating on GPUs: {gpus}")
+        triton_server = server_pool.get_server(gpus)
+        triton_client = triton_server.create_grpc_client()
+        triton_client_config = TritonClientConfig(server_url=triton_client.server_url)
+        # other Triton related configuration are forwarded with ctx.forward
+        LOGGER.debug(f"  [{variant.name}] Load on Triton")
+        config_result = ctx.forward(
+            config_model_on_triton_cmd,
+            **dataclass2dict(batching_config),
+            **dataclass2dict(instances_config),
+            **dataclass2dict(model_to_deploy_config),
+            **dataclass2dict(variant.optimization_config),
+            **dataclass2dict(triton_client_config),
+            **dataclass2dict(backend_config),
+            **dataclass2dict(tensorrt_common_config),
+            model_repository=output_model_store,
+            model_blobs_dir=model_blobs_dir,
+            load_model=True,
+        )
+        if config_result.status.state != State.SUCCEEDED:
+            error_logs.append(config_result.status.message)
+        else:
+            model_config_path = pathlib.Path(config_result.model_dir_in_model_store)
+
+            LOGGER.debug(f"  [{variant.name}] Run inference requests.")
+            evaluate_result = ctx.forward(
+                triton_evaluate_model_cmd,
+                workspace_path=evaluation_workspace_path,
+                **dataclass2dict(triton_client_config),
+                **dataclass2dict(dataset_profile_config),
+                **dataclass2dict(perf_measurement_config),
+                **dataclass2dict(model_signature_config_updated),
+                model_name=model_to_deploy_config.model_name,
+                model_version=model_to_deploy_config.model_version,
+            )
+            if evaluate_result.status.state != State.SUCCEEDED:
+                error_logs.append(evaluate_result.log)
+    finally:
+        if triton_server is not None:
+            _unload_model_variant(triton_server, variant, error_logs)
+        if parallel:
+            shutil.rmtree(evaluation_workspace_path, ignore_errors=True)
+
+    if error_logs:
+        server_log = ""
+        if triton_server is not None:
+            # logs of the running server may be incomplete; server is restarted for the next variant
+            triton_server.stop()
+            server_log = triton_server.logs()
+        LOGGER.debug(server_log)
+
+        log_file = log_configuration_error(
+            workspace=workspace.path,
+            model=model_to_deploy,
+            variant=variant,
+            server_log=server_log,
+            errors=error_logs,
+        )
+        status = Status(
+            state=State.FAILED,
+            log_path=log_file.as_posix(),
+            message=f"Unable to evaluate model {variant.name}. Details can be found in logfile: {log_file.absolute()}",
+        )
+    else:
+        status = Status(
+            state=State.SUCCEEDED,
+            message=f"Model {variant.name} successfully loaded.",
+        )
+
+    return TritonConfiguratorResult(
+        status=status,
+        model=model_to_deploy,
+        model_config_name=variant.name,
+        model_config_path=model_config_path,
+        batching_config=batching_config,
+        backend_config=backend_config,
+        instances_config=instances_config,
+        tensorrt_common_config=tensorrt_common_config,
+        dataset_profile_config=dataset_profile_config,
+        perf_measurement_config=perf_measurement_config,
+        optimization_config=variant.optimization_config,
+        triton_config=triton_config,
+        model_signature_config=model_signature_config_updated,
+    )
+
+
+def _unload_model_variant(triton_server, variant: Variant, error_logs: List[str]):
+    """Unload the variant, so the server can be reused for the next variants."""
+    if not _is_server_live(triton_server):
+        error_logs.append(f"Triton server is not live after evaluation of {variant.name}.")
+        return
+
+    LOGGER.debug(f"  [{variant.name}] Unload from Triton")
+    try:
+        triton_server.create_grpc_client().unload_model(variant.name)
+    except Exception as e:
+        # the variant works, but the server state is unknown - it is restarted for the next variant
+        LOGGER.warning(f"Unable to unload model {variant.name} from Triton: {e}. Restarting Triton server.")
+        triton_server.stop()
+
+
 def _get_max_batch_size(profile_config: ModelAnalyzerProfileConfig):
     """Select the max batch size used for conversion and datasets based on profiling configuration"""
     if profile_config.config_search_max_batch_sizes:
@@ -319,6 +319,15 @@ class ConversionSetHelmChartConfigCli:
     )
 
 
+class ConversionCacheConfigCli:
+    conversion_cache_dir = CliSpec(
+        help="Path to the directory with cached conversion results. Can be shared between workspaces and runs."
+    )
+    conversion_cache_max_size = CliSpec(
+        help="Maximal size of the conversion cache in bytes. Least recently used results are removed above the limit."
+    )
+
+
 class BatchingConfigCli:
     max_batch_size = CliSpec(help="Maximum batch size allowed for inference.")
 
@@ -52,6 +52,7 @@ from model_navigator.triton.config import (
     TritonModelOptimizationConfig,
 )
 from model_navigator.utils import Workspace
+from model_navigator.utils.blob_store import BlobStore
 from model_navigator.utils.cli import common_options, options_from_config
 from model_navigator.validators import run_command_validators
 
@@ -110,6 +111,14 @@ CMD_NAME = "triton-config-model"
     required=True,
     help="Path to the Triton Model Repository.",
 )
+@click.option(
+    "--model-blobs-dir",
+    type=click.Path(file_okay=False, writable=True),
+    required=False,
+    help="Path to the directory storing model files content once. "
+    "When provided, model files in the Triton Model Repository are hard links to the stored files instead of copies. "
+    "Should be located on the same filesystem as the Triton Model Repository.",
+)
 @click.option(
     "--load-model",
     help="Request model load on the Triton Server and ensure it is loaded.",
@@ -150,6 +159,7 @@ def config_model_on_triton_cmd(
     load_model_timeout_s: int,
     model_control_mode: str,
     workspace_path: str,
+    model_blobs_dir: Optional[str] = None,
     **kwargs,
 ):
     init_logger(verbose=verbose)
@@ -165,6 +175,7 @@ def config_model_on_triton_cmd(
             "load_model_timeout_s": load_model_timeout_s,
             "model_control_mode": model_control_mode,
             "workspace_path": workspace_path,
+            "model_blobs_dir": model_blobs_dir,
             **kwargs,
         },
     )
@@ -216,7 +227,8 @@ def config_model_on_triton_cmd(
 
     model_dir_in_model_store = None
     try:
-        model_store = TritonModelStore(model_repository)
+        blob_store = BlobStore(model_blobs_dir) if model_blobs_dir else None
+        model_store = TritonModelStore(model_repository, blob_store=blob_store)
         model_dir_in_model_store = model_store.deploy_model(
             model=model,
             model_version=model_version,
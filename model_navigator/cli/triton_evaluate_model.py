@@ -14,11 +14,13 @@
 import csv
 import dataclasses
 import logging
+import pathlib
+import tempfile
 import traceback
 from dataclasses import dataclass
 from enum import Enum
 from subprocess import TimeoutExpired
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import click as click
 
@@ -35,8 +37,8 @@ from model_navigator.converter import DatasetProfileConfig
 from model_navigator.exceptions import ModelNavigatorException
 from model_navigator.log import log_dict, set_logger
 from model_navigator.model import ModelSignatureConfig
-from model_navigator.perf_analyzer import PerfAnalyzer, PerfAnalyzerConfig, PerfMeasurementConfig
-from model_navigator.perf_analyzer.config import SharedMemoryMode
+from model_navigator.perf_analyzer import PerfAnalyzer, PerfAnalyzerConfig, PerfClient, PerfMeasurementConfig
+from model_navigator.perf_analyzer.config import PerfClientType, SharedMemoryMode
 from model_navigator.results import State, Status
 from model_navigator.triton import TritonClientConfig, parse_server_url
 from model_navigator.triton.utils import get_shape_params
@@ -47,6 +49,11 @@ LOGGER = logging.getLogger("triton_evaluate_model")
 
 DEFAULT_RANDOM_DATA_FILENAME = "random_data.json"
 
+# concurrency increase is worth it when throughput grows at least by 5%
+THROUGHPUT_PLATEAU_GAIN = 0.05
+# number of concurrency levels measured between the probes bracketing the throughput knee
+REFINEMENT_POINTS = 4
+
 
 class MeasurementMode(Enum):
     COUNT_WINDOWS = "count_windows"
@@ -71,10 +78,29 @@ class BatchingMode(Enum):
     DYNAMIC = "dynamic"
 
 
+class ConcurrencySearch(Enum):
+    """
+    Available concurrency search modes for dynamic batching
+    """
+
+    LINEAR = "linear"
+    ADAPTIVE = "adaptive"
+
+
+@dataclass
+class ConcurrencySearchResult:
+    # the lowest concurrency reaching the throughput plateau
+    knee_concurrency: int
+    knee_throughput: float
+    # the highest measured concurrency with p99 latency within the budget; None if not found or budget not set
+    max_concurrency_within_latency_budget: Optional[int] = None
+
+
 @dataclass
 class TritonEvaluateModelResult:
     status: Status
     log: Optional[str]
+    concurrency_search_result: Optional[ConcurrencySearchResult] = None
 
 
 def _read_csv_file(file: str, additional_fields: Dict) -> List[Dict]:
@@ -122,6 +148,93 @@ def _average_latency(row: Dict):
     return avg_latency
 
 
+def _get_latency_ms(row: Dict) -> float:
+    # perf_analyzer reports latencies in microseconds
+    latency = row.get("p99 latency") or row["avg latency"]
+    return int(latency) / 1000
+
+
+def _search_concurrency(
+    measure: Callable[[int, int, int], List[Dict]],
+    min_concurrency: int,
+    max_concurrency: int,
+    latency_budget: Optional[float] = None,
+) -> Tuple[List[Dict], ConcurrencySearchResult]:
+    """
+    Find the throughput knee and the highest concurrency meeting the latency budget (ms).
+
+    Concurrency is probed exponentially until throughput stops growing or the latency budget is exceeded.
+    Then the bracket around the last probe with significant throughput gain is refined with a single `measure` call.
+
+    Args:
+        measure: run perf_analyzer for `start:end:step` concurrency range and return report rows
+    """
+    measurements = {}
+
+    def _measure(start: int, end: int, step: int):
+        for row in measure(start, end, step):
+            measurements[int(row["Concurrency"])] = row
+
+    def _throughput(concurrency: int) -> float:
+        return float(measurements[concurrency]["Inferences/Second"])
+
+    def _within_budget(concurrency: int) -> bool:
+        return latency_budget is None or _get_latency_ms(measurements[concurrency]) <= latency_budget
+
+    bracket = None
+    probes = []
+    concurrency = min_concurrency
+    while True:
+        _measure(concurrency, concurrency, 1)
+        probes.append(concurrency)
+        if len(probes) > 1 and (
+            not _within_budget(concurrency)
+            or _throughput(concurrency) < (1 + THROUGHPUT_PLATEAU_GAIN) * _throughput(probes[-2])
+        ):
+            # the knee lies anywhere after the last probe with significant throughput gain
+            bracket = (probes[max(0, len(probes) - 3)], concurrency)
+            break
+        if not _within_budget(concurrency) or concurrency >= max_concurrency:
+            break
+        concurrency = min(2 * concurrency, max_concurrency)
+
+    if bracket is not None and bracket[1] - bracket[0] > 1:
+        low, high = bracket
+        step = max(1, (high - low) // (REFINEMENT_POINTS + 1))
+        LOGGER.debug(f"Refining concurrency search between {low} and {high} with step {step}")
+        _measure(low + step, high - 1, step)
+
+    max_throughput = max(_throughput(concurrency) for concurrency in measurements)
+    knee_concurrency = min(
+        concurrency
+        for concurrency in measurements
+        if _throughput(concurrency) >= (1 - THROUGHPUT_PLATEAU_GAIN) * max_throughput
+    )
+    within_budget = [concurrency for concurrency in measurements if _within_budget(concurrency)]
+    search_result = ConcurrencySearchResult(
+        knee_concurrency=knee_concurrency,
+        knee_throughput=_throughput(knee_concurrency),
+        max_concurrency_within_latency_budget=(
+            max(within_budget) if latency_budget is not None and within_budget else None
+        ),
+    )
+    rows = [measurements[concurrency] for concurrency in sorted(measurements)]
+    return rows, search_result
+
+
+def _python_perf_client_evaluation(
+    perf_client: PerfClient, batch_size: int, concurrency_range: str
+) -> Tuple[List[Dict], str]:
+    start, end, step = map(int, concurrency_range.split(":"))
+    rows, log = [], ""
+    for concurrency in range(start, end + 1, step):
+        result = perf_client.run(concurrency=concurrency)
+        log += f"{result}\n"
+        row = result.report_row()
+        rows.append({"Batch": batch_size, **row, "avg latency": _average_latency(row)})
+    return rows, log
+
+
 def _perf_analyzer_evaluation(
     server_url: str,
     model_name: str,
@@ -141,7 +254,10 @@ def _perf_analyzer_evaluation(
     verbose: bool = False,
     timeout: int = 600,
     bin_path: Optional[str] = None,
-):
+    concurrency_search: ConcurrencySearch = ConcurrencySearch.LINEAR,
+    latency_budget: Optional[float] = None,
+    perf_client: PerfClientType = PerfClientType.PERF_ANALYZER,
+) -> Tuple[str, Optional[ConcurrencySearchResult]]:
     protocol, host, port = parse_server_url(server_url)
 
     if batching_mode == BatchingMode.STATIC:
@@ -159,52 +275,99 @@ def _perf_analyzer_evaluation(
 
     results = []
     output = ""
-    for batch_size in batch_sizes:
-        for concurrency in range(min_concurrency, max_concurrency + step, step):
-            params = {
-                "model-name": model_name,
-                "model-version": model_version,
-                "batch-size": batch_size,
-                "url": f"{host}:{port}",
-                "protocol": protocol,
-                "input-data": input_data,
-                "measurement-mode": measurement_mode,
-                "measurement-request-count": measurement_request_count,
-                "measurement-interval": measurement_interval,
-                "concurrency-range": f"{concurrency}:{concurrency}:1",
-            }
-
-            if latency_report_file:
-                params["latency-report-file"] = latency_report_file
-
-            if verbose:
-                params["verbose"] = True
-
-            params["shared-memory"] = shared_memory.value
-            params["output-shared-memory-size"] = output_shared_memory_size
-
-            if verbose:
-                log_dict(f"Perf Analyzer config for {batch_size}", params)
-
-            perf_config = PerfAnalyzerConfig()
-            for param, value in params.items():
-                perf_config[param] = value
-
-            for shape in input_shapes:
-                perf_config["shape"] = shape
-
-            perf_analyzer = PerfAnalyzer(perf_config, timeout=timeout, stream_output=verbose, bin_path=bin_path)
-            perf_analyzer.run()
-            output += perf_analyzer.output()
-
-            if latency_report_file:
-                partial_result = _read_csv_file(latency_report_file, additional_fields={"Batch": batch_size})
-                results.extend(partial_result)
+    python_perf_clients = {}
+
+    def _run_python_perf_client(batch_size: int, concurrency_range: str) -> List[Dict]:
+        nonlocal output
+        if batch_size not in python_perf_clients:
+            python_perf_clients[batch_size] = PerfClient(
+                server_url=server_url,
+                model_name=model_name,
+                model_version=model_version,
+                batch_size=batch_size,
+                input_shapes=input_shapes,
+                input_data=input_data,
+                measurement_mode=MeasurementMode(measurement_mode).value,
+                measurement_interval=measurement_interval,
+                measurement_request_count=measurement_request_count,
+                shared_memory=shared_memory,
+                output_shared_memory_size=output_shared_memory_size,
+                timeout=timeout,
+                verbose=verbose,
+            )
+
+        rows, log = _python_perf_client_evaluation(python_perf_clients[batch_size], batch_size, concurrency_range)
+        output += log
+        return rows
+
+    def _run_perf_analyzer(batch_size: int, concurrency_range: str, report_file: Optional[str]) -> List[Dict]:
+        nonlocal output
+        if perf_client == PerfClientType.PYTHON:
+            return _run_python_perf_client(batch_size, concurrency_range)
+
+        params = {
+            "model-name": model_name,
+            "model-version": model_version,
+            "batch-size": batch_size,
+            "url": f"{host}:{port}",
+            "protocol": protocol,
+            "input-data": input_data,
+            "measurement-mode": measurement_mode,
+            "measurement-request-count": measurement_request_count,
+            "measurement-interval": measurement_interval,
+            "concurrency-range": concurrency_range,
+        }
+
+        if report_file:
+            params["latency-report-file"] = report_file
+
+        if verbose:
+            params["verbose"] = True
+
+        params["shared-memory"] = shared_memory.value
+        params["output-shared-memory-size"] = output_shared_memory_size
+
+        if verbose:
+            log_dict(f"Perf Analyzer config for {batch_size}", params)
+
+        perf_config = PerfAnalyzerConfig()
+        for param, value in params.items():
+            perf_config[param] = value
+
+        for shape in input_shapes:
+            perf_config["shape"] = shape
+
+        perf_analyzer = PerfAnalyzer(perf_config, timeout=timeout, stream_output=verbose, bin_path=bin_path)
+        perf_analyzer.run()
+        output += perf_analyzer.output()
+
+        if report_file:
+            return _read_csv_file(report_file, additional_fields={"Batch": batch_size})
+        return []
+
+    search_result = None
+    if concurrency_search == ConcurrencySearch.ADAPTIVE and batching_mode == BatchingMode.DYNAMIC:
+        # measurements are required to drive the search even if the report is not requested
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_file = (pathlib.Path(tmp_dir) / "latency_report.csv").as_posix()
+            for batch_size in batch_sizes:
+                rows, search_result = _search_concurrency(
+                    lambda start, end, step: _run_perf_analyzer(batch_size, f"{start}:{end}:{step}", report_file),
+                    min_concurrency=1,
+                    max_concurrency=max_concurrency,
+                    latency_budget=latency_budget,
+                )
+                LOGGER.info(f"Concurrency search result for batch size {batch_size}: {search_result}")
+                results.extend(rows)
+    else:
+        for batch_size in batch_sizes:
+            for concurrency in range(min_concurrency, max_concurrency + step, step):
+                results.extend(_run_perf_analyzer(batch_size, f"{concurrency}:{concurrency}:1", latency_report_file))
 
     if latency_report_file and results:
         _save_csv_file(latency_report_file, results)
 
-    return output
+    return output, search_result
 
 
 @cli.common_options
@@ -241,6 +404,32 @@ def _perf_analyzer_evaluation(
     default=None,
     help="Provide path to file where CSV report has to be stored",
 )
+@click.option(
+    "--concurrency-search",
+    type=click.Choice([item.value for item in ConcurrencySearch]),
+    default=ConcurrencySearch.LINEAR.value,
+    help="Select concurrency search for dynamic batching "
+    "'linear' measure concurrency steps from the whole range. "
+    "'adaptive' probe concurrency exponentially and refine around the throughput knee.",
+    required=False,
+)
+@click.option(
+    "--latency-budget",
+    type=float,
+    default=None,
+    help="Find the highest concurrency with p99 latency in milliseconds not exceeding the budget "
+    "in adaptive concurrency search",
+    required=False,
+)
+@click.option(
+    "--perf-client",
+    type=click.Choice([item.value for item in PerfClientType]),
+    default=PerfClientType.PERF_ANALYZER.value,
+    help="Select client generating the load "
+    "'perf_analyzer' run perf_analyzer binary. "
+    "'python' run load generator in process using tritonclient library.",
+    required=False,
+)
 @cli.options_from_config(PerfMeasurementConfig, PerfMeasurementConfigCli)
 @cli.options_from_config(DatasetProfileConfig, DatasetProfileConfigCli)
 @cli.options_from_config(TritonClientConfig, TritonClientConfigCli)
@@ -256,6 +445,9 @@ def triton_evaluate_model_cmd(
     verbose: bool,
     latency_report_file: str,
     concurrency_steps: int,
+    concurrency_search: str,
+    latency_budget: Optional[float],
+    perf_client: str,
     package: Optional[NavPackage],
     **kwargs,
 ):
@@ -282,6 +474,9 @@ def triton_evaluate_model_cmd(
                     "model_version": model_version,
                     "batch_sizes": batch_sizes,
                     "concurrency_steps": concurrency_steps,
+                    "concurrency_search": concurrency_search,
+                    "latency_budget": latency_budget,
+                    "perf_client": perf_client,
                     "latency_report_file": latency_report_file,
                     "package": package,
                     "verbose": verbose,
@@ -294,6 +489,7 @@ def triton_evaluate_model_cmd(
         )
 
     perf_analyzer_log = None
+    concurrency_search_result = None
 
     profiling_data = "random"
     shapes = []
@@ -312,7 +508,7 @@ def triton_evaluate_model_cmd(
             if shapes_params:
                 shapes = shapes_params
 
-        perf_analyzer_log = _perf_analyzer_evaluation(
+        perf_analyzer_log, concurrency_search_result = _perf_analyzer_evaluation(
             server_url=triton_client_config.server_url,
             model_name=model_name,
             model_version=model_version,
@@ -330,12 +526,16 @@ def triton_evaluate_model_cmd(
             concurrency_steps=concurrency_steps,
             latency_report_file=latency_report_file,
             bin_path=perf_measurement_config.perf_analyzer_path,
+            concurrency_search=ConcurrencySearch(concurrency_search),
+            latency_budget=latency_budget,
+            perf_client=PerfClientType(perf_client),
         )
 
         message = f"Evaluated model {model_name} and batch size {batch_sizes} and mode: {perf_measurement_config.perf_measurement_output_shared_memory_size}"
         result = TritonEvaluateModelResult(
             status=Status(state=State.SUCCEEDED, message=message),
             log=perf_analyzer_log,
+            concurrency_search_result=concurrency_search_result,
         )
     except ModelNavigatorException as e:
         LOGGER.debug(f"Encountered exception \n{str(e)}")
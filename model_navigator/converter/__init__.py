@@ -13,6 +13,7 @@
 # limitations under the License.
 from model_navigator.converter.config import (  # noqa: F401
     ComparatorConfig,
+    ConversionCacheConfig,
     ConversionConfig,
     ConversionLaunchMode,
     ConversionSetConfig,
@@ -16,6 +16,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -77,6 +78,12 @@ class DatasetProfileConfig(BaseConfig):
     dtypes: Optional[Dict[str, np.dtype]] = None
 
 
+@dataclass
+class ConversionCacheConfig(BaseConfig):
+    conversion_cache_dir: Optional[Path] = None
+    conversion_cache_max_size: Optional[int] = None
+
+
 @dataclass
 class TensorRTConversionConfig(BaseConfig):
     precision: TensorRTPrecision = TensorRTPrecision.FP16
@@ -13,7 +13,8 @@
 # limitations under the License.
 import logging
 import traceback
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
 
 from model_navigator.converter.config import ComparatorConfig, ConversionConfig
 from model_navigator.converter.dataloader import Dataloader
@@ -25,6 +26,7 @@ from model_navigator.exceptions import ModelNavigatorConverterCommandException,
 from model_navigator.model import ModelConfig, ModelSignatureConfig
 from model_navigator.results import State, Status
 from model_navigator.triton import DeviceKind
+from model_navigator.utils.conversion_cache import ConversionCache
 from model_navigator.utils.workspace import Workspace
 
 LOGGER = logging.getLogger(__name__)
@@ -33,9 +35,12 @@ CONVERTED_DIRNAME = "converted"
 
 
 class ConvertCommandsExecutor:
-    def __init__(self, *, workspace: Workspace, verbose: bool = False):
+    def __init__(
+        self, *, workspace: Workspace, verbose: bool = False, conversion_cache: Optional[ConversionCache] = None
+    ):
         LOGGER.debug(f"Convert Commands Executor created; workspace={workspace.path}")
         self._cache = {}
+        self._conversion_cache = conversion_cache
         self._verbose = verbose
         self._workspace = workspace
         self._workdir_path = workspace.path / CONVERTED_DIRNAME
@@ -67,12 +72,47 @@ class ConvertCommandsExecutor:
         suffix = command.file_suffix or ""
         return self._workdir_path / f"{model.model_path.stem}{COMMAND_SPEC_SEP}{command.name}{suffix}"
 
+    def run_conversion(
+        self,
+        command: BaseConvertCommand,
+        model: ModelConfig,
+        output_path: Path,
+        log_path: Path,
+        convert_fn: Callable[[], None],
+    ) -> None:
+        """Execute convert_fn producing output_path or restore the output from the conversion cache."""
+        if self._conversion_cache is None or command.cache_params is None:
+            convert_fn()
+            return
+
+        key = self._conversion_cache.get_key(
+            model.model_path,
+            converter=command.name,
+            params=command.cache_params,
+            packages=command.cache_packages,
+            # cached commands build TensorRT engines which are specific to the GPU model
+            uses_gpu=True,
+        )
+        if self._conversion_cache.get(key, output_path):
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_path.write_text(
+                f"Model restored from conversion cache {self._conversion_cache.cache_dir} (key={key})\n"
+            )
+            return
+
+        convert_fn()
+        self._conversion_cache.put(key, output_path)
+
 
 class Converter:
-    def __init__(self, *, workspace: Workspace, verbose: bool = False) -> None:
+    def __init__(
+        self, *, workspace: Workspace, verbose: bool = False, conversion_cache: Optional[ConversionCache] = None
+    ) -> None:
         LOGGER.debug(f"Converter created; workspace={workspace.path}")
         self._registry = ConvertCommandsRegistry()
-        self._executor = ConvertCommandsExecutor(workspace=workspace, verbose=verbose)
+        self._executor = ConvertCommandsExecutor(
+            workspace=workspace, verbose=verbose, conversion_cache=conversion_cache
+        )
 
     def convert(
         self,
@@ -13,10 +13,12 @@
 # limitations under the License.
 import itertools
 import logging
+import pathlib
+import zipfile
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from functools import lru_cache
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -25,7 +27,8 @@ from model_navigator.converter.utils import navigator_subprocess
 from model_navigator.exceptions import ModelNavigatorException
 from model_navigator.model import Format, Model, ModelConfig, ModelSignatureConfig
 from model_navigator.tensor import TensorSpec
-from model_navigator.utils.nav_package import NavPackage
+from model_navigator.utils.nav_package import NavPackage, NavPackageDirectory
+from model_navigator.utils.sample_store import INDEX_FILENAME, SampleStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -283,6 +286,27 @@ class RandomDataloader(Dataloader):
         )
 
 
+def _read_npz_header(fobj) -> Dict[str, Tuple[Tuple[int, ...], np.dtype]]:
+    """Read shapes and dtypes of arrays stored in npz file without loading the data"""
+    header = {}
+    with zipfile.ZipFile(fobj) as npz:
+        for member in npz.namelist():
+            if not member.endswith(".npy"):
+                continue
+            with npz.open(member) as npy:
+                version = np.lib.format.read_magic(npy)
+                if version == (1, 0):
+                    shape, _, dtype = np.lib.format.read_array_header_1_0(npy)
+                elif version == (2, 0):
+                    shape, _, dtype = np.lib.format.read_array_header_2_0(npy)
+                else:
+                    npy.seek(0)
+                    array = np.lib.format.read_array(npy)
+                    shape, dtype = array.shape, array.dtype
+            header[member[: -len(".npy")]] = (tuple(shape), dtype)
+    return header
+
+
 class NavPackageDataloader(Dataloader):
     """Dataloader for reading inputs dumped in .nav packages
     It generates batches of size 1 and max_batch_size.
@@ -306,6 +330,8 @@ class NavPackageDataloader(Dataloader):
         self.max_batch_size = max_batch_size
         self.model_signature_config = model_signature_config
         self.size_index = None
+        self._store = None
+        self._stored_dtypes = {}
         if dataset not in package.datasets:
             raise ModelNavigatorException(f"Dataset {dataset} not found in {package}")
         self._index_by_shape()
@@ -315,68 +341,99 @@ class NavPackageDataloader(Dataloader):
         Produces batches of sizes 1 and max_batch_size,
         repeatedly reusing samples from the package if needed to make a full batch."""
         for batch_size in {1, self.max_batch_size}:
-            for inputs, files in self.size_index.items():
-                count = len(files)
+            for inputs, sample_ids in self.size_index.items():
+                count = len(sample_ids)
                 samples = []
-                for i, file in enumerate(itertools.cycle(files)):
+                # samples reused to fill the last batch are kept instead of reading them again
+                first_samples = []
+                for i, sample_id in enumerate(itertools.cycle(sample_ids)):
                     if i > 0 and i % batch_size == 0:
                         yield self._stack_batch(inputs, samples)
                         if i >= count:
                             break
                         samples = []
-                    with self.package.open(file) as fobj:
-                        samples.append(dict(np.load(fobj)))
-
-    @property
-    @lru_cache
+                    if i < count:
+                        sample = self._load_sample(sample_id)
+                        if i < batch_size:
+                            first_samples.append(sample)
+                    else:
+                        sample = first_samples[i % count]
+                    samples.append(sample)
+
+    @cached_property
     def min_shapes(self) -> Dict[str, List[int]]:
-        shape = {}
-        for sample in self:
-            for inp, val in sample.items():
-                if not shape.get(inp):
-                    shape[inp] = list(val.shape)
-                assert len(shape[inp]) == len(val.shape)
-                for i, (s1, s2) in enumerate(zip(shape[inp], val.shape)):
-                    shape[inp][i] = min(s1, s2)
-        return shape
+        return self._get_batch_shapes(min, batch_size=1)
 
-    @property
-    @lru_cache
+    @cached_property
     def max_shapes(self) -> Dict[str, List[int]]:
-        shape = {}
-        for sample in self:
-            for inp, val in sample.items():
-                if not shape.get(inp):
-                    shape[inp] = list(val.shape)
-                assert len(shape[inp]) == len(val.shape)
-                for i, (s1, s2) in enumerate(zip(shape[inp], val.shape)):
-                    shape[inp][i] = max(s1, s2)
-        return shape
+        return self._get_batch_shapes(max, batch_size=self.max_batch_size)
 
     @property
     def opt_shapes(self) -> Dict[str, List[int]]:
         return self.max_shapes
 
-    @property
-    def dtypes(self) -> Dict[str, List[np.dtype]]:
-        dtypes = {}
-        for sample in self:
-            for inp, val in sample.items():
-                dtypes[inp] = self._extract_dtype(val, inp)
-
-            break
-
-        return dtypes
+    @cached_property
+    def dtypes(self) -> Dict[str, type]:
+        return {name: self._get_dtype(name, dtype) for name, dtype in self._stored_dtypes.items()}
+
+    def _get_batch_shapes(self, reduce, batch_size: int) -> Dict[str, List[int]]:
+        """Shapes of batches computed from the index - every batch produced while iterating has batch_size 1 or max"""
+        shapes = {}
+        for inputs in self.size_index:
+            for name, shape in inputs:
+                batch_shape = [batch_size, *shape]
+                if name not in shapes:
+                    shapes[name] = batch_shape
+                assert len(shapes[name]) == len(batch_shape)
+                shapes[name] = [reduce(s1, s2) for s1, s2 in zip(shapes[name], batch_shape)]
+        return shapes
 
     def _index_by_shape(self):
-        """Group samples by shapes, so that batches can be made when iterating"""
+        """Group samples by shapes, so that batches can be made when iterating.
+
+        Shapes and dtypes are read from the sample store index or npy headers - samples data is not loaded.
+        """
         self.size_index = defaultdict(list)
-        for file in self.package.datasets[self.dataset]:
-            with self.package.open(file) as fobj:
-                sample = dict(np.load(fobj))
-                key = frozenset((k, v.shape) for k, v in sample.items())
+        self._stored_dtypes = {}
+        files = self.package.datasets[self.dataset]
+        index_file = next((file for file in files if pathlib.Path(file).name == INDEX_FILENAME), None)
+        if index_file is not None:
+            store_kwargs = {}
+            if not isinstance(self.package, NavPackageDirectory):
+                store_kwargs = {"open_file": self.package.open, "map_file": self.package.memmap}
+            self._store = SampleStore(pathlib.Path(index_file).parent, **store_kwargs)
+            self._stored_dtypes = {name: self._store.dtype(name) for name in self._store.tensor_names}
+            for idx in range(len(self._store)):
+                key = frozenset(self._store.shapes(idx).items())
+                self.size_index[key].append(idx)
+        else:
+            # packages created with previous versions store each sample in a separate npz file
+            for file in sorted(files):
+                if not file.endswith(".npz"):
+                    continue
+                with self.package.open(file) as fobj:
+                    header = _read_npz_header(fobj)
+                for name, (_, dtype) in header.items():
+                    self._stored_dtypes.setdefault(name, dtype)
+                key = frozenset((name, shape) for name, (shape, _) in header.items())
                 self.size_index[key].append(file)
 
+    def _get_dtype(self, name: str, dtype: np.dtype) -> type:
+        """Scalar type of the input, e.g. `np.float32`, as returned by the other dataloaders."""
+        if not self.model_signature_config or not self.model_signature_config.inputs:
+            return dtype.type
+        tensor_spec = self.model_signature_config.inputs.get(name)
+        if not tensor_spec:
+            LOGGER.debug(f"Input {name} not found in signature.")
+            return dtype.type
+        return np.dtype(tensor_spec.dtype).type
+
+    def _load_sample(self, sample_id: Union[int, str]) -> Dict[str, np.ndarray]:
+        if isinstance(sample_id, int):
+            return self._store[sample_id]
+        with self.package.open(sample_id) as fobj:
+            return dict(np.load(fobj))
+
     def _format_sample(self, sample, name):
         if not self.model_signature_config or not self.model_signature_config.inputs:
             LOGGER.debug("No signature. No cast.")
@@ -397,16 +454,5 @@ class NavPackageDataloader(Dataloader):
     def _stack_batch(self, inputs, samples):
         batch = {}
         for name, _ in inputs:
-            batch[name] = np.stack(self._format_sample(s, name) for s in samples)
+            batch[name] = np.stack([self._format_sample(s, name) for s in samples])
         return batch
-
-    def _extract_dtype(self, val, name):
-        if not self.model_signature_config or not self.model_signature_config.inputs:
-            return val.dtype.type
-
-        tensor_spec = self.model_signature_config.inputs.get(name)
-        if not tensor_spec:
-            LOGGER.debug(f"Input {name} not found in signature.")
-            return val.dtype.type
-
-        return tensor_spec.dtype.type
@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import logging
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 import numpy as np
 
@@ -22,13 +24,53 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_TOLERANCE_ATOL = 1e-5
 DEFAULT_TOLERANCE_RTOL = 1e-5
 
+# number of elements processed at once while computing statistics; bounds the size of temporary arrays
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class _Moments:
+    """Mean, standard deviation and max of values accumulated chunk by chunk (Chan et al. parallel algorithm)."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    max: float = -np.inf
+
+    def update(self, chunk: np.ndarray) -> None:
+        if chunk.size == 0:
+            return
+        chunk = chunk.astype(np.float64, copy=False)
+        chunk_mean = float(np.mean(chunk))
+        with np.errstate(invalid="ignore"):  # infinite reldiff when output is 0
+            chunk_m2 = float(np.sum(np.square(chunk - chunk_mean)))
+
+        count = self.count + chunk.size
+        delta = chunk_mean - self.mean
+        self.mean += delta * chunk.size / count
+        self.m2 += chunk_m2 + delta**2 * self.count * chunk.size / count
+        self.count = count
+        # np.maximum propagates NaN, while the builtin max drops it depending on the order of arguments
+        self.max = float(np.maximum(self.max, np.amax(chunk)))
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.count)) if self.count else 0.0
+
 
 @dataclass
 class OutputErrorStat:
+    """
+    Error statistics of a pair of outputs.
+
+    Diff arrays and statistics are computed once on first use and cached,
+    so the statistics can be queried repeatedly e.g. while searching tolerance parameters.
+    """
+
     out0: np.ndarray
     out1: np.ndarray
 
-    @property
+    @functools.cached_property
     def absdiff(self):
         if np.issubdtype(self.out0.dtype, np.bool_) and np.issubdtype(self.out1.dtype, np.bool_):
             absdiff = np.logical_xor(self.out0, self.out1)
@@ -36,12 +78,34 @@ class OutputErrorStat:
             absdiff = np.abs(self.out0 - self.out1)
         return absdiff
 
-    @property
+    @functools.cached_property
     def reldiff(self):
-        _reldiff = self.absdiff / np.abs(self.out1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _reldiff = self.absdiff / np.abs(self.out1)
         _reldiff[self.absdiff == 0] = 0
         return _reldiff
 
+    @functools.cached_property
+    def _moments(self) -> Tuple[_Moments, _Moments]:
+        # single pass over both diff arrays
+        absdiff_moments, reldiff_moments = _Moments(), _Moments()
+        absdiff, reldiff = self.absdiff.ravel(), self.reldiff.ravel()
+        for start in range(0, absdiff.size, _CHUNK_SIZE):
+            absdiff_moments.update(absdiff[start : start + _CHUNK_SIZE])
+            reldiff_moments.update(reldiff[start : start + _CHUNK_SIZE])
+        return absdiff_moments, reldiff_moments
+
+    @functools.cached_property
+    def _reldiff_above_absdiff(self) -> Tuple[np.ndarray, np.ndarray]:
+        # sorted absdiff and max reldiff of the elements with absdiff not lower than the corresponding one
+        absdiff, reldiff = self.absdiff.ravel(), self.reldiff.ravel()
+        if np.issubdtype(absdiff.dtype, np.floating):
+            valid = ~np.isnan(absdiff)
+            absdiff, reldiff = absdiff[valid], reldiff[valid]
+        order = np.argsort(absdiff, kind="stable")
+        max_reldiff = np.maximum.accumulate(reldiff[order][::-1])[::-1]
+        return absdiff[order], max_reldiff
+
     def min_out(self):
         return np.amin([np.amin(self.out0), np.amin(self.out1)])
 
@@ -49,65 +113,85 @@ class OutputErrorStat:
         return np.amax([np.amax(self.out0), np.amax(self.out1)])
 
     def max_absdiff(self):
-        return np.amax(self.absdiff)
+        return self._moments[0].max
 
     def max_reldiff(self):
-        return np.amax(self.reldiff)
+        return self._moments[1].max
 
     def mean_absdiff(self):
-        return np.mean(self.absdiff)
+        return self._moments[0].mean
 
     def mean_reldiff(self):
-        return np.mean(self.reldiff)
+        return self._moments[1].mean
 
     def std_absdiff(self):
-        return np.std(self.absdiff)
+        return self._moments[0].std
 
     def std_reldiff(self):
-        return np.std(self.reldiff)
+        return self._moments[1].std
 
+    def max_reldiff_above_absdiff(self, atol: float) -> float:
+        """Max reldiff of the elements which absdiff is not lower than `atol`."""
+        sorted_absdiff, max_reldiff = self._reldiff_above_absdiff
+        idx = np.searchsorted(sorted_absdiff, atol, side="left")
+        return max_reldiff[idx] if idx < max_reldiff.size else DEFAULT_TOLERANCE_RTOL
 
-def _get_recommended_tolerance_params(iter_result0, iter_result1, std_coeff: int = 2):
-    atol = {}
-    rtol = {}
-    for out0_name, output0 in iter_result0.items():
-        output1 = iter_result1[out0_name]
-        output_stat = OutputErrorStat(out0=output0, out1=output1)
-
+    def recommended_tolerance(self, std_coeff: int = 2) -> Tuple[float, float]:
         # heuristic: atol = <absdiff mean> + <std_coeff> * <absdiff std_dev>
-        output_atol = output_stat.mean_absdiff() + std_coeff * output_stat.std_absdiff()
-
+        atol = self.mean_absdiff() + std_coeff * self.std_absdiff()
         # for those elements which abs diff values are above calculated atol - get max reldiff
-        above_atol_idx = np.where(output_stat.absdiff >= output_atol)
-        rtol_to_check = output_stat.reldiff[above_atol_idx]
-        output_rtol = np.amax(rtol_to_check) if rtol_to_check.size > 0 else DEFAULT_TOLERANCE_RTOL
+        rtol = self.max_reldiff_above_absdiff(atol)
+        return atol, rtol
 
-        atol[out0_name] = output_atol
-        rtol[out0_name] = output_rtol
 
-    return atol, rtol
+def _get_error_stats(iter_result0, iter_result1) -> Dict[str, OutputErrorStat]:
+    return {
+        out_name: OutputErrorStat(out0=output0, out1=iter_result1[out_name])
+        for out_name, output0 in iter_result0.items()
+    }
 
 
-def _get_values_range(iter_result0, iter_result1):
-    stats = {
-        out_name: OutputErrorStat(out0=iter_result0[out_name], out1=iter_result1[out_name]) for out_name in iter_result0
-    }
-    return {name: (stat.min_out(), stat.max_out()) for name, stat in stats.items()}
+def _get_recommended_tolerance_params(iter_result0, iter_result1, std_coeff: int = 2):
+    return _get_recommended_tolerance_params_from_stats(_get_error_stats(iter_result0, iter_result1), std_coeff)
+
+
+def _get_recommended_tolerance_params_from_stats(output_stats: Dict[str, OutputErrorStat], std_coeff: int = 2):
+    atol = {}
+    rtol = {}
+    for out_name, output_stat in output_stats.items():
+        atol[out_name], rtol[out_name] = output_stat.recommended_tolerance(std_coeff)
+
+    return atol, rtol
 
 
 class ToleranceParameterHelper:
     def __init__(self, comparator_inputs_path: Path, comparator_outputs_path: Path):
         self._comparator_inputs_path = comparator_inputs_path
         self._comparator_outputs_path = comparator_outputs_path
+        self._error_stats = None
 
-    def get_tolerance_parameters(self):
-        from polygraphy.comparator import RunResults
+    def get_error_stats(self) -> List[Dict[str, OutputErrorStat]]:
+        """Error statistics of outputs for each pair of compared runners and each iteration; loaded once."""
+        if self._error_stats is None:
+            from polygraphy.comparator import RunResults
+
+            run_results = RunResults.load(self._comparator_outputs_path)
+            comparisons = [(i, i + 1) for i in range(len(run_results) - 1)]
+
+            self._error_stats = []
+            for runner0_index, runner1_index in comparisons:
+                # run_results is list of tuples (<name>, <results>)
+                (_, results0), (_, results1) = run_results[runner0_index], run_results[runner1_index]
+                for result0, result1 in zip(results0, results1):
+                    self._error_stats.append(_get_error_stats(result0, result1))
+
+        return self._error_stats
 
+    def get_tolerance_parameters(self):
         MAX_RTOL = 0.05  # max 5% difference
         MAX_REL_COMPARING_ATOL_TO_MAX_ABS_OUTPUT = 0.01  # atol can be max 1% of max of abs of all outputs
 
-        run_results = RunResults.load(self._comparator_outputs_path)
-        comparisons = [(i, i + 1) for i in range(len(run_results) - 1)]
+        error_stats = self.get_error_stats()
 
         value_ranges_per_output = self.get_outputs_value_ranges()
         max_value_per_output = {
@@ -120,14 +204,12 @@ class ToleranceParameterHelper:
         while atol_final is None:
             atol_all_iterations = {}
             rtol_all_iterations = {}
-            for runner0_index, runner1_index in comparisons:
-                # run_results is list of tuples (<name>, <results>)
-                (_, results0), (_, results1) = run_results[runner0_index], run_results[runner1_index]
-                for result0, result1 in zip(results0, results1):
-                    atol, rtol = _get_recommended_tolerance_params(result0, result1, std_coeff=std_coeff)
-                    for name, tol in atol.items():
-                        atol_all_iterations.setdefault(name, []).append(tol)
-                        rtol_all_iterations.setdefault(name, []).append(rtol[name])
+            # diff arrays and statistics are cached by error stats - only the thresholds are computed per std_coeff
+            for output_stats in error_stats:
+                atol, rtol = _get_recommended_tolerance_params_from_stats(output_stats, std_coeff=std_coeff)
+                for name, tol in atol.items():
+                    atol_all_iterations.setdefault(name, []).append(tol)
+                    rtol_all_iterations.setdefault(name, []).append(rtol[name])
 
             def fractional_ceil(a, precision=0):
                 return np.true_divide(np.ceil(a * 10**precision), 10**precision)
@@ -160,19 +242,10 @@ class ToleranceParameterHelper:
         return atol_final, rtol_final
 
     def get_outputs_value_ranges(self):
-        from polygraphy.comparator import RunResults
-
-        run_results = RunResults.load(self._comparator_outputs_path)
-        comparisons = [(i, i + 1) for i in range(len(run_results) - 1)]
-
         output_values_range_all_iterations = {}
-        for runner0_index, runner1_index in comparisons:
-            # run_results is list of tuples (<name>, <results>)
-            (_, results0), (_, results1) = run_results[runner0_index], run_results[runner1_index]
-            for result0, result1 in zip(results0, results1):
-                values_range = _get_values_range(result0, result1)
-                for name, value_range in values_range.items():
-                    output_values_range_all_iterations.setdefault(name, []).append(value_range)
+        for output_stats in self.get_error_stats():
+            for name, stat in output_stats.items():
+                output_values_range_all_iterations.setdefault(name, []).append((stat.min_out(), stat.max_out()))
 
         out_values_ranges = {
             name: (np.amin([vr[0] for vr in value_ranges]), np.amax([vr[1] for vr in value_ranges]))
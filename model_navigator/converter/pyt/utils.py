@@ -25,7 +25,7 @@ def numpy_to_torch_type(dtype):
     # pytype: enable=import-error
 
     return {
-        np.bool: torch.bool,
+        np.bool_: torch.bool,
         np.uint8: torch.uint8,
         np.int8: torch.int8,
         np.int16: torch.int16,
@@ -14,8 +14,9 @@
 import abc
 import logging
 import shutil
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from model_navigator.converter.config import ComparatorConfig, ConversionConfig
 from model_navigator.converter.dataloader import Dataloader
@@ -29,7 +30,7 @@ from model_navigator.converter.utils import KEY_VALUE_SEP, PARAMETERS_SEP, exten
 from model_navigator.exceptions import ModelNavigatorConverterException
 from model_navigator.model import Model, ModelConfig, ModelSignatureConfig
 from model_navigator.results import State, Status
-from model_navigator.utils.config import YamlConfigFile
+from model_navigator.utils.config import YamlConfigFile, dataclass2dict
 
 LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +58,16 @@ class BaseConvertCommand(abc.ABC):
     def file_suffix(self):
         return None
 
+    @property
+    def cache_params(self) -> Optional[Dict]:
+        """Parameters affecting the output of the command. Outputs are stored in the conversion cache only if defined."""
+        return None
+
+    @property
+    def cache_packages(self) -> Tuple[str, ...]:
+        """Distributions which versions affect the output of the command."""
+        return ()
+
     @abc.abstractmethod
     def transform(self, executor, model: ModelConfig, *, verbose: int = 0) -> ConversionResult:
         pass
@@ -199,15 +210,22 @@ class ONNX2TRTCommand(BaseConvertCommand):
         output_path = executor.get_output_path(model, self)
         log_path = Path(f"{output_path}.log")
 
-        onnx2trt(
-            input_path=model.model_path,
-            output_path=output_path,
-            log_path=log_path,
-            tensorrt_config=self._conversion_config.tensorrt_config,
-            dataloader=self._dataloader,
-            rtol=self._comparator_config.rtol,
-            atol=self._comparator_config.atol,
-            verbose=bool(verbose),
+        executor.run_conversion(
+            self,
+            model,
+            output_path,
+            log_path,
+            partial(
+                onnx2trt,
+                input_path=model.model_path,
+                output_path=output_path,
+                log_path=log_path,
+                tensorrt_config=self._conversion_config.tensorrt_config,
+                dataloader=self._dataloader,
+                rtol=self._comparator_config.rtol,
+                atol=self._comparator_config.atol,
+                verbose=bool(verbose),
+            ),
         )
 
         model_name = extend_model_name(model.model_name, transform_name=self.name)
@@ -231,6 +249,21 @@ class ONNX2TRTCommand(BaseConvertCommand):
     def file_suffix(self):
         return ".plan"
 
+    @property
+    def cache_params(self) -> Optional[Dict]:
+        return {
+            "tensorrt_config": dataclass2dict(self._conversion_config.tensorrt_config),
+            "min_shapes": self._dataloader.min_shapes,
+            "opt_shapes": self._dataloader.opt_shapes,
+            "max_shapes": self._dataloader.max_shapes,
+            "rtol": self._comparator_config.rtol,
+            "atol": self._comparator_config.atol,
+        }
+
+    @property
+    def cache_packages(self) -> Tuple[str, ...]:
+        return ("tensorrt", "polygraphy")
+
 
 class TorchScript2ONNXCommand(BaseConvertCommand):
     def __init__(
@@ -306,14 +339,21 @@ class TorchTensorRTCommand(BaseConvertCommand):
         output_path = executor.get_output_path(model, self)
         log_path = Path(f"{output_path}.log")
 
-        ts2torchtrt(
-            input_path=model.model_path,
-            output_path=output_path,
-            log_path=log_path,
-            dataloader=self._dataloader,
-            signature_config=self._signature_config,
-            tensorrt_config=self._conversion_config.tensorrt_config,
-            verbose=bool(verbose),
+        executor.run_conversion(
+            self,
+            model,
+            output_path,
+            log_path,
+            partial(
+                ts2torchtrt,
+                input_path=model.model_path,
+                output_path=output_path,
+                log_path=log_path,
+                dataloader=self._dataloader,
+                signature_config=self._signature_config,
+                tensorrt_config=self._conversion_config.tensorrt_config,
+                verbose=bool(verbose),
+            ),
         )
 
         model_name = extend_model_name(model.model_name, transform_name=self.name)
@@ -335,6 +375,21 @@ class TorchTensorRTCommand(BaseConvertCommand):
     def file_suffix(self):
         return ".pt"
 
+    @property
+    def cache_params(self) -> Optional[Dict]:
+        return {
+            "tensorrt_config": dataclass2dict(self._conversion_config.tensorrt_config),
+            "signature_config": dataclass2dict(self._signature_config) if self._signature_config else None,
+            "min_shapes": self._dataloader.min_shapes,
+            "opt_shapes": self._dataloader.opt_shapes,
+            "max_shapes": self._dataloader.max_shapes,
+            "dtypes": self._dataloader.dtypes,
+        }
+
+    @property
+    def cache_packages(self) -> Tuple[str, ...]:
+        return ("tensorrt", "torch", "torch-tensorrt")
+
 
 class TFSavedModel2ONNXTransform(BaseConvertCommand):
     def __init__(
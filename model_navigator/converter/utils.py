@@ -84,13 +84,15 @@ def _handle_subprocess_output(p, log_file, verbose):
 
 
 @contextlib.contextmanager
-def navigator_subprocess(*, log_file=None, verbose: bool = False):
+def navigator_subprocess(*, log_file=None, verbose: bool = False, inherit_env: bool = False):
     tf_cpp_min_log_level = 0 if verbose else 2
     envs = {
         "TF_CPP_MIN_LOG_LEVEL": str(tf_cpp_min_log_level),
         "TF_ENABLE_DEPRECATION_WARNINGS": "0",
         "PYRO_FLAME_ENABLED": "1",
     }
+    if inherit_env:
+        envs = {**os.environ, **envs}
 
     msg = None
     Pyro4.config.SERIALIZER = "pickle"  # pytype: disable=module-attr
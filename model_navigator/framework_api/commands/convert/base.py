@@ -11,9 +11,66 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
 
 from model_navigator.framework_api.commands.export.base import ExportBase
+from model_navigator.framework_api.utils import is_gpu_runtime
+from model_navigator.model import Format
+from model_navigator.utils.conversion_cache import ConversionCache
 
 
 class ConvertBase(ExportBase):
-    pass
+    fingerprint_params = (
+        "input_metadata",
+        "opset",
+        "precision_mode",
+        "max_workspace_size",
+        "minimum_segment_size",
+        "trt_profile",
+        "target_device",
+        "batch_dim",
+    )
+    reproduce_script_names = ("reproduce_conversion.sh", "reproduce_conversion.py")
+
+    def is_exclusive(self) -> bool:
+        return False
+
+    def get_input_relative_path(self) -> Path:
+        """Path of the input (source) model relative to the workdir."""
+        raise NotImplementedError
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        return [self.get_input_relative_path(), Path("model_input")]
+
+    def uses_gpu(self, target_device: str = "cpu", **kwargs) -> bool:
+        return is_gpu_runtime(self.target_format, self.runtime_provider, target_device)
+
+    def _run_conversion(
+        self,
+        conversion_cache: Optional[ConversionCache],
+        input_model_path: Path,
+        converted_model_path: Path,
+        params: Dict,
+        packages: Sequence[str],
+        convert_fn: Callable[[], None],
+    ) -> None:
+        """Execute convert_fn producing converted_model_path or restore the model from the conversion cache."""
+        if conversion_cache is None:
+            convert_fn()
+            return
+
+        key = conversion_cache.get_key(
+            input_model_path,
+            converter=self.name,
+            params=params,
+            packages=packages,
+            uses_gpu=self.target_format in (Format.TENSORRT, Format.TORCH_TRT, Format.TF_TRT),
+        )
+        # reproduction scripts are written by convert_fn, so they are kept with the converted model
+        reproduce_script_paths = [converted_model_path.parent / name for name in self.reproduce_script_names]
+        if conversion_cache.get(key, converted_model_path, extra_paths=reproduce_script_paths):
+            return
+
+        convert_fn()
+        conversion_cache.put(key, converted_model_path, extra_paths=reproduce_script_paths)
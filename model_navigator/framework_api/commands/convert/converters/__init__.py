@@ -11,3 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+from model_navigator.framework_api.package_utils import is_tf_available, is_torch_available, lazy_modules_getattr
+
+# converters import the frameworks, so they are imported when the conversion is executed
+__getattr__ = lazy_modules_getattr(
+    __name__,
+    {
+        "ts2torchtrt": (f"{__name__}.ts2torchtrt", is_torch_available),
+        "sm2tftrt": (f"{__name__}.sm2tftrt", is_tf_available),
+    },
+)
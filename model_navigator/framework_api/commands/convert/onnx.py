@@ -15,7 +15,6 @@ from distutils.version import LooseVersion
 from pathlib import Path
 from typing import Optional, Tuple
 
-from polygraphy.backend.onnxrt import SessionFromOnnx
 from polygraphy.backend.trt import Profile
 
 from model_navigator.framework_api.exceptions import UserError
@@ -24,10 +23,11 @@ from model_navigator.framework_api.commands.convert.base import ConvertBase
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.execution_context import ExecutionContext
 from model_navigator.framework_api.logger import LOGGER
-from model_navigator.framework_api.runners.onnx import OnnxrtRunner
 from model_navigator.framework_api.utils import Framework, Status, format_to_relative_model_path
 from model_navigator.model import Format
 from model_navigator.utils import devices, tensorrt
+from model_navigator.utils.conversion_cache import ConversionCache
+from model_navigator.utils.formats.onnx import inspect_onnx_graph
 
 
 class ConvertONNX2TRT(ConvertBase):
@@ -52,6 +52,14 @@ class ConvertONNX2TRT(ConvertBase):
         self.jit_compile = jit_compile
         # pytype: enable=wrong-arg-types
 
+    def get_input_relative_path(self) -> Path:
+        # ONNX model exported from the source model or copied from the source ONNX model
+        return format_to_relative_model_path(
+            format=Format.ONNX,
+            enable_xla=self.enable_xla,
+            jit_compile=self.jit_compile,
+        )
+
     def __call__(
         self,
         workdir: Path,
@@ -61,6 +69,7 @@ class ConvertONNX2TRT(ConvertBase):
         trt_profile: Profile,
         verbose: bool,
         max_workspace_size: Optional[int] = None,
+        conversion_cache: Optional[ConversionCache] = None,
         **kwargs,
     ) -> Optional[Path]:
         LOGGER.info("ONNX to TRT conversion started")
@@ -94,10 +103,8 @@ class ConvertONNX2TRT(ConvertBase):
             return
         converted_model_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with ExecutionContext(workdir=workdir):
-            onnx_runner = OnnxrtRunner(SessionFromOnnx(input_model_path.as_posix(), providers=[target_device]))
-            with onnx_runner:
-                onnx_input_metadata = onnx_runner.get_input_metadata()
+        # graph inputs are read without loading the weights; cached for the conversions to other precisions
+        onnx_input_metadata = inspect_onnx_graph(input_model_path).inputs
 
         convert_cmd = ["polygraphy", "convert", input_model_path.relative_to(workdir).as_posix()]
         convert_cmd.extend(["--convert-to", "trt"])
@@ -139,11 +146,22 @@ class ConvertONNX2TRT(ConvertBase):
             else:
                 convert_cmd.extend(["--pool-limit", f"workspace:{max_workspace_size}"])
 
-        with ExecutionContext(
-            workdir=workdir,
-            cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
-            verbose=verbose,
-        ) as context:
-            context.execute_cmd(convert_cmd)
+        def _convert():
+            with ExecutionContext(
+                workdir=workdir,
+                cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
+                verbose=verbose,
+            ) as context:
+                context.execute_cmd(convert_cmd)
+
+        # command contains all conversion parameters and paths relative to the workdir
+        self._run_conversion(
+            conversion_cache,
+            input_model_path,
+            converted_model_path,
+            params={"convert_cmd": convert_cmd},
+            packages=("tensorrt", "polygraphy"),
+            convert_fn=_convert,
+        )
 
         return self.get_output_relative_path()
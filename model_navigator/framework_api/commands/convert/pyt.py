@@ -18,8 +18,8 @@ from typing import Optional, Tuple
 from polygraphy.backend.trt import Profile
 
 from model_navigator.converter.config import TensorRTPrecision, TensorRTPrecisionMode
+from model_navigator.framework_api.commands.convert import converters
 from model_navigator.framework_api.commands.convert.base import ConvertBase
-from model_navigator.framework_api.commands.convert.converters import ts2torchtrt
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.commands.export.pyt import ExportPYT2TorchScript
 from model_navigator.framework_api.common import TensorMetadata
@@ -28,6 +28,7 @@ from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.utils import JitType, Status, parse_kwargs_to_cmd
 from model_navigator.model import Format
 from model_navigator.utils import devices, tensorrt
+from model_navigator.utils.conversion_cache import ConversionCache
 
 
 class ConvertTorchScript2TorchTensorRT(ConvertBase):
@@ -43,6 +44,9 @@ class ConvertTorchScript2TorchTensorRT(ConvertBase):
         self.target_jit_type = target_jit_type
         self.target_precision = target_precision
 
+    def get_input_relative_path(self) -> Path:
+        return ExportPYT2TorchScript(target_jit_type=self.target_jit_type).get_output_relative_path()
+
     def __call__(
         self,
         workdir: Path,
@@ -54,6 +58,7 @@ class ConvertTorchScript2TorchTensorRT(ConvertBase):
         target_device: str,
         verbose: bool,
         debug: bool,
+        conversion_cache: Optional[ConversionCache] = None,
         **kwargs,
     ) -> Optional[Path]:
         LOGGER.info("Conversion TorchScript to TorchTensorRT started")
@@ -62,9 +67,7 @@ class ConvertTorchScript2TorchTensorRT(ConvertBase):
 
         import torch_tensorrt  # pytype: disable=import-error # noqa: F401
 
-        exported_model_path = (
-            workdir / ExportPYT2TorchScript(target_jit_type=self.target_jit_type).get_output_relative_path()
-        )
+        exported_model_path = workdir / self.get_input_relative_path()
         converted_model_path = workdir / self.get_output_relative_path()
         if converted_model_path.exists():
             LOGGER.info("Model already exists. Skipping conversion.")
@@ -78,27 +81,36 @@ class ConvertTorchScript2TorchTensorRT(ConvertBase):
 
         input_dtypes_str = [tensorrt.cast_type(input_spec.dtype).name for input_spec in input_metadata.values()]
 
-        with ExecutionContext(
-            workdir=workdir,
-            script_path=converted_model_path.parent / "reproduce_conversion.py",
-            cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
-            verbose=verbose,
-        ) as context:
-            kwargs = {
-                "exported_model_path": exported_model_path.relative_to(workdir).as_posix(),
-                "converted_model_path": converted_model_path.relative_to(workdir).as_posix(),
-                "shapes": {name: vars(shape_tuple) for name, shape_tuple in trt_profile.items()},
-                "input_dtypes": input_dtypes_str,
-                "max_workspace_size": max_workspace_size,
-                "precision": self.target_precision.value,
-                "precision_mode": precision_mode.value,
-                "target_device": target_device,
-                "navigator_workdir": workdir.as_posix(),
-                "debug": debug,
-            }
+        kwargs = {
+            "exported_model_path": exported_model_path.relative_to(workdir).as_posix(),
+            "converted_model_path": converted_model_path.relative_to(workdir).as_posix(),
+            "shapes": {name: vars(shape_tuple) for name, shape_tuple in trt_profile.items()},
+            "input_dtypes": input_dtypes_str,
+            "max_workspace_size": max_workspace_size,
+            "precision": self.target_precision.value,
+            "precision_mode": precision_mode.value,
+            "target_device": target_device,
+            "navigator_workdir": workdir.as_posix(),
+            "debug": debug,
+        }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+        def _convert():
+            with ExecutionContext(
+                workdir=workdir,
+                script_path=converted_model_path.parent / "reproduce_conversion.py",
+                cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
+                verbose=verbose,
+            ) as context:
+                args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+                context.execute_external_runtime_script(converters.ts2torchtrt.__file__, args)
 
-            context.execute_external_runtime_script(ts2torchtrt.__file__, args)
+        self._run_conversion(
+            conversion_cache,
+            exported_model_path,
+            converted_model_path,
+            params={name: value for name, value in kwargs.items() if name not in ("navigator_workdir", "debug")},
+            packages=("tensorrt", "torch", "torch-tensorrt"),
+            convert_fn=_convert,
+        )
 
         return self.get_output_relative_path()
@@ -16,14 +16,15 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 from model_navigator.converter.config import TensorRTPrecision
+from model_navigator.framework_api.commands.convert import converters
 from model_navigator.framework_api.commands.convert.base import ConvertBase
-from model_navigator.framework_api.commands.convert.converters import sm2tftrt
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.execution_context import ExecutionContext
 from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.utils import Status, format_to_relative_model_path, parse_kwargs_to_cmd
 from model_navigator.model import Format
 from model_navigator.utils import devices
+from model_navigator.utils.conversion_cache import ConversionCache
 
 
 class ConvertSavedModel2ONNX(ConvertBase):
@@ -41,20 +42,24 @@ class ConvertSavedModel2ONNX(ConvertBase):
         self.jit_compile = jit_compile
         # pytype: enable=wrong-arg-types
 
+    def get_input_relative_path(self) -> Path:
+        return format_to_relative_model_path(
+            format=Format.TF_SAVEDMODEL,
+            enable_xla=self.enable_xla,
+            jit_compile=self.jit_compile,
+        )
+
     def __call__(
         self,
         workdir: Path,
         opset: int,
         model_name: str,
         verbose: bool,
+        conversion_cache: Optional[ConversionCache] = None,
         **kwargs,
     ):
         LOGGER.info("SavedModel to ONNX conversion started")
-        exported_model_path = workdir / format_to_relative_model_path(
-            format=Format.TF_SAVEDMODEL,
-            enable_xla=self.enable_xla,
-            jit_compile=self.jit_compile,
-        )
+        exported_model_path = workdir / self.get_input_relative_path()
 
         converted_model_path = workdir / self.get_output_relative_path()
 
@@ -78,12 +83,23 @@ class ConvertSavedModel2ONNX(ConvertBase):
             str(opset),
         ]
 
-        with ExecutionContext(
-            workdir=workdir,
-            cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
-            verbose=verbose,
-        ) as context:
-            context.execute_cmd(convert_cmd)
+        def _convert():
+            with ExecutionContext(
+                workdir=workdir,
+                cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
+                verbose=verbose,
+            ) as context:
+                context.execute_cmd(convert_cmd)
+
+        # command contains all conversion parameters and paths relative to the workdir
+        self._run_conversion(
+            conversion_cache,
+            exported_model_path,
+            converted_model_path,
+            params={"convert_cmd": convert_cmd},
+            packages=("tensorflow", "tf2onnx"),
+            convert_fn=_convert,
+        )
 
         return self.get_output_relative_path()
 
@@ -108,6 +124,13 @@ class ConvertSavedModel2TFTRT(ConvertBase):
         self.jit_compile = jit_compile
         # pytype: enable=wrong-arg-types
 
+    def get_input_relative_path(self) -> Path:
+        return format_to_relative_model_path(
+            format=Format.TF_SAVEDMODEL,
+            enable_xla=self.enable_xla,
+            jit_compile=self.jit_compile,
+        )
+
     def __call__(
         self,
         max_workspace_size: int,
@@ -116,17 +139,14 @@ class ConvertSavedModel2TFTRT(ConvertBase):
         model_name: str,
         verbose: bool,
         batch_dim: Optional[int] = None,
+        conversion_cache: Optional[ConversionCache] = None,
         **kwargs,
     ) -> Optional[Path]:
         LOGGER.info("SavedModel to TF-TRT conversion started")
         if not devices.get_available_gpus():
             raise RuntimeError("No GPUs available.")
 
-        exported_model_path = workdir / format_to_relative_model_path(
-            format=Format.TF_SAVEDMODEL,
-            enable_xla=self.enable_xla,
-            jit_compile=self.jit_compile,
-        )
+        exported_model_path = workdir / self.get_input_relative_path()
         converted_model_path = workdir / self.get_output_relative_path()
         converted_model_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -138,24 +158,33 @@ class ConvertSavedModel2TFTRT(ConvertBase):
             self.status = Status.SKIPPED
             return
 
-        with ExecutionContext(
-            workdir=workdir,
-            script_path=converted_model_path.parent / "reproduce_conversion.py",
-            cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
-            verbose=verbose,
-        ) as context:
-            kwargs = {
-                "exported_model_path": exported_model_path.relative_to(workdir).as_posix(),
-                "converted_model_path": converted_model_path.relative_to(workdir).as_posix(),
-                "max_workspace_size": max_workspace_size,
-                "target_precision": self.target_precision.value,
-                "minimum_segment_size": minimum_segment_size,
-                "batch_dim": batch_dim,
-                "navigator_workdir": workdir.as_posix(),
-            }
-
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
-
-            context.execute_external_runtime_script(sm2tftrt.__file__, args)
+        kwargs = {
+            "exported_model_path": exported_model_path.relative_to(workdir).as_posix(),
+            "converted_model_path": converted_model_path.relative_to(workdir).as_posix(),
+            "max_workspace_size": max_workspace_size,
+            "target_precision": self.target_precision.value,
+            "minimum_segment_size": minimum_segment_size,
+            "batch_dim": batch_dim,
+            "navigator_workdir": workdir.as_posix(),
+        }
+
+        def _convert():
+            with ExecutionContext(
+                workdir=workdir,
+                script_path=converted_model_path.parent / "reproduce_conversion.py",
+                cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
+                verbose=verbose,
+            ) as context:
+                args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+                context.execute_external_runtime_script(converters.sm2tftrt.__file__, args)
+
+        self._run_conversion(
+            conversion_cache,
+            exported_model_path,
+            converted_model_path,
+            params={name: value for name, value in kwargs.items() if name != "navigator_workdir"},
+            packages=("tensorflow", "tensorrt"),
+            convert_fn=_convert,
+        )
 
         return self.get_output_relative_path()
@@ -16,4 +16,5 @@ from model_navigator.framework_api.commands.export.base import ExportBase
 
 
 class CopyBase(ExportBase):
-    pass
+    def is_exclusive(self) -> bool:
+        return False
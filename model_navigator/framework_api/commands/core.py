@@ -14,6 +14,7 @@
 
 import json
 import logging
+import threading
 import traceback
 import typing
 from abc import ABCMeta, abstractmethod
@@ -23,12 +24,14 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional,
 
 import typing_inspect
 
+from model_navigator.framework_api.common import DataObject
 from model_navigator.framework_api.exceptions import UserError
 from model_navigator.framework_api.logger import LOGGER, get_logger_names
 from model_navigator.framework_api.utils import Parameter, Status, format_to_relative_model_path
 from model_navigator.model import Format
 
 if TYPE_CHECKING:
+    from model_navigator.framework_api.incremental import IncrementalState
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
 
 
@@ -44,10 +47,14 @@ class CommandType(Parameter):
     INFER_MODEL_OUTPUT = "infer-model-output"
     CUSTOM = "custom"
     PERFORMANCE = "performance"
+    TUNING = "tuning"
     COPY = "copy"
 
 
 class Command(metaclass=ABCMeta):
+    # names of the parameters determining the result of the command; None if the command is always executed
+    fingerprint_params: Optional[Tuple[str, ...]] = None
+
     def __init__(
         self,
         name: str,
@@ -62,6 +69,7 @@ class Command(metaclass=ABCMeta):
         self.output: Any = None
         self.err_msg: Optional[str] = None
         self.status = Status.INITIALIZED
+        self.fingerprint: Optional[str] = None
         self._requires = requires
 
     def _update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs) -> None:
@@ -70,6 +78,18 @@ class Command(metaclass=ABCMeta):
     def __getattr__(self, item):
         return None
 
+    @property
+    def requires(self) -> Tuple["Command", ...]:
+        return self._requires
+
+    def is_exclusive(self) -> bool:
+        """Command has to be executed when no other command is running."""
+        return False
+
+    def uses_gpu(self, **kwargs) -> bool:
+        """Command occupies GPU during the execution."""
+        return False
+
     def get_formatted_command_details(
         self,
     ):
@@ -129,6 +149,10 @@ class Command(metaclass=ABCMeta):
             LOGGER.warning(f"Logging input parameters for Command {self.name} failed:\n{traceback.format_exc()}")
 
     def transform(self, package_descriptor: "PackageDescriptor", **kwargs):
+        self.execute(**kwargs)
+        self.update_package_descriptor(package_descriptor, **kwargs)
+
+    def execute(self, **kwargs):
         workdir = kwargs.get("workdir")
         self._attach_logger_to_command_log_file(loggers=self._get_loggers(), workdir=workdir)
         self.status = self._validate(**kwargs)
@@ -136,7 +160,9 @@ class Command(metaclass=ABCMeta):
             try:
                 if self.status == Status.OK:
                     self.log_command_params(kwargs)
-                    self.output = self.__call__(**kwargs)
+                    if not self._reuse_previous_output(**kwargs):
+                        self.output = self.__call__(**kwargs)
+                        self._record_output(**kwargs)
                     assert self.status in (Status.OK, Status.SKIPPED), self.err_msg
                 else:
                     self.missing_params = self._get_missing_params(**kwargs)
@@ -159,9 +185,58 @@ class Command(metaclass=ABCMeta):
 
         else:
             self.status = Status.SKIPPED
-        self._update_package_descriptor(package_descriptor, **kwargs)
         self._detach_logger_from_command_log_file(self._get_loggers())
 
+    def get_fingerprint_params(self, **kwargs) -> Optional[Dict[str, Any]]:
+        """Parameters determining the result of the command; None if the command is always executed."""
+        if self.fingerprint_params is None:
+            return None
+        return {name: kwargs.get(name) for name in self.fingerprint_params}
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        """Paths relative to the workdir which content determines the result of the command."""
+        return []
+
+    def dump_output(self, output: Any) -> Any:
+        """JSON serializable form of the output recorded in the incremental mode."""
+        return DataObject.parse_value(output)
+
+    def load_output(self, data: Any) -> Any:
+        return data
+
+    def is_output_available(self, workdir: Path, output: Any) -> bool:
+        """Check if the output recorded in the previous execution can be still used."""
+        return True
+
+    def discard_output(self, workdir: Path) -> None:
+        """Remove the output of the previous execution which inputs have changed."""
+        pass
+
+    def _reuse_previous_output(
+        self, workdir: Path, incremental_state: Optional["IncrementalState"] = None, **kwargs
+    ) -> bool:
+        if incremental_state is None:
+            return False
+        self.fingerprint = incremental_state.get_fingerprint(self, workdir=workdir, **kwargs)
+        if self.fingerprint is None:
+            return False
+
+        found, output = incremental_state.get_output(self, self.fingerprint)
+        if found and self.is_output_available(workdir, output):
+            LOGGER.info(f"Inputs of {self.name} have not changed since its last execution. Reusing its results.")
+            self.output = output
+            return True
+
+        self.discard_output(workdir)
+        return False
+
+    def _record_output(self, incremental_state: Optional["IncrementalState"] = None, **kwargs) -> None:
+        if incremental_state is not None and self.fingerprint is not None and self.status == Status.OK:
+            incremental_state.record(self, self.fingerprint, self.output)
+
+    def update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs):
+        self._update_package_descriptor(package_descriptor, **kwargs)
+
     def _check_requires(self):
         for req in self._requires:
             if req.status != Status.OK:
@@ -239,6 +314,9 @@ class Command(metaclass=ABCMeta):
             self.log_file_handler.setLevel(logging.DEBUG)
             formatter = logging.Formatter(log_format)
             self.log_file_handler.setFormatter(formatter)
+            # collect only logs of this command when commands are executed concurrently
+            thread_id = threading.get_ident()
+            self.log_file_handler.addFilter(lambda record: record.thread == thread_id)
             LOGGER.addHandler(self.log_file_handler)
 
             for logger in loggers:
@@ -254,6 +332,6 @@ class Command(metaclass=ABCMeta):
         for logger in loggers:
             if isinstance(logger, str):
                 logger = logging.getLogger(logger)
-            logger.handlers = [h for h in logger.handlers if h != self.log_file_handler]
+            logger.removeHandler(self.log_file_handler)
         LOGGER.removeHandler(self.log_file_handler)
         self.log_file_handler = None
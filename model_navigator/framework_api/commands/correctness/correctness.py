@@ -16,7 +16,7 @@ import json
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy
 
@@ -31,12 +31,14 @@ from model_navigator.framework_api.utils import (
     RuntimeProvider,
     Status,
     format_to_relative_model_path,
+    is_gpu_runtime,
     parse_kwargs_to_cmd,
 )
 from model_navigator.model import Format
 
 if TYPE_CHECKING:
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
+    from model_navigator.framework_api.runtime_workers import RuntimeWorkers
 
 
 @dataclass
@@ -69,6 +71,17 @@ def get_assert_message(atol: float, rtol: float):
 
 
 class Correctness(Command):
+    fingerprint_params = (
+        "input_metadata",
+        "output_metadata",
+        "target_device",
+        "batch_dim",
+        "rtol",
+        "atol",
+        "max_batch_size",
+        "batched_correctness",
+    )
+
     def __init__(
         self,
         name: str,
@@ -89,6 +102,15 @@ class Correctness(Command):
         self.enable_xla = enable_xla
         self.jit_compile = jit_compile
 
+    def uses_gpu(self, target_device: str = "cpu", **kwargs) -> bool:
+        return is_gpu_runtime(self.target_format, self.runtime_provider, target_device)
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        return [self.get_output_relative_path(), Path("model_input"), Path("model_output")]
+
+    def load_output(self, data: Any) -> Optional[TolerancePerOutputName]:
+        return TolerancePerOutputName.from_json(data) if data is not None else None
+
     def _update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs) -> None:
         runtime_results = package_descriptor.get_runtime_results(
             format=self.target_format,
@@ -116,6 +138,9 @@ class Correctness(Command):
         verbose: bool,
         rtol: Optional[float] = None,
         atol: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        batched_correctness: bool = False,
+        runtime_workers: Optional["RuntimeWorkers"] = None,
         **kwargs,
     ) -> TolerancePerOutputName:
         LOGGER.info(f"Correctness test for: {self.target_format} {self.runtime_provider} started.")
@@ -151,13 +176,15 @@ class Correctness(Command):
                 "enable_xla": self.enable_xla,
                 "jit_compile": self.jit_compile,
                 "runner_manager_dict": runner_manager.to_dict(parse=True),
+                "max_batch_size": max_batch_size if batched_correctness else None,
             }
 
             args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
 
             from model_navigator.framework_api.commands.correctness import correctness_script
 
-            context.execute_external_runtime_script(correctness_script.__file__, args)
+            runtime_worker = runtime_workers.get_worker(self.target_format) if runtime_workers else None
+            context.execute_external_runtime_script(correctness_script.__file__, args, runtime_worker=runtime_worker)
             per_output_tolerance = TolerancePerOutputName.from_json(json.load(temp_file))
 
         def is_diff_within_tol(diff, tol):
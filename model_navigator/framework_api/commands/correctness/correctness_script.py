@@ -20,15 +20,56 @@ from typing import Dict, List, Optional
 
 import fire
 import numpy as np
-from polygraphy.comparator import util as comp_util
 
 from model_navigator.converter.config import TensorRTPrecision
 from model_navigator.framework_api.commands.correctness import Tolerance, TolerancePerOutputName
+from model_navigator.framework_api.common import Sample
 from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.runners.runner_manager import RunnerManager
 from model_navigator.framework_api.utils import Format, JitType, RuntimeProvider, load_samples
 
 
+def _batch_samples(samples: List[Sample], outputs: List[Sample], batch_dim: Optional[int], max_batch_size: int):
+    """Concatenate samples with matching shapes along the batch dimension.
+
+    Yields tuples of batched input sample, batched original output and number of samples in the batch.
+    """
+    if batch_dim is None or max_batch_size <= 1:
+        for sample, output in zip(samples, outputs):
+            yield sample, output, 1
+        return
+
+    groups = {}
+    for sample, output in zip(samples, outputs):
+        key = tuple((name, tensor.shape) for name, tensor in {**sample, **output}.items())
+        groups.setdefault(key, []).append((sample, output))
+
+    for group in groups.values():
+        for idx in range(0, len(group), max_batch_size):
+            batch = group[idx : idx + max_batch_size]
+            yield tuple(
+                {name: np.concatenate([item[i][name] for item in batch], axis=batch_dim) for name in batch[0][i]}
+                for i in range(2)
+            ) + (len(batch),)
+
+
+def _per_sample_max(values: np.ndarray, batch_dim: Optional[int], batch_size: int) -> np.ndarray:
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    if batch_dim is None or values.ndim <= batch_dim or values.shape[batch_dim] != batch_size:
+        return np.array([values.max() if values.size else 0.0])
+    values = np.moveaxis(values, batch_dim, 0).reshape(batch_size, -1)
+    if values.shape[1] == 0:
+        return np.zeros(batch_size)
+    return values.max(axis=1)
+
+
+def _update_max(current: float, per_sample_max: np.ndarray) -> float:
+    # samples with NaN difference (e.g. 0 / 0 in the relative difference) are not taken into account
+    per_sample_max = per_sample_max[~np.isnan(per_sample_max)]
+    return max(current, float(per_sample_max.max())) if per_sample_max.size else current
+
+
 def correctness(
     model_name: str,
     output_names: List[str],
@@ -42,6 +83,7 @@ def correctness(
     jit_compile: bool,
     runner_manager_dict: Dict,
     navigator_workdir: Optional[str] = None,
+    max_batch_size: Optional[int] = None,
 ):
     if not navigator_workdir:
         navigator_workdir = pathlib.Path.cwd()
@@ -61,8 +103,9 @@ def correctness(
     )
 
     per_output_tolerance = TolerancePerOutputName({name: Tolerance(0.0, 0.0) for name in output_names})
+    batches = _batch_samples(correctness_samples, correctness_samples_output, batch_dim, max_batch_size or 1)
     with runner:
-        for sample, original_output in zip(correctness_samples, correctness_samples_output):
+        for sample, original_output, batch_size in batches:
             comp_output = runner.infer(sample)
 
             is_len_valid = len(original_output) == len(comp_output)
@@ -71,11 +114,11 @@ def correctness(
                 sys.exit(1)
 
             for name in output_names:
-                if any(np.isnan(comp_output[name]).flatten()):
+                if np.isnan(comp_output[name]).any():
                     LOGGER.error("Comparison output contains NaN")
                     sys.exit(1)
 
-                if any(np.isinf(comp_output[name]).flatten()):
+                if np.isinf(comp_output[name]).any():
                     LOGGER.error("Comparison output contains inf")
                     sys.exit(1)
 
@@ -84,13 +127,12 @@ def correctness(
                 absout1 = np.abs(out1)
 
                 reldiff = absdiff / absout1
-                max_reldiff = comp_util.compute_max(reldiff)
-                max_absdiff = comp_util.compute_max(absdiff)
+                max_reldiff = _per_sample_max(reldiff, batch_dim, batch_size)
+                max_absdiff = _per_sample_max(absdiff, batch_dim, batch_size)
 
-                if max_absdiff > per_output_tolerance[name].atol:
-                    per_output_tolerance[name].atol = float(max_absdiff)
-                if max_reldiff > per_output_tolerance[name].rtol:
-                    per_output_tolerance[name].rtol = float(max_reldiff)
+                tolerance = per_output_tolerance[name]
+                tolerance.atol = _update_max(tolerance.atol, max_absdiff)
+                tolerance.rtol = _update_max(tolerance.rtol, max_reldiff)
 
     results_path = pathlib.Path(results_path)
     with results_path.open("w") as f:
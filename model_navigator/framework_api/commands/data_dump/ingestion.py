@@ -0,0 +1,195 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from polygraphy.backend.trt import Profile
+
+from model_navigator.framework_api.common import Sample
+from model_navigator.framework_api.logger import LOGGER
+from model_navigator.framework_api.utils import Framework, extract_bs1, extract_sample, validate_sample_input
+
+
+class AxisShapes:
+    """Sizes of a tensor axis observed in the samples.
+
+    Sizes are kept as a histogram, so the memory is bounded by the number of distinct sizes
+    and not by the number of samples while min, median and max are exact.
+    """
+
+    def __init__(self, shapes: Iterable[int] = ()):
+        self._counts = Counter()
+        self._num_samples = 0
+        for dim in shapes:
+            self.add(dim)
+
+    def add(self, dim: int) -> None:
+        self._counts[dim] += 1
+        self._num_samples += 1
+
+    @property
+    def min(self) -> int:
+        return min(self._counts)
+
+    @property
+    def max(self) -> int:
+        return max(self._counts)
+
+    @property
+    def median(self) -> float:
+        """Median computed the same way as `numpy.median` - mean of the middle values for an even number of samples."""
+        middle = ((self._num_samples - 1) // 2, self._num_samples // 2)
+        values, position = [], 0
+        for dim in sorted(self._counts):
+            count = self._counts[dim]
+            values.extend(dim for idx in middle if position <= idx < position + count)
+            position += count
+        return sum(values) / len(values)
+
+    def __len__(self) -> int:
+        return self._num_samples
+
+
+AxesShapes = Dict[str, Dict[int, AxisShapes]]
+
+
+def update_axes_shapes(axes_shapes: AxesShapes, sample: Sample) -> None:
+    for name, tensor in sample.items():
+        for ax, dim in enumerate(tensor.shape):
+            axes_shapes[name].setdefault(ax, AxisShapes()).add(dim)
+
+
+@dataclass
+class DataloaderSummary:
+    """Result of the single pass over the dataloader used for metadata inference and samples collection."""
+
+    axes_shapes: AxesShapes
+    correctness_samples: List[Sample]
+    # per input name and axis - (index, size, sample) of the first sample with minimal and maximal size of the axis
+    # within the bounds of the user TRT profile
+    min_max_samples: Dict[str, Dict[int, Dict[str, Tuple[int, int, Sample]]]]
+
+    def __str__(self):
+        shapes = {
+            name: [(shapes.min, shapes.median, shapes.max) for shapes in axes.values()]
+            for name, axes in self.axes_shapes.items()
+        }
+        return f"{{correctness_samples_count: {len(self.correctness_samples)}, axes_min_median_max: {shapes}}}"
+
+    def select_samples(self, trt_profile: Profile) -> Tuple[Sample, List[Sample], List[Sample]]:
+        """Select profiling and conversion samples - the first samples hitting min or max shapes of the profile.
+
+        The profile does not have to match the data range (e.g. it is provided by the user or the min batch size is 1),
+        so the observed sizes closest to the profile min and max within the profile range are used.
+        """
+        conversion_samples = {}
+        profiling_idx = None
+        for name, axes in self.min_max_samples.items():
+            if name not in trt_profile:
+                continue
+            shapes = trt_profile[name]
+            for ax, (min_shape, max_shape) in enumerate(zip(shapes.min, shapes.max)):
+                for key in ("min", "max"):
+                    if key not in axes.get(ax, {}):
+                        continue
+                    idx, dim, sample = axes[ax][key]
+                    if not min_shape <= dim <= max_shape:
+                        continue
+                    conversion_samples[idx] = sample
+                    if key == "max":
+                        profiling_idx = idx if profiling_idx is None else max(profiling_idx, idx)
+
+        conversion_samples_list = [conversion_samples[idx] for idx in sorted(conversion_samples)]
+        if not conversion_samples_list:
+            conversion_samples_list = self.correctness_samples[:1]
+        if profiling_idx is not None:
+            profiling_sample = conversion_samples[profiling_idx]
+        else:
+            profiling_sample = conversion_samples_list[0]
+
+        return profiling_sample, self.correctness_samples, conversion_samples_list
+
+
+def ingest_dataloader(
+    dataloader,
+    input_names: Sequence[str],
+    framework: Framework,
+    batch_dim: Optional[int],
+    sample_count: int,
+    seed: int,
+    check_len: bool = True,
+    trt_profile: Optional[Profile] = None,
+) -> DataloaderSummary:
+    """Iterate the dataloader once and collect shapes statistics and samples.
+
+    Correctness samples are selected with reservoir sampling, what requires memory only for `sample_count` samples.
+    For conversion samples only the first samples with min and max size of each axis are kept. Sizes outside
+    of the user `trt_profile` bounds are skipped, so the extremes within the profile are found.
+    """
+    num_samples = len(dataloader)
+    if sample_count > num_samples:
+        LOGGER.warning(
+            f"Requested sample_count ({sample_count}) is larger than the number of available samples ({num_samples}). Using {num_samples} samples."
+        )
+        sample_count = num_samples
+
+    random_state = np.random.RandomState(seed)
+    axes_shapes = {name: {} for name in input_names}
+    reservoir: List[Tuple[int, Sample]] = []
+    min_max_samples = {name: {} for name in input_names}
+
+    i = -1
+    for i, sample in enumerate(dataloader):
+        if i >= num_samples:
+            LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
+            break
+        validate_sample_input(sample, framework)
+        sample = extract_sample(sample, input_names, framework)
+        update_axes_shapes(axes_shapes, sample)
+
+        sample_bs1 = None
+        if i < sample_count:
+            sample_bs1 = extract_bs1(sample, batch_dim)
+            reservoir.append((i, sample_bs1))
+        else:
+            j = random_state.randint(0, i + 1)
+            if j < sample_count:
+                sample_bs1 = extract_bs1(sample, batch_dim)
+                reservoir[j] = (i, sample_bs1)
+
+        for name, tensor in sample.items():
+            for ax, dim in enumerate(tensor.shape):
+                if trt_profile is not None and name in trt_profile:
+                    shapes = trt_profile[name]
+                    if ax < len(shapes.min) and not shapes.min[ax] <= dim <= shapes.max[ax]:
+                        continue
+                candidates = min_max_samples[name].setdefault(ax, {})
+                is_min = "min" not in candidates or dim < candidates["min"][1]
+                is_max = "max" not in candidates or dim > candidates["max"][1]
+                if (is_min or is_max) and sample_bs1 is None:
+                    sample_bs1 = extract_bs1(sample, batch_dim)
+                if is_min:
+                    candidates["min"] = (i, dim, sample_bs1)
+                if is_max:
+                    candidates["max"] = (i, dim, sample_bs1)
+
+    if check_len:
+        assert i + 1 >= num_samples, f"{len(dataloader)=}, but only {i + 1} samples found."
+
+    correctness_samples = [sample for _, sample in sorted(reservoir, key=lambda item: item[0])]
+    return DataloaderSummary(
+        axes_shapes=axes_shapes, correctness_samples=correctness_samples, min_max_samples=min_max_samples
+    )
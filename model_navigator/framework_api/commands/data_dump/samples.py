@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from pathlib import Path
 from typing import Any, List, Optional, Tuple
 
@@ -21,21 +20,23 @@ from polygraphy.backend.onnxrt import SessionFromOnnx
 from polygraphy.backend.trt import Profile
 
 from model_navigator.framework_api.commands.core import Command, CommandType
-from model_navigator.framework_api.common import Sample, SizedDataLoader, TensorMetadata
+from model_navigator.framework_api.commands.data_dump.ingestion import DataloaderSummary
+from model_navigator.framework_api.common import Sample, TensorMetadata
 from model_navigator.framework_api.exceptions import UserError
 from model_navigator.framework_api.logger import LOGGER
-from model_navigator.framework_api.utils import Framework, extract_bs1, extract_sample, get_available_onnx_providers
+from model_navigator.framework_api.utils import Framework, get_available_onnx_providers
+from model_navigator.utils.sample_store import SampleStoreWriter
 
 
 def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
-    if any(np.isnan(tensor.flatten())):
+    if np.isnan(tensor).any():
         message = "Tensor data contains `NaN` value. Please verify the dataloader and model."
         if raise_on_error:
             raise UserError(message)
         else:
             LOGGER.warning(message)
 
-    if any(np.isinf(tensor.flatten())):
+    if np.isinf(tensor).any():
         message = "Tensor data contains `inf` value. Please verify the dataloader and model."
         if raise_on_error:
             raise UserError(message)
@@ -43,41 +44,21 @@ def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
             LOGGER.warning(message)
 
 
-def samples_to_json(
+def samples_to_store(
     samples: List[Sample], path: Path, batch_dim: Optional[int], *, raise_on_error: bool = True
 ) -> None:
-    flatten_samples = []
-    for sample in samples:
-        sample_data = {}
-        for name, tensor in sample.items():
-            if batch_dim is not None:
-                tensor = tensor.squeeze(batch_dim)
+    with SampleStoreWriter(path) as writer:
+        for sample in samples:
+            squeezed_sample = {}
+            for name, tensor in sample.items():
+                if batch_dim is not None:
+                    tensor = tensor.squeeze(batch_dim)
 
-            _validate_tensor(tensor, raise_on_error=raise_on_error)
+                _validate_tensor(tensor, raise_on_error=raise_on_error)
 
-            sample_data[name] = {
-                "content": tensor.flatten().tolist(),
-                "shape": tensor.shape,
-            }
-        flatten_samples.append(sample_data)
+                squeezed_sample[name] = tensor
 
-    with open(path.as_posix(), "w") as f:
-        json.dump({"data": flatten_samples}, f)
-
-
-def samples_to_npz(samples: List[Sample], path: Path, batch_dim: Optional[int], *, raise_on_error: bool = True) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-    for i, sample in enumerate(samples):
-        squeezed_sample = {}
-        for name, tensor in sample.items():
-            if batch_dim is not None:
-                tensor = tensor.squeeze(batch_dim)
-
-            _validate_tensor(tensor, raise_on_error=raise_on_error)
-
-            squeezed_sample[name] = tensor
-
-        np.savez((path / f"{i}.npz").as_posix(), **squeezed_sample)
+            writer.append(squeezed_sample)
 
 
 class FetchInputModelData(Command):
@@ -92,75 +73,13 @@ class FetchInputModelData(Command):
             "conversion_samples",
         )
 
-    @staticmethod
-    def collect_samples(dataloader, input_metadata, trt_profile, framework, batch_dim, correctness_samples_ind):
-        profiling_sample = None
-        correctness_samples = []
-        conversion_samples = []
-        conversion_min_max_sampled = {
-            name: {ax: {"min": False, "max": False} for ax in range(len(input_metadata[name].shape))}
-            for name in input_metadata
-        }
-        for i, sample in enumerate(dataloader):
-            if i >= len(dataloader):
-                break
-            sample = extract_sample(sample, input_metadata, framework)
-
-            if i in correctness_samples_ind:
-                correctness_samples.append(extract_bs1(sample, batch_dim))
-            do_sample_conversion = False
-            do_sample_profiling = False
-            for name in input_metadata:
-                for (ax, shapes), tensor_dim in zip(
-                    enumerate(zip(trt_profile[name].min, trt_profile[name].opt, trt_profile[name].max)),
-                    sample[name].shape,
-                ):
-                    if tensor_dim == shapes[0] and not conversion_min_max_sampled[name][ax]["min"]:
-                        do_sample_conversion = True
-                        conversion_min_max_sampled[name][ax]["min"] = True
-                    if tensor_dim == shapes[2] and not conversion_min_max_sampled[name][ax]["max"]:
-                        do_sample_conversion = True
-                        conversion_min_max_sampled[name][ax]["max"] = True
-                        do_sample_profiling = True
-
-            if do_sample_conversion:
-                conversion_samples.append(extract_bs1(sample, batch_dim))
-            if do_sample_profiling:
-                profiling_sample = extract_bs1(sample, batch_dim)
-
-        if not conversion_samples:
-            conversion_samples = correctness_samples[:1]
-        if profiling_sample is None:
-            profiling_sample = conversion_samples[0]
-
-        return profiling_sample, correctness_samples, conversion_samples
-
     def __call__(
         self,
-        framework: Framework,
-        dataloader: SizedDataLoader,
-        sample_count: int,
-        input_metadata: TensorMetadata,
-        batch_dim: Optional[int],
-        seed: int,
+        dataloader_summary: DataloaderSummary,
         trt_profile: Profile,
         **kwargs,
-    ) -> Tuple[List[Sample], List[Sample], List[Sample]]:
-
-        num_samples = len(dataloader)
-        if sample_count > num_samples:
-            LOGGER.warning(
-                f"Requested sample_count ({sample_count}) is larger than the number of available samples ({num_samples}). Using {num_samples} samples."
-            )
-            sample_count = num_samples
-
-        np.random.seed(seed)
-        correctness_samples_ind = set(np.random.choice(num_samples, size=sample_count, replace=False))
-        profiling_sample, correctness_samples, conversion_samples = self.collect_samples(
-            dataloader, input_metadata, trt_profile, framework, batch_dim, correctness_samples_ind
-        )
-
-        return profiling_sample, correctness_samples, conversion_samples
+    ) -> Tuple[Sample, List[Sample], List[Sample]]:
+        return dataloader_summary.select_samples(trt_profile)
 
 
 class DumpInputModelData(Command):
@@ -190,7 +109,7 @@ class DumpInputModelData(Command):
             (correctness_samples, "correctness"),
             (conversion_samples, "conversion"),
         ]:
-            samples_to_npz(samples, sample_data_path / dirname, batch_dim, raise_on_error=self._raise_on_error)
+            samples_to_store(samples, sample_data_path / dirname, batch_dim, raise_on_error=self._raise_on_error)
 
 
 class DumpOutputModelData(Command):
@@ -264,7 +183,7 @@ class DumpOutputModelData(Command):
             with runner:
                 outputs = [runner.infer(sample) for sample in samples]
 
-            samples_to_npz(outputs, output_data_path / dirname, batch_dim, raise_on_error=self._raise_on_error)
+            samples_to_store(outputs, output_data_path / dirname, batch_dim, raise_on_error=self._raise_on_error)
             ret.append(outputs)
 
         return tuple(ret)
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, List
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from model_navigator.framework_api.commands.core import Command
 from model_navigator.framework_api.status import ModelStatus, RuntimeResults
@@ -24,6 +26,39 @@ if TYPE_CHECKING:
 
 
 class ExportBase(Command):
+    fingerprint_params = (
+        "model",
+        "model_params",
+        "input_metadata",
+        "output_metadata",
+        "forward_kw_names",
+        "dynamic_axes",
+        "opset",
+        "target_device",
+        "batch_dim",
+    )
+
+    def is_exclusive(self) -> bool:
+        # exports use the source model in the current process
+        return True
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        return [Path("model_input")]
+
+    def load_output(self, data: Any) -> Optional[Path]:
+        return Path(data) if data is not None else None
+
+    def is_output_available(self, workdir: Path, output: Optional[Path]) -> bool:
+        return output is not None and (workdir / output).exists()
+
+    def discard_output(self, workdir: Path) -> None:
+        # commands skip the export when the model exists, so the model exported from changed inputs is removed
+        output_path = workdir / self.get_output_relative_path()
+        if output_path.is_dir():
+            shutil.rmtree(output_path)
+        elif output_path.exists():
+            output_path.unlink()
+
     def _update_package_descriptor(
         self, package_descriptor: "PackageDescriptor", runtimes: List[RuntimeProvider], **kwargs
     ) -> None:
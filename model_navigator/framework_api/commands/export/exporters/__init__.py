@@ -12,16 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from model_navigator.framework_api.package_utils import is_jax_available, is_tf_available, is_torch_available
+from model_navigator.framework_api.package_utils import (
+    is_jax_available,
+    is_tf_available,
+    is_torch_available,
+    lazy_modules_getattr,
+)
 
-if is_torch_available():
-    from model_navigator.framework_api.commands.export.exporters import pytorch2onnx, pytorch2torchscript  # noqa: F401
-
-if is_tf_available():
-    from model_navigator.framework_api.commands.export.exporters import (  # noqa: F401
-        keras2savedmodel,
-        savedmodel2savedmodel,
-    )
-
-if is_tf_available and is_jax_available():
-    from model_navigator.framework_api.commands.export.exporters import jax2savedmodel  # noqa: F401
+# exporters import the frameworks, so they are imported when the export is executed
+__getattr__ = lazy_modules_getattr(
+    __name__,
+    {
+        "pytorch2onnx": (f"{__name__}.pytorch2onnx", is_torch_available),
+        "pytorch2torchscript": (f"{__name__}.pytorch2torchscript", is_torch_available),
+        "keras2savedmodel": (f"{__name__}.keras2savedmodel", is_tf_available),
+        "savedmodel2savedmodel": (f"{__name__}.savedmodel2savedmodel", is_tf_available),
+        "jax2savedmodel": (f"{__name__}.jax2savedmodel", lambda: is_tf_available() and is_jax_available()),
+    },
+)
@@ -13,9 +13,7 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Optional, Tuple
-
-import tensorflow as tf  # pytype: disable=import-error
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.commands.export import exporters
@@ -26,6 +24,9 @@ from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.utils import parse_kwargs_to_cmd
 from model_navigator.model import Format
 
+if TYPE_CHECKING:
+    import tensorflow as tf  # pytype: disable=import-error
+
 
 class ExportJAX2SavedModel(ExportBase):
     def __init__(self, jit_compile: bool, enable_xla: bool, requires: Tuple[Command, ...] = ()):
@@ -45,7 +46,7 @@ class ExportJAX2SavedModel(ExportBase):
         workdir: Path,
         input_metadata: TensorMetadata,
         verbose: bool,
-        model: Optional[tf.keras.Model] = None,
+        model: Optional["tf.keras.Model"] = None,
         batch_dim: Optional[int] = 0,
         **kwargs,
     ) -> Optional[Path]:
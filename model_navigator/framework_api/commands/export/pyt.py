@@ -13,9 +13,7 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Optional, Tuple
-
-import torch  # pytype: disable=import-error
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.commands.export import exporters
@@ -26,6 +24,9 @@ from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.utils import JitType, parse_kwargs_to_cmd
 from model_navigator.model import Format
 
+if TYPE_CHECKING:
+    import torch  # pytype: disable=import-error
+
 
 class ExportPYT2TorchScript(ExportBase):
     def __init__(self, target_jit_type: JitType, requires: Tuple[Command, ...] = ()):
@@ -43,7 +44,7 @@ class ExportPYT2TorchScript(ExportBase):
         model_name: str,
         target_device: str,
         verbose: bool,
-        model: Optional[torch.nn.Module] = None,
+        model: Optional["torch.nn.Module"] = None,
         batch_dim: Optional[int] = None,
         **kwargs,
     ) -> Optional[Path]:
@@ -103,7 +104,7 @@ class ExportPYT2ONNX(ExportBase):
         target_device: str,
         verbose: bool,
         forward_kw_names: Optional[Tuple[str, ...]] = None,
-        model: Optional[torch.nn.Module] = None,
+        model: Optional["torch.nn.Module"] = None,
         batch_dim: Optional[int] = None,
         **kwargs,
     ) -> Optional[Path]:
@@ -13,9 +13,7 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Optional, Tuple
-
-import tensorflow as tf  # pytype: disable=import-error
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from model_navigator.framework_api.commands.core import Command, CommandType
 from model_navigator.framework_api.commands.export import exporters
@@ -26,6 +24,9 @@ from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.utils import parse_kwargs_to_cmd
 from model_navigator.model import Format
 
+if TYPE_CHECKING:
+    import tensorflow as tf  # pytype: disable=import-error
+
 
 class ExportTF2SavedModel(ExportBase):
     def __init__(self, requires: Tuple[Command, ...] = ()):
@@ -38,7 +39,7 @@ class ExportTF2SavedModel(ExportBase):
 
     def __call__(
         self,
-        model: tf.keras.Model,
+        model: "tf.keras.Model",
         model_name: str,
         input_metadata: TensorMetadata,
         output_metadata: TensorMetadata,
@@ -82,6 +83,9 @@ class ExportTF2SavedModel(ExportBase):
 
 
 class UpdateSavedModelSignature(ExportBase):
+    # model is updated in place
+    fingerprint_params = None
+
     def __init__(self, requires: Tuple[Command, ...] = ()):
         super().__init__(
             name="Update SavedModel Signature",
@@ -105,6 +109,8 @@ class UpdateSavedModelSignature(ExportBase):
         assert exported_model_path.exists()
         exported_model_path.parent.mkdir(parents=True, exist_ok=True)
 
+        import tensorflow as tf  # pytype: disable=import-error
+
         exporters.savedmodel2savedmodel.get_model = lambda: tf.keras.models.load_model(exported_model_path)
 
         with ExecutionContext(
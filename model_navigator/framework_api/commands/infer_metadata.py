@@ -15,11 +15,17 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-import numpy as np
 from polygraphy.backend.onnxrt import SessionFromOnnx
 from polygraphy.backend.trt import Profile
 
 from model_navigator.framework_api.commands.core import Command, CommandType
+from model_navigator.framework_api.commands.data_dump.ingestion import (
+    AxesShapes,
+    AxisShapes,
+    DataloaderSummary,
+    ingest_dataloader,
+    update_axes_shapes,
+)
 from model_navigator.framework_api.common import Sample, SizedDataLoader, TensorMetadata
 from model_navigator.framework_api.execution_context import ExecutionContext
 from model_navigator.framework_api.exceptions import UserError
@@ -35,6 +41,7 @@ from model_navigator.framework_api.utils import (
     validate_sample_input,
 )
 from model_navigator.tensor import TensorSpec
+from model_navigator.utils.formats.onnx import inspect_onnx_graph
 
 if TYPE_CHECKING:
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
@@ -47,17 +54,15 @@ def _extract_axes_shapes(
     num_samples: int,
     framework: Framework,
     check_len: bool = True,
-) -> Dict[str, Dict[int, List[int]]]:
-    axes_shapes = {name: {ax: [] for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
+) -> AxesShapes:
+    axes_shapes = {name: {ax: AxisShapes() for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
     for i, sample in enumerate(dataloader):
         if i >= num_samples:
             LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
             break
         validate_sample_input(sample, framework)
         sample = extract_sample(sample, input_names, framework)
-        for name, tensor in sample.items():
-            for k, dim in enumerate(tensor.shape):
-                axes_shapes[name][k].append(dim)
+        update_axes_shapes(axes_shapes, sample)
 
     if check_len:
         assert i + 1 >= len(dataloader), f"{len(dataloader)=}, but only {i + 1} samples found."
@@ -65,9 +70,9 @@ def _extract_axes_shapes(
     return axes_shapes
 
 
-def _extract_max_batch_size(axes_shapes: Dict[str, Dict[int, List[int]]], batch_dim: Optional[int]) -> int:
+def _extract_max_batch_size(axes_shapes: AxesShapes, batch_dim: Optional[int]) -> int:
     if batch_dim is not None:
-        return max(list(axes_shapes.values())[0][batch_dim])
+        return list(axes_shapes.values())[0][batch_dim].max
     return 0
 
 
@@ -77,9 +82,9 @@ def _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim):
         min_max_opt = []
         for ax, shapes in axes.items():
             if ax == batch_dim:  # min bs = 1
-                min_max_opt.append((1, int(np.median(shapes)), max(shapes)))
+                min_max_opt.append((1, int(shapes.median), shapes.max))
             else:
-                min_max_opt.append((min(shapes), int(np.median(shapes)), max(shapes)))
+                min_max_opt.append((shapes.min, int(shapes.median), shapes.max))
         if min_max_opt:
             trt_profile.add(name, *list(zip(*min_max_opt)))
         else:
@@ -117,10 +122,10 @@ def _get_metadata_from_axes_shapes(axes_shapes, batch_dim, dtypes):
     for name, axes in axes_shapes.items():
         tensor_shape = []
         for ax, shapes in axes.items():
-            if ax == batch_dim or min(shapes) != max(shapes):
+            if ax == batch_dim or shapes.min != shapes.max:
                 tensor_shape.append(-1)
             else:
-                tensor_shape.append(shapes[0])
+                tensor_shape.append(shapes.min)
         metadata.add(name, tuple(tensor_shape), dtypes[name])
     return metadata
 
@@ -152,6 +157,7 @@ class InferInputMetadata(Command):
             "input_metadata",
             "trt_profile",
             "max_batch_size",
+            "dataloader_summary",
         )
 
     def _update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs) -> None:
@@ -164,12 +170,14 @@ class InferInputMetadata(Command):
         model: Union[object, Path],
         framework: Framework,
         dataloader: SizedDataLoader,
+        sample_count: int,
+        seed: int,
         _input_names: Optional[Tuple[str, ...]] = None,
         batch_dim: Optional[int] = None,
         dynamic_axes: Optional[Dict[str, Union[Dict[int, str], List[int]]]] = None,
         trt_dynamic_axes: Optional[Dict[str, Dict[int, Tuple[int, int, int]]]] = None,
         **kwargs,
-    ) -> Tuple[TensorMetadata, Profile, int]:
+    ) -> Tuple[TensorMetadata, Profile, int, DataloaderSummary]:
 
         sample = next(iter(dataloader))
         validate_sample_input(sample, framework)
@@ -178,35 +186,33 @@ class InferInputMetadata(Command):
         input_metadata = None
         if input_names is None:
             if framework == Framework.ONNX:
-                # pytype: disable=attribute-error
-                onnx_runner = OnnxrtRunner(
-                    SessionFromOnnx(model.as_posix(), providers=get_available_onnx_providers(exclude_trt=True))
-                )
-                # pytype: enable=attribute-error
-                with onnx_runner:
-                    input_metadata = TensorMetadata.from_polygraphy_tensor_metadata(onnx_runner.get_input_metadata())
-                    input_names = tuple(input_metadata.keys())
+                # graph inputs are read without creating ONNX Runtime session
+                input_metadata = TensorMetadata(inspect_onnx_graph(model).inputs)
+                input_names = tuple(input_metadata.keys())
             elif isinstance(sample, Mapping):
                 input_names = tuple(sample.keys())
             else:
                 input_names = tuple(f"input__{i}" for i in range(len(input_tuple)))
 
         input_sample = extract_sample(sample, input_names, framework)
-        input_ndims = [t.ndim for t in input_sample.values()]
         input_dtypes = {n: t.dtype for n, t in input_sample.items()}
-        num_samples = len(dataloader)
-        axes_shapes = _extract_axes_shapes(dataloader, input_names, input_ndims, num_samples, framework)
+        user_trt_profile = None if trt_dynamic_axes is None else get_trt_profile_from_trt_dynamic_axes(trt_dynamic_axes)
+        # shapes and samples used by the following commands are collected in a single pass over the dataloader
+        dataloader_summary = ingest_dataloader(
+            dataloader, input_names, framework, batch_dim, sample_count, seed, trt_profile=user_trt_profile
+        )
+        axes_shapes = dataloader_summary.axes_shapes
         max_batch_size = _extract_max_batch_size(axes_shapes, batch_dim)
 
         dataloader_trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim)
-        if trt_dynamic_axes is None:
+        if user_trt_profile is None:
             trt_profile = dataloader_trt_profile
 
             LOGGER.warning(
                 f"No TRT (min, opt, max) values for axes provided. Using values derived from the dataloader: {trt_profile}."
             )
         else:
-            trt_profile = get_trt_profile_from_trt_dynamic_axes(trt_dynamic_axes)
+            trt_profile = user_trt_profile
             _verify_user_trt_profile(trt_profile, dataloader_trt_profile)
 
         input_metadata = _get_metadata_from_axes_shapes(axes_shapes, batch_dim, input_dtypes)
@@ -215,7 +221,7 @@ class InferInputMetadata(Command):
         else:
             _verify_and_update_user_dynamic_axes_(dynamic_axes, input_metadata)
 
-        return input_metadata, trt_profile, max_batch_size
+        return input_metadata, trt_profile, max_batch_size, dataloader_summary
 
 
 class InferOutputMetadata(Command):
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from model_navigator.framework_api.commands.performance.onnx_tuning import (  # noqa: F401
+    OnnxSessionTuner,
+    TuneOnnxSessionOptions,
+)
 from model_navigator.framework_api.commands.performance.performance import (  # noqa: F401
     MeasurementMode,
     Performance,
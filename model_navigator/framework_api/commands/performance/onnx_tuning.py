@@ -0,0 +1,207 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from polygraphy.backend.base import BaseRunner
+
+from model_navigator.framework_api.commands.core import Command, CommandType
+from model_navigator.framework_api.commands.performance.performance import Profiler, ProfilerConfig
+from model_navigator.framework_api.common import Sample, TensorMetadata
+from model_navigator.framework_api.execution_context import ExecutionContext
+from model_navigator.framework_api.logger import LOGGER
+from model_navigator.framework_api.runners.onnx import (
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxSessionConfig,
+)
+from model_navigator.framework_api.runners.runner_manager import RunnerManager
+from model_navigator.framework_api.utils import (
+    RuntimeProvider,
+    Status,
+    format_to_relative_model_path,
+    parse_kwargs_to_cmd,
+)
+from model_navigator.model import Format
+
+if TYPE_CHECKING:
+    from model_navigator.framework_api.package_descriptor import PackageDescriptor
+    from model_navigator.framework_api.runtime_workers import RuntimeWorkers
+
+# relative throughput gain required to prefer an option over the current best value; smaller gains are noise
+MIN_THROUGHPUT_GAIN = 0.02
+
+
+class OnnxSessionTuner:
+    """
+    Search for the ONNX Runtime session options maximizing the throughput on CPU.
+
+    Options are tuned one at a time (coordinate descent) starting from the ONNX Runtime defaults,
+    so the number of measurements grows with the sum and not the product of the candidate values.
+    Throughput is measured with the profiler for the largest profiled batch size.
+    """
+
+    def __init__(
+        self,
+        get_runner: Callable[[OnnxSessionConfig], BaseRunner],
+        profiling_sample: Sample,
+        profiler_config: ProfilerConfig,
+        batch_dim: Optional[int] = 0,
+        max_batch_size: Optional[int] = None,
+        num_cores: Optional[int] = None,
+        min_gain: float = MIN_THROUGHPUT_GAIN,
+    ):
+        self._get_runner = get_runner
+        self._profiling_sample = profiling_sample
+        self._batch_dim = batch_dim
+        self._max_batch_size = max_batch_size
+        self._num_cores = num_cores or os.cpu_count() or 1
+        self._min_gain = min_gain
+
+        batch_sizes = None
+        if batch_dim is not None:
+            batch_sizes = [max(profiler_config.batch_sizes or [max_batch_size])]
+        self._profiler_config = dataclasses.replace(profiler_config, batch_sizes=batch_sizes, concurrency=None)
+
+    def get_candidates(self) -> Dict[str, Sequence[Any]]:
+        threads = sorted({1, max(1, self._num_cores // 2), self._num_cores})
+        return {
+            "intra_op_num_threads": threads,
+            "execution_mode": list(OnnxExecutionMode),
+            # inter-op threads are used only in the parallel execution mode
+            "inter_op_num_threads": threads,
+            "graph_optimization_level": list(OnnxGraphOptimizationLevel),
+            "enable_cpu_mem_arena": [True, False],
+            "enable_mem_pattern": [True, False],
+        }
+
+    def _measure(self, session_config: OnnxSessionConfig) -> float:
+        runner = self._get_runner(session_config)
+        profiler = Profiler(
+            runner, self._profiling_sample, self._profiler_config, self._batch_dim, self._max_batch_size
+        )
+        throughput = profiler.run()[-1].throughput
+        LOGGER.info(f"ONNX Runtime session options {session_config}: {throughput:.4f} [infer/sec]")
+        return throughput
+
+    def run(self) -> OnnxSessionConfig:
+        best_config = OnnxSessionConfig(
+            execution_mode=OnnxExecutionMode.SEQUENTIAL,
+            graph_optimization_level=OnnxGraphOptimizationLevel.ALL,
+            enable_cpu_mem_arena=True,
+            enable_mem_pattern=True,
+        )
+        best_throughput = self._measure(best_config)
+        for option, values in self.get_candidates().items():
+            if option == "inter_op_num_threads" and best_config.execution_mode != OnnxExecutionMode.PARALLEL:
+                continue
+            for value in values:
+                if getattr(best_config, option) == value:
+                    continue
+                session_config = dataclasses.replace(best_config, **{option: value})
+                throughput = self._measure(session_config)
+                if throughput > best_throughput * (1 + self._min_gain):
+                    best_config, best_throughput = session_config, throughput
+
+        LOGGER.info(f"Best ONNX Runtime session options {best_config}: {best_throughput:.4f} [infer/sec]")
+        return best_config
+
+
+class TuneOnnxSessionOptions(Command):
+    fingerprint_params = (
+        "profiler_config",
+        "input_metadata",
+        "output_metadata",
+        "batch_dim",
+        "max_batch_size",
+    )
+
+    def __init__(self, name: str, requires: Tuple[Command, ...] = ()):
+        super().__init__(name=name, command_type=CommandType.TUNING, target_format=Format.ONNX, requires=requires)
+        self.runtime_provider = RuntimeProvider.CPU
+
+    @staticmethod
+    def get_output_name():
+        return "onnx_session_config"
+
+    def is_exclusive(self) -> bool:
+        # other commands would affect the measured performance
+        return True
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        return [self.get_output_relative_path(), Path("model_input")]
+
+    def load_output(self, data: Any) -> Optional[OnnxSessionConfig]:
+        return OnnxSessionConfig.from_dict(data) if data is not None else None
+
+    def _update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs) -> None:
+        # failed tuning does not invalidate the model - it is profiled with the default session options
+        if self.status != Status.OK:
+            return
+        runtime_results = package_descriptor.get_runtime_results(
+            format=self.target_format, runtime_provider=self.runtime_provider
+        )
+        if runtime_results.status == Status.OK:
+            runtime_results.onnx_session_config = self.output
+
+    def __call__(
+        self,
+        workdir: Path,
+        model_name: str,
+        profiler_config: ProfilerConfig,
+        input_metadata: TensorMetadata,
+        output_metadata: TensorMetadata,
+        target_device: str,
+        batch_dim: Optional[int],
+        max_batch_size: Optional[int],
+        verbose: bool,
+        runtime_workers: Optional["RuntimeWorkers"] = None,
+        **kwargs,
+    ) -> OnnxSessionConfig:
+        LOGGER.info(f"ONNX Runtime session options tuning for: {self.target_format} {self.runtime_provider} started.")
+
+        model_dir = (workdir / format_to_relative_model_path(format=self.target_format)).parent
+        runner_manager = RunnerManager(input_metadata, output_metadata, target_device)
+
+        with ExecutionContext(
+            workdir=workdir,
+            script_path=model_dir / "reproduce_onnx_tuning.py",
+            cmd_path=model_dir / "reproduce_onnx_tuning.sh",
+            verbose=verbose,
+        ) as context, tempfile.NamedTemporaryFile() as temp_file:
+            kwargs = {
+                "navigator_workdir": workdir.as_posix(),
+                "model_name": model_name,
+                "batch_dim": batch_dim,
+                "results_path": temp_file.name,
+                "runtime": self.runtime_provider.value,
+                "profiler_config": profiler_config.to_dict(parse=True),
+                "max_batch_size": max_batch_size,
+                "runner_manager_dict": runner_manager.to_dict(parse=True),
+            }
+
+            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+
+            from model_navigator.framework_api.commands.performance import onnx_tuning_script
+
+            runtime_worker = runtime_workers.get_worker(self.target_format) if runtime_workers else None
+            context.execute_external_runtime_script(onnx_tuning_script.__file__, args, runtime_worker=runtime_worker)
+            session_config = OnnxSessionConfig.from_dict(json.load(temp_file))
+
+        return session_config
@@ -0,0 +1,63 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pathlib
+from typing import Dict, Optional
+
+import fire
+
+from model_navigator.framework_api.commands.performance.onnx_tuning import OnnxSessionTuner
+from model_navigator.framework_api.commands.performance.performance import ProfilerConfig
+from model_navigator.framework_api.runners.onnx import OnnxSessionConfig
+from model_navigator.framework_api.runners.runner_manager import RunnerManager
+from model_navigator.framework_api.utils import Format, RuntimeProvider, load_samples
+
+
+def tune(
+    model_name: str,
+    batch_dim: int,
+    results_path: str,
+    runtime: str,
+    profiler_config: Dict,
+    max_batch_size: Optional[int],
+    runner_manager_dict: Dict,
+    navigator_workdir: Optional[str] = None,
+):
+    if not navigator_workdir:
+        navigator_workdir = pathlib.Path.cwd()
+    navigator_workdir = pathlib.Path(navigator_workdir)
+
+    profiling_sample = load_samples("profiling_sample", navigator_workdir, batch_dim)
+    profiler_config = ProfilerConfig.from_dict(profiler_config)
+    runner_manager = RunnerManager.from_dict(runner_manager_dict)
+
+    def _get_runner(session_config: OnnxSessionConfig):
+        return runner_manager.get_runner(
+            workdir=navigator_workdir,
+            format=Format.ONNX,
+            runtime=RuntimeProvider(runtime),
+            reuse_buffers=profiler_config.reuse_buffers,
+            onnx_session_config=session_config,
+        )
+
+    session_config = OnnxSessionTuner(_get_runner, profiling_sample, profiler_config, batch_dim, max_batch_size).run()
+
+    results_path = pathlib.Path(results_path)
+    with results_path.open("w") as f:
+        json.dump(session_config.to_dict(parse=True), f)
+
+
+if __name__ == "__main__":
+    fire.Fire(tune)
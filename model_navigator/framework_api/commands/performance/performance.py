@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Mapping, Optional, Sequence, Tuple
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 from polygraphy.backend.base import BaseRunner
@@ -28,7 +32,8 @@ from model_navigator.framework_api.common import DataObject, Sample, TensorMetad
 from model_navigator.framework_api.exceptions import ModelNavigatorExportAPIError
 from model_navigator.framework_api.execution_context import ExecutionContext
 from model_navigator.framework_api.logger import LOGGER
-from model_navigator.framework_api.runners.base import INavigatorStabilizedRunner
+from model_navigator.framework_api.runners.base import INavigatorRunner, INavigatorStabilizedRunner
+from model_navigator.framework_api.runners.onnx import OnnxSessionConfig
 from model_navigator.framework_api.runners.runner_manager import RunnerManager
 from model_navigator.framework_api.utils import (
     JitType,
@@ -36,12 +41,14 @@ from model_navigator.framework_api.utils import (
     RuntimeProvider,
     Status,
     format_to_relative_model_path,
+    is_gpu_runtime,
     parse_kwargs_to_cmd,
 )
 from model_navigator.model import Format
 
 if TYPE_CHECKING:
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
+    from model_navigator.framework_api.runtime_workers import RuntimeWorkers
 
 
 @dataclass
@@ -55,40 +62,82 @@ class ProfilingResults(DataObject):
     p99_latency: float  # ms
     throughput: float  # infer / sec
     request_count: int
+    concurrency: int = 1
+    # confidence interval of the average latency; available when confidence level is configured
+    avg_latency_ci_low: Optional[float] = None  # ms
+    avg_latency_ci_high: Optional[float] = None  # ms
+    # average duration of the inference phases (see `InferencePhase`); available when the runner measures phases
+    phases_avg_latency: Optional[Dict[str, float]] = None  # ms
 
     @classmethod
     def from_dict(cls, d: Mapping):
         return cls(**d)
 
     @classmethod
-    def from_measurements(cls, measurements: List[float], batch_size: int):
-        measurements = np.array(measurements)
+    def from_measurements(
+        cls,
+        measurements: List[float],
+        batch_size: int,
+        concurrency: int = 1,
+        duration: Optional[float] = None,
+        trim_percentage: float = 0.0,
+        confidence_level: Optional[float] = None,
+        phase_measurements: Optional[List[Dict[str, float]]] = None,
+    ):
+        """
+        Create results from list of request latencies in milliseconds.
+
+        When `duration` (ms) of the whole window is provided, the throughput is computed from the wall-clock
+        time of the window, what is required when requests were executed concurrently.
+        With `trim_percentage` the given percentage of the fastest and the slowest requests is removed before
+        computing latency statistics. With `confidence_level` (e.g. 0.95) the confidence interval of the average
+        latency is computed with the normal approximation.
+        `phase_measurements` holds per request durations of the inference phases in milliseconds; phases are
+        averaged over the same requests as the latency.
+        """
+        request_count = len(measurements)
+        order = np.argsort(np.array(measurements), kind="stable")
+        trim_count = int(len(measurements) * trim_percentage / 100)
+        if trim_count > 0 and len(measurements) > 2 * trim_count:
+            order = order[trim_count:-trim_count]
+        measurements = np.array(measurements)[order]
+
+        phases_avg_latency = None
+        if phase_measurements and any(phase_measurements):
+            kept_phases = [phase_measurements[idx] for idx in order]
+            phase_names = list(dict.fromkeys(name for phases in kept_phases for name in phases))
+            phases_avg_latency = {
+                name: float(np.mean([phases.get(name, 0.0) for phases in kept_phases])) for name in phase_names
+            }
+
+        avg_latency = float(np.mean(measurements))
+        if duration is None:
+            throughput = 1000 * max(1, batch_size) / avg_latency
+        else:
+            throughput = 1000 * max(1, batch_size) * request_count / duration
+
+        avg_latency_ci_low, avg_latency_ci_high = None, None
+        if confidence_level is not None:
+            std_error = (
+                float(np.std(measurements, ddof=1) / np.sqrt(len(measurements))) if len(measurements) > 1 else 0.0
+            )
+            margin = NormalDist().inv_cdf(0.5 + confidence_level / 2) * std_error
+            avg_latency_ci_low, avg_latency_ci_high = avg_latency - margin, avg_latency + margin
+
         return cls(
             batch_size=batch_size,
-            avg_latency=float(np.mean(measurements)),
+            avg_latency=avg_latency,
             std_latency=float(np.std(measurements)),
             p50_latency=float(np.percentile(measurements, 50)),
             p90_latency=float(np.percentile(measurements, 90)),
             p95_latency=float(np.percentile(measurements, 95)),
             p99_latency=float(np.percentile(measurements, 99)),
-            throughput=float(1000 * max(1, batch_size) / np.mean(measurements)),
-            request_count=len(measurements),
-        )
-
-    @classmethod
-    def from_profiling_results(cls, profiling_results: List["ProfilingResults"]):
-        batch_size = profiling_results[0].batch_size
-
-        return cls(
-            batch_size=batch_size,
-            avg_latency=float(np.mean([result.avg_latency for result in profiling_results])),
-            std_latency=float(np.mean([result.std_latency for result in profiling_results])),
-            p50_latency=float(np.mean([result.p50_latency for result in profiling_results])),
-            p90_latency=float(np.mean([result.p90_latency for result in profiling_results])),
-            p95_latency=float(np.mean([result.p95_latency for result in profiling_results])),
-            p99_latency=float(np.mean([result.p99_latency for result in profiling_results])),
-            throughput=float(np.mean([result.throughput for result in profiling_results])),
-            request_count=int(np.mean([result.request_count for result in profiling_results])),
+            throughput=float(throughput),
+            request_count=request_count,
+            concurrency=concurrency,
+            avg_latency_ci_low=avg_latency_ci_low,
+            avg_latency_ci_high=avg_latency_ci_high,
+            phases_avg_latency=phases_avg_latency,
         )
 
     @classmethod
@@ -106,19 +155,35 @@ class ProfilingResults(DataObject):
         )
 
     def __str__(self):
+        avg_latency_ci = ""
+        if self.avg_latency_ci_low is not None and self.avg_latency_ci_high is not None:
+            avg_latency_ci = f"Avg Latency CI: [{self.avg_latency_ci_low:.4f}, {self.avg_latency_ci_high:.4f}] [ms]\n"
+        phases_avg_latency = ""
+        if self.phases_avg_latency:
+            phases_avg_latency = "".join(
+                f"\n  {phase}: {latency:.4f} [ms]" for phase, latency in self.phases_avg_latency.items()
+            )
+            phases_avg_latency = f"\nAvg Latency per phase:{phases_avg_latency}"
         return (
             f"Batch: {self.batch_size}\n"
+            f"Concurrency: {self.concurrency}\n"
             f"Request count: {self.request_count}\n"
             f"Throughput: {self.throughput:.4f} [infer/sec]\n"
             f"Avg Latency: {self.avg_latency:.4f} [ms]\n"
+            f"{avg_latency_ci}"
             f"Std Latency: {self.std_latency:.4f} [ms]\n"
             f"p50 Latency: {self.p50_latency:.4f} [ms]\n"
             f"p90 Latency: {self.p90_latency:.4f} [ms]\n"
             f"p95 Latency: {self.p95_latency:.4f} [ms]\n"
             f"p99 Latency: {self.p99_latency:.4f} [ms]"
+            f"{phases_avg_latency}"
         )
 
 
+# request latencies (ms), duration of the window (ms) and per request durations of the inference phases (ms)
+Window = Tuple[List[float], float, List[Dict[str, float]]]
+
+
 class MeasurementMode(Parameter):
     TIME_WINDOWS = "time_windows"
     COUNT_WINDOWS = "count_windows"
@@ -132,16 +197,34 @@ class ProfilerConfig(DataObject):
     measurement_request_count: Optional[int] = 50
     stability_percentage: float = 10.0
     max_trials: int = 10
+    concurrency: Optional[Sequence[int]] = None
+    warmup_request_count: int = 10
+    warmup_interval: Optional[float] = None  # ms
+    trim_percentage: float = 0.0
+    confidence_level: Optional[float] = None
+    reuse_buffers: bool = False
+    onnx_cpu_tuning: bool = False
+    tf_function: bool = False
+    tf_jit_compile: bool = False
 
     @classmethod
     def from_dict(cls, dict: Mapping):
         return cls(
             batch_sizes=dict.get("batch_sizes"),
+            concurrency=dict.get("concurrency"),
             measurement_interval=dict.get("measurement_interval"),
             measurement_mode=MeasurementMode(dict.get("measurement_mode", MeasurementMode.TIME_WINDOWS)),
             measurement_request_count=dict.get("measurement_request_count"),
             stability_percentage=dict.get("stability_percentage", 10.0),
             max_trials=dict.get("max_trials", 10),
+            warmup_request_count=dict.get("warmup_request_count", 10),
+            warmup_interval=dict.get("warmup_interval"),
+            trim_percentage=dict.get("trim_percentage", 0.0),
+            confidence_level=dict.get("confidence_level"),
+            reuse_buffers=dict.get("reuse_buffers", False),
+            onnx_cpu_tuning=dict.get("onnx_cpu_tuning", False),
+            tf_function=dict.get("tf_function", False),
+            tf_jit_compile=dict.get("tf_jit_compile", False),
         )
 
 
@@ -173,6 +256,18 @@ class Profiler:
                 assert max_batch_size
                 self._batch_sizes = [1, max_batch_size]
 
+        if self._config.concurrency:
+            if any(concurrency < 1 for concurrency in self._config.concurrency):
+                raise ValueError(f"Profiling concurrency must be positive, got {self._config.concurrency}.")
+            self._concurrency = self._config.concurrency
+        else:
+            self._concurrency = [1]
+
+        if not 0 <= self._config.trim_percentage < 50:
+            raise ValueError(f"Profiling trim percentage must be in [0, 50), got {self._config.trim_percentage}.")
+        if self._config.confidence_level is not None and not 0 < self._config.confidence_level < 1:
+            raise ValueError(f"Profiling confidence level must be in (0, 1), got {self._config.confidence_level}.")
+
     @staticmethod
     def expand_sample(sample: Sample, axis: Optional[int], n: int):
         if axis is None:
@@ -182,22 +277,80 @@ class Profiler:
             expanded_sample[name] = tensor.repeat(n, axis=axis)
         return expanded_sample
 
-    def _run_time_window_measurement(self, runner: BaseRunner, sample: Sample, batch_size: int) -> ProfilingResults:
-        measurements = []
+    def _warmup(self, runner: BaseRunner, sample: Sample) -> None:
+        """Run requests which are not measured - hides lazy initialization, JIT compilation and graph tracing."""
+        if self._config.warmup_interval:
+            start = time.monotonic()
+            while (time.monotonic() - start) * 1000 < self._config.warmup_interval:
+                runner.infer(sample)
+        else:
+            for _ in range(self._config.warmup_request_count):
+                runner.infer(sample)
+
+    @staticmethod
+    def _infer(runner: BaseRunner, sample: Sample) -> Tuple[float, Dict[str, float]]:
+        """Run a single request. Return its latency and the durations of the inference phases in milliseconds."""
+        runner.infer(sample)
+        phases = runner.last_inference_phases() if isinstance(runner, INavigatorRunner) else {}
+        return runner.last_inference_time() * 1000, {phase: duration * 1000 for phase, duration in phases.items()}
+
+    def _run_time_window_measurement(self, runner: BaseRunner, sample: Sample) -> Window:
+        measurements, phase_measurements = [], []
         start = time.monotonic()
         while (time.monotonic() - start) * 1000 < self._config.measurement_interval:
-            runner.infer(sample)
-            measurements.append(runner.last_inference_time() * 1000)
+            latency, phases = self._infer(runner, sample)
+            measurements.append(latency)
+            phase_measurements.append(phases)
 
-        return ProfilingResults.from_measurements(measurements, batch_size)
+        return measurements, (time.monotonic() - start) * 1000, phase_measurements
 
-    def _run_count_window_measurement(self, runner: BaseRunner, sample: Sample, batch_size: int) -> ProfilingResults:
-        measurements = []
+    def _run_count_window_measurement(self, runner: BaseRunner, sample: Sample) -> Window:
+        measurements, phase_measurements = [], []
+        start = time.monotonic()
         for _ in range(self._config.measurement_request_count):
-            runner.infer(sample)
-            measurements.append(runner.last_inference_time() * 1000)
+            latency, phases = self._infer(runner, sample)
+            measurements.append(latency)
+            phase_measurements.append(phases)
+
+        return measurements, (time.monotonic() - start) * 1000, phase_measurements
 
-        return ProfilingResults.from_measurements(measurements, batch_size)
+    def _run_concurrent_measurement(self, runner: BaseRunner, sample: Sample, concurrency: int) -> Window:
+        if runner.is_thread_safe():
+            lock = None
+        else:
+            LOGGER.debug(f"Runner {runner.name} is not thread safe. Requests are going to be serialized.")
+            lock = threading.Lock()
+
+        def _infer():
+            start = time.perf_counter()
+            if lock is None:
+                runner.infer(sample)
+            else:
+                with lock:
+                    runner.infer(sample)
+            return (time.perf_counter() - start) * 1000
+
+        def _run_time_window_worker(deadline: float) -> List[float]:
+            measurements = []
+            while time.perf_counter() < deadline:
+                measurements.append(_infer())
+            return measurements
+
+        def _run_count_window_worker() -> List[float]:
+            return [_infer() for _ in range(self._config.measurement_request_count)]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            if self._config.measurement_mode == MeasurementMode.TIME_WINDOWS:
+                deadline = start + self._config.measurement_interval / 1000
+                futures = [executor.submit(_run_time_window_worker, deadline) for _ in range(concurrency)]
+            else:
+                futures = [executor.submit(_run_count_window_worker) for _ in range(concurrency)]
+            measurements = [measurement for future in futures for measurement in future.result()]
+            duration = (time.perf_counter() - start) * 1000
+
+        # phases are stored per runner, so they cannot be attributed to concurrent requests
+        return measurements, duration, []
 
     def _is_measurement_stable(self, profiling_results: List[ProfilingResults], count: int = 3) -> bool:
         if len(profiling_results) < count:
@@ -210,38 +363,63 @@ class Profiler:
 
         return np.all(deviation_perc < self._config.stability_percentage)
 
-    def _measurements_result(self, profiling_results: List[ProfilingResults], count: int = 3) -> ProfilingResults:
-        if len(profiling_results) < count:
+    def _measurements_result(
+        self, windows: List[Window], batch_size: int, concurrency: int = 1, count: int = 3
+    ) -> ProfilingResults:
+        """Compute results over the requests pooled from the last `count` windows."""
+        if len(windows) < count:
             raise ModelNavigatorExportAPIError(
                 "Measurements results requires at least 3 consecutive stable measurements."
             )
 
-        profiling_results = profiling_results[-count:]
-        profiling_result = ProfilingResults.from_profiling_results(profiling_results)
-
-        return profiling_result
+        windows = windows[-count:]
+        measurements = [measurement for window_measurements, _, _ in windows for measurement in window_measurements]
+        duration = sum(window_duration for _, window_duration, _ in windows) if concurrency > 1 else None
+        phase_measurements = [phases for _, _, window_phases in windows for phases in window_phases]
+
+        return ProfilingResults.from_measurements(
+            measurements,
+            batch_size,
+            concurrency=concurrency,
+            duration=duration,
+            trim_percentage=self._config.trim_percentage,
+            confidence_level=self._config.confidence_level,
+            phase_measurements=phase_measurements,
+        )
 
-    def _run_measurement(self, runner: BaseRunner, sample: Sample, batch_size: int) -> ProfilingResults:
+    def _run_measurement(
+        self, runner: BaseRunner, sample: Sample, batch_size: int, concurrency: int = 1
+    ) -> ProfilingResults:
+        windows = []
         profiling_results = []
 
-        measurement_fn = {
-            MeasurementMode.TIME_WINDOWS: self._run_time_window_measurement,
-            MeasurementMode.COUNT_WINDOWS: self._run_count_window_measurement,
-        }[self._config.measurement_mode]
+        if concurrency > 1:
+            measurement_fn = functools.partial(self._run_concurrent_measurement, concurrency=concurrency)
+        else:
+            measurement_fn = {
+                MeasurementMode.TIME_WINDOWS: self._run_time_window_measurement,
+                MeasurementMode.COUNT_WINDOWS: self._run_count_window_measurement,
+            }[self._config.measurement_mode]
 
         if runner.is_inference_time_stabilized():
             runner.infer(sample)
             profiling_result = ProfilingResults.from_stable_runner(runner, batch_size)
             return profiling_result
         else:
+            count = min(3, self._config.max_trials)
             for idx in range(self._config.max_trials):
-                profiling_result = measurement_fn(runner, sample, batch_size)
+                measurements, duration, phase_measurements = measurement_fn(runner, sample)
+                windows.append((measurements, duration, phase_measurements))
+                profiling_result = ProfilingResults.from_measurements(
+                    measurements, batch_size, concurrency=concurrency, duration=duration if concurrency > 1 else None
+                )
                 profiling_results.append(profiling_result)
                 LOGGER.debug(
-                    f"Measurement [{idx}]: {profiling_result.throughput} infer/sec, {profiling_result.avg_latency} ms"
+                    f"Measurement [{idx}]: {profiling_result.throughput} infer/sec, {profiling_result.avg_latency} ms, "
+                    f"concurrency {concurrency}"
                 )
-                if self._is_measurement_stable(profiling_results, count=min(3, self._config.max_trials)):
-                    return self._measurements_result(profiling_results, count=min(3, self._config.max_trials))
+                if self._is_measurement_stable(profiling_results, count=count):
+                    return self._measurements_result(windows, batch_size, concurrency=concurrency, count=count)
 
         raise RuntimeError(
             "Unable to get stable performance results. Consider increasing "
@@ -253,16 +431,39 @@ class Profiler:
         with self._runner as runner:
             for batch_size in self._batch_sizes:
                 sample = self.expand_sample(self._profiling_sample, self._batch_dim, batch_size)
-                LOGGER.info(f"Performance profiling for {runner.name} and batch size: {batch_size} started")
-                profiling_result = self._run_measurement(runner, sample, batch_size)
-                LOGGER.info(
-                    f"Performance profiling result for {runner.name} and batch size: {batch_size}:\n{profiling_result}"
-                )
-                results.append(profiling_result)
+                if not runner.is_inference_time_stabilized():
+                    # new input shapes may trigger engine profile selection or retracing
+                    self._warmup(runner, sample)
+                for concurrency in self._concurrency:
+                    if concurrency > 1 and runner.is_inference_time_stabilized():
+                        LOGGER.warning(
+                            f"Runner {runner.name} measures performance internally. "
+                            f"Skipping profiling for concurrency: {concurrency}."
+                        )
+                        continue
+                    LOGGER.info(
+                        f"Performance profiling for {runner.name}, batch size: {batch_size} "
+                        f"and concurrency: {concurrency} started"
+                    )
+                    profiling_result = self._run_measurement(runner, sample, batch_size, concurrency)
+                    LOGGER.info(
+                        f"Performance profiling result for {runner.name}, batch size: {batch_size} "
+                        f"and concurrency: {concurrency}:\n{profiling_result}"
+                    )
+                    results.append(profiling_result)
         return results
 
 
 class Performance(Command):
+    fingerprint_params = (
+        "profiler_config",
+        "input_metadata",
+        "output_metadata",
+        "target_device",
+        "batch_dim",
+        "max_batch_size",
+    )
+
     def __init__(
         self,
         name: str,
@@ -273,6 +474,7 @@ class Performance(Command):
         runtime_provider: Optional[RuntimeProvider] = None,
         enable_xla: Optional[bool] = None,
         jit_compile: Optional[bool] = None,
+        onnx_session_config: Optional[OnnxSessionConfig] = None,
     ):
         super().__init__(
             name=name, command_type=CommandType.PERFORMANCE, target_format=target_format, requires=requires
@@ -282,6 +484,32 @@ class Performance(Command):
         self.runtime_provider = runtime_provider
         self.enable_xla = enable_xla
         self.jit_compile = jit_compile
+        self.onnx_session_config = onnx_session_config
+
+    def is_exclusive(self) -> bool:
+        # other commands would affect the measured performance
+        return True
+
+    def _get_onnx_session_config(self, onnx_session_config: Optional[OnnxSessionConfig]) -> Optional[OnnxSessionConfig]:
+        """Session options tuned in this pipeline take precedence over the ones stored in the package."""
+        if self.target_format != Format.ONNX or self.runtime_provider != RuntimeProvider.CPU:
+            return None
+        return onnx_session_config or self.onnx_session_config
+
+    def get_fingerprint_params(self, onnx_session_config: Optional[OnnxSessionConfig] = None, **kwargs):
+        params = super().get_fingerprint_params(**kwargs)
+        if params is not None:
+            params["onnx_session_config"] = self._get_onnx_session_config(onnx_session_config)
+        return params
+
+    def uses_gpu(self, target_device: str = "cpu", **kwargs) -> bool:
+        return is_gpu_runtime(self.target_format, self.runtime_provider, target_device)
+
+    def get_fingerprint_paths(self) -> List[Path]:
+        return [self.get_output_relative_path(), Path("model_input")]
+
+    def load_output(self, data: Any) -> Optional[List[ProfilingResults]]:
+        return [ProfilingResults.from_dict(results) for results in data] if data is not None else None
 
     def _update_package_descriptor(self, package_descriptor: "PackageDescriptor", **kwargs) -> None:
         runtime_results = package_descriptor.get_runtime_results(
@@ -310,6 +538,8 @@ class Performance(Command):
         batch_dim: Optional[int],
         max_batch_size: Optional[int],
         verbose: bool,
+        runtime_workers: Optional["RuntimeWorkers"] = None,
+        onnx_session_config: Optional[OnnxSessionConfig] = None,
         **kwargs,
     ) -> List[ProfilingResults]:
         LOGGER.info(f"Performance test for: {self.target_format} {self.runtime_provider} started.")
@@ -324,6 +554,7 @@ class Performance(Command):
         model_dir = model_path.parent
 
         runner_manager = RunnerManager(input_metadata, output_metadata, target_device)
+        onnx_session_config = self._get_onnx_session_config(onnx_session_config)
 
         with ExecutionContext(
             workdir=workdir,
@@ -346,12 +577,15 @@ class Performance(Command):
                 "max_batch_size": max_batch_size,
                 "runner_manager_dict": runner_manager.to_dict(parse=True),
             }
+            if onnx_session_config is not None:
+                kwargs["onnx_session_config"] = onnx_session_config.to_dict(parse=True)
 
             args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
 
             from model_navigator.framework_api.commands.performance import performance_script
 
-            context.execute_external_runtime_script(performance_script.__file__, args)
+            runtime_worker = runtime_workers.get_worker(self.target_format) if runtime_workers else None
+            context.execute_external_runtime_script(performance_script.__file__, args, runtime_worker=runtime_worker)
             results = [ProfilingResults.from_dict(res) for res in json.load(temp_file)]
 
         return results
@@ -22,6 +22,7 @@ import fire
 from model_navigator.converter.config import TensorRTPrecision
 from model_navigator.framework_api.commands.performance import Profiler
 from model_navigator.framework_api.commands.performance.performance import ProfilerConfig
+from model_navigator.framework_api.runners.onnx import OnnxSessionConfig
 from model_navigator.framework_api.runners.runner_manager import RunnerManager
 from model_navigator.framework_api.utils import Format, JitType, RuntimeProvider, load_samples
 
@@ -40,12 +41,14 @@ def profile(
     jit_compile: bool,
     runner_manager_dict: Dict,
     navigator_workdir: Optional[str] = None,
+    onnx_session_config: Optional[Dict] = None,
 ):
     if not navigator_workdir:
         navigator_workdir = pathlib.Path.cwd()
     navigator_workdir = pathlib.Path(navigator_workdir)
 
     profiling_sample = load_samples("profiling_sample", navigator_workdir, batch_dim)
+    profiler_config = ProfilerConfig.from_dict(profiler_config)
 
     runner = RunnerManager.from_dict(runner_manager_dict).get_runner(
         workdir=navigator_workdir,
@@ -55,11 +58,13 @@ def profile(
         runtime=RuntimeProvider(runtime) if runtime else None,
         enable_xla=enable_xla,
         jit_compile=jit_compile,
+        reuse_buffers=profiler_config.reuse_buffers,
+        onnx_session_config=OnnxSessionConfig.from_dict(onnx_session_config) if onnx_session_config else None,
+        tf_function=profiler_config.tf_function,
+        tf_jit_compile=profiler_config.tf_jit_compile,
     )
 
-    results = Profiler(
-        runner, profiling_sample, ProfilerConfig.from_dict(profiler_config), batch_dim, max_batch_size
-    ).run()
+    results = Profiler(runner, profiling_sample, profiler_config, batch_dim, max_batch_size).run()
 
     results_path = pathlib.Path(results_path)
     with results_path.open("w") as f:
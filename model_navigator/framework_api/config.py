@@ -78,6 +78,8 @@ class Config(DataObject):
     # https://numpy.org/doc/stable/reference/generated/numpy.allclose.html
     atol: Optional[float] = None
     rtol: Optional[float] = None
+    # Run correctness inference on batches of samples with matching shapes up to max_batch_size
+    batched_correctness: bool = False
 
     # Verbose logging - enable debug mode in export and conversion paths
     verbose: bool = False
@@ -85,6 +87,20 @@ class Config(DataObject):
     # Debug - enabled debug mode for converters
     debug: bool = False
 
+    # Execute correctness and profiling in long-lived worker processes - one per framework runtime
+    use_runtime_workers: bool = False
+
+    # Pipeline execution - number of commands executed concurrently and number of those which can use GPU at once
+    max_concurrent_commands: int = 1
+    max_concurrent_gpu_commands: int = 1
+
+    # Directory with converted models shared between workdirs and runs, and its size limit in bytes
+    conversion_cache_dir: Optional[Union[str, Path]] = None
+    conversion_cache_max_size: Optional[int] = None
+
+    # Skip commands which inputs have not changed since their last successful execution in the workdir
+    incremental: bool = False
+
     def _check_types(self):
         try:
             iter(self.dataloader)
@@ -132,5 +148,7 @@ class Config(DataObject):
         self._check_types()
         if "/" in self.model_name:
             raise UserError("Model name cannot contain '/' character.")  # '/' causes problems for OTIS
+        if self.max_concurrent_commands < 1 or self.max_concurrent_gpu_commands < 1:
+            raise UserError("Number of concurrently executed commands must be greater than 0.")
         object.__setattr__(self, "timestamp", f"{datetime.datetime.utcnow():%Y-%m-%dT%H:%M:%S.%f}")
         self._log()
@@ -13,7 +13,8 @@
 # limitations under the License.
 # pytype: skip-file
 
-from model_navigator.framework_api.package_utils import is_hf_available
+from model_navigator.framework_api.package_utils import is_hf_available, lazy_modules_getattr
 
-if is_hf_available():
-    from model_navigator.framework_api.contrib import huggingface  # noqa: F401
+__getattr__ = lazy_modules_getattr(
+    __name__, {"huggingface": ("model_navigator.framework_api.contrib.huggingface", is_hf_available)}
+)
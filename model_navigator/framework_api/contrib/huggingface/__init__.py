@@ -13,10 +13,12 @@
 # limitations under the License.
 # pytype: skip-file
 
-from model_navigator.framework_api.package_utils import is_tf_available, is_torch_available
+from model_navigator.framework_api.package_utils import is_tf_available, is_torch_available, lazy_modules_getattr
 
-if is_torch_available():
-    from model_navigator.framework_api.contrib.huggingface import torch  # noqa: F401
-
-if is_tf_available():
-    from model_navigator.framework_api.contrib.huggingface import tensorflow  # noqa: F401
+__getattr__ = lazy_modules_getattr(
+    __name__,
+    {
+        "torch": ("model_navigator.framework_api.contrib.huggingface.torch", is_torch_available),
+        "tensorflow": ("model_navigator.framework_api.contrib.huggingface.tensorflow", is_tf_available),
+    },
+)
@@ -20,13 +20,16 @@ import subprocess
 import sys
 import textwrap
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import fire
 
 from model_navigator.framework_api.exceptions import UserError
 from model_navigator.framework_api.logger import LOGGER
 
+if TYPE_CHECKING:
+    from model_navigator.framework_api.runtime_workers import RuntimeWorker
+
 
 class FileHandlersLogging:
     """
@@ -92,13 +95,33 @@ class ExecutionContext(contextlib.AbstractContextManager):
         except Exception as e:
             raise UserError(f"Command to reproduce error:\n{' '.join(cmd)}") from e
 
-    def execute_external_runtime_script(self, path, args):
+    def execute_external_runtime_script(self, path, args, runtime_worker: Optional["RuntimeWorker"] = None):
         shutil.copy(path, self._script_path)
         script_path_relative = self._script_path.relative_to(self._workdir)
 
         filtered_args = self._filter_workdir_args(args)
         cmd = [sys.executable, script_path_relative.as_posix()] + filtered_args
-        self.execute_cmd(cmd)
+        if runtime_worker is None:
+            self.execute_cmd(cmd)
+        else:
+            self.execute_in_runtime_worker(runtime_worker, cmd, args)
+
+    def execute_in_runtime_worker(self, runtime_worker: "RuntimeWorker", cmd, args):
+        """
+        Execute the script in the long-lived runtime worker instead of a new Python interpreter.
+        The command to reproduce is stored the same way as for the execution in subprocess.
+        """
+        run_cmd = self._bake_command(cmd)
+
+        result, self._output = runtime_worker.run_script(self._script_path, args, cwd=self._workdir)
+        if self._verbose:
+            LOGGER.info("Command output:")
+            print(textwrap.indent(self._output.rstrip(), "    "))
+
+        if result != 0:
+            raise UserError(
+                f"Processes exited with error code:{result}. Command to reproduce error:\n{' '.join(run_cmd)}"
+            )
 
     def execute_cmd(self, cmd, dry_run=False):
         run_cmd = self._bake_command(cmd)
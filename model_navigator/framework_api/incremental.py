@@ -0,0 +1,203 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Results of the commands executed in the workdir, used to skip unchanged commands in the incremental mode.
+
+Each successfully executed command is recorded with the fingerprint of its inputs - the command, its parameters
+and the content of the files it reads from the workdir - and with its output:
+
+    <workdir>/.nav_commands.json
+
+When the command is executed again with the same fingerprint, the execution is skipped and the output is reused.
+"""
+
+import hashlib
+import json
+import pathlib
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+from polygraphy.backend.trt import Profile
+
+from model_navigator.__version__ import __version__
+from model_navigator.framework_api.common import DataObject
+from model_navigator.framework_api.logger import LOGGER
+from model_navigator.utils.conversion_cache import hash_content
+
+if TYPE_CHECKING:
+    from model_navigator.framework_api.commands.core import Command
+
+COMMANDS_STATE_FILENAME = ".nav_commands.json"
+STATE_VERSION = 1
+
+# attributes distinguishing commands of the same class in the pipelines
+_COMMAND_ATTRIBUTES = (
+    "target_format",
+    "target_jit_type",
+    "target_precision",
+    "runtime_provider",
+    "enable_xla",
+    "jit_compile",
+)
+
+
+def _hash_array(array: np.ndarray) -> str:
+    array = np.ascontiguousarray(array)
+    return hashlib.sha256(f"{array.dtype.str}{array.shape}".encode() + array.tobytes()).hexdigest()
+
+
+def _tensor_to_numpy(tensor) -> np.ndarray:
+    # bytes of the tensor - numpy does not support all torch dtypes (e.g. bfloat16)
+    import torch  # pytype: disable=import-error
+
+    return tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+
+
+def hash_model(model) -> str:
+    """Hash of the model type, structure and weights; content hash for the model file"""
+    if isinstance(model, (str, pathlib.Path)):
+        return hash_content(model)
+
+    model_hash = hashlib.sha256(f"{type(model).__module__}.{type(model).__qualname__}".encode())
+    if hasattr(model, "state_dict"):  # torch.nn.Module
+        model_hash.update(repr(model).encode())
+        for name, tensor in model.state_dict().items():
+            model_hash.update(name.encode())
+            model_hash.update(_hash_array(_tensor_to_numpy(tensor)).encode())
+    elif hasattr(model, "variables"):  # tf.Module, e.g. tf.keras.Model
+        for variable in model.variables:
+            model_hash.update(variable.name.encode())
+            model_hash.update(_hash_array(np.asarray(variable)).encode())
+    elif hasattr(model, "__code__"):  # function, e.g. JAX model which parameters are passed separately
+        model_hash.update(model.__qualname__.encode())
+        model_hash.update(model.__code__.co_code)
+        model_hash.update(repr(model.__code__.co_consts).encode())
+    else:
+        model_hash.update(repr(model).encode())
+    return model_hash.hexdigest()
+
+
+def fingerprint_value(value: Any) -> Any:
+    """JSON serializable representation of the command parameter; arrays are represented by their hashes"""
+    if isinstance(value, (DataObject, Profile, pathlib.Path)) or hasattr(value, "to_json"):
+        return DataObject.parse_value(value)
+    if isinstance(value, np.ndarray) or (hasattr(value, "__array__") and hasattr(value, "dtype")):
+        return _hash_array(np.asarray(value))
+    if isinstance(value, (list, tuple)):
+        return [fingerprint_value(item) for item in value]
+    if isinstance(value, Mapping):
+        return {str(key): fingerprint_value(item) for key, item in value.items()}
+    return DataObject.parse_value(value)
+
+
+def get_command_key(command: "Command") -> str:
+    """Identifier of the command in the workdir"""
+    key = {"command": type(command).__qualname__, "name": command.name}
+    key.update({name: DataObject.parse_value(getattr(command, name)) for name in _COMMAND_ATTRIBUTES})
+    return json.dumps(key, sort_keys=True)
+
+
+class IncrementalState:
+    """Fingerprints and outputs of the commands successfully executed in the workdir.
+
+    Args:
+        workdir: directory where the commands are executed and the state is stored
+    """
+
+    def __init__(self, workdir: pathlib.Path):
+        self._workdir = pathlib.Path(workdir)
+        self._lock = threading.Lock()
+        state = self._read()
+        self._commands: Dict[str, Dict] = state.get("commands", {})
+        # relative path -> [size, mtime_ns, content hash]; files are hashed again only when they change
+        self._file_hashes: Dict[str, List] = state.get("file_hashes", {})
+        # hashes of the models and other objects from memory, computed once per run
+        self._model_hashes: Dict[int, Tuple[Any, str]] = {}
+
+    def get_fingerprint(self, command: "Command", **kwargs) -> Optional[str]:
+        """Fingerprint of the command inputs; None when the command does not support the incremental mode"""
+        params = command.get_fingerprint_params(**kwargs)
+        if params is None:
+            return None
+
+        data = {
+            "version": __version__,
+            "command": get_command_key(command),
+            "params": {name: self._get_param_fingerprint(name, value) for name, value in params.items()},
+            "paths": {path.as_posix(): self._hash_path(path) for path in command.get_fingerprint_paths()},
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_output(self, command: "Command", fingerprint: str) -> Tuple[bool, Any]:
+        """Output of the previous successful execution of the command with the same fingerprint"""
+        with self._lock:
+            record = self._commands.get(get_command_key(command))
+        if record is None or record["fingerprint"] != fingerprint:
+            return False, None
+        return True, command.load_output(record["output"])
+
+    def record(self, command: "Command", fingerprint: str, output: Any) -> None:
+        record = {"fingerprint": fingerprint, "output": command.dump_output(output)}
+        with self._lock:
+            self._commands[get_command_key(command)] = record
+
+    def save(self) -> None:
+        with self._lock:
+            state = {"version": STATE_VERSION, "commands": self._commands, "file_hashes": self._file_hashes}
+            with open(self._workdir / COMMANDS_STATE_FILENAME, "w") as f:
+                json.dump(state, f, default=str)
+
+    def _read(self) -> Dict:
+        try:
+            with open(self._workdir / COMMANDS_STATE_FILENAME) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if state.get("version") != STATE_VERSION:
+            LOGGER.info(f"Ignoring results of previous commands stored in unsupported format in {self._workdir}")
+            return {}
+        return state
+
+    def _get_param_fingerprint(self, name: str, value: Any) -> Any:
+        if name != "model" or value is None:
+            return fingerprint_value(value)
+
+        with self._lock:
+            # the model is kept with its hash, so its id is not reused by another object
+            cached = self._model_hashes.get(id(value))
+        if cached is None:
+            cached = (value, hash_model(value))
+            with self._lock:
+                self._model_hashes[id(value)] = cached
+        return cached[1]
+
+    def _hash_path(self, relative_path: pathlib.Path) -> Optional[str]:
+        path = self._workdir / relative_path
+        if not path.exists():
+            return None
+
+        files = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+        path_hash = hashlib.sha256()
+        for file_path in files:
+            relative_file_path = file_path.relative_to(self._workdir).as_posix()
+            stat = file_path.stat()
+            with self._lock:
+                size, mtime_ns, file_hash = self._file_hashes.get(relative_file_path, (None, None, None))
+            if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                file_hash = hash_content(file_path)
+                with self._lock:
+                    self._file_hashes[relative_file_path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+            path_hash.update(relative_file_path.encode())
+            path_hash.update(file_hash.encode())
+        return path_hash.hexdigest()
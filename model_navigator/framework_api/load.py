@@ -43,6 +43,7 @@ from model_navigator.framework_api.utils import (
 )
 from model_navigator.model import Format
 from model_navigator.utils import devices
+from model_navigator.utils.nav_package import ZippedNavPackage
 
 
 class StatusDictUpdater:
@@ -123,6 +124,7 @@ class PackageUpdater:
                 raise ModelNavigatorBackwardCompatibilityError(
                     "Cannot load TensorFlow2 .nav packages generated by Model Navigator version < 0.3.4 and with multiple inputs."
                 )
+            pkg_desc.materialize()
             _update_savedmodel_signature(
                 model_name=pkg_desc.config.model_name,
                 input_metadata=pkg_desc.navigator_status.input_metadata,
@@ -168,6 +170,7 @@ def _load_package_descriptor(
     path: Union[str, Path],
     workdir: Optional[Union[str, Path]] = None,
     override_workdir: bool = False,
+    lazy: bool = False,
 ) -> PackageDescriptor:
     def _filter_out_converted_models(paths: List[str], pkg_desc: PackageDescriptor):
         export_formats = get_framework_export_formats(pkg_desc.framework)
@@ -204,17 +207,25 @@ def _load_package_descriptor(
         StatusDictUpdater().update_(status_dict, format_version)
         navigator_status = NavigatorStatus.from_dict(status_dict)
 
+        package = ZippedNavPackage(path) if lazy else None
         if workdir.exists():
             if override_workdir:
                 shutil.rmtree(workdir)
-            else:
+            elif package is None or not package.is_materialized_in(workdir):
                 raise FileExistsError(workdir)
 
         pkg_desc = PackageDescriptor(navigator_status, workdir)
         all_members = zf.namelist()
         filtered_members = _filter_out_converted_models(all_members, pkg_desc)
         filtered_members = _filter_out_generated_files(filtered_members)
-        zf.extractall(workdir, members=filtered_members)
+        if package is not None:
+            # members are extracted when accessed; workdir reused when already holding members of this package
+            # status file is written from the updated status and must not be overridden by the package member
+            filtered_members = [member for member in filtered_members if member != PackageDescriptor.status_filename]
+            pkg_desc = PackageDescriptor(navigator_status, workdir, package=package, package_members=filtered_members)
+            workdir.mkdir(parents=True, exist_ok=True)
+        else:
+            zf.extractall(workdir, members=filtered_members)
 
     PackageUpdater().update_(pkg_desc, pkg_version)
     pkg_desc.save_status_file()
@@ -248,16 +259,24 @@ def load(
     target_device: Optional[str] = None,
     verbose: bool = False,
     debug: bool = False,
+    use_runtime_workers: bool = False,
+    max_concurrent_commands: int = 1,
+    max_concurrent_gpu_commands: int = 1,
+    batched_correctness: bool = False,
+    conversion_cache_dir: Optional[Union[str, Path]] = None,
+    conversion_cache_max_size: Optional[int] = None,
+    lazy: bool = False,
 ) -> PackageDescriptor:
     """Load .nav package from the path.
     If `retest_conversions = True` rerun conversion tests (including correctness and performance).
+    If `lazy = True` extract package members to workdir only when they are accessed.
     """
     if run_profiling is None:
         run_profiling = retest_conversions
     if not retest_conversions and run_profiling:
         raise ValueError("Cannot run profiling without retesting conversions.")
 
-    pkg_desc = _load_package_descriptor(path=path, workdir=workdir, override_workdir=override_workdir)
+    pkg_desc = _load_package_descriptor(path=path, workdir=workdir, override_workdir=override_workdir, lazy=lazy)
     if not retest_conversions:
         return pkg_desc
 
@@ -267,6 +286,12 @@ def load(
     config.disable_git_info = True
     config.verbose = verbose
     config.debug = debug
+    config.use_runtime_workers = use_runtime_workers
+    config.max_concurrent_commands = max_concurrent_commands
+    config.max_concurrent_gpu_commands = max_concurrent_gpu_commands
+    config.batched_correctness = batched_correctness
+    config.conversion_cache_dir = conversion_cache_dir
+    config.conversion_cache_max_size = conversion_cache_max_size
 
     if use_config_defaults:
         _update_config_defaults(config, pkg_desc.framework)
@@ -294,6 +319,13 @@ def load(
         for model_status in pkg_desc.navigator_status.model_status
         if model_status.format in get_framework_export_formats(pkg_desc.framework)
     ]
+    # pipelines read exported models and samples from workdir
+    for model_status in exported_model_status:
+        if model_status.path:
+            pkg_desc.materialize(model_status.path.parent)
+    pkg_desc.materialize(Path("model_input"))
+    pkg_desc.materialize(Path("model_output"))
+
     pipeline_manager = PipelineManager(builders)
     new_pkg_desc = PackageDescriptor.build(pipeline_manager, config, existing_model_status=exported_model_status)
     _copy_verified_status(pkg_desc, new_pkg_desc)
@@ -17,7 +17,6 @@ import itertools
 import os
 import shutil
 import uuid
-import zipfile
 from importlib.metadata import version
 from itertools import chain
 from pathlib import Path
@@ -32,6 +31,7 @@ from model_navigator.framework_api.commands.performance import ProfilerConfig
 from model_navigator.framework_api.common import TensorMetadata
 from model_navigator.framework_api.config import Config
 from model_navigator.framework_api.exceptions import UserError
+from model_navigator.framework_api.incremental import COMMANDS_STATE_FILENAME
 from model_navigator.framework_api.logger import LOGGER
 from model_navigator.framework_api.pipelines.builders.profiling import profiling_builder
 from model_navigator.framework_api.pipelines.pipeline_manager import PipelineManager
@@ -51,16 +51,31 @@ from model_navigator.framework_api.utils import (
 )
 from model_navigator.model import Format
 from model_navigator.utils.environment import get_env, get_git_info
+from model_navigator.utils.nav_package import (
+    MATERIALIZED_MEMBERS_FILENAME,
+    ZippedNavPackage,
+    write_zipped_nav_package,
+)
 
 
 class PackageDescriptor:
     status_filename = get_default_status_filename()
 
-    def __init__(self, navigator_status: NavigatorStatus, workdir: Path, model: Optional[object] = None):
+    def __init__(
+        self,
+        navigator_status: NavigatorStatus,
+        workdir: Path,
+        model: Optional[object] = None,
+        package: Optional[ZippedNavPackage] = None,
+        package_members: Optional[Sequence[str]] = None,
+    ):
         self.navigator_status = navigator_status
         self.workdir = workdir
         self.model = model
         self._forward_kw_names = None
+        # lazily loaded package - members are extracted to workdir when accessed
+        self._package = package
+        self._package_members = set(package_members) if package_members is not None else None
 
     @classmethod
     def build(
@@ -155,6 +170,15 @@ class PackageDescriptor:
 
             return tensorflow.keras.models.load_model(model_path)
 
+    def materialize(self, relative_path: Optional[Path] = None) -> None:
+        """Extract members of lazily loaded package located under the path; all members if path is None."""
+        if self._package is None:
+            return
+        members = self._package.members_under(relative_path)
+        if self._package_members is not None:
+            members = [member for member in members if member in self._package_members]
+        self._package.materialize(members, self.workdir)
+
     def _cleanup(self):
         if self.workdir.exists():
             shutil.rmtree(self.workdir, ignore_errors=True)
@@ -281,13 +305,15 @@ class PackageDescriptor:
             model object for TensorFlow, PyTorch and ONNX
             model path for TensorRT
         """
-        model_path = self.workdir / format_to_relative_model_path(
+        relative_model_path = format_to_relative_model_path(
             format=format,
             jit_type=jit_type,
             precision=precision,
             enable_xla=enable_xla,
             jit_compile=jit_compile,
         )
+        self.materialize(relative_model_path.parent)
+        model_path = self.workdir / relative_model_path
         if model_path.exists():
             return self._load_model(model_path=model_path, format=format)
         else:
@@ -305,10 +331,28 @@ class PackageDescriptor:
         """
         Load exported model for given format, jit_type and precision and return Polygraphy runner for given runtime.
 
+        ONNX models are loaded with the session options found by the CPU tuning if it was run for the runtime.
+
         :return
             Polygraphy BaseRunner object: https://github.com/NVIDIA/TensorRT/blob/main/tools/Polygraphy/polygraphy/backend/base/runner.py
         """
-
+        onnx_session_config = None
+        if format == Format.ONNX:
+            try:
+                onnx_session_config = self.get_runtime_results(
+                    format=format, runtime_provider=runtime
+                ).onnx_session_config
+            except RuntimeError:
+                pass
+        self.materialize(
+            format_to_relative_model_path(
+                format=format,
+                jit_type=jit_type,
+                precision=precision,
+                enable_xla=enable_xla,
+                jit_compile=jit_compile,
+            ).parent
+        )
         return RunnerManager(
             input_metadata=self.navigator_status.input_metadata,
             output_metadata=self.navigator_status.output_metadata,
@@ -321,6 +365,7 @@ class PackageDescriptor:
             runtime=runtime,
             enable_xla=enable_xla,
             jit_compile=jit_compile,
+            onnx_session_config=onnx_session_config,
         )
 
     def get_source_runner(
@@ -444,20 +489,25 @@ class PackageDescriptor:
     def _make_zip(self, zip_path, workdir, dirs_to_save, base_models_paths, converted_models_paths) -> None:
 
         checkpoint_extensions = {ext.value for ext in Extension}
-        with zipfile.ZipFile(zip_path.as_posix(), "w") as zf:
-            for dirname, _, files in os.walk(workdir.as_posix()):
-                if dirname != workdir.as_posix() and not dirname.startswith(tuple(d.as_posix() for d in dirs_to_save)):
+        dirs_to_save = tuple(d.as_posix() for d in dirs_to_save)
+        converted_models_paths = tuple(p.as_posix() for p in converted_models_paths)
+        base_models_paths = {mp.as_posix() for mp in base_models_paths}
+        members = {}
+        for dirname, _, files in os.walk(workdir.as_posix()):
+            if dirname != workdir.as_posix() and not dirname.startswith(dirs_to_save):
+                continue
+            if dirname.startswith(converted_models_paths):
+                continue
+            for filename in files:
+                if filename in (MATERIALIZED_MEMBERS_FILENAME, COMMANDS_STATE_FILENAME):
                     continue
-                if dirname.startswith(tuple(p.as_posix() for p in converted_models_paths)):
+                filepath = os.path.join(dirname, filename)
+                _, ext = os.path.splitext(filepath)
+                if ext.lstrip(".") in checkpoint_extensions and filepath not in base_models_paths:
                     continue
-                for filename in files:
-                    filepath = os.path.join(dirname, filename)
-                    _, ext = os.path.splitext(filepath)
-                    if ext.lstrip(".") in checkpoint_extensions and filepath not in [
-                        mp.as_posix() for mp in base_models_paths
-                    ]:
-                        continue
-                    zf.write(filepath, filepath[len(workdir.as_posix()) :])
+                members[Path(filepath).relative_to(workdir).as_posix()] = Path(filepath)
+
+        write_zipped_nav_package(zip_path, members)
 
     def _get_models_paths_to_save(
         self,
@@ -530,15 +580,15 @@ class PackageDescriptor:
         That won't allow for correctness check later on in the deployment process.
         """
         path = Path(path)
-        if path.exists():
-            if override:
-                path.unlink()
-            else:
-                raise FileExistsError(path)
+        # overridden package is updated in place, so members which have not changed since it was saved are kept
+        if path.exists() and not override:
+            raise FileExistsError(path)
 
         if not self.workdir.exists():
             raise FileNotFoundError("Workdir has been removed. Save() no longer available.")
 
+        self.materialize()
+
         if self._is_empty:
             raise RuntimeError("No successful exports, .nav package cannot be created.")
 
@@ -11,55 +11,86 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+"""Detection of the optional frameworks.
 
-from packaging import version
+Frameworks are detected from the module specs and the distributions metadata without importing them,
+so importing Model Navigator does not pay the import time of the frameworks.
+"""
 
-try:
-    import jax.experimental  # pytype: disable=import-error # noqa: F401
+import functools
+import importlib
+import importlib.util
+import sys
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as get_version
+from typing import Callable, Mapping, Optional, Tuple
 
-    _JAX_AVILABLE = True
-except ModuleNotFoundError:
-    _JAX_AVILABLE = False
+from packaging import version
 
-try:
-    import torch  # pytype: disable=import-error # noqa: F401
+# distributions providing the `tensorflow` module
+_TF_DISTRIBUTIONS = ("tensorflow", "tensorflow-gpu", "tensorflow-cpu", "tensorflow-macos", "tf-nightly")
 
-    _TORCH_AVAILABLE = True
-except ModuleNotFoundError:
-    _TORCH_AVAILABLE = False
 
-try:
-    import tensorflow  # pytype: disable=import-error
+def _is_module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-    _TF_VERSION = tensorflow.__version__
 
-    if version.parse(_TF_VERSION) < version.parse("2.0.0"):
-        _TF_AVAILABLE = False
-    else:
-        _TF_AVAILABLE = True
-except (ModuleNotFoundError, AttributeError):
-    _TF_AVAILABLE = False
+def _get_tf_version() -> Optional[str]:
+    for distribution in _TF_DISTRIBUTIONS:
+        try:
+            return get_version(distribution)
+        except PackageNotFoundError:
+            continue
 
-try:
-    import datasets  # pytype: disable=import-error # noqa: F401
-    import transformers  # pytype: disable=import-error # noqa: F401
+    # module installed without distribution metadata, e.g. built from source
+    try:
+        import tensorflow  # pytype: disable=import-error
 
-    _HF_AVAILABLE = True
-except ModuleNotFoundError:
-    _HF_AVAILABLE = False
+        return tensorflow.__version__
+    except (ImportError, AttributeError):
+        return None
 
 
+@functools.lru_cache(maxsize=None)
 def is_torch_available() -> bool:
-    return _TORCH_AVAILABLE
+    return _is_module_available("torch")
 
 
+@functools.lru_cache(maxsize=None)
 def is_tf_available() -> bool:
-    return _TF_AVAILABLE
+    if not _is_module_available("tensorflow"):
+        return False
+    tf_version = _get_tf_version()
+    return tf_version is not None and version.parse(tf_version) >= version.parse("2.0.0")
 
 
+@functools.lru_cache(maxsize=None)
 def is_hf_available() -> bool:
-    return _HF_AVAILABLE
+    return _is_module_available("datasets") and _is_module_available("transformers")
 
 
+@functools.lru_cache(maxsize=None)
 def is_jax_available() -> bool:
-    return _JAX_AVILABLE
+    return _is_module_available("jax") and _is_module_available("jaxlib")
+
+
+def lazy_modules_getattr(package_name: str, modules: Mapping[str, Tuple[str, Callable[[], bool]]]) -> Callable:
+    """Return module `__getattr__` importing framework specific modules of the package on the first access.
+
+    Modules are given as `attribute name -> (module name, availability check)`. Attributes of unavailable
+    frameworks are not defined, the same as when the modules were imported conditionally.
+    """
+
+    def __getattr__(name: str):
+        if name in modules:
+            module_name, is_available = modules[name]
+            if is_available():
+                module = importlib.import_module(module_name)
+                setattr(sys.modules[package_name], name, module)
+                return module
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    return __getattr__
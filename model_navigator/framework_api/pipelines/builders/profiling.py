@@ -16,10 +16,11 @@
 from typing import TYPE_CHECKING
 
 from model_navigator.framework_api.commands.load import LoadMetadata, LoadSamples
-from model_navigator.framework_api.commands.performance import Performance
+from model_navigator.framework_api.commands.performance import Performance, TuneOnnxSessionOptions
 from model_navigator.framework_api.config import Config
 from model_navigator.framework_api.pipelines.pipeline import Pipeline
-from model_navigator.framework_api.utils import Status
+from model_navigator.framework_api.utils import RuntimeProvider, Status
+from model_navigator.model import Format
 
 if TYPE_CHECKING:
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
@@ -33,6 +34,17 @@ def profiling_builder(config: Config, package_descriptor: "PackageDescriptor") -
     for model_status in package_descriptor.navigator_status.model_status:
         for runtime_results in model_status.runtime_results:
             if runtime_results.status == Status.OK:
+                if (
+                    config.profiler_config.onnx_cpu_tuning
+                    and model_status.format == Format.ONNX
+                    and runtime_results.runtime == RuntimeProvider.CPU
+                ):
+                    commands.append(
+                        TuneOnnxSessionOptions(
+                            name=f"Tune session options {model_status.format.value}",
+                            requires=(load_metadata, load_samples),
+                        )
+                    )
                 commands.append(
                     Performance(
                         name=f"Performance {model_status.format.value}",
@@ -43,6 +55,7 @@ def profiling_builder(config: Config, package_descriptor: "PackageDescriptor") -
                         runtime_provider=runtime_results.runtime,
                         enable_xla=model_status.enable_xla,
                         jit_compile=model_status.jit_compile,
+                        onnx_session_config=runtime_results.onnx_session_config,
                     )
                 )
 
@@ -36,7 +36,8 @@ def tensorflow_conversion_builder(config: Config, package_descriptor: "PackageDe
     for enable_xla in config.enable_xla if config.enable_xla else [None]:
         for jit_compile in config.jit_compile if config.jit_compile else [None]:
             if Format.ONNX in config.target_formats or Format.TENSORRT in config.target_formats:
-                commands.append(ConvertSavedModel2ONNX(enable_xla=enable_xla, jit_compile=jit_compile))
+                convert_onnx = ConvertSavedModel2ONNX(enable_xla=enable_xla, jit_compile=jit_compile)
+                commands.append(convert_onnx)
             if Format.TENSORRT in config.target_formats:
                 for target_precision in config.target_precisions:
                     commands.append(
@@ -45,6 +46,7 @@ def tensorflow_conversion_builder(config: Config, package_descriptor: "PackageDe
                             precision_mode=config.precision_mode,
                             enable_xla=enable_xla,
                             jit_compile=jit_compile,
+                            requires=(convert_onnx,),
                         )
                     )
             if Format.TF_TRT in config.target_formats:
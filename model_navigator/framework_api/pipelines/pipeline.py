@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from model_navigator.framework_api.commands.core import Command
@@ -39,20 +40,89 @@ class Pipeline:
     def __call__(self, config: Config, package_descriptor: "PackageDescriptor", **kwargs) -> Dict[str, Any]:
         LOGGER.info(pad_string(f"Pipeline '{self.name}' started"))
         additional_params = kwargs
+        if config.max_concurrent_commands > 1 and len(self.commands) > 1:
+            self._execute_concurrently(config, package_descriptor, additional_params)
+            return additional_params
+
         for command in self.commands:
             LOGGER.info(pad_string(command.get_formatted_command_details()))
             command.transform(package_descriptor, **{**config.to_dict(), **additional_params})
-
-            output_names = command.get_output_name()
-            outputs = command.output
-            if output_names is not None:
-                if outputs is None:
-                    outputs = ()
-                if isinstance(output_names, str):
-                    output_names, outputs = (output_names,), (outputs,)
-                for output_name, output in zip(output_names, outputs):
-                    additional_params[output_name] = output
-                    if output_name in config.__dataclass_fields__:
-                        setattr(config, output_name, output)
+            self._update_params(command, config, additional_params)
 
         return additional_params
+
+    def _execute_concurrently(
+        self, config: Config, package_descriptor: "PackageDescriptor", additional_params: Dict[str, Any]
+    ):
+        """
+        Execute commands which do not depend on each other concurrently.
+
+        Command is started when all commands it requires are finished. Exclusive commands are executed
+        when no other command is running and no following command is started before them.
+        Package descriptor and pipeline parameters are updated in the order of commands in the pipeline,
+        so the produced package does not depend on the order in which commands finish.
+        """
+        indices = {id(command): idx for idx, command in enumerate(self.commands)}
+        dependencies = [
+            {indices[id(req)] for req in command.requires if indices.get(id(req), idx) < idx}
+            for idx, command in enumerate(self.commands)
+        ]
+        kwargs: Dict[int, Dict[str, Any]] = {}
+        running: Dict[Future, int] = {}
+        gpu_commands, finished, committed = set(), set(), set()
+        next_committed = 0
+
+        with ThreadPoolExecutor(max_workers=config.max_concurrent_commands) as executor:
+            while next_committed < len(self.commands):
+                for idx, command in enumerate(self.commands):
+                    if idx in kwargs:
+                        continue
+                    if len(running) >= config.max_concurrent_commands:
+                        break
+                    if any(self.commands[running_idx].is_exclusive() for running_idx in running.values()):
+                        break
+                    if not dependencies[idx] <= committed:
+                        if command.is_exclusive():
+                            break
+                        continue
+                    if command.is_exclusive() and running:
+                        break
+
+                    command_kwargs = {**config.to_dict(), **additional_params}
+                    uses_gpu = command.uses_gpu(**command_kwargs)
+                    if uses_gpu and len(gpu_commands & set(running.values())) >= config.max_concurrent_gpu_commands:
+                        continue
+
+                    LOGGER.info(pad_string(command.get_formatted_command_details()))
+                    kwargs[idx] = command_kwargs
+                    running[executor.submit(command.execute, **command_kwargs)] = idx
+                    if uses_gpu:
+                        gpu_commands.add(idx)
+                    if command.is_exclusive():
+                        break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished.add(running.pop(future))
+                    future.result()
+
+                while next_committed in finished:
+                    command = self.commands[next_committed]
+                    command.update_package_descriptor(package_descriptor, **kwargs[next_committed])
+                    self._update_params(command, config, additional_params)
+                    committed.add(next_committed)
+                    next_committed += 1
+
+    @staticmethod
+    def _update_params(command: Command, config: Config, additional_params: Dict[str, Any]):
+        output_names = command.get_output_name()
+        outputs = command.output
+        if output_names is not None:
+            if outputs is None:
+                outputs = ()
+            if isinstance(output_names, str):
+                output_names, outputs = (output_names,), (outputs,)
+            for output_name, output in zip(output_names, outputs):
+                additional_params[output_name] = output
+                if output_name in config.__dataclass_fields__:
+                    setattr(config, output_name, output)
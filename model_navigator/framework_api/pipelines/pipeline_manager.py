@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import shutil
 from typing import TYPE_CHECKING, Callable, List, Sequence
 
 from model_navigator.framework_api.config import Config
+from model_navigator.framework_api.incremental import IncrementalState
 from model_navigator.framework_api.logger import LOGGER, add_log_file_handler
 from model_navigator.framework_api.pipelines.pipeline import Pipeline
+from model_navigator.framework_api.runtime_workers import RuntimeWorkers
 from model_navigator.framework_api.utils import Indent, Status, pad_string
+from model_navigator.utils.conversion_cache import ConversionCache
 
 if TYPE_CHECKING:
     from model_navigator.framework_api.package_descriptor import PackageDescriptor
@@ -34,12 +38,26 @@ class PipelineManager:
         self._prepare_workdir(config)
         self._prepare_log_file(config)
 
-        additional_params = {}
-        for pipeline_builder in self._pipeline_builders:
-            pipeline = pipeline_builder(config, package_descriptor)
-            additional_params = pipeline(config=config, package_descriptor=package_descriptor, **additional_params)
-            self._pipelines.append(pipeline)
-            package_descriptor.save_status_file()
+        with contextlib.ExitStack() as exit_stack:
+            additional_params = {}
+            if config.use_runtime_workers:
+                additional_params["runtime_workers"] = exit_stack.enter_context(RuntimeWorkers(verbose=config.verbose))
+            if config.conversion_cache_dir is not None:
+                additional_params["conversion_cache"] = ConversionCache(
+                    config.conversion_cache_dir, max_size=config.conversion_cache_max_size
+                )
+            incremental_state = None
+            if config.incremental:
+                incremental_state = IncrementalState(config.workdir)
+                additional_params["incremental_state"] = incremental_state
+
+            for pipeline_builder in self._pipeline_builders:
+                pipeline = pipeline_builder(config, package_descriptor)
+                additional_params = pipeline(config=config, package_descriptor=package_descriptor, **additional_params)
+                self._pipelines.append(pipeline)
+                package_descriptor.save_status_file()
+                if incremental_state is not None:
+                    incremental_state.save()
 
         self._log_results()
 
@@ -13,11 +13,65 @@
 # limitations under the License.
 
 
+import time
+from typing import Dict
+
+from model_navigator.framework_api.utils import Parameter
+
+
+class InferencePhase(Parameter):
+    INPUT_PREPARATION = "input_preparation"
+    H2D = "h2d"
+    COMPUTE = "compute"
+    D2H = "d2h"
+    OUTPUT_CONVERSION = "output_conversion"
+
+
+class PhaseTimer:
+    """
+    Measure consecutive phases of a single inference with `time.perf_counter_ns`.
+
+    Each `mark` closes the phase started by the previous `mark` (or by the timer creation).
+    """
+
+    def __init__(self):
+        self._start = self._last = time.perf_counter_ns()
+        self._phases: Dict[InferencePhase, int] = {}
+
+    def mark(self, phase: InferencePhase) -> None:
+        now = time.perf_counter_ns()
+        self._phases[phase] = self._phases.get(phase, 0) + now - self._last
+        self._last = now
+
+    def total(self) -> float:
+        """Time from the timer creation to the last mark in seconds."""
+        return (self._last - self._start) / 1e9
+
+    def phases(self) -> Dict[str, float]:
+        """Duration of each marked phase in seconds."""
+        return {phase.value: duration / 1e9 for phase, duration in self._phases.items()}
+
+
 class INavigatorRunner:
+    # per phase duration of the last inference in seconds; set by runners which measure phases
+    inference_phases: Dict[str, float] = {}
+
     @classmethod
     def is_inference_time_stabilized(cls) -> bool:
         return False
 
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        return False
+
+    def last_inference_phases(self) -> Dict[str, float]:
+        """Duration of the phases (see `InferencePhase`) of the last inference in seconds."""
+        return self.inference_phases
+
+    def _record_inference_time(self, timer: PhaseTimer) -> None:
+        self.inference_time = timer.total()
+        self.inference_phases = timer.phases()
+
 
 class INavigatorStabilizedRunner(INavigatorRunner):
     @classmethod
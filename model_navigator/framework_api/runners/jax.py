@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 from collections import OrderedDict
 from typing import Mapping
 
@@ -20,7 +19,7 @@ import numpy
 from polygraphy.backend.base import BaseRunner
 from polygraphy.common import TensorMetadata
 
-from model_navigator.framework_api.runners.base import INavigatorRunner
+from model_navigator.framework_api.runners.base import INavigatorRunner, InferencePhase, PhaseTimer
 
 
 class JAXRunner(INavigatorRunner, BaseRunner):
@@ -56,15 +55,15 @@ class JAXRunner(INavigatorRunner, BaseRunner):
         return self.input_metadata
 
     def infer_impl(self, feed_dict):
+        timer = PhaseTimer()
         inputs = tuple(feed_dict.values())
 
-        start = time.time()
         if self._forward_kw_names is None:
             outputs = self.model(*inputs, params=self.model_params)
         else:
             inputs = dict(zip(self._forward_kw_names, inputs))
             outputs = self.model(**inputs, params=self.model_params)
-        end = time.time()
+        timer.mark(InferencePhase.COMPUTE)
 
         if self.output_names is None:
             if isinstance(outputs, Mapping):
@@ -76,11 +75,15 @@ class JAXRunner(INavigatorRunner, BaseRunner):
             outputs = (outputs,)
         if isinstance(outputs, Mapping):
             outputs = outputs.values()
+        # JAX dispatches computations asynchronously - the conversion waits for the results
         outputs = [numpy.asarray(output) for output in outputs]
         outputs = tuple(outputs)
+        timer.mark(InferencePhase.D2H)
 
         out_dict = OrderedDict()
         for name, output in zip(self.output_names, outputs):
             out_dict[name] = output
-        self.inference_time = end - start
+        timer.mark(InferencePhase.OUTPUT_CONVERSION)
+
+        self._record_inference_time(timer)
         return out_dict
@@ -12,29 +12,211 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
+import threading
 from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Mapping, Optional
 
+from polygraphy import util
 from polygraphy.backend.onnxrt import OnnxrtRunner as _OnnxrtRunner
+from polygraphy.backend.onnxrt import SessionFromOnnx
 
-from model_navigator.framework_api.runners.base import INavigatorRunner
-from model_navigator.framework_api.utils import Framework, validate_sample_output
+from model_navigator.framework_api.common import DataObject
+from model_navigator.framework_api.runners.base import INavigatorRunner, InferencePhase, PhaseTimer
+from model_navigator.framework_api.utils import Framework, Parameter, validate_sample_output
+
+_GPU_PROVIDERS = ("CUDAExecutionProvider", "TensorrtExecutionProvider")
+
+
+class OnnxExecutionMode(Parameter):
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
+class OnnxGraphOptimizationLevel(Parameter):
+    DISABLE_ALL = "disable_all"
+    BASIC = "basic"
+    EXTENDED = "extended"
+    ALL = "all"
+
+
+@dataclass
+class OnnxSessionConfig(DataObject):
+    """ONNX Runtime session options; options set to None keep the ONNX Runtime defaults."""
+
+    intra_op_num_threads: Optional[int] = None
+    inter_op_num_threads: Optional[int] = None
+    execution_mode: Optional[OnnxExecutionMode] = None
+    graph_optimization_level: Optional[OnnxGraphOptimizationLevel] = None
+    enable_cpu_mem_arena: Optional[bool] = None
+    enable_mem_pattern: Optional[bool] = None
+
+    @classmethod
+    def from_dict(cls, dict: Mapping):
+        return cls(
+            intra_op_num_threads=dict.get("intra_op_num_threads"),
+            inter_op_num_threads=dict.get("inter_op_num_threads"),
+            execution_mode=OnnxExecutionMode(dict["execution_mode"]) if dict.get("execution_mode") else None,
+            graph_optimization_level=OnnxGraphOptimizationLevel(dict["graph_optimization_level"])
+            if dict.get("graph_optimization_level")
+            else None,
+            enable_cpu_mem_arena=dict.get("enable_cpu_mem_arena"),
+            enable_mem_pattern=dict.get("enable_mem_pattern"),
+        )
+
+    def to_session_options(self):
+        import onnxruntime  # pytype: disable=import-error
+
+        options = onnxruntime.SessionOptions()
+        if self.intra_op_num_threads is not None:
+            options.intra_op_num_threads = self.intra_op_num_threads
+        if self.inter_op_num_threads is not None:
+            options.inter_op_num_threads = self.inter_op_num_threads
+        if self.execution_mode is not None:
+            options.execution_mode = getattr(onnxruntime.ExecutionMode, f"ORT_{self.execution_mode.name}")
+        if self.graph_optimization_level is not None:
+            level_name = self.graph_optimization_level.name
+            if self.graph_optimization_level != OnnxGraphOptimizationLevel.DISABLE_ALL:
+                level_name = f"ENABLE_{level_name}"
+            options.graph_optimization_level = getattr(onnxruntime.GraphOptimizationLevel, f"ORT_{level_name}")
+        if self.enable_cpu_mem_arena is not None:
+            options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        if self.enable_mem_pattern is not None:
+            options.enable_mem_pattern = self.enable_mem_pattern
+        return options
+
+
+class SessionFromOnnxWithOptions(SessionFromOnnx):
+    """
+    Functor that builds an ONNX Runtime inference session with the session options from `session_config`.
+    """
+
+    def __init__(self, model_bytes, providers=None, session_config: Optional[OnnxSessionConfig] = None):
+        super().__init__(model_bytes, providers=providers)
+        self.session_config = session_config or OnnxSessionConfig()
+
+    def call_impl(self):
+        import onnxruntime  # pytype: disable=import-error
+
+        model_bytes, _ = util.invoke_if_callable(self._model_bytes_or_path)
+        available_providers = onnxruntime.get_available_providers()
+        providers = []
+        for provider in self.providers:
+            matched_provider = util.find_str_in_iterable(provider, available_providers)
+            if matched_provider is None:
+                raise ValueError(f"Could not find ONNX Runtime execution provider {provider} in {available_providers}")
+            providers.append(matched_provider)
+
+        return onnxruntime.InferenceSession(
+            model_bytes, sess_options=self.session_config.to_session_options(), providers=providers
+        )
 
 
 class OnnxrtRunner(INavigatorRunner, _OnnxrtRunner):
+    """
+    Runs inference using ONNX Runtime.
+    """
+
+    def __init__(self, sess, name=None, reuse_buffers=False):
+        """
+        Args:
+            sess (Union[onnxruntime.InferenceSession, Callable() -> onnxruntime.InferenceSession]):
+                    An ONNX-Runtime inference session or a callable that returns one.
+            name (str):
+                    The human-readable name prefix to use for this runner.
+                    A runner count and timestamp will be appended to this prefix.
+            reuse_buffers (bool):
+                    Run inference with IOBinding; device input buffers and output buffers are allocated
+                    once per shape and reused by the following requests.
+        """
+        super().__init__(sess, name=name)
+        self._reuse_buffers = reuse_buffers
+        self._input_names = None
+        self._buffers = threading.local()
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        return True
+
     def infer(self, feed_dict, check_inputs=None, *args, **kwargs):
-        feed_dict = {name: tensor for name, tensor in feed_dict.items() if name in self.get_input_metadata()}
+        if self._input_names is None:
+            self._input_names = set(self.get_input_metadata())
+        if not feed_dict.keys() <= self._input_names:
+            feed_dict = {name: tensor for name, tensor in feed_dict.items() if name in self._input_names}
         return super().infer(feed_dict, check_inputs, *args, **kwargs)
 
     def infer_impl(self, feed_dict):
-        start = time.time()
+        if self._reuse_buffers:
+            return self._infer_with_io_binding(feed_dict)
+
+        timer = PhaseTimer()
+        # with numpy inputs and outputs the host-device transfers are part of the session run
         inference_outputs = self.sess.run(None, feed_dict)
-        end = time.time()
+        timer.mark(InferencePhase.COMPUTE)
+
+        validate_sample_output(inference_outputs, Framework.ONNX)
+
+        out_dict = OrderedDict()
+        for node, out in zip(self.sess.get_outputs(), inference_outputs):
+            out_dict[node.name] = out
+        timer.mark(InferencePhase.OUTPUT_CONVERSION)
+
+        self._record_inference_time(timer)
+        return out_dict
+
+    def _infer_with_io_binding(self, feed_dict):
+        import onnxruntime  # pytype: disable=import-error
+
+        timer = PhaseTimer()
+        buffers = self._get_buffers()
+        binding = buffers.binding
+        for name, tensor in feed_dict.items():
+            if buffers.device_type == "cpu":
+                # CPU inputs are bound without copying
+                binding.bind_cpu_input(name, tensor)
+                continue
+            shape, dtype, ortvalue = buffers.inputs.get(name, (None, None, None))
+            if shape == tensor.shape and dtype == tensor.dtype:
+                ortvalue.update_inplace(tensor)
+            else:
+                ortvalue = onnxruntime.OrtValue.ortvalue_from_numpy(tensor, buffers.device_type, 0)
+                buffers.inputs[name] = (tensor.shape, tensor.dtype, ortvalue)
+            binding.bind_ortvalue_input(name, ortvalue)
+
+        # outputs allocated by the previous request with the same input shapes are reused
+        shapes = tuple((name, tensor.shape) for name, tensor in feed_dict.items())
+        outputs = buffers.outputs.get(shapes)
+        for idx, node in enumerate(self.sess.get_outputs()):
+            if outputs is None:
+                binding.bind_output(node.name, buffers.device_type)
+            else:
+                binding.bind_ortvalue_output(node.name, outputs[idx])
+        timer.mark(InferencePhase.H2D)
+
+        self.sess.run_with_iobinding(binding)
+        timer.mark(InferencePhase.COMPUTE)
+
+        if outputs is None:
+            buffers.outputs[shapes] = binding.get_outputs()
+        inference_outputs = binding.copy_outputs_to_cpu()
+        timer.mark(InferencePhase.D2H)
 
         validate_sample_output(inference_outputs, Framework.ONNX)
 
         out_dict = OrderedDict()
         for node, out in zip(self.sess.get_outputs(), inference_outputs):
             out_dict[node.name] = out
-        self.inference_time = end - start
+        timer.mark(InferencePhase.OUTPUT_CONVERSION)
+
+        self._record_inference_time(timer)
         return out_dict
+
+    def _get_buffers(self):
+        # buffers are kept per thread as requests may be sent concurrently; new session invalidates them
+        buffers = self._buffers
+        if getattr(buffers, "sess", None) is not self.sess:
+            buffers.sess = self.sess
+            buffers.binding = self.sess.io_binding()
+            buffers.device_type = "cuda" if set(_GPU_PROVIDERS) & set(self.sess.get_providers()) else "cpu"
+            buffers.inputs, buffers.outputs = {}, {}
+        return buffers
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
+import threading
 from collections import OrderedDict
 from pathlib import Path
 from typing import Mapping
@@ -21,7 +21,7 @@ import torch  # pytype: disable=import-error
 from polygraphy.backend.base import BaseRunner
 from polygraphy.common import TensorMetadata
 
-from model_navigator.framework_api.runners.base import INavigatorRunner
+from model_navigator.framework_api.runners.base import INavigatorRunner, InferencePhase, PhaseTimer
 from model_navigator.framework_api.utils import Framework, validate_sample_output
 from model_navigator.utils import tensorrt
 
@@ -40,6 +40,7 @@ class PytRunner(INavigatorRunner, BaseRunner):
         name=None,
         forward_kw_names=None,
         trt_dtype_cast=False,
+        reuse_buffers=False,
     ):
         """
         Args:
@@ -57,6 +58,10 @@ class PytRunner(INavigatorRunner, BaseRunner):
 
             trt_dtype_cast (bool):
                 Cast data type is required for Torch-TensorRT
+
+            reuse_buffers (bool):
+                Copy inputs and outputs through pinned host and device buffers allocated once per shape.
+                Returned outputs are overwritten by the next request on CUDA devices.
         """
         super().__init__(name=name, prefix="pytorch-runner")
         self._model = model
@@ -69,6 +74,12 @@ class PytRunner(INavigatorRunner, BaseRunner):
         self.output_names = output_names
         self._forward_kw_names = forward_kw_names
         self._trt_dtype_cast = trt_dtype_cast
+        self._reuse_buffers = reuse_buffers and torch.device(target_device).type == "cuda"
+        self._buffers = threading.local()
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        return True
 
     def activate_impl(self):
         if isinstance(self._model, (str, Path)):
@@ -84,17 +95,24 @@ class PytRunner(INavigatorRunner, BaseRunner):
         return self.input_metadata
 
     def infer_impl(self, feed_dict):
-        start = time.time()
+        timer = PhaseTimer()
+        values = [
+            self._cast_value(val, dtype) for (val, (dtype, _)) in zip(feed_dict.values(), self.input_metadata.values())
+        ]
+        timer.mark(InferencePhase.INPUT_PREPARATION)
+
         with torch.no_grad():
-            inputs = [
-                torch.from_numpy(self._cast_value(val, dtype)).to(self._target_device)
-                for (val, (dtype, _)) in zip(feed_dict.values(), self.input_metadata.values())
-            ]
+            inputs = [self._to_device(idx, val) for idx, val in enumerate(values)]
+            self._synchronize()
+            timer.mark(InferencePhase.H2D)
+
             if self._forward_kw_names is None:
                 outputs = self.model(*inputs)
             else:
                 inputs_dict = dict(zip(self._forward_kw_names, inputs))
                 outputs = self.model(**inputs_dict)
+            self._synchronize()
+            timer.mark(InferencePhase.COMPUTE)
 
         validate_sample_output(outputs, Framework.PYT)
         if torch.is_tensor(outputs):
@@ -102,17 +120,57 @@ class PytRunner(INavigatorRunner, BaseRunner):
         if isinstance(outputs, Mapping):
             outputs = outputs.values()
 
+        outputs = [self._to_host(idx, output) for idx, output in enumerate(outputs)]
+        self._synchronize()
+        timer.mark(InferencePhase.D2H)
+
         out_dict = OrderedDict()
         if self.output_names is None:
             self.output_names = [f"output__{i}" for i in range(len(outputs))]
         for name, output in zip(self.output_names, outputs):
-            out_dict[name] = output.cpu().numpy()
-        end = time.time()
-        self.inference_time = end - start
+            out_dict[name] = output.numpy()
+        timer.mark(InferencePhase.OUTPUT_CONVERSION)
+
+        self._record_inference_time(timer)
         return out_dict
 
+    def _synchronize(self):
+        # CUDA kernels are executed asynchronously - wait for them to attribute the time to the right phase
+        if torch.device(self._target_device).type == "cuda":
+            torch.cuda.synchronize(self._target_device)
+
+    def _to_device(self, idx, value):
+        if not self._reuse_buffers:
+            return torch.from_numpy(value).to(self._target_device)
+
+        host_buffer, device_buffer = self._get_buffers("inputs", idx, value.shape, torch.from_numpy(value).dtype)
+        host_buffer.numpy()[...] = value
+        device_buffer.copy_(host_buffer, non_blocking=True)
+        return device_buffer
+
+    def _to_host(self, idx, output):
+        if not self._reuse_buffers or output.device.type != "cuda":
+            return output.cpu()
+
+        host_buffer, _ = self._get_buffers("outputs", idx, output.shape, output.dtype, device=False)
+        host_buffer.copy_(output, non_blocking=True)
+        return host_buffer
+
+    def _get_buffers(self, kind, idx, shape, dtype, device=True):
+        # buffers are kept per thread as requests may be sent concurrently
+        if not hasattr(self._buffers, kind):
+            setattr(self._buffers, kind, {})
+        buffers = getattr(self._buffers, kind)
+        host_buffer, device_buffer = buffers.get(idx, (None, None))
+        if host_buffer is None or host_buffer.shape != tuple(shape) or host_buffer.dtype != dtype:
+            host_buffer = torch.empty(tuple(shape), dtype=dtype, pin_memory=True)
+            device_buffer = torch.empty_like(host_buffer, device=self._target_device) if device else None
+            buffers[idx] = (host_buffer, device_buffer)
+        return host_buffer, device_buffer
+
     def _cast_value(self, value, dtype):
-        value = value.astype(dtype)
+        if value.dtype != dtype:
+            value = value.astype(dtype)
         value = tensorrt.cast_tensor(value)
 
         return value
@@ -20,6 +20,7 @@ from polygraphy.backend.base import BaseRunner
 from model_navigator.converter.config import TensorRTPrecision
 from model_navigator.framework_api.common import DataObject, TensorMetadata
 from model_navigator.framework_api.logger import LOGGER
+from model_navigator.framework_api.runners.onnx import OnnxSessionConfig
 from model_navigator.framework_api.runners.trt import TrtexecRunner, TrtExecRuntimeConfig
 from model_navigator.framework_api.utils import (
     Format,
@@ -45,10 +46,20 @@ class RunnerManager(DataObject):
         runtime: Optional[RuntimeProvider] = None,
         enable_xla: Optional[bool] = None,
         jit_compile: Optional[bool] = None,
+        reuse_buffers: bool = False,
+        onnx_session_config: Optional[OnnxSessionConfig] = None,
+        tf_function: bool = False,
+        tf_jit_compile: bool = False,
     ) -> BaseRunner:
         """
         Load exported model for given format, jit_type and precision and return Polygraphy runner for given runtime.
 
+        With `reuse_buffers` runners which support it allocate input and output buffers once and reuse them,
+        what is intended for profiling where the outputs are not used.
+        `onnx_session_config` sets the ONNX Runtime session options, e.g. found by the CPU tuning.
+        With `tf_function` SavedModel runners call the signature through the concrete function cached on activation
+        and with `tf_jit_compile` the function is compiled with XLA.
+
         :return
             Polygraphy BaseRunner object: https://github.com/NVIDIA/TensorRT/blob/main/tools/Polygraphy/polygraphy/backend/base/runner.py
         """
@@ -60,7 +71,15 @@ class RunnerManager(DataObject):
             jit_compile=jit_compile,
         )
         if model_path.exists():
-            return self._load_runner(model_path=model_path, format=format, runtime=runtime)
+            return self._load_runner(
+                model_path=model_path,
+                format=format,
+                runtime=runtime,
+                reuse_buffers=reuse_buffers,
+                onnx_session_config=onnx_session_config,
+                tf_function=tf_function,
+                tf_jit_compile=tf_jit_compile,
+            )
         else:
             raise ValueError(f"Runner does not exists for {model_path}.")
 
@@ -72,7 +91,16 @@ class RunnerManager(DataObject):
             target_device=data_dict["target_device"],
         )
 
-    def _load_runner(self, model_path: Path, format: Format, runtime: Optional[RuntimeProvider] = None):
+    def _load_runner(
+        self,
+        model_path: Path,
+        format: Format,
+        runtime: Optional[RuntimeProvider] = None,
+        reuse_buffers: bool = False,
+        onnx_session_config: Optional[OnnxSessionConfig] = None,
+        tf_function: bool = False,
+        tf_jit_compile: bool = False,
+    ):
         model_path = model_path.as_posix()
         LOGGER.debug(f"Loading runner from path: {model_path}")
 
@@ -80,13 +108,14 @@ class RunnerManager(DataObject):
             runtime = format2runtimes(format)
 
         if format == Format.ONNX:
-            from polygraphy.backend.onnxrt import SessionFromOnnx
-
-            from model_navigator.framework_api.runners.onnx import OnnxrtRunner
+            from model_navigator.framework_api.runners.onnx import OnnxrtRunner, SessionFromOnnxWithOptions
 
             if not isinstance(runtime, (tuple, list)):
                 runtime = [runtime]
-            return OnnxrtRunner(SessionFromOnnx(model_path, providers=runtime))
+            return OnnxrtRunner(
+                SessionFromOnnxWithOptions(model_path, providers=runtime, session_config=onnx_session_config),
+                reuse_buffers=reuse_buffers,
+            )
         elif format == Format.TENSORRT:
             from polygraphy.backend.common import BytesFromPath
             from polygraphy.backend.trt import EngineFromBytes
@@ -105,6 +134,7 @@ class RunnerManager(DataObject):
             trt_dtype_cast = False
             if format == Format.TORCH_TRT:  # make sure that torch_tensorrt is initialized
                 import torch_tensorrt  # pytype: disable=import-error # noqa: F401
+
                 trt_dtype_cast = True
 
             return PytRunner(
@@ -113,14 +143,22 @@ class RunnerManager(DataObject):
                 output_names=list(self.output_metadata.keys()),
                 target_device=self.target_device,
                 trt_dtype_cast=trt_dtype_cast,
+                reuse_buffers=reuse_buffers,
             )
         elif format in (Format.TF_SAVEDMODEL, Format.TF_TRT):
             from model_navigator.framework_api.runners.tf import TFSavedModelRunner
 
+            if tf_jit_compile and format == Format.TF_TRT:
+                # TensorRT engines embedded in the graph cannot be compiled with XLA
+                LOGGER.warning("XLA compilation is not supported for TF-TRT models. Using tf.function without XLA.")
+                tf_jit_compile = False
+
             return TFSavedModelRunner(
                 model_path,
                 input_metadata=self.input_metadata,
                 output_names=list(self.output_metadata.keys()),
+                use_tf_function=tf_function,
+                jit_compile=tf_jit_compile,
             )
         else:
             raise ValueError(f"Unknown format: {format}")
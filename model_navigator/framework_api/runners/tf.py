@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 from collections import OrderedDict
 from pathlib import Path
 from typing import Mapping
@@ -22,7 +21,7 @@ import tensorflow as tf  # pytype: disable=import-error
 from polygraphy.backend.base import BaseRunner
 from polygraphy.common import TensorMetadata
 
-from model_navigator.framework_api.runners.base import INavigatorRunner
+from model_navigator.framework_api.runners.base import INavigatorRunner, InferencePhase, PhaseTimer
 from model_navigator.framework_api.utils import Framework, validate_sample_output
 
 
@@ -54,6 +53,10 @@ class TFBaseRunner(INavigatorRunner, BaseRunner):
             self.input_metadata.add(name, spec.dtype, spec.shape)
         self.output_names = output_names
 
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        return True
+
     def activate_impl(self):
         if isinstance(self._model, (str, Path)):
             self.model = tf.keras.models.load_model(str(self._model))
@@ -67,9 +70,17 @@ class TFBaseRunner(INavigatorRunner, BaseRunner):
         return self.input_metadata
 
     def infer_impl(self, feed_dict):
-        start = time.time()
-        outputs = self._infer_impl(feed_dict)
-        end = time.time()
+        timer = PhaseTimer()
+        inputs = self._prepare_inputs(feed_dict)
+        if inputs is not None:
+            timer.mark(InferencePhase.H2D)
+        outputs = self._infer_impl(inputs if inputs is not None else feed_dict)
+        timer.mark(InferencePhase.COMPUTE)
+
+        # eager GPU ops may still be running - reading the values waits for them
+        if isinstance(outputs, (list, tuple)):
+            outputs = [output.numpy() if tf.is_tensor(output) else output for output in outputs]
+        timer.mark(InferencePhase.D2H)
 
         validate_sample_output(outputs, Framework.TF2)
 
@@ -87,18 +98,80 @@ class TFBaseRunner(INavigatorRunner, BaseRunner):
         out_dict = OrderedDict()
         for name, output in zip(self.output_names, outputs):
             out_dict[name] = output
-        self.inference_time = end - start
+        timer.mark(InferencePhase.OUTPUT_CONVERSION)
+
+        self._record_inference_time(timer)
         return out_dict
 
+    def _prepare_inputs(self, feed_dict):
+        """Copy inputs to the device before the inference; None if the inputs are passed to the model as they are."""
+        return None
+
     def _infer_impl(self, feed_dict):
         raise NotImplementedError
 
 
 class TFSavedModelRunner(TFBaseRunner):
+    """
+    Runs inference on the `serving_default` signature of the SavedModel.
+    """
+
+    def __init__(self, model, input_metadata, output_names, name=None, use_tf_function=False, jit_compile=False):
+        """
+        Args:
+            use_tf_function (bool):
+                    Resolve the signature once on activation and call it through the concrete function
+                    of `tf.function` with relaxed input signature (all dimensions unknown), so it is traced once
+                    for all batch sizes. Inputs are converted to `tf.constant` on the device before the call.
+            jit_compile (bool):
+                    Compile the inference function with XLA. Implies `use_tf_function`.
+        """
+        super().__init__(model, input_metadata, output_names, name)
+        self._use_tf_function = use_tf_function or jit_compile
+        self._jit_compile = jit_compile
+        self._infer_fn = None
+        self._input_names = None
+        self._device = None
+
+    def activate_impl(self):
+        super().activate_impl()
+        signature = self.model.signatures["serving_default"]
+        if not self._use_tf_function:
+            self._infer_fn = signature
+            return
+
+        _, input_specs = signature.structured_input_signature
+        self._input_names = list(input_specs)
+        relaxed_input_signature = [
+            (
+                tf.TensorSpec(shape=[None] * input_specs[name].shape.rank, dtype=input_specs[name].dtype, name=name)
+                if input_specs[name].shape.rank is not None
+                else tf.TensorSpec(shape=None, dtype=input_specs[name].dtype, name=name)
+            )
+            for name in self._input_names
+        ]
+
+        def _infer(*inputs):
+            return signature(**dict(zip(self._input_names, inputs)))
+
+        infer_fn = tf.function(_infer, input_signature=relaxed_input_signature, jit_compile=self._jit_compile)
+        self._infer_fn = infer_fn.get_concrete_function()
+        self._device = "/GPU:0" if tf.config.list_logical_devices("GPU") else "/CPU:0"
+
+    def deactivate_impl(self):
+        super().deactivate_impl()
+        self._infer_fn = None
+
+    def _prepare_inputs(self, feed_dict):
+        if not self._use_tf_function:
+            return None
+        with tf.device(self._device):
+            return [tf.constant(feed_dict[name]) for name in self._input_names]
+
     def _infer_impl(self, feed_dict):
-        infer = self.model.signatures["serving_default"]
-        outputs = [output.numpy() for output in infer(**feed_dict).values()]
-        return outputs
+        if self._use_tf_function:
+            return list(self._infer_fn(*feed_dict).values())
+        return list(self._infer_fn(**feed_dict).values())
 
 
 class TFKerasRunner(TFBaseRunner):
@@ -24,7 +24,12 @@ from polygraphy.logger import G_LOGGER, LogMode
 from polygraphy_trtexec.backend import TrtexecRunner as _TrtexecRunner
 
 from model_navigator.framework_api.common import TensorMetadata
-from model_navigator.framework_api.runners.base import INavigatorRunner, INavigatorStabilizedRunner
+from model_navigator.framework_api.runners.base import (
+    INavigatorRunner,
+    INavigatorStabilizedRunner,
+    InferencePhase,
+    PhaseTimer,
+)
 from model_navigator.model import Format
 from model_navigator.utils import tensorrt
 from model_navigator.utils.config import dataclass2dict
@@ -36,12 +41,21 @@ class TrtRunner(INavigatorRunner, _TrtRunner):
     """
 
     def infer(self, feed_dict, check_inputs=None, *args, **kwargs):
+        timer = PhaseTimer()
         feed_dict = {
             name: tensorrt.cast_tensor(tensor)
             for name, tensor in feed_dict.items()
             if name in self.get_input_metadata()
         }
-        return super().infer(feed_dict, check_inputs, *args, **kwargs)
+        timer.mark(InferencePhase.INPUT_PREPARATION)
+
+        outputs = super().infer(feed_dict, check_inputs, *args, **kwargs)
+        # Polygraphy measures host-device copies together with the engine execution
+        self.inference_phases = {
+            **timer.phases(),
+            InferencePhase.COMPUTE.value: self.inference_time,
+        }
+        return outputs
 
 
 @dataclasses.dataclass
@@ -0,0 +1,138 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import io
+import os
+import runpy
+import shlex
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from model_navigator.framework_api.exceptions import UserError
+from model_navigator.framework_api.logger import LOGGER
+from model_navigator.model import Format
+
+# Formats which share the framework runtime are executed in the same worker
+FORMAT2WORKER_NAME = {
+    Format.TORCHSCRIPT: "pytorch",
+    Format.TORCH_TRT: "pytorch",
+    Format.TF_SAVEDMODEL: "tensorflow",
+    Format.TF_TRT: "tensorflow",
+    Format.ONNX: "onnxruntime",
+    Format.TENSORRT: "tensorrt",
+}
+
+
+def run_script(script_path: str, args: List[str], cwd: str) -> Tuple[int, str]:
+    """
+    Execute the runtime script inside the worker process the same way as it would be executed from the command line.
+
+    Executed in the worker process. Return the exit code and the captured output of the script.
+    """
+    output = io.StringIO()
+    argv, workdir = sys.argv, os.getcwd()
+    sys.argv = [script_path] + shlex.split(" ".join(args))
+    try:
+        os.chdir(cwd)
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            runpy.run_path(script_path, run_name="__main__")
+        return_code = 0
+    except SystemExit as e:
+        return_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception:
+        output.write(traceback.format_exc())
+        return_code = 1
+    finally:
+        sys.argv = argv
+        os.chdir(workdir)
+
+    return return_code, output.getvalue()
+
+
+class RuntimeWorker:
+    """
+    Long-lived Python process executing runtime scripts.
+
+    Frameworks are imported once in the worker, what removes the interpreter start and import overhead
+    from each executed script.
+    """
+
+    def __init__(self, name: str, verbose: bool = False):
+        self.name = name
+        self._verbose = verbose
+        self._exit_stack = None
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._module is not None
+
+    def start(self):
+        from model_navigator.converter.utils import navigator_subprocess
+
+        LOGGER.info(f"Starting `{self.name}` runtime worker.")
+        self._exit_stack = contextlib.ExitStack()
+        navigator = self._exit_stack.enter_context(navigator_subprocess(verbose=self._verbose, inherit_env=True))
+        self._module = navigator.module(__name__)
+
+    def stop(self):
+        if self._exit_stack is not None:
+            LOGGER.info(f"Stopping `{self.name}` runtime worker.")
+            with contextlib.suppress(Exception):
+                self._exit_stack.close()
+        self._exit_stack = None
+        self._module = None
+
+    def run_script(self, script_path: Path, args: List[str], cwd: Path) -> Tuple[int, str]:
+        import Pyro4.errors
+
+        with self._lock:
+            if not self.is_running:
+                self.start()
+            try:
+                return self._module.run_script(Path(script_path).absolute().as_posix(), args, cwd.as_posix())
+            except Pyro4.errors.CommunicationError as e:
+                self.stop()
+                raise UserError(f"Runtime worker `{self.name}` exited unexpectedly.") from e
+
+
+class RuntimeWorkers(contextlib.AbstractContextManager):
+    """
+    Pool of runtime workers - one worker per framework runtime.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self._verbose = verbose
+        self._workers: Dict[str, RuntimeWorker] = {}
+        self._lock = threading.Lock()
+
+    def get_worker(self, format: Format) -> RuntimeWorker:
+        name = FORMAT2WORKER_NAME[format]
+        with self._lock:
+            if name not in self._workers:
+                self._workers[name] = RuntimeWorker(name, verbose=self._verbose)
+            return self._workers[name]
+
+    def close(self):
+        with self._lock:
+            for worker in self._workers.values():
+                worker.stop()
+            self._workers.clear()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -24,6 +24,7 @@ from model_navigator.framework_api.commands.correctness import TolerancePerOutpu
 from model_navigator.framework_api.commands.performance import ProfilingResults
 from model_navigator.framework_api.common import DataObject, TensorMetadata
 from model_navigator.framework_api.constants import NAV_PACKAGE_FORMAT_VERSION
+from model_navigator.framework_api.runners.onnx import OnnxSessionConfig
 from model_navigator.framework_api.utils import JitType, RuntimeProvider, Status
 from model_navigator.model import Format
 
@@ -36,6 +37,7 @@ class RuntimeResults(DataObject):
     tolerance: Optional[TolerancePerOutputName] = None
     performance: Optional[List[ProfilingResults]] = None
     verified: bool = False
+    onnx_session_config: Optional[OnnxSessionConfig] = None
 
     @classmethod
     def from_dict(cls, data_dict: Dict):
@@ -50,6 +52,9 @@ class RuntimeResults(DataObject):
             else None,
             err_msg=data_dict.get("err_msg"),
             verified=data_dict["verified"],
+            onnx_session_config=OnnxSessionConfig.from_dict(data_dict["onnx_session_config"])
+            if data_dict.get("onnx_session_config") is not None
+            else None,
         )
 
 
@@ -71,6 +71,13 @@ def export(
     profiler_config: Optional[ProfilerConfig] = None,
     verbose: bool = False,
     debug: bool = False,
+    use_runtime_workers: bool = False,
+    max_concurrent_commands: int = 1,
+    max_concurrent_gpu_commands: int = 1,
+    batched_correctness: bool = False,
+    conversion_cache_dir: Optional[Union[str, Path]] = None,
+    conversion_cache_max_size: Optional[int] = None,
+    incremental: bool = False,
 ) -> PackageDescriptor:
     """Function exports PyTorch model to all supported formats."""
 
@@ -157,6 +164,13 @@ def export(
         profiler_config=profiler_config,
         verbose=verbose,
         debug=debug,
+        use_runtime_workers=use_runtime_workers,
+        max_concurrent_commands=max_concurrent_commands,
+        max_concurrent_gpu_commands=max_concurrent_gpu_commands,
+        batched_correctness=batched_correctness,
+        conversion_cache_dir=conversion_cache_dir,
+        conversion_cache_max_size=conversion_cache_max_size,
+        incremental=incremental,
     )
 
     builders = [
@@ -24,6 +24,7 @@ from model_navigator.framework_api.exceptions import UserError
 from model_navigator.model import Format
 from model_navigator.utils import devices as devices_utils
 from model_navigator.utils import enums
+from model_navigator.utils.sample_store import SampleStore
 
 
 def get_supported_onnx_providers(exclude_trt: bool = False):
@@ -46,6 +47,18 @@ def get_available_onnx_providers(exclude_trt: bool = False) -> List:
     return onnx_providers
 
 
+def is_gpu_runtime(model_format: Format, runtime_provider: Optional["RuntimeProvider"], target_device: str) -> bool:
+    if model_format in (Format.TENSORRT, Format.TORCH_TRT, Format.TF_TRT):
+        return True
+    elif model_format == Format.ONNX:
+        return runtime_provider in (RuntimeProvider.CUDA, RuntimeProvider.TRT, RuntimeProvider.TRT_EXEC)
+    elif model_format == Format.TORCHSCRIPT:
+        return target_device.startswith("cuda")
+    elif model_format == Format.TF_SAVEDMODEL:
+        return bool(devices_utils.get_available_gpus())
+    return False
+
+
 def numpy_to_torch_dtype(np_dtype):
     np_dtype = numpy.dtype(np_dtype).type
     import torch  # pytype: disable=import-error
@@ -316,16 +329,19 @@ def load_samples(samples_name, workdir, batch_dim):
     samples_type = samples_name.split("_")[0]
     samples_dirname = "model_output" if samples_name.split("_")[-1] == "output" else "model_input"
     samples_dirpath = workdir / samples_dirname / samples_type
-    samples = []
-    for sample_filepath in samples_dirpath.iterdir():
-        sample = {}
-        with numpy.load(sample_filepath.as_posix()) as data:
-            for k, v in data.items():
-                if batch_dim is not None:
-                    v = numpy.expand_dims(v, batch_dim)
-                    # v = numpy.repeat(v, max_batch_size, batch_dim)
-                sample[k] = v
-        samples.append(sample)
+    if SampleStore.exists(samples_dirpath):
+        samples = list(SampleStore(samples_dirpath))
+    else:
+        # packages created with previous versions store each sample in a separate npz file
+        samples = []
+        for sample_filepath in sorted(samples_dirpath.glob("*.npz"), key=lambda path: int(path.stem)):
+            with numpy.load(sample_filepath.as_posix()) as data:
+                samples.append(dict(data.items()))
+
+    if batch_dim is not None:
+        samples = [
+            {name: numpy.expand_dims(tensor, batch_dim) for name, tensor in sample.items()} for sample in samples
+        ]
     if samples_type == "profiling":
         samples = samples[0]
 
@@ -13,4 +13,5 @@
 # limitations under the License.
 from model_navigator.perf_analyzer.config import MeasurementMode, PerfMeasurementConfig  # noqa: F401
 from model_navigator.perf_analyzer.perf_analyzer import PerfAnalyzer  # noqa: F401
+from model_navigator.perf_analyzer.perf_client import PerfClient, PerfClientResult  # noqa: F401
 from model_navigator.perf_analyzer.perf_config import PerfAnalyzerConfig  # noqa: F401
@@ -26,6 +26,15 @@ class MeasurementMode(Enum):
     TIME_WINDOWS = "time_windows"
 
 
+class PerfClientType(Enum):
+    """
+    Available clients generating load for performance measurement
+    """
+
+    PERF_ANALYZER = "perf_analyzer"
+    PYTHON = "python"
+
+
 class SharedMemoryMode(Enum):
     """
     Available offline mode for memory
@@ -0,0 +1,453 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Python load generator measuring models served by Triton without spawning perf_analyzer.
+
+Requests are sent from worker threads, each with its own tritonclient client, with fixed concurrency
+or at fixed request rate. Like in perf_analyzer, measurement windows are repeated until throughput and
+average latency of the last 3 windows are stable; when the stability is not reached, the window is extended.
+"""
+
+import base64
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from model_navigator.exceptions import ModelNavigatorException
+from model_navigator.perf_analyzer.config import MeasurementMode, SharedMemoryMode
+from model_navigator.perf_analyzer.perf_analyzer import COUNT_INTERVAL_DELTA, MAX_INTERVAL_CHANGES, TIME_INTERVAL_DELTA
+from model_navigator.record.record import Record
+from model_navigator.record.types.perf_latency import PerfLatency
+from model_navigator.record.types.perf_throughput import PerfThroughput
+from model_navigator.triton.client import TritonClient, TritonClientProtocol, client_utils, grpc_client, http_client
+from model_navigator.triton.utils import parse_server_url
+
+LOGGER = logging.getLogger(__name__)
+
+STABLE_WINDOWS = 3
+
+# sends single request; created for each worker thread by the sender factory
+Sender = Callable[[], None]
+SenderFactory = Callable[[int], ContextManager[Sender]]
+
+
+@dataclass
+class PerfClientResult:
+    batch_size: int
+    concurrency: int
+    request_rate: Optional[float]
+    throughput: float  # infer/sec
+    latencies: np.ndarray  # usec, per request from the stable windows
+
+    @property
+    def avg_latency(self) -> float:
+        return float(np.mean(self.latencies))
+
+    def latency_percentile(self, percentile: float) -> float:
+        return float(np.percentile(self.latencies, percentile))
+
+    def latency_histogram(self, bins: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """Return counts of requests and latency bin edges in usec."""
+        return np.histogram(self.latencies, bins=bins)
+
+    def records(self) -> List[Record]:
+        return [
+            PerfThroughput(float(self.throughput)),
+            PerfLatency(self.latency_percentile(99) / 1000),
+        ]
+
+    def report_row(self) -> Dict[str, Union[int, float]]:
+        """Return row with the perf_analyzer latency report columns."""
+        row = {"Request Rate": self.request_rate} if self.request_rate else {"Concurrency": self.concurrency}
+        row["Inferences/Second"] = self.throughput
+        # server side breakdown is not collected, so the whole request latency is accounted to network and server
+        row["Network+Server Send/Recv"] = int(self.avg_latency)
+        for percentile in (50, 90, 95, 99):
+            row[f"p{percentile} latency"] = int(self.latency_percentile(percentile))
+        return row
+
+    def __str__(self):
+        load = f"Request Rate: {self.request_rate}" if self.request_rate else f"Concurrency: {self.concurrency}"
+        return (
+            f"Batch size: {self.batch_size}, {load}, throughput: {self.throughput:.2f} infer/sec, "
+            f"latency avg: {self.avg_latency:.0f} usec, p50: {self.latency_percentile(50):.0f} usec, "
+            f"p90: {self.latency_percentile(90):.0f} usec, p95: {self.latency_percentile(95):.0f} usec, "
+            f"p99: {self.latency_percentile(99):.0f} usec"
+        )
+
+
+class LoadGenerator:
+    """Send requests from worker threads and measure throughput and latency in stable windows.
+
+    Args:
+        sender_factory: create context manager providing sender for given worker index
+        measurement_mode: count windows end after `measurement_request_count` requests,
+            time windows after `measurement_interval` ms
+        stability_percentage: allowed deviation of throughput and latency of windows from their mean
+        max_trials: maximal number of windows measured before the window is extended
+        timeout: maximal measurement time in seconds
+    """
+
+    def __init__(
+        self,
+        sender_factory: SenderFactory,
+        measurement_mode: MeasurementMode = MeasurementMode.COUNT_WINDOWS,
+        measurement_interval: int = 5000,
+        measurement_request_count: int = 50,
+        stability_percentage: float = 10,
+        max_trials: int = 10,
+        timeout: int = 600,
+    ):
+        self._sender_factory = sender_factory
+        self._measurement_mode = measurement_mode
+        self._measurement_interval = measurement_interval
+        self._measurement_request_count = measurement_request_count
+        self._stability_percentage = stability_percentage
+        self._max_trials = max_trials
+        self._timeout = timeout
+
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._completed: List[Tuple[int, int]] = []  # (end time, latency) in ns
+        self._error: Optional[Exception] = None
+        self._next_request = 0
+
+    def measure(
+        self, concurrency: int = 1, request_rate: Optional[float] = None, batch_size: int = 1
+    ) -> PerfClientResult:
+        """Measure with `concurrency` requests in flight or at `request_rate` requests per second.
+
+        With the request rate `concurrency` is the number of worker threads sending the scheduled requests.
+        """
+        self._stop.clear()
+        self._completed, self._error, self._next_request = [], None, 0
+        deadline = time.monotonic() + self._timeout
+        start_ns = time.perf_counter_ns()
+
+        workers = [
+            threading.Thread(target=self._worker, args=(idx, start_ns, request_rate), daemon=True)
+            for idx in range(concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            windows = None
+            for _ in range(MAX_INTERVAL_CHANGES):
+                windows = self._measure_windows(batch_size, deadline)
+                if windows is not None:
+                    break
+                self._extend_window()
+        finally:
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+
+        if windows is None:
+            raise ModelNavigatorException(f"Measured {MAX_INTERVAL_CHANGES} times, but no stable measurement obtained.")
+
+        latencies = np.concatenate([window_latencies for window_latencies, _ in windows]) / 1000
+        duration = sum(window_duration for _, window_duration in windows)
+        return PerfClientResult(
+            batch_size=batch_size,
+            concurrency=concurrency,
+            request_rate=request_rate,
+            throughput=len(latencies) * batch_size / duration,
+            latencies=latencies,
+        )
+
+    def _worker(self, idx: int, start_ns: int, request_rate: Optional[float]):
+        try:
+            with self._sender_factory(idx) as send:
+                while not self._stop.is_set():
+                    if request_rate:
+                        with self._condition:
+                            request_idx = self._next_request
+                            self._next_request += 1
+                        delay = (start_ns + request_idx * 1e9 / request_rate - time.perf_counter_ns()) / 1e9
+                        if delay > 0 and self._stop.wait(delay):
+                            break
+
+                    request_start = time.perf_counter_ns()
+                    send()
+                    request_end = time.perf_counter_ns()
+                    with self._condition:
+                        self._completed.append((request_end, request_end - request_start))
+                        self._condition.notify_all()
+        except Exception as e:
+            LOGGER.debug(f"Worker {idx} failed: {e}")
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def _measure_windows(self, batch_size: int, deadline: float) -> Optional[List[Tuple[np.ndarray, float]]]:
+        windows = []
+        with self._condition:
+            position = len(self._completed)
+        window_start = time.perf_counter_ns()
+        for _ in range(self._max_trials):
+            with self._condition:
+                if self._measurement_mode == MeasurementMode.COUNT_WINDOWS:
+                    end = position + self._measurement_request_count
+                    self._condition.wait_for(
+                        lambda: self._error is not None or len(self._completed) >= end,
+                        timeout=max(0.0, deadline - time.monotonic()),
+                    )
+                else:
+                    self._condition.wait_for(
+                        lambda: self._error is not None,
+                        timeout=min(self._measurement_interval / 1000, max(0.0, deadline - time.monotonic())),
+                    )
+                    end = len(self._completed)
+
+                if self._error is not None:
+                    raise ModelNavigatorException(f"Sending inference request failed: {self._error}")
+                if time.monotonic() >= deadline or len(self._completed) < end:
+                    raise ModelNavigatorException(f"Measurement has not finished in {self._timeout}s.")
+
+                completed = self._completed[position:end]
+                window_end = completed[-1][0] if self._measurement_mode == MeasurementMode.COUNT_WINDOWS else None
+
+            window_end = window_end or time.perf_counter_ns()
+            if completed:
+                windows.append((np.array([latency for _, latency in completed]), (window_end - window_start) / 1e9))
+            position, window_start = end, window_end
+            if len(windows) >= STABLE_WINDOWS and self._is_stable(windows[-STABLE_WINDOWS:], batch_size):
+                return windows[-STABLE_WINDOWS:]
+
+        return None
+
+    def _is_stable(self, windows: List[Tuple[np.ndarray, float]], batch_size: int) -> bool:
+        throughputs = np.array([len(latencies) * batch_size / duration for latencies, duration in windows])
+        latencies = np.array([np.mean(latencies) for latencies, _ in windows])
+        tolerance = self._stability_percentage / 100
+        return all(
+            np.all(np.abs(values - values.mean()) <= tolerance * values.mean()) for values in (throughputs, latencies)
+        )
+
+    def _extend_window(self):
+        if self._measurement_mode == MeasurementMode.COUNT_WINDOWS:
+            self._measurement_request_count += COUNT_INTERVAL_DELTA
+            LOGGER.debug(f"Measurement is not stable, request count increased to {self._measurement_request_count}.")
+        else:
+            self._measurement_interval += TIME_INTERVAL_DELTA
+            LOGGER.debug(f"Measurement is not stable, window increased to {self._measurement_interval} ms.")
+
+
+def _get_shape(metadata_shape: List[int], shape: Optional[List[int]], batch_size: Optional[int]) -> List[int]:
+    dims = list(metadata_shape[1:] if batch_size is not None else metadata_shape)
+    if shape is not None:
+        dims = shape
+    dims = [dim if dim >= 0 else 1 for dim in dims]
+    return [batch_size] + dims if batch_size is not None else dims
+
+
+def _generate_input(dtype: np.dtype, shape: List[int], input_data: str) -> np.ndarray:
+    if dtype == np.object_:
+        value = b"0" if input_data == "zero" else str(np.random.randint(0, 100)).encode()
+        return np.full(shape, value, dtype=np.object_)
+    if input_data == "zero":
+        return np.zeros(shape, dtype=dtype)
+    if dtype == np.bool_:
+        return np.random.randint(0, 2, size=shape).astype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        return np.random.randint(0, 100, size=shape).astype(dtype)
+    return np.random.random_sample(shape).astype(dtype)
+
+
+def _load_input(content: Union[Dict, List], dtype: np.dtype, shape: List[int]) -> np.ndarray:
+    if isinstance(content, dict):
+        data = np.frombuffer(base64.b64decode(content["b64"]), dtype=dtype)
+    else:
+        data = np.array(content, dtype=dtype)
+    return data.reshape(shape)
+
+
+class PerfClient:
+    """Python alternative to perf_analyzer evaluating model served by Triton.
+
+    Args:
+        server_url: url of Triton in format `<protocol>://<address/hostname>:<port>`
+        model_name: name of the evaluated model
+        model_version: version of the evaluated model; the latest if empty
+        batch_size: batch size of the requests; ignored for models not supporting batching
+        input_shapes: shapes of inputs without batch dimension in perf_analyzer format `<name>:<dim>,<dim>`
+        input_data: `random`, `zero` or path to JSON file in perf_analyzer format; the first sample is used
+        shared_memory: pass inputs and outputs through system shared memory
+        output_shared_memory_size: size of shared memory region reserved for each output
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        model_name: str,
+        model_version: str = "",
+        batch_size: int = 1,
+        input_shapes: Optional[List[str]] = None,
+        input_data: Union[str, Path] = "random",
+        measurement_mode: Union[MeasurementMode, str] = MeasurementMode.COUNT_WINDOWS,
+        measurement_interval: int = 5000,
+        measurement_request_count: int = 50,
+        shared_memory: SharedMemoryMode = SharedMemoryMode.NONE,
+        output_shared_memory_size: int = 102400,
+        stability_percentage: float = 10,
+        max_trials: int = 10,
+        timeout: int = 600,
+        verbose: bool = False,
+    ):
+        if shared_memory == SharedMemoryMode.CUDA:
+            raise ModelNavigatorException(
+                "CUDA shared memory is not supported by Python perf client. Use perf_analyzer."
+            )
+
+        self._server_url = server_url
+        self._model_name = model_name
+        self._model_version = model_version
+        self._batch_size = batch_size
+        self._input_shapes = input_shapes or []
+        self._input_data = input_data
+        self._shared_memory = shared_memory
+        self._output_shared_memory_size = output_shared_memory_size
+        self._verbose = verbose
+        self._load_generator_params = {
+            "measurement_mode": MeasurementMode(measurement_mode),
+            "measurement_interval": measurement_interval,
+            "measurement_request_count": measurement_request_count,
+            "stability_percentage": stability_percentage,
+            "max_trials": max_trials,
+            "timeout": timeout,
+        }
+        self._inputs = None
+        self._output_names = None
+        self._supports_batching = None
+        self._url = None
+        self._client_lib = None
+
+    def run(self, concurrency: int = 1, request_rate: Optional[float] = None) -> PerfClientResult:
+        """Measure model with `concurrency` requests in flight or at `request_rate` requests per second."""
+        if self._inputs is None:
+            self._inputs, self._output_names = self._prepare_inputs()
+
+        load_generator = LoadGenerator(self._create_sender, **self._load_generator_params)
+        batch_size = self._batch_size if self._supports_batching else 1
+        result = load_generator.measure(concurrency=concurrency, request_rate=request_rate, batch_size=batch_size)
+        LOGGER.debug(str(result))
+        return result
+
+    def _prepare_inputs(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        client = TritonClient(self._server_url, verbose=self._verbose)
+        # senders connect with low-level clients directly, so the url is parsed once and not for each worker
+        _, host, port = parse_server_url(self._server_url)
+        self._url = f"{host}:{port}"
+        self._client_lib = grpc_client if client.protocol == TritonClientProtocol.GRPC else http_client
+        metadata = client.get_model_metadata(self._model_name, self._model_version)
+        model_config = client.get_model_config(self._model_name, self._model_version)
+        self._supports_batching = int(model_config.get("max_batch_size", 0)) > 0
+        batch_size = self._batch_size if self._supports_batching else None
+
+        shapes = {}
+        for input_shape in self._input_shapes:
+            name, dims = input_shape.rsplit(":", 1)
+            shapes[name] = [int(dim) for dim in dims.split(",") if dim]
+
+        samples = None
+        if self._input_data not in ("random", "zero"):
+            with open(self._input_data) as f:
+                samples = json.load(f)["data"]
+
+        inputs = {}
+        for input_metadata in metadata["inputs"]:
+            name = input_metadata["name"]
+            dtype = client_utils.triton_to_np_dtype(input_metadata["datatype"])
+            if samples is not None:
+                sample = samples[0][name]
+                data = _load_input(sample["content"], dtype, [1] + sample["shape"] if batch_size else sample["shape"])
+                inputs[name] = np.repeat(data, batch_size, axis=0) if batch_size else data
+            else:
+                shape = _get_shape(input_metadata["shape"], shapes.get(name), batch_size)
+                inputs[name] = _generate_input(dtype, shape, self._input_data)
+
+        output_names = [output_metadata["name"] for output_metadata in metadata["outputs"]]
+        return inputs, output_names
+
+    @contextlib.contextmanager
+    def _create_sender(self, worker_idx: int):
+        client_lib = self._client_lib
+        # pytype: disable=attribute-error
+        client = client_lib.InferenceServerClient(url=self._url, verbose=self._verbose)
+        infer_inputs = [
+            client_lib.InferInput(name, list(data.shape), client_utils.np_to_triton_dtype(data.dtype))
+            for name, data in self._inputs.items()
+        ]
+        infer_outputs = [client_lib.InferRequestedOutput(name) for name in self._output_names]
+        # pytype: enable=attribute-error
+
+        with contextlib.ExitStack() as stack:
+            stack.callback(client.close)
+            if self._shared_memory == SharedMemoryMode.SYSTEM:
+                stack.enter_context(self._system_shared_memory(client, worker_idx, infer_inputs, infer_outputs))
+            else:
+                for infer_input, data in zip(infer_inputs, self._inputs.values()):
+                    infer_input.set_data_from_numpy(data)
+
+            def _send():
+                client.infer(self._model_name, infer_inputs, model_version=self._model_version, outputs=infer_outputs)
+
+            yield _send
+
+    @contextlib.contextmanager
+    def _system_shared_memory(self, client, worker_idx: int, infer_inputs: List, infer_outputs: List):
+        from tritonclient.utils import shared_memory as shm  # pytype: disable=import-error
+
+        if any(data.dtype == np.object_ for data in self._inputs.values()):
+            raise ModelNavigatorException("BYTES inputs are not supported with shared memory by Python perf client.")
+
+        region_prefix = f"{self._model_name}_{os.getpid()}_{worker_idx}"
+        regions = {
+            f"{region_prefix}_input": sum(data.nbytes for data in self._inputs.values()),
+            f"{region_prefix}_output": self._output_shared_memory_size * len(infer_outputs),
+        }
+        handles = []
+        try:
+            for region_name, byte_size in regions.items():
+                handle = shm.create_shared_memory_region(region_name, f"/{region_name}", byte_size)
+                handles.append((region_name, handle))
+                client.register_system_shared_memory(region_name, f"/{region_name}", byte_size)
+
+            input_region, input_handle = handles[0]
+            shm.set_shared_memory_region(input_handle, list(self._inputs.values()))
+            offset = 0
+            for infer_input, data in zip(infer_inputs, self._inputs.values()):
+                infer_input.set_shared_memory(input_region, data.nbytes, offset=offset)
+                offset += data.nbytes
+
+            output_region, _ = handles[1]
+            for idx, infer_output in enumerate(infer_outputs):
+                infer_output.set_shared_memory(
+                    output_region, self._output_shared_memory_size, offset=idx * self._output_shared_memory_size
+                )
+
+            yield
+        finally:
+            for region_name, handle in handles:
+                with contextlib.suppress(Exception):
+                    client.unregister_system_shared_memory(region_name)
+                shm.destroy_shared_memory_region(handle)
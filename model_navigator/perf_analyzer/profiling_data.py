@@ -12,16 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
+import hashlib
 import json
 import logging
+import struct
+from enum import Enum
 from pathlib import Path
-from sys import getsizeof
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import numpy as np
 
+from model_navigator.exceptions import ModelNavigatorException
+
 LOGGER = logging.getLogger(__name__)
 
 
+class ProfilingDataFormat(Enum):
+    """
+    Formats of real input data for Perf Analyzer
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+
+
 def _remove_batch_dim(data):
     """Skip batch dimensions.
     This should probably be replaced by better dataset abstraction.
@@ -36,35 +50,132 @@ def _base64_content(data: np.ndarray):
     return {"b64": b64_content}
 
 
+def _bytes_elements(data: np.ndarray) -> List[bytes]:
+    return [item if isinstance(item, bytes) else str(item).encode("utf-8") for item in data.flatten()]
+
+
+def _binary_content(data: np.ndarray) -> bytes:
+    """Convert the array of input values to raw bytes; BYTES elements are prefixed with 4-byte length"""
+    if data.dtype != np.object_:
+        return np.ascontiguousarray(data).tobytes()
+    return b"".join(struct.pack("<I", len(item)) + item for item in _bytes_elements(data))
+
+
+def _binary_file_content(name: str, data: np.ndarray) -> bytes:
+    """Content of the input file in the binary data directory.
+
+    Perf Analyzer reads BYTES inputs from this directory as text with one element per line.
+    """
+    if data.dtype != np.object_:
+        return np.ascontiguousarray(data).tobytes()
+    elements = _bytes_elements(data)
+    if any(b"\n" in item for item in elements):
+        raise ModelNavigatorException(
+            f"Input {name} contains BYTES elements with new lines, which cannot be passed to Perf Analyzer "
+            f"in {ProfilingDataFormat.BINARY.value} format. Use {ProfilingDataFormat.JSON.value} format instead."
+        )
+    return b"\n".join(elements)
+
+
+def _sample_hash(feed_dict: Dict[str, np.ndarray]) -> str:
+    sample_hash = hashlib.sha256()
+    for name, data in sorted(feed_dict.items()):
+        sample_hash.update(f"{name}:{data.dtype}:{data.shape}".encode("utf-8"))
+        sample_hash.update(_binary_content(data))
+    return sample_hash.hexdigest()
+
+
+def _iterate_samples(
+    dataloader: Iterable[Dict[str, np.ndarray]], max_samples: Optional[int], deduplicate: bool
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Pull samples from the dataloader lazily; only hashes of samples are kept for deduplication"""
+    seen_hashes = set()
+    num_samples = 0
+    if max_samples is not None and max_samples <= 0:
+        return
+
+    for feed_dict in dataloader:
+        if deduplicate:
+            sample_hash = _sample_hash(feed_dict)
+            if sample_hash in seen_hashes:
+                continue
+            seen_hashes.add(sample_hash)
+        num_samples += 1
+        yield feed_dict
+        if max_samples is not None and num_samples >= max_samples:
+            break
+
+
+def _write_json(samples: Iterator[Dict[str, np.ndarray]], output_path: Path) -> int:
+    num_samples = 0
+    with open(output_path, "w") as json_file:
+        json_file.write('{"data": [')
+        for feed_dict in samples:
+            json_file.write(",\n" if num_samples else "\n")
+            sample = {
+                name: {"content": _base64_content(data), "shape": _remove_batch_dim(data)}
+                for name, data in feed_dict.items()
+            }
+            json.dump(sample, json_file)
+            num_samples += 1
+        json_file.write("\n]}\n")
+    return num_samples
+
+
+def _write_binary(samples: Iterator[Dict[str, np.ndarray]], output_path: Path) -> int:
+    feed_dict = next(samples, None)
+    if feed_dict is None:
+        return 0
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    for name, data in feed_dict.items():
+        (output_path / name).write_bytes(_binary_file_content(name, data))
+
+    shapes = " ".join(
+        f"--shape {name}:{','.join(map(str, _remove_batch_dim(data)))}" for name, data in feed_dict.items()
+    )
+    LOGGER.debug(f"Perf Analyzer reads single sample from binary files directory. Pass input shapes with: {shapes}")
+    return 1
+
+
 def create_profiling_data(
     dataloader,
     output_path: Path,
+    max_samples: Optional[int] = None,
+    deduplicate: bool = False,
+    data_format: ProfilingDataFormat = ProfilingDataFormat.JSON,
 ):
     """
-    Create profiling data based on dataloader and save it to JSON file.
+    Create profiling data based on dataloader and save it to JSON file or directory of binary files.
 
     The perf_analyzer doesn't support passing value ranges and support the real data passed in form of JSON files. The
     real data provide better performance analysis and is mandatory for models with embeddings.
 
     The data is stored in form of base64 format to preserve the input data type - ex. FP16.
+    Samples are pulled from the dataloader and written one by one, so the memory usage does not depend
+    on the number of samples.
+
+    In the binary format the directory contains a file with raw data named after each input;
+    BYTES inputs are written as text with one element per line.
+    Perf Analyzer supports only a single sample in this format, so only the first sample is written.
 
     More about real input data:
     https://github.com/triton-inference-server/server/blob/main/docs/perf_analyzer.md#real-input-data
+
+    Args:
+        dataloader: iterable of feed dicts with batch size 1
+        output_path: path to JSON file or to directory for binary format
+        max_samples: maximal number of samples written; all samples if None
+        deduplicate: skip samples with the same content as one of the previous samples
+        data_format: format of the output data
     """
     LOGGER.debug("Generating profiling data for Perf Analyzer")
 
-    data = {
-        "data": [
-            {
-                name: {"content": _base64_content(data), "shape": _remove_batch_dim(data)}
-                for name, data in feed_dict.items()
-            }
-            for idx, feed_dict in enumerate(dataloader)
-        ]
-    }
-
-    LOGGER.debug(f"Saving data of size {getsizeof(data)} bytes to {output_path}")
-    with open(output_path, "w") as json_file:
-        json.dump(data, json_file, indent=4)
+    output_path = Path(output_path)
+    samples = _iterate_samples(dataloader, max_samples=max_samples, deduplicate=deduplicate)
+    if data_format == ProfilingDataFormat.BINARY:
+        num_samples = _write_binary(samples, output_path)
+    else:
+        num_samples = _write_json(samples, output_path)
 
-    LOGGER.debug("File saved")
+    LOGGER.debug(f"Saved {num_samples} samples to {output_path}")
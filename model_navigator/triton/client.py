@@ -16,7 +16,7 @@ import json
 import logging
 import time
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from model_navigator.triton.exceptions import TritonServerNotReadyException
 
@@ -180,6 +180,24 @@ class TritonClient:
         model_metadata = self._format_response(model_metadata)
         return model_metadata
 
+    def get_model_config(self, model_name: str, model_version: str = ""):
+        """Returns configuration of the model loaded on Triton.
+
+        Args:
+            model_name: name of the model which configuration is requested to obtain.
+            model_version: version of the model which configuration is requested to obtain.
+
+        Returns:
+            Dictionary with model configuration.
+
+        Raises:
+            InferenceServerClient: in case of error in processing request on server side.
+        """
+        model_config = self.client.get_model_config(model_name, model_version)
+        model_config = self._format_response(model_config)
+        # gRPC response wraps the configuration
+        return model_config.get("config", model_config)
+
     def load_model(self, model_name: str) -> None:
         """Requests that a model be loaded into Triton, or reloaded if the model is already loaded.
 
@@ -191,6 +209,33 @@ class TritonClient:
         """
         self.client.load_model(model_name)
 
+    def unload_model(self, model_name: str, *, timeout_s: int = 120, check_interval_s: float = 0.5) -> None:
+        """Requests that a model be unloaded from Triton and waits until all its versions are unloaded.
+
+        Args:
+            model_name: name of the model to unload
+            timeout_s: how long in seconds to wait till model is unloaded
+            check_interval_s: time intervals in seconds at which state of model is should be checked
+
+        Raises:
+            RuntimeError: in case model is not unloaded till timeout has been reached
+            InferenceServerException: in case of error in processing request on server side.
+        """
+        self.client.unload_model(model_name)
+
+        def _is_loaded() -> bool:
+            return any(
+                state in [ModelState.READY, ModelState.UNLOADING]
+                for (name, _), state in self._get_models_states().items()
+                if name == model_name
+            )
+
+        start_time_s = time.time()
+        while _is_loaded():
+            if time.time() - start_time_s >= timeout_s:
+                raise RuntimeError(f"Model {model_name} requested to be unloaded, but is still loaded")
+            time.sleep(check_interval_s)
+
     def wait_for_model(
         self, *, model_name: str, model_version: str, timeout_s: int = 120, check_interval_s: int = 5
     ) -> Dict[str, Any]:
@@ -242,7 +287,9 @@ class TritonClient:
         Raises:
             InferenceServerException: in case of error in processing request on server side.
         """
+        return self._get_models_states().get((model_name, model_version), ModelState.UNAVAILABLE)
 
+    def _get_models_states(self) -> Dict[Tuple[str, str], ModelState]:
         def handle_http_response(models):
             models_states = {}
             for model in models:
@@ -271,7 +318,7 @@ class TritonClient:
         else:
             models_states = handle_grpc_response(models=repository_index.models)
 
-        return models_states.get((model_name, model_version), ModelState.UNAVAILABLE)
+        return models_states
 
     def _format_response(self, response):
         if not isinstance(response, dict):
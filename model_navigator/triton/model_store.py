@@ -28,6 +28,7 @@ from model_navigator.triton.config import (
     TritonModelOptimizationConfig,
 )
 from model_navigator.triton.model_config import TritonModelConfigGenerator
+from model_navigator.utils.blob_store import BlobStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,9 +38,12 @@ class TritonModelStore:
         self,
         model_store_path: Union[str, Path],
         target_triton_version: Optional[str] = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         self._model_store_path = Path(model_store_path)
         self._target_triton_version = target_triton_version
+        # when provided, model files are hard links to the blobs instead of copies
+        self._blob_store = blob_store
 
     def deploy_model(
         self,
@@ -86,6 +90,11 @@ class TritonModelStore:
     def _copy_model(self, model: Model, version: str) -> Path:
         dst_path = self._get_model_path(model, version)
         dst_path.parent.mkdir(exist_ok=True, parents=True)
+        if self._blob_store is not None:
+            LOGGER.debug(f"Linking {model.path} to {dst_path} through {self._blob_store}")
+            self._blob_store.deploy(model.path, dst_path)
+            return dst_path
+
         LOGGER.debug(f"Copying {model.path} to {dst_path}")
         if model.path.is_file():
             shutil.copy(model.path, dst_path)
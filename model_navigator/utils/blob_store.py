@@ -0,0 +1,142 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed store of model files shared between Triton model stores.
+
+Each distinct file content is stored once:
+
+    <blobs_dir>/<sha256>  # file content
+
+Model files deployed to model stores are hard links to the blobs, so variants of the model which differ only
+in the Triton model configuration do not duplicate the model weights. When hard links are not possible
+(e.g. the model store is located on a different filesystem) files are reflinked or, as a last resort, copied.
+"""
+
+import contextlib
+import logging
+import os
+import pathlib
+import shutil
+import uuid
+from typing import Dict, Union
+
+from model_navigator.utils.conversion_cache import hash_content
+
+LOGGER = logging.getLogger(__name__)
+
+_TMP_PREFIX = "tmp-"
+# ioctl request cloning the file extents (copy-on-write copy) on Linux filesystems supporting it (btrfs, xfs)
+_FICLONE = 0x40049409
+
+
+def reflink(src: pathlib.Path, dst: pathlib.Path) -> None:
+    """Create copy-on-write copy of the file in not existing `dst`.
+
+    Raise OSError if the filesystem does not support it.
+    """
+    try:
+        import fcntl
+    except ImportError as e:
+        raise OSError("Reflinks are not supported on this platform") from e
+
+    with src.open("rb") as src_file, dst.open("xb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except OSError:
+            dst_file.close()
+            dst.unlink()
+            raise
+
+
+def _link_or_copy_new(src: pathlib.Path, dst: pathlib.Path, hard_link: bool) -> None:
+    if hard_link:
+        with contextlib.suppress(OSError):
+            os.link(src, dst)
+            return
+    with contextlib.suppress(OSError):
+        reflink(src, dst)
+        return
+    shutil.copy2(src, dst)
+
+
+def link_or_copy(src: pathlib.Path, dst: pathlib.Path, *, hard_link: bool = True) -> None:
+    """Place file with the content of `src` in `dst` using the cheapest available method.
+
+    The file is prepared aside and renamed over `dst`, so existing `dst` is replaced and never written to
+    - it may be a link to a blob shared with other model stores.
+    """
+    tmp_path = dst.parent / f"{_TMP_PREFIX}{uuid.uuid4().hex}-{dst.name}"
+    try:
+        _link_or_copy_new(src, tmp_path, hard_link)
+        os.replace(tmp_path, dst)
+    finally:
+        # rename does nothing when both paths are hard links to the same file
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+class BlobStore:
+    """Store of model files contents located in `blobs_dir`.
+
+    Args:
+        blobs_dir: directory where the blobs are stored; should be located on the same filesystem as the model stores
+    """
+
+    def __init__(self, blobs_dir: Union[str, pathlib.Path]):
+        self._blobs_dir = pathlib.Path(blobs_dir)
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f"BlobStore(blobs_dir={self._blobs_dir})"
+
+    @property
+    def blobs_dir(self) -> pathlib.Path:
+        return self._blobs_dir
+
+    def add(self, src_path: Union[str, pathlib.Path]) -> str:
+        """Store the content of the file and return its hash."""
+        src_path = pathlib.Path(src_path)
+        content_hash = hash_content(src_path)
+        blob_path = self._blobs_dir / content_hash
+        # blob with different size was damaged (e.g. truncated) and is replaced
+        if not blob_path.exists() or blob_path.stat().st_size != src_path.stat().st_size:
+            # blob does not share the inode with the source, so it is not changed when the source is overwritten;
+            # it is prepared aside and renamed, so concurrent deployments never see incomplete blobs
+            link_or_copy(src_path, blob_path, hard_link=False)
+        return content_hash
+
+    def deploy(self, src_path: Union[str, pathlib.Path], dst_path: Union[str, pathlib.Path]) -> Dict[str, str]:
+        """Deploy the file or directory to `dst_path` linking files to the blobs.
+
+        Return hashes of the deployed files content by the path relative to `dst_path` ("." for a single file).
+        """
+        src_path, dst_path = pathlib.Path(src_path), pathlib.Path(dst_path)
+        if not src_path.is_dir():
+            return {".": self._deploy_file(src_path, dst_path)}
+
+        hashes = {}
+        dst_path.mkdir(parents=True, exist_ok=True)
+        for file_path in sorted(src_path.rglob("*")):
+            rel_path = file_path.relative_to(src_path)
+            if file_path.is_dir():
+                (dst_path / rel_path).mkdir(parents=True, exist_ok=True)
+            else:
+                hashes[rel_path.as_posix()] = self._deploy_file(file_path, dst_path / rel_path)
+        return hashes
+
+    def _deploy_file(self, src_path: pathlib.Path, dst_path: pathlib.Path) -> str:
+        content_hash = self.add(src_path)
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        LOGGER.debug(f"Linking {dst_path} to blob {content_hash}")
+        link_or_copy(self._blobs_dir / content_hash, dst_path)
+        return content_hash
@@ -13,6 +13,7 @@
 # limitations under the License.
 import dataclasses
 import functools
+import importlib
 import logging
 from dataclasses import MISSING, dataclass, fields
 from enum import Enum
@@ -141,6 +142,29 @@ class OptionNargs(click.Option):
         return _convert(value, (self.nargs != 1) + bool(self.multiple))
 
 
+class LazyGroup(click.Group):
+    """
+    Group of commands which modules are imported only when the command is used.
+
+    Commands are given as `name -> "<module>:<command attribute>"`, so listing or invoking one command
+    does not import the modules (and their dependencies) of the other commands.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self._lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self._lazy_commands:
+            module_name, command_name = self._lazy_commands[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, command_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 def _extract_enum_values_if_present(param, value):
     if isinstance(value, Enum):
         value = value.value
@@ -0,0 +1,280 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache of conversion artifacts shared between workspaces and runs.
+
+Entries are addressed by a hash of the source model content and all parameters affecting the conversion output:
+
+    <cache_dir>/<key>/entry.json  # size of the artifact; modification time is the last access time
+    <cache_dir>/<key>/<artifact>  # converted model file or directory
+    <cache_dir>/<key>/extra/      # files accompanying the artifact, e.g. the conversion reproduction scripts
+
+When the total size of the artifacts exceeds the limit, the least recently used entries are removed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import threading
+import uuid
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from model_navigator.__version__ import __version__
+
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_FILENAME = "entry.json"
+_EXTRA_DIRNAME = "extra"
+_TMP_PREFIX = "tmp-"
+_CHUNK_SIZE = 1 << 20
+
+# (path, size, mtime) -> content hash; avoids hashing the same source model for each conversion
+_content_hashes: Dict[Tuple[str, int, int], str] = {}
+_content_hashes_lock = threading.Lock()
+
+
+def _hash_file(path: pathlib.Path) -> str:
+    stat = path.stat()
+    memo_key = (path.resolve().as_posix(), stat.st_size, stat.st_mtime_ns)
+    with _content_hashes_lock:
+        if memo_key in _content_hashes:
+            return _content_hashes[memo_key]
+
+    file_hash = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+
+    with _content_hashes_lock:
+        _content_hashes[memo_key] = file_hash.hexdigest()
+    return file_hash.hexdigest()
+
+
+def _hash_onnx_model(path: pathlib.Path) -> str:
+    from model_navigator.utils.formats.onnx import get_external_data_paths
+
+    # weights stored as external data may change while the graph file stays the same
+    try:
+        external_data_paths = get_external_data_paths(path)
+    except (ValueError, IndexError) as e:
+        LOGGER.debug(f"Could not read external data locations of {path}: {e}")
+        external_data_paths = []
+    if not external_data_paths:
+        return _hash_file(path)
+
+    model_hash = hashlib.sha256(_hash_file(path).encode())
+    for data_path in external_data_paths:
+        model_hash.update(pathlib.Path(os.path.relpath(data_path, path.parent)).as_posix().encode())
+        model_hash.update(_hash_file(data_path).encode() if data_path.is_file() else b"missing")
+    return model_hash.hexdigest()
+
+
+def hash_content(path: Union[str, pathlib.Path]) -> str:
+    """Hash of the file content or of relative paths and contents of all files in the directory.
+
+    Hash of the ONNX model includes also the external data files referenced by its graph.
+    """
+    path = pathlib.Path(path)
+    if not path.is_dir():
+        if path.suffix == ".onnx":
+            return _hash_onnx_model(path)
+        return _hash_file(path)
+
+    dir_hash = hashlib.sha256()
+    for file_path in sorted(p for p in path.rglob("*") if p.is_file()):
+        dir_hash.update(file_path.relative_to(path).as_posix().encode())
+        dir_hash.update(_hash_file(file_path).encode())
+    return dir_hash.hexdigest()
+
+
+def _get_size(path: pathlib.Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size
+
+
+def _copy(src: pathlib.Path, dst: pathlib.Path) -> None:
+    if src.is_dir():
+        shutil.copytree(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def _get_package_version(name: str) -> Optional[str]:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def _get_gpu_names() -> List[str]:
+    from model_navigator.utils.devices import get_available_gpus
+
+    return sorted(gpu["name"] for gpu in get_available_gpus())
+
+
+class ConversionCache:
+    """Content-addressed cache of converted models located in `cache_dir`.
+
+    Args:
+        cache_dir: directory where the artifacts are stored; can be shared between workspaces
+        max_size: maximal total size of the artifacts in bytes; unlimited if None
+    """
+
+    def __init__(self, cache_dir: Union[str, pathlib.Path], max_size: Optional[int] = None):
+        self._cache_dir = pathlib.Path(cache_dir)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f"ConversionCache(cache_dir={self._cache_dir}, max_size={self._max_size})"
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        return self._cache_dir
+
+    def get_key(
+        self,
+        source_path: Union[str, pathlib.Path],
+        converter: str,
+        params: Dict,
+        packages: Sequence[str] = (),
+        uses_gpu: bool = False,
+    ) -> str:
+        """Key of the conversion.
+
+        Args:
+            source_path: path to the source model file or directory
+            converter: name of the conversion
+            params: conversion config, optimization profile, precision etc.; has to be JSON serializable
+            packages: distributions performing the conversion; their versions are part of the key
+            uses_gpu: conversion output depends on the GPU model (e.g. TensorRT engines)
+        """
+        key_data = {
+            "source": hash_content(source_path),
+            "converter": converter,
+            "navigator_version": __version__,
+            "packages": {name: _get_package_version(name) for name in sorted(packages)},
+            "devices": _get_gpu_names() if uses_gpu else [],
+            "params": params,
+        }
+        key_json = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(key_json.encode()).hexdigest()
+
+    def get(
+        self,
+        key: str,
+        output_path: Union[str, pathlib.Path],
+        extra_paths: Sequence[Union[str, pathlib.Path]] = (),
+    ) -> bool:
+        """Copy the cached artifact to `output_path`. Return False if there is no entry for the key.
+
+        Extra files stored with the artifact are copied to those of `extra_paths` which have matching names.
+        """
+        output_path = pathlib.Path(output_path)
+        entry_dir = self._cache_dir / key
+        with self._lock:
+            artifact_path = self._get_artifact_path(entry_dir)
+            if artifact_path is None:
+                LOGGER.debug(f"Conversion cache miss for {output_path.name} (key={key})")
+                return False
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _copy(artifact_path, output_path)
+            for extra_path in map(pathlib.Path, extra_paths):
+                cached_extra_path = entry_dir / _EXTRA_DIRNAME / extra_path.name
+                if cached_extra_path.is_file():
+                    extra_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(cached_extra_path, extra_path)
+            os.utime(entry_dir / ENTRY_FILENAME)
+
+        LOGGER.info(f"Restored {output_path} from conversion cache (key={key})")
+        return True
+
+    def put(
+        self,
+        key: str,
+        output_path: Union[str, pathlib.Path],
+        extra_paths: Sequence[Union[str, pathlib.Path]] = (),
+    ) -> None:
+        """Store the artifact located in `output_path` and evict the least recently used entries.
+
+        Existing files from `extra_paths` are stored along with the artifact and restored by `get`.
+        """
+        output_path = pathlib.Path(output_path)
+        extra_paths = [pathlib.Path(extra_path) for extra_path in extra_paths if pathlib.Path(extra_path).is_file()]
+        entry_dir = self._cache_dir / key
+        # the entry is prepared aside and renamed, so other processes never see incomplete entries
+        tmp_dir = self._cache_dir / f"{_TMP_PREFIX}{uuid.uuid4().hex}"
+        with self._lock:
+            if (entry_dir / ENTRY_FILENAME).exists():
+                return
+
+            try:
+                tmp_dir.mkdir()
+                _copy(output_path, tmp_dir / output_path.name)
+                if extra_paths:
+                    (tmp_dir / _EXTRA_DIRNAME).mkdir()
+                for extra_path in extra_paths:
+                    shutil.copy2(extra_path, tmp_dir / _EXTRA_DIRNAME / extra_path.name)
+                size = _get_size(output_path) + sum(extra_path.stat().st_size for extra_path in extra_paths)
+                with (tmp_dir / ENTRY_FILENAME).open("w") as f:
+                    json.dump({"artifact": output_path.name, "size": size}, f)
+                os.rename(tmp_dir, entry_dir)
+                LOGGER.debug(f"Stored {output_path} in conversion cache (key={key})")
+            except OSError as e:
+                LOGGER.warning(f"Could not store {output_path} in conversion cache: {e}")
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            self._evict(keep=key)
+
+    def _get_artifact_path(self, entry_dir: pathlib.Path) -> Optional[pathlib.Path]:
+        try:
+            with (entry_dir / ENTRY_FILENAME).open("r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        artifact_path = entry_dir / entry["artifact"]
+        return artifact_path if artifact_path.exists() else None
+
+    def _evict(self, keep: str) -> None:
+        if self._max_size is None:
+            return
+
+        entries = []
+        for entry_dir in self._cache_dir.iterdir():
+            entry_path = entry_dir / ENTRY_FILENAME
+            if entry_dir.name.startswith(_TMP_PREFIX) or not entry_path.is_file():
+                continue
+            try:
+                with entry_path.open("r") as f:
+                    size = json.load(f)["size"]
+                entries.append((entry_path.stat().st_mtime_ns, entry_dir, size))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        total_size = sum(size for _, _, size in entries)
+        for _, entry_dir, size in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+            if entry_dir.name == keep:
+                continue
+            LOGGER.debug(f"Evicting {entry_dir.name} from conversion cache")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
@@ -11,9 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import logging
+import mmap
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 from model_navigator.model import ModelSignatureConfig
 from model_navigator.tensor import TensorSpec
@@ -21,33 +26,239 @@ from model_navigator.utils.formats.base import BaseFormatUtils
 
 LOGGER = logging.getLogger(__name__)
 
+# field numbers from onnx.proto
+_MODEL_GRAPH = 7
+_MODEL_OPSET_IMPORT = 8
+_OPSET_ID_VERSION = 2
+_GRAPH_INITIALIZER = 5
+_GRAPH_INPUT = 11
+_GRAPH_OUTPUT = 12
+_GRAPH_VALUE_INFO = 13
+_GRAPH_SPARSE_INITIALIZER = 15
+_GRAPH_NODE = 1
+_NODE_ATTRIBUTE = 5
+_ATTRIBUTE_TENSOR = 5
+_ATTRIBUTE_GRAPH = 6
+_ATTRIBUTE_TENSORS = 10
+_ATTRIBUTE_GRAPHS = 11
+_ATTRIBUTE_SPARSE_TENSOR = 22
+_ATTRIBUTE_SPARSE_TENSORS = 23
+_TENSOR_NAME = 8
+_TENSOR_EXTERNAL_DATA = 13
+_SPARSE_TENSOR_VALUES = 1
+_SPARSE_TENSOR_INDICES = 2
+_STRING_ENTRY_KEY = 1
+_STRING_ENTRY_VALUE = 2
+
+_WIRE_VARINT = 0
+_WIRE_FIXED64 = 1
+_WIRE_LENGTH_DELIMITED = 2
+_WIRE_FIXED32 = 5
+
 
 @dataclass
 class ONNXProperties:
     onnx_opset: int
 
 
+@dataclass
+class ONNXGraphMetadata:
+    """Tensors of the main graph of the ONNX model by their names. Inputs do not contain the initializers.
+
+    Dynamic and symbolic dimensions are -1. Shape of tensors with unknown rank is empty.
+    """
+
+    inputs: Dict[str, TensorSpec]
+    outputs: Dict[str, TensorSpec]
+    value_info: Dict[str, TensorSpec]
+    opset: Optional[int]
+
+
+def _read_varint(buffer, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _iter_fields(buffer, start: int, end: int) -> Iterator[Tuple[int, int, int, int]]:
+    """Yield field number, wire type, start and end of the value for each field of the serialized protobuf message.
+
+    Values are not read, so skipping large fields (e.g. weights) does not touch their data.
+    """
+    pos = start
+    while pos < end:
+        key, pos = _read_varint(buffer, pos)
+        field_number, wire_type = key >> 3, key & 0x7
+        if wire_type == _WIRE_VARINT:
+            _, value_end = _read_varint(buffer, pos)
+        elif wire_type == _WIRE_FIXED64:
+            value_end = pos + 8
+        elif wire_type == _WIRE_LENGTH_DELIMITED:
+            length, pos = _read_varint(buffer, pos)
+            value_end = pos + length
+        elif wire_type == _WIRE_FIXED32:
+            value_end = pos + 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type} at offset {pos}.")
+        yield field_number, wire_type, pos, value_end
+        pos = value_end
+
+
+def _read_tensor_name(buffer, start: int, end: int) -> Optional[str]:
+    for field_number, _, value_start, value_end in _iter_fields(buffer, start, end):
+        if field_number == _TENSOR_NAME:
+            return _read_string(buffer, value_start, value_end)
+    return None
+
+
+def _read_string(buffer, start: int, end: int) -> str:
+    return bytes(buffer[start:end]).decode("utf-8")
+
+
+def _iter_tensor_external_locations(buffer, start: int, end: int) -> Iterator[str]:
+    for field_number, _, entry_start, entry_end in _iter_fields(buffer, start, end):
+        if field_number != _TENSOR_EXTERNAL_DATA:
+            continue
+        entry = {
+            entry_field: _read_string(buffer, value_start, value_end)
+            for entry_field, _, value_start, value_end in _iter_fields(buffer, entry_start, entry_end)
+        }
+        if entry.get(_STRING_ENTRY_KEY) == "location" and _STRING_ENTRY_VALUE in entry:
+            yield entry[_STRING_ENTRY_VALUE]
+
+
+def _iter_sparse_tensor_external_locations(buffer, start: int, end: int) -> Iterator[str]:
+    for field_number, _, value_start, value_end in _iter_fields(buffer, start, end):
+        if field_number in (_SPARSE_TENSOR_VALUES, _SPARSE_TENSOR_INDICES):
+            yield from _iter_tensor_external_locations(buffer, value_start, value_end)
+
+
+def _iter_graph_external_locations(buffer, start: int, end: int) -> Iterator[str]:
+    """Locations of external data of the initializers and node attributes tensors, including subgraphs."""
+    for field_number, wire_type, value_start, value_end in _iter_fields(buffer, start, end):
+        if wire_type != _WIRE_LENGTH_DELIMITED:
+            continue
+        if field_number == _GRAPH_INITIALIZER:
+            yield from _iter_tensor_external_locations(buffer, value_start, value_end)
+        elif field_number == _GRAPH_SPARSE_INITIALIZER:
+            yield from _iter_sparse_tensor_external_locations(buffer, value_start, value_end)
+        elif field_number == _GRAPH_NODE:
+            for node_field, _, attribute_start, attribute_end in _iter_fields(buffer, value_start, value_end):
+                if node_field == _NODE_ATTRIBUTE:
+                    yield from _iter_attribute_external_locations(buffer, attribute_start, attribute_end)
+
+
+def _iter_attribute_external_locations(buffer, start: int, end: int) -> Iterator[str]:
+    for field_number, wire_type, value_start, value_end in _iter_fields(buffer, start, end):
+        if wire_type != _WIRE_LENGTH_DELIMITED:
+            continue
+        if field_number in (_ATTRIBUTE_TENSOR, _ATTRIBUTE_TENSORS):
+            yield from _iter_tensor_external_locations(buffer, value_start, value_end)
+        elif field_number in (_ATTRIBUTE_SPARSE_TENSOR, _ATTRIBUTE_SPARSE_TENSORS):
+            yield from _iter_sparse_tensor_external_locations(buffer, value_start, value_end)
+        elif field_number in (_ATTRIBUTE_GRAPH, _ATTRIBUTE_GRAPHS):
+            yield from _iter_graph_external_locations(buffer, value_start, value_end)
+
+
+def get_external_data_paths(path: Union[str, Path]) -> List[Path]:
+    """Paths of the external data files referenced by the ONNX model, read without loading the model."""
+    path = Path(path)
+    if path.stat().st_size == 0:
+        return []
+
+    locations = set()
+    with path.open("rb") as model_file, mmap.mmap(model_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for field_number, wire_type, start, end in _iter_fields(buffer, 0, len(buffer)):
+            if field_number == _MODEL_GRAPH and wire_type == _WIRE_LENGTH_DELIMITED:
+                locations.update(_iter_graph_external_locations(buffer, start, end))
+    return [path.parent / location for location in sorted(locations)]
+
+
+def _get_np_dtype(elem_type: int) -> Optional[np.dtype]:
+    import onnx
+
+    if not elem_type:
+        return None
+    if hasattr(onnx.helper, "tensor_dtype_to_np_dtype"):
+        return np.dtype(onnx.helper.tensor_dtype_to_np_dtype(elem_type))
+    return np.dtype(onnx.mapping.TENSOR_TYPE_TO_NP_TYPE[elem_type])  # pytype: disable=module-attr
+
+
+def _get_tensor_specs(value_infos: List, exclude: Set[str] = frozenset()) -> Dict[str, TensorSpec]:
+    specs = {}
+    for value_info in value_infos:
+        if value_info.name in exclude:
+            continue
+        tensor_type = value_info.type.tensor_type
+        shape = tuple(dim.dim_value if dim.dim_value > 0 else -1 for dim in tensor_type.shape.dim)
+        specs[value_info.name] = TensorSpec(
+            name=value_info.name, shape=shape, dtype=_get_np_dtype(tensor_type.elem_type)
+        )
+    return specs
+
+
+@functools.lru_cache(maxsize=32)
+def _inspect_onnx_graph(path: str, size: int, mtime_ns: int) -> ONNXGraphMetadata:
+    import onnx
+
+    if size == 0:
+        raise ValueError(f"ONNX model {path} is empty.")
+
+    value_infos = {_GRAPH_INPUT: [], _GRAPH_OUTPUT: [], _GRAPH_VALUE_INFO: []}
+    initializer_names = set()
+    opset = None
+    with open(path, "rb") as model_file, mmap.mmap(model_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for field_number, wire_type, start, end in _iter_fields(buffer, 0, len(buffer)):
+            if wire_type != _WIRE_LENGTH_DELIMITED:
+                continue
+            if field_number == _MODEL_OPSET_IMPORT and opset is None:
+                for opset_field, _, opset_start, _ in _iter_fields(buffer, start, end):
+                    if opset_field == _OPSET_ID_VERSION:
+                        opset, _ = _read_varint(buffer, opset_start)
+            elif field_number == _MODEL_GRAPH:
+                for graph_field, _, value_start, value_end in _iter_fields(buffer, start, end):
+                    if graph_field in value_infos:
+                        value_infos[graph_field].append(
+                            onnx.ValueInfoProto.FromString(bytes(buffer[value_start:value_end]))
+                        )
+                    elif graph_field == _GRAPH_INITIALIZER:
+                        initializer_names.add(_read_tensor_name(buffer, value_start, value_end))
+                    elif graph_field == _GRAPH_SPARSE_INITIALIZER:
+                        for sparse_field, _, values_start, values_end in _iter_fields(buffer, value_start, value_end):
+                            if sparse_field == _SPARSE_TENSOR_VALUES:
+                                initializer_names.add(_read_tensor_name(buffer, values_start, values_end))
+
+    return ONNXGraphMetadata(
+        # some inputs of models exported with older opsets are weights with initializers
+        inputs=_get_tensor_specs(value_infos[_GRAPH_INPUT], exclude=initializer_names),
+        outputs=_get_tensor_specs(value_infos[_GRAPH_OUTPUT]),
+        value_info=_get_tensor_specs(value_infos[_GRAPH_VALUE_INFO]),
+        opset=opset,
+    )
+
+
+def inspect_onnx_graph(path: Union[str, Path]) -> ONNXGraphMetadata:
+    """Read inputs, outputs and value info of the ONNX model graph without loading the model.
+
+    Nodes, initializers and external data are skipped, so it is cheap also for models with large weights.
+    Results are cached per model file (path, size and modification time) and must not be modified.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _inspect_onnx_graph(path.as_posix(), stat.st_size, stat.st_mtime_ns)
+
+
 class ONNXUtils(BaseFormatUtils):
     @classmethod
     def get_signature(cls, path: Path):
-        import onnx
-        from polygraphy.backend.onnx.util import get_input_metadata, get_output_metadata
-
-        model = onnx.load(path.as_posix())
-
-        input_metadata = get_input_metadata(model.graph)
-        output_metadata = get_output_metadata(model.graph)
-
-        return ModelSignatureConfig(
-            inputs={
-                name: TensorSpec.from_polygraphy_metadata_tuple(name, metadata_tuple)
-                for name, metadata_tuple in input_metadata.items()
-            },
-            outputs={
-                name: TensorSpec.from_polygraphy_metadata_tuple(name, metadata_tuple)
-                for name, metadata_tuple in output_metadata.items()
-            },
-        )
+        graph_metadata = inspect_onnx_graph(path)
+
+        return ModelSignatureConfig(inputs=dict(graph_metadata.inputs), outputs=dict(graph_metadata.outputs))
 
     @classmethod
     def validate_signature(cls, signature: ModelSignatureConfig):
@@ -55,12 +266,7 @@ class ONNXUtils(BaseFormatUtils):
 
     @classmethod
     def get_properties(cls, path: Path):
-        import onnx
-
-        model = onnx.load(path.as_posix())
-        try:
-            opset = model.opset_import[0].version
-        except Exception:
+        opset = inspect_onnx_graph(path).opset
+        if opset is None:
             LOGGER.warning("Model does not contain ONNX opset information")
-            opset = None
         return ONNXProperties(onnx_opset=opset)
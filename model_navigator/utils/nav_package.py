@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import abc
+import contextlib
+import json
 import logging
 import os
 import pathlib
 import shutil
+import struct
+import uuid
 import zipfile
 from collections import defaultdict
-from typing import IO, Dict, Iterable, Union
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from model_navigator.exceptions import ModelNavigatorInvalidPackageException
 from model_navigator.model import Format, JitType
@@ -26,6 +32,15 @@ from model_navigator.utils.workspace import Workspace
 
 LOGGER = logging.getLogger(__name__)
 
+# records members extracted to the directory, so they are not extracted again
+MATERIALIZED_MEMBERS_FILENAME = ".nav_materialized.json"
+
+# model weights and samples barely compress - they are stored, what also allows to memory map them from the package
+STORED_EXTENSIONS = {".onnx", ".pt", ".plan", ".engine", ".savedmodel", ".pb", ".h5", ".bin", ".npy", ".npz", ".zip"}
+STORED_EXTENSION_PREFIXES = (".data-",)  # TensorFlow variables shards e.g. variables.data-00000-of-00001
+_COPY_BUFFER_SIZE = 1 << 20
+_TMP_PREFIX = "tmp-"
+
 
 def select_input_format(models):
     """Automatically select which input model from the .nav package to use as input"""
@@ -68,6 +83,10 @@ class NavPackage(abc.ABC):
     def all_files(self) -> Iterable[str]:
         ...
 
+    def memmap(self, fpath: Union[str, pathlib.Path], dtype: np.dtype) -> Optional[np.ndarray]:
+        """Map the member to memory as 1D array; None when the member cannot be mapped (e.g. it is compressed)"""
+        return None
+
     @abc.abstractmethod
     def vfs_path_to_member(
         self, member_path: Union[str, pathlib.Path], workspace_path: Union[str, pathlib.Path]
@@ -81,11 +100,20 @@ class NavPackageDirectory(NavPackage):
 
     @property
     def datasets(self):
-        return {path.name: [p.as_posix() for p in path.glob("*.npz")] for path in self.path.glob("model_input/*")}
+        return {
+            path.name: [p.as_posix() for p in path.iterdir() if p.is_file()] for path in self.path.glob("model_input/*")
+        }
 
     def open(self, fpath: Union[str, pathlib.Path]) -> IO[bytes]:
         return open(self.path / fpath, "rb")
 
+    def memmap(self, fpath: Union[str, pathlib.Path], dtype: np.dtype) -> Optional[np.ndarray]:
+        path = self.path / fpath
+        if path.stat().st_size == 0:
+            return np.empty((0,), dtype=dtype)
+        # copy-on-write mapping - data can be modified in memory without changing the package
+        return np.memmap(path, dtype=dtype, mode="c")
+
     @property
     def all_files(self):
         return (p.relative_to(self.path).as_posix() for p in self.path.glob("**/*"))
@@ -125,6 +153,22 @@ class ZippedNavPackage(NavPackage):
     def open(self, fpath: Union[str, pathlib.Path]) -> IO[bytes]:
         return self.arc.open(str(fpath), "r")
 
+    def memmap(self, fpath: Union[str, pathlib.Path], dtype: np.dtype) -> Optional[np.ndarray]:
+        """Map uncompressed member directly from the package file"""
+        info = self.arc.getinfo(str(fpath))
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        if info.file_size == 0:
+            return np.empty((0,), dtype=dtype)
+
+        # data follows the local file header, which extra field may differ from the one in the central directory
+        with open(self.path, "rb") as f:
+            f.seek(info.header_offset)
+            header = struct.unpack(zipfile.structFileHeader, f.read(zipfile.sizeFileHeader))
+        filename_length, extra_length = header[-2:]
+        offset = info.header_offset + zipfile.sizeFileHeader + filename_length + extra_length
+        return np.memmap(self.path, dtype=dtype, mode="c", offset=offset, shape=(info.file_size // dtype.itemsize,))
+
     @property
     def all_files(self):
         return self.arc.namelist()
@@ -151,6 +195,50 @@ class ZippedNavPackage(NavPackage):
         self.arc.extractall(members=to_extract, path=dstpath)
         return dstpath / member_path
 
+    @property
+    def fingerprint(self) -> Dict:
+        stat = self.path.stat()
+        return {"path": self.path.resolve().as_posix(), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def is_materialized_in(self, output_dir: Union[str, pathlib.Path]) -> bool:
+        """Check if the directory holds members materialized from this package"""
+        return _read_materialized_members(pathlib.Path(output_dir)).get("package") == self.fingerprint
+
+    def members_under(self, member_path: Union[str, pathlib.Path, None] = None) -> List[str]:
+        """Return the member and members of the directory; all members if `member_path` is None"""
+        names = [name for name in self.arc.namelist() if not name.endswith("/")]
+        if member_path is None:
+            return names
+        prefix = pathlib.PurePosixPath(member_path).as_posix()
+        return [name for name in names if name == prefix or name.startswith(f"{prefix}/")]
+
+    def materialize(self, members: Iterable[str], output_dir: Union[str, pathlib.Path]) -> List[str]:
+        """Extract members to the directory unless they have been already extracted from this package.
+
+        Returns:
+            List of members extracted in this call
+        """
+        output_dir = pathlib.Path(output_dir)
+        materialized = _read_materialized_members(output_dir)
+        if materialized.get("package") != self.fingerprint:
+            materialized = {"package": self.fingerprint, "members": {}}
+
+        extracted = []
+        for member in members:
+            info = self.arc.getinfo(member)
+            if materialized["members"].get(member) == info.CRC and (output_dir / member).exists():
+                continue
+            self.arc.extract(info, output_dir)
+            materialized["members"][member] = info.CRC
+            extracted.append(member)
+
+        if extracted:
+            LOGGER.debug(f"Extracted {len(extracted)} members of {self.path} to {output_dir}")
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with open(output_dir / MATERIALIZED_MEMBERS_FILENAME, "w") as f:
+                json.dump(materialized, f)
+        return extracted
+
     def __getstate__(self):
         dct = dict(self.__dict__)
         del dct["arc"]
@@ -161,6 +249,78 @@ class ZippedNavPackage(NavPackage):
         self.arc = zipfile.ZipFile(self.path, "r")
 
 
+def _read_materialized_members(output_dir: pathlib.Path) -> Dict:
+    try:
+        with open(output_dir / MATERIALIZED_MEMBERS_FILENAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_compress_type(member: str) -> int:
+    """Compression of the package member selected by the file extension"""
+    ext = pathlib.PurePosixPath(member).suffix.lower()
+    if ext in STORED_EXTENSIONS or ext.startswith(STORED_EXTENSION_PREFIXES):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _file_fingerprint(path: pathlib.Path) -> bytes:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def _is_up_to_date(path: pathlib.Path, members: List[Tuple[str, pathlib.Path, bytes]]) -> bool:
+    """Check if the package contains exactly `members` in the same order and with the same fingerprints"""
+    try:
+        with zipfile.ZipFile(path, "r") as zf:
+            infos = zf.infolist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+    return [(info.filename, info.comment) for info in infos] == [
+        (arcname, fingerprint) for arcname, _, fingerprint in members
+    ]
+
+
+def write_zipped_nav_package(path: Union[str, pathlib.Path], members: Dict[str, pathlib.Path]) -> None:
+    """Write files to the zipped package.
+
+    Members are compressed according to `get_compress_type`. Members are written from the least recently modified
+    and each member records the size and modification time of its file in the member comment. When the package
+    at `path` already contains the same members, it is not written again. Otherwise the package is written aside
+    and renamed, so the existing package is replaced only with a complete one.
+
+    Args:
+        path: path to the package; existing package is replaced
+        members: member names mapped to the files
+    """
+    path = pathlib.Path(path)
+    mtimes = {arcname: file_path.stat().st_mtime_ns for arcname, file_path in members.items()}
+    ordered_members = [
+        (arcname, members[arcname], _file_fingerprint(members[arcname]))
+        for arcname in sorted(members, key=lambda arcname: (mtimes[arcname], arcname))
+    ]
+
+    if path.exists() and _is_up_to_date(path, ordered_members):
+        LOGGER.debug(f"Package {path} is up to date")
+        return
+
+    tmp_path = path.parent / f"{_TMP_PREFIX}{uuid.uuid4().hex}-{path.name}"
+    try:
+        with zipfile.ZipFile(tmp_path.as_posix(), "w") as zf:
+            for arcname, file_path, fingerprint in ordered_members:
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                zinfo.compress_type = get_compress_type(arcname)
+                zinfo.comment = fingerprint
+                with open(file_path, "rb") as src, zf.open(zinfo, "w") as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        os.replace(tmp_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
 def from_path(path: Union[str, pathlib.Path]):
     for cls in [ZippedNavPackage, NavPackageDirectory]:
         try:
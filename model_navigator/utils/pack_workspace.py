@@ -17,8 +17,9 @@ import os
 import pathlib
 import uuid
 import zipfile
+from collections import Counter
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import yaml
 
@@ -27,6 +28,7 @@ from model_navigator.exceptions import ModelNavigatorException
 from model_navigator.results import ResultsStore, State
 from model_navigator.utils import Workspace
 from model_navigator.utils.config import dataclass2dict
+from model_navigator.utils.conversion_cache import hash_content
 from model_navigator.utils.environment import EnvironmentStore
 
 FORMAT_VERSION = "0.0.1"
@@ -49,6 +51,32 @@ def parse_config(config):
     return parsed_config
 
 
+class _BlobsIndex:
+    """Find files with the same content as the files already stored in the package."""
+
+    def __init__(self, files: Iterable[pathlib.Path]):
+        self._sizes_counts = Counter(file.stat().st_size for file in files)
+        self._inodes_hashes: Dict[Tuple[int, int], str] = {}
+        self._stored: Dict[str, str] = {}
+
+    def get_stored(self, path: pathlib.Path, relname: str) -> Optional[str]:
+        """Return name of the stored file with the same content or register `relname` as stored and return None."""
+        stat = path.stat()
+        if self._sizes_counts[stat.st_size] < 2:
+            return None
+
+        # hard linked files are not hashed again
+        inode = (stat.st_dev, stat.st_ino)
+        if inode not in self._inodes_hashes:
+            self._inodes_hashes[inode] = hash_content(path)
+        content_hash = self._inodes_hashes[inode]
+
+        if content_hash in self._stored:
+            return self._stored[content_hash]
+        self._stored[content_hash] = relname
+        return None
+
+
 def pack_workspace(
     workspace: Workspace,
     package_path: pathlib.Path,
@@ -149,7 +177,9 @@ def pack_workspace(
         # zipfile does not support symlinks, so we store symlink info in a yaml file
         symlinks = {}
         models_path = pathlib.Path(workspace.path / "analyzer" / "model-store")
-        for model in models_path.glob("**/*"):
+        models = list(models_path.glob("**/*"))
+        blobs = _BlobsIndex(model for model in models if model.is_file() and not model.is_symlink())
+        for model in models:
             relname = model.relative_to(models_path)
             outname = pathlib.Path("model-store") / relname
             if model.is_symlink():
@@ -157,6 +187,14 @@ def pack_workspace(
                 symlinks[relname.as_posix()] = location
                 package.writestr(outname.as_posix(), location)
                 continue
+            if model.is_file():
+                # files with the same content as an already stored one (e.g. weights shared between model variants)
+                # are stored as symlinks to it
+                location = blobs.get_stored(model, relname.as_posix())
+                if location is not None:
+                    symlinks[relname.as_posix()] = location
+                    package.writestr(outname.as_posix(), location)
+                    continue
             package.write(model, arcname=outname)
         package.writestr("model-store/symlinks.yaml", yaml.safe_dump(symlinks, width=240, sort_keys=False))
 
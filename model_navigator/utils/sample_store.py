@@ -0,0 +1,196 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Columnar store of model input and output samples.
+
+Samples are stored in a directory with one contiguous binary file per tensor name
+and an index file holding dtype, shape and offset of each sample:
+
+    <path>/index.json
+    <path>/0.bin  # data of all samples for the first tensor name
+    <path>/1.bin  # data of all samples for the second tensor name
+    ...
+
+Data files are memory mapped when reading, so samples are returned as views without copying the data.
+"""
+
+import json
+import pathlib
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+INDEX_FILENAME = "index.json"
+FORMAT_VERSION = 1
+
+
+class SampleStoreWriter:
+    """Append samples to the store located in `path`."""
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self._path = pathlib.Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._tensors: Dict[str, Dict] = {}
+        self._files: Dict[str, IO[bytes]] = {}
+        self._num_samples = 0
+
+    def append(self, sample: Dict[str, np.ndarray]) -> None:
+        if self._num_samples > 0 and sample.keys() != self._tensors.keys():
+            raise ValueError(
+                f"All samples must have the same tensor names. Expected {list(self._tensors)} got {list(sample)}."
+            )
+
+        for name, tensor in sample.items():
+            tensor = np.asarray(tensor)
+            if tensor.dtype.hasobject:
+                raise ValueError(f"Tensor {name} has object dtype which cannot be stored.")
+
+            if name not in self._tensors:
+                filename = f"{len(self._tensors)}.bin"
+                self._tensors[name] = {"file": filename, "dtype": tensor.dtype.str, "offsets": [], "shapes": []}
+                self._files[name] = open(self._path / filename, "wb")
+
+            tensor_index = self._tensors[name]
+            if tensor.dtype.str != tensor_index["dtype"]:
+                raise ValueError(
+                    f"Tensor {name} has dtype {tensor.dtype} while previous samples have {tensor_index['dtype']}."
+                )
+
+            tensor_file = self._files[name]
+            tensor_index["offsets"].append(tensor_file.tell() // tensor.dtype.itemsize)
+            tensor_index["shapes"].append(list(tensor.shape))
+            tensor_file.write(np.ascontiguousarray(tensor).tobytes())
+
+        self._num_samples += 1
+
+    def close(self) -> None:
+        self._close_files()
+        with open(self._path / INDEX_FILENAME, "w") as f:
+            json.dump({"version": FORMAT_VERSION, "num_samples": self._num_samples, "tensors": self._tensors}, f)
+
+    def _close_files(self) -> None:
+        for tensor_file in self._files.values():
+            tensor_file.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # store is not valid without the index, so it is not written when dumping samples failed
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
+
+
+class SampleStore:
+    """Read samples from the store located in `path`.
+
+    By default data files are memory mapped. When `open_file` is provided (e.g. to read the store
+    from a zipped package) data files are read through it and kept in memory. Then `map_file` is tried first
+    to memory map the data file without reading it, e.g. when it is stored uncompressed in the package.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        open_file: Optional[Callable[[str], IO[bytes]]] = None,
+        map_file: Optional[Callable[[str, np.dtype], Optional[np.ndarray]]] = None,
+    ):
+        self._path = pathlib.Path(path)
+        self._open_file = open_file
+        self._map_file = map_file
+        with self._open(INDEX_FILENAME) as f:
+            index = json.load(f)
+        self._num_samples = index["num_samples"]
+        self._tensors = index["tensors"]
+        self._data: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def exists(path: Union[str, pathlib.Path]) -> bool:
+        return (pathlib.Path(path) / INDEX_FILENAME).is_file()
+
+    @property
+    def tensor_names(self) -> List[str]:
+        return list(self._tensors)
+
+    def dtype(self, name: str) -> np.dtype:
+        return np.dtype(self._tensors[name]["dtype"])
+
+    def shape(self, idx: int, name: str) -> Tuple[int, ...]:
+        return tuple(self._tensors[name]["shapes"][idx])
+
+    def shapes(self, idx: int) -> Dict[str, Tuple[int, ...]]:
+        return {name: self.shape(idx, name) for name in self._tensors}
+
+    def tensor(self, name: str) -> np.ndarray:
+        """Return data of all samples for given tensor name as a single (num_samples, *shape) view.
+
+        Available only if all samples of the tensor have the same shape.
+        """
+        shapes = self._tensors[name]["shapes"]
+        if any(shape != shapes[0] for shape in shapes):
+            raise ValueError(f"Samples of tensor {name} have different shapes.")
+        shape = tuple(shapes[0]) if shapes else ()
+        return self._get_data(name)[: self._num_samples * int(np.prod(shape))].reshape((self._num_samples,) + shape)
+
+    def __len__(self) -> int:
+        return self._num_samples
+
+    def __getitem__(self, idx: int) -> Dict[str, np.ndarray]:
+        if idx < 0:
+            idx += self._num_samples
+        if not 0 <= idx < self._num_samples:
+            raise IndexError(f"Sample index {idx} out of range.")
+
+        sample = {}
+        for name, tensor_index in self._tensors.items():
+            offset = tensor_index["offsets"][idx]
+            shape = tuple(tensor_index["shapes"][idx])
+            sample[name] = self._get_data(name)[offset : offset + int(np.prod(shape))].reshape(shape)
+        return sample
+
+    def __iter__(self) -> Iterator[Dict[str, np.ndarray]]:
+        for idx in range(self._num_samples):
+            yield self[idx]
+
+    def _open(self, filename: str) -> IO:
+        if self._open_file is not None:
+            return self._open_file((self._path / filename).as_posix())
+        return open(self._path / filename, "rb")
+
+    def _get_data(self, name: str) -> np.ndarray:
+        if name not in self._data:
+            tensor_index = self._tensors[name]
+            dtype = np.dtype(tensor_index["dtype"])
+            if self._open_file is not None:
+                data = None
+                if self._map_file is not None:
+                    data = self._map_file((self._path / tensor_index["file"]).as_posix(), dtype)
+                if data is None:
+                    with self._open(tensor_index["file"]) as f:
+                        data = np.frombuffer(f.read(), dtype=dtype)
+                self._data[name] = data
+            elif (self._path / tensor_index["file"]).stat().st_size == 0:
+                self._data[name] = np.empty((0,), dtype=dtype)
+            else:
+                # copy-on-write mapping - samples can be modified in memory without changing the store
+                self._data[name] = np.memmap(self._path / tensor_index["file"], dtype=dtype, mode="c")
+        return self._data[name]
+
+
+def write_samples(path: Union[str, pathlib.Path], samples: Iterable[Dict[str, np.ndarray]]) -> None:
+    with SampleStoreWriter(path) as writer:
+        for sample in samples:
+            writer.append(sample)
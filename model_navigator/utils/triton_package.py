@@ -70,7 +70,8 @@ class TritonPackage:
                     _extract(chld, out_path / chld.name)
                 return
 
-            with out_path.open(out_mode) as f, pkg_path.open() as g:
+            # zipfile.Path opens members in text mode in newer Python versions
+            with out_path.open(out_mode) as f, self.arc.open(pkg_path.at) as g:  # pytype: disable=attribute-error
                 shutil.copyfileobj(g, f)
 
         try:
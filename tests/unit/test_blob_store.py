@@ -0,0 +1,86 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import errno
+import os
+
+from model_navigator.utils.blob_store import BlobStore
+
+
+def _make_model(path, content: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_blob_store_links_variants_files_to_single_blob(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    model_dir = tmp_path / "model.savedmodel"
+    _make_model(model_dir / "saved_model.pb", b"graph")
+    _make_model(model_dir / "variables" / "variables.data", b"weights")
+
+    hashes_a = blob_store.deploy(model_dir, tmp_path / "store" / "variant_a" / "1" / "model.savedmodel")
+    hashes_b = blob_store.deploy(model_dir, tmp_path / "store" / "variant_b" / "1" / "model.savedmodel")
+
+    assert hashes_a == hashes_b
+    assert set(hashes_a) == {"saved_model.pb", "variables/variables.data"}
+    assert sorted(path.name for path in blob_store.blobs_dir.iterdir()) == sorted(hashes_a.values())
+
+    weights_a = tmp_path / "store" / "variant_a" / "1" / "model.savedmodel" / "variables" / "variables.data"
+    weights_b = tmp_path / "store" / "variant_b" / "1" / "model.savedmodel" / "variables" / "variables.data"
+    assert weights_a.read_bytes() == b"weights"
+    assert os.path.samefile(weights_a, weights_b)
+
+    # blobs do not share the inode with the source model, so overwriting it does not change deployed variants
+    assert not os.path.samefile(model_dir / "variables" / "variables.data", weights_a)
+
+
+def test_blob_store_copies_files_when_links_are_not_possible(tmp_path, monkeypatch):
+    def _link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", _link)
+    blob_store = BlobStore(tmp_path / "blobs")
+    model_path = _make_model(tmp_path / "model.onnx", b"model")
+
+    hashes = blob_store.deploy(model_path, tmp_path / "store" / "variant" / "1" / "model.onnx")
+
+    assert (tmp_path / "store" / "variant" / "1" / "model.onnx").read_bytes() == b"model"
+    assert (blob_store.blobs_dir / hashes["."]).read_bytes() == b"model"
+
+
+def test_blob_store_keeps_blob_content_when_deploying_to_existing_destination(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    model_path = _make_model(tmp_path / "model.plan", b"engine")
+    dst_path = tmp_path / "store" / "variant" / "1" / "model.plan"
+
+    hashes = blob_store.deploy(model_path, dst_path)
+    assert blob_store.deploy(model_path, dst_path) == hashes
+
+    assert dst_path.read_bytes() == b"engine"
+    assert (blob_store.blobs_dir / hashes["."]).read_bytes() == b"engine"
+    assert os.path.samefile(dst_path, blob_store.blobs_dir / hashes["."])
+    assert sorted(path.name for path in dst_path.parent.iterdir()) == ["model.plan"]
+    assert sorted(path.name for path in blob_store.blobs_dir.iterdir()) == [hashes["."]]
+
+
+def test_blob_store_replaces_existing_destination_with_new_content(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    dst_path = tmp_path / "store" / "variant" / "1" / "model.plan"
+
+    old_hashes = blob_store.deploy(_make_model(tmp_path / "old" / "model.plan", b"old engine"), dst_path)
+    new_hashes = blob_store.deploy(_make_model(tmp_path / "new" / "model.plan", b"new engine"), dst_path)
+
+    assert dst_path.read_bytes() == b"new engine"
+    assert (blob_store.blobs_dir / old_hashes["."]).read_bytes() == b"old engine"
+    assert (blob_store.blobs_dir / new_hashes["."]).read_bytes() == b"new engine"
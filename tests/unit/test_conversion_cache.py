@@ -0,0 +1,128 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import numpy as np
+import pytest
+
+from model_navigator.utils.conversion_cache import ENTRY_FILENAME, ConversionCache
+
+
+def _make_model(path, content: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_conversion_cache_key_depends_on_model_content_and_params(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    model_path = _make_model(tmp_path / "workspace_a" / "model.onnx", b"model")
+    same_model_path = _make_model(tmp_path / "workspace_b" / "model.onnx", b"model")
+    other_model_path = _make_model(tmp_path / "workspace_c" / "model.onnx", b"other model")
+
+    key = cache.get_key(model_path, converter="onnx2trt", params={"precision": "fp16"})
+
+    assert key == cache.get_key(same_model_path, converter="onnx2trt", params={"precision": "fp16"})
+    assert key != cache.get_key(other_model_path, converter="onnx2trt", params={"precision": "fp16"})
+    assert key != cache.get_key(model_path, converter="onnx2trt", params={"precision": "fp32"})
+    assert key != cache.get_key(model_path, converter="ts2onnx", params={"precision": "fp16"})
+
+
+def test_conversion_cache_key_of_directory_depends_on_files(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    model_dir = tmp_path / "model.savedmodel"
+    _make_model(model_dir / "saved_model.pb", b"graph")
+    _make_model(model_dir / "variables" / "variables.index", b"index")
+
+    key = cache.get_key(model_dir, converter="sm2onnx", params={})
+    _make_model(model_dir / "variables" / "variables.index", b"new index")
+
+    assert key != cache.get_key(model_dir, converter="sm2onnx", params={})
+
+
+def test_conversion_cache_restores_stored_artifacts(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    engine_path = _make_model(tmp_path / "workspace_a" / "model.plan", b"engine")
+    model_dir = tmp_path / "workspace_a" / "model.savedmodel"
+    _make_model(model_dir / "saved_model.pb", b"graph")
+
+    assert not cache.get("engine", tmp_path / "workspace_b" / "model.plan")
+
+    cache.put("engine", engine_path)
+    cache.put("savedmodel", model_dir)
+
+    assert cache.get("engine", tmp_path / "workspace_b" / "model.plan")
+    assert (tmp_path / "workspace_b" / "model.plan").read_bytes() == b"engine"
+    assert cache.get("savedmodel", tmp_path / "workspace_b" / "model.savedmodel")
+    assert (tmp_path / "workspace_b" / "model.savedmodel" / "saved_model.pb").read_bytes() == b"graph"
+    assert not [path for path in cache.cache_dir.iterdir() if path.name.startswith("tmp-")]
+
+
+def test_conversion_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_size=25)
+    for name in ("a", "b"):
+        cache.put(name, _make_model(tmp_path / "workspace" / f"{name}.plan", b"0123456789"))
+    # "a" is the oldest entry until it is accessed
+    os.utime(cache.cache_dir / "a" / ENTRY_FILENAME, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(cache.cache_dir / "b" / ENTRY_FILENAME, ns=(2_000_000_000, 2_000_000_000))
+    assert cache.get("a", tmp_path / "output" / "a.plan")
+
+    cache.put("c", _make_model(tmp_path / "workspace" / "c.plan", b"0123456789"))
+
+    assert sorted(path.name for path in cache.cache_dir.iterdir()) == ["a", "c"]
+
+
+def test_conversion_cache_key_of_onnx_model_depends_on_external_data(tmp_path):
+    onnx = pytest.importorskip("onnx")
+    from onnx import helper, numpy_helper
+
+    cache = ConversionCache(tmp_path / "cache")
+    weights = numpy_helper.from_array(np.ones((64, 64), dtype=np.float32), name="weights")
+    graph = helper.make_graph(
+        [helper.make_node("MatMul", ["x", "weights"], ["y"])],
+        "model",
+        [helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [1, 64])],
+        [helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [1, 64])],
+        initializer=[weights],
+    )
+    model_path = tmp_path / "model.onnx"
+    onnx.save_model(helper.make_model(graph), model_path, save_as_external_data=True, location="weights.bin")
+
+    key = cache.get_key(model_path, converter="onnx2trt", params={})
+    model_bytes = model_path.read_bytes()
+    weights_path = tmp_path / "weights.bin"
+    weights_mtime_ns = weights_path.stat().st_mtime_ns
+    weights_path.write_bytes(np.zeros((64, 64), dtype=np.float32).tobytes())
+    os.utime(weights_path, ns=(weights_mtime_ns + 10**9, weights_mtime_ns + 10**9))
+
+    assert model_path.read_bytes() == model_bytes
+    assert key != cache.get_key(model_path, converter="onnx2trt", params={})
+
+
+def test_conversion_cache_restores_extra_files(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    engine_path = _make_model(tmp_path / "workspace_a" / "model.plan", b"engine")
+    script_path = _make_model(tmp_path / "workspace_a" / "reproduce_conversion.sh", b"convert")
+    missing_path = tmp_path / "workspace_a" / "reproduce_conversion.py"
+
+    cache.put("engine", engine_path, extra_paths=[script_path, missing_path])
+
+    restored_dir = tmp_path / "workspace_b"
+    assert cache.get(
+        "engine",
+        restored_dir / "model.plan",
+        extra_paths=[restored_dir / "reproduce_conversion.sh", restored_dir / "reproduce_conversion.py"],
+    )
+    assert (restored_dir / "reproduce_conversion.sh").read_bytes() == b"convert"
+    assert not (restored_dir / "reproduce_conversion.py").exists()
@@ -0,0 +1,49 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import subprocess
+import sys
+import time
+
+FRAMEWORK_MODULES = ["torch", "tensorflow", "jax", "transformers", "datasets"]
+
+
+def _run_python(code: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_does_not_import_frameworks():
+    start = time.perf_counter()
+    loaded = _run_python(
+        "import json, sys; import model_navigator; "
+        f"print(json.dumps([name for name in {FRAMEWORK_MODULES!r} if name in sys.modules]))"
+    )
+    elapsed = time.perf_counter() - start
+
+    assert loaded == [], f"Importing model_navigator (took {elapsed:.2f}s) imported frameworks: {loaded}"
+
+
+def test_cli_imports_only_invoked_command():
+    loaded = _run_python(
+        "import json, sys; import click.testing; from model_navigator.cli.main import cli; "
+        "result = click.testing.CliRunner().invoke(cli, ['select', '--help']); "
+        "print(json.dumps({'exit_code': result.exit_code, "
+        "'modules': sorted(name for name in sys.modules if name.startswith('model_navigator.cli.'))}))"
+    )
+
+    assert loaded["exit_code"] == 0
+    assert "model_navigator.cli.select" in loaded["modules"]
+    assert "model_navigator.cli.optimize" not in loaded["modules"]
+    assert "model_navigator.cli.convert_model" not in loaded["modules"]
@@ -13,12 +13,14 @@
 # limitations under the License.
 import pathlib
 import tempfile
+import zipfile
 
 import numpy as np
 import pytest
 
 from model_navigator.converter.dataloader import NavPackageDataloader
-from model_navigator.utils.nav_package import NavPackageDirectory
+from model_navigator.utils.nav_package import NavPackageDirectory, ZippedNavPackage
+from model_navigator.utils.sample_store import write_samples
 
 
 @pytest.fixture
@@ -59,3 +61,72 @@ def test_batch_dim(nav_package):
         for n in dataloader.max_shapes:
             for a, b in zip(dataloader.max_shapes[n], dataloader.min_shapes[n]):
                 assert a >= b
+
+
+@pytest.fixture
+def nav_package_with_sample_store():
+    with tempfile.TemporaryDirectory(suffix=".nav") as package:
+        path = pathlib.Path(package)
+        samples = [
+            {"input__0": np.arange(i * 4, dtype=np.int32), "input__1": np.random.random((2 * i + 1, 2 * i + 5))}
+            for i in range(4)
+            for _ in range(70)
+        ]
+        write_samples(path / "model_input" / "test", samples)
+        yield NavPackageDirectory(path)
+
+
+def test_batch_dim_with_sample_store(nav_package_with_sample_store):
+    for bs in (1, 3, 64):
+        dataloader = NavPackageDataloader(nav_package_with_sample_store, "test", max_batch_size=bs)
+        sizes = set()
+        for sample in dataloader:
+            assert sample["input__0"].dtype == np.int32
+            assert sample["input__1"].dtype == np.float64
+            sizes.update(v.shape[0] for v in sample.values())
+        assert sizes == {1, bs}
+        assert all(dataloader.max_shapes[n][0] == bs for n in dataloader.max_shapes)
+        assert all(dataloader.min_shapes[n][0] == 1 for n in dataloader.min_shapes)
+
+
+def test_shapes_and_dtypes_from_npz_headers_without_loading_samples(nav_package, monkeypatch):
+    dataloader = NavPackageDataloader(nav_package, "test", max_batch_size=8)
+
+    def _fail_load(*args, **kwargs):
+        raise AssertionError("Samples data should not be loaded")
+
+    monkeypatch.setattr(dataloader, "_load_sample", _fail_load)
+    assert dataloader.min_shapes == {"input__0": [1, 0], "input__1": [1, 1, 5]}
+    assert dataloader.max_shapes == {"input__0": [8, 12], "input__1": [8, 7, 11]}
+    assert dataloader.dtypes == {"input__0": np.int32, "input__1": np.float64}
+
+
+def test_dtypes_are_scalar_types_accepted_by_torch_type_conversion(nav_package):
+    pytest.importorskip("torch")
+    import torch
+
+    from model_navigator.converter.pyt.utils import numpy_to_torch_type
+
+    dataloader = NavPackageDataloader(nav_package, "test", max_batch_size=8)
+
+    torch_types = {name: numpy_to_torch_type(dtype) for name, dtype in dataloader.dtypes.items()}
+
+    assert torch_types == {"input__0": torch.int32, "input__1": torch.float64}
+
+
+def test_zipped_package_with_stored_sample_store_is_memory_mapped(nav_package_with_sample_store, tmp_path):
+    package_path = tmp_path / "package.nav"
+    with zipfile.ZipFile(package_path, "w", compression=zipfile.ZIP_STORED) as arc:
+        for path in sorted(nav_package_with_sample_store.path.rglob("*")):
+            arc.write(path, path.relative_to(nav_package_with_sample_store.path).as_posix())
+    package = ZippedNavPackage(package_path)
+
+    dataloader = NavPackageDataloader(package, "test", max_batch_size=64)
+    batches = list(dataloader)
+
+    assert all(isinstance(data, np.memmap) for data in dataloader._store._data.values())
+    expected = list(NavPackageDataloader(nav_package_with_sample_store, "test", max_batch_size=64))
+    assert len(batches) == len(expected)
+    for batch, expected_batch in zip(batches, expected):
+        for name in expected_batch:
+            np.testing.assert_array_equal(batch[name], expected_batch[name])
@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import zipfile
+
+import numpy as np
 import pytest
 
 from model_navigator.exceptions import ModelNavigatorInvalidPackageException
-from model_navigator.utils.nav_package import select_input_format
+from model_navigator.utils.nav_package import ZippedNavPackage, select_input_format, write_zipped_nav_package
 
 
 # select_input tests
@@ -82,3 +86,122 @@ def test_no_valid_formats():
         match="No valid models found in package. Models found: FOO, path: /FOO/BAR",
     ):
         select_input_format([inp_invalid, inp_onnx])
+
+
+@pytest.fixture
+def zipped_package(tmp_path):
+    package_path = tmp_path / "package.nav"
+    with zipfile.ZipFile(package_path, "w", compression=zipfile.ZIP_DEFLATED) as arc:
+        arc.writestr("status.yaml", "model_name: test")
+        arc.writestr("onnx/model.onnx", b"onnx" * 100)
+        arc.writestr("onnx/config.yaml", "format: onnx")
+        arc.writestr("model_input/profiling/0.bin", b"\x00" * 16, compress_type=zipfile.ZIP_STORED)
+    return ZippedNavPackage(package_path)
+
+
+def test_materialize_extracts_only_requested_members(zipped_package, tmp_path):
+    workdir = tmp_path / "workdir"
+
+    extracted = zipped_package.materialize(zipped_package.members_under("onnx"), workdir)
+
+    assert sorted(extracted) == ["onnx/config.yaml", "onnx/model.onnx"]
+    assert (workdir / "onnx" / "model.onnx").read_bytes() == b"onnx" * 100
+    assert not (workdir / "status.yaml").exists()
+    assert not (workdir / "model_input").exists()
+    assert zipped_package.is_materialized_in(workdir)
+
+
+def test_materialize_skips_already_extracted_members(zipped_package, tmp_path):
+    workdir = tmp_path / "workdir"
+    zipped_package.materialize(zipped_package.members_under("onnx"), workdir)
+
+    assert zipped_package.materialize(zipped_package.members_under(), workdir) == [
+        "status.yaml",
+        "model_input/profiling/0.bin",
+    ]
+    assert zipped_package.materialize(zipped_package.members_under(), workdir) == []
+
+    (workdir / "onnx" / "model.onnx").unlink()
+    assert zipped_package.materialize(zipped_package.members_under(), workdir) == ["onnx/model.onnx"]
+
+
+def test_memmap_maps_only_stored_members(zipped_package):
+    data = zipped_package.memmap("model_input/profiling/0.bin", np.dtype(np.float32))
+
+    assert isinstance(data, np.memmap)
+    np.testing.assert_array_equal(data, np.zeros((4,), dtype=np.float32))
+    assert zipped_package.memmap("onnx/model.onnx", np.dtype(np.uint8)) is None
+
+
+@pytest.fixture
+def package_workdir(tmp_path):
+    workdir = tmp_path / "workdir"
+    files = {
+        "model_input/profiling/0.bin": b"\0" * 16,
+        "onnx/model.onnx": b"onnx" * 100,
+        "onnx/config.yaml": b"format: onnx\n" * 10,
+        "status.yaml": b"status: ok\n" * 10,
+    }
+    for mtime, (name, content) in enumerate(files.items(), start=1_600_000_000):
+        (workdir / name).parent.mkdir(parents=True, exist_ok=True)
+        (workdir / name).write_bytes(content)
+        os.utime(workdir / name, ns=(mtime * 10**9, mtime * 10**9))
+    return workdir
+
+
+def _members(workdir):
+    return {p.relative_to(workdir).as_posix(): p for p in workdir.rglob("*") if p.is_file()}
+
+
+def test_write_zipped_nav_package_selects_compression_by_extension(package_workdir, tmp_path):
+    package_path = tmp_path / "package.nav"
+
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    with zipfile.ZipFile(package_path) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["model_input/profiling/0.bin", "onnx/model.onnx", "onnx/config.yaml", "status.yaml"]
+        compress_types = {info.filename: info.compress_type for info in zf.infolist()}
+        assert zf.read("onnx/config.yaml") == b"format: onnx\n" * 10
+    assert compress_types == {
+        "model_input/profiling/0.bin": zipfile.ZIP_STORED,
+        "onnx/model.onnx": zipfile.ZIP_STORED,
+        "onnx/config.yaml": zipfile.ZIP_DEFLATED,
+        "status.yaml": zipfile.ZIP_DEFLATED,
+    }
+
+
+def test_write_zipped_nav_package_skips_writing_unchanged_package(package_workdir, tmp_path):
+    package_path = tmp_path / "package.nav"
+    write_zipped_nav_package(package_path, _members(package_workdir))
+    stat = package_path.stat()
+
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    assert (package_path.stat().st_ino, package_path.stat().st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+
+
+def test_write_zipped_nav_package_replaces_package_when_member_changed(package_workdir, tmp_path):
+    package_path = tmp_path / "package.nav"
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    (package_workdir / "status.yaml").write_bytes(b"status: profiled\n")
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    with zipfile.ZipFile(package_path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("status.yaml") == b"status: profiled\n"
+        assert zf.read("onnx/model.onnx") == b"onnx" * 100
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["package.nav", "workdir"]
+
+
+def test_write_zipped_nav_package_rewrites_package_when_member_removed(package_workdir, tmp_path):
+    package_path = tmp_path / "package.nav"
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    (package_workdir / "model_input" / "profiling" / "0.bin").unlink()
+    write_zipped_nav_package(package_path, _members(package_workdir))
+
+    with zipfile.ZipFile(package_path) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["onnx/model.onnx", "onnx/config.yaml", "status.yaml"]
@@ -0,0 +1,115 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from model_navigator.cli.optimize import _get_free_ports, _GpuScheduler, _TritonServerPool
+
+
+class FakeTritonServer:
+    def __init__(self, gpus):
+        self.gpus = gpus
+        self.alive = False
+        self.starts = 0
+
+    def start(self):
+        self.alive = True
+        self.starts += 1
+
+    def stop(self):
+        self.alive = False
+
+    def is_alive(self):
+        return self.alive
+
+    def create_grpc_client(self):
+        client = MagicMock()
+        client.client.is_server_live.return_value = self.alive
+        return client
+
+
+def test_gpu_scheduler_assign_each_gpu_to_single_variant_at_a_time():
+    gpus = ["GPU-0", "GPU-1", "GPU-2"]
+    scheduler = _GpuScheduler(gpus)
+    lock = threading.Lock()
+    used_gpus = []
+    max_used_gpus = []
+
+    def _evaluate(num_required_gpus):
+        with scheduler.acquire(num_required_gpus) as variant_gpus:
+            with lock:
+                assert not set(variant_gpus) & set(used_gpus)
+                used_gpus.extend(variant_gpus)
+                max_used_gpus.append(len(used_gpus))
+            time.sleep(0.01)
+            with lock:
+                for gpu in variant_gpus:
+                    used_gpus.remove(gpu)
+            return variant_gpus
+
+    with ThreadPoolExecutor(max_workers=scheduler.max_parallel) as executor:
+        results = list(executor.map(_evaluate, [None, 2, 1, None, 3, 1]))
+
+    assert scheduler.max_parallel == 3
+    assert [len(variant_gpus) for variant_gpus in results] == [1, 2, 1, 1, 3, 1]
+    assert max(max_used_gpus) <= len(gpus)
+    assert sorted(scheduler._free_gpus) == gpus
+
+
+def test_gpu_scheduler_return_no_gpus_when_running_on_cpu():
+    scheduler = _GpuScheduler([])
+
+    with scheduler.acquire(None) as variant_gpus:
+        assert variant_gpus == []
+    assert scheduler.max_parallel == 1
+
+
+def test_get_free_ports_return_distinct_ports():
+    ports = _get_free_ports()
+
+    assert set(ports) == {"http", "grpc", "metrics"}
+    assert len(set(ports.values())) == 3
+
+
+def test_triton_server_pool_reuse_server_when_variants_use_same_gpus():
+    server_pool = _TritonServerPool(FakeTritonServer)
+
+    triton_server = server_pool.get_server(["GPU-0"])
+    assert server_pool.get_server(["GPU-0"]) is triton_server
+    assert triton_server.starts == 1
+
+    # variant crashed the server
+    triton_server.alive = False
+    assert server_pool.get_server(["GPU-0"]) is triton_server
+    assert triton_server.starts == 2
+
+    server_pool.close()
+    assert not triton_server.alive
+
+
+def test_triton_server_pool_stop_idle_servers_when_gpus_are_required_by_other_gpus_set():
+    server_pool = _TritonServerPool(FakeTritonServer)
+
+    gpu0_server = server_pool.get_server(["GPU-0"])
+    gpu1_server = server_pool.get_server(["GPU-1"])
+    gpu01_server = server_pool.get_server(["GPU-0", "GPU-1"])
+    gpu2_server = server_pool.get_server(["GPU-2"])
+
+    assert not gpu0_server.alive and not gpu1_server.alive
+    assert gpu01_server.alive and gpu2_server.alive
+    assert gpu01_server.gpus == ["GPU-0", "GPU-1"]
+    assert server_pool.get_server(["GPU-0"]) is not gpu0_server
+    assert not gpu01_server.alive
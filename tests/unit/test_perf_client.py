@@ -0,0 +1,150 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from model_navigator.exceptions import ModelNavigatorException
+from model_navigator.perf_analyzer.config import MeasurementMode
+from model_navigator.perf_analyzer.perf_client import LoadGenerator, PerfClient
+from model_navigator.record.types.perf_latency import PerfLatency
+from model_navigator.record.types.perf_throughput import PerfThroughput
+
+
+def _sleeping_sender_factory(latency_s, started_workers=None):
+    @contextlib.contextmanager
+    def _factory(worker_idx):
+        if started_workers is not None:
+            started_workers.append(worker_idx)
+        yield lambda: time.sleep(latency_s)
+
+    return _factory
+
+
+def test_load_generator_measures_with_concurrency():
+    started_workers = []
+    load_generator = LoadGenerator(
+        _sleeping_sender_factory(0.002, started_workers), measurement_request_count=20, stability_percentage=50
+    )
+
+    result = load_generator.measure(concurrency=2, batch_size=4)
+
+    assert sorted(started_workers) == [0, 1]
+    assert len(result.latencies) >= 60
+    assert result.latency_percentile(50) >= 2000
+    # 2 requests in flight with 4 samples each and ~2ms latency
+    assert 1000 <= result.throughput <= 4000
+    records = result.records()
+    assert isinstance(records[0], PerfThroughput) and isinstance(records[1], PerfLatency)
+    assert records[1].value() == pytest.approx(result.latency_percentile(99) / 1000)
+    row = result.report_row()
+    assert row["Concurrency"] == 2
+    assert row["p99 latency"] >= row["p50 latency"]
+    counts, edges = result.latency_histogram(bins=5)
+    assert counts.sum() == len(result.latencies) and len(edges) == 6
+
+
+def test_load_generator_measures_with_request_rate():
+    load_generator = LoadGenerator(
+        _sleeping_sender_factory(0.001),
+        measurement_mode=MeasurementMode.TIME_WINDOWS,
+        measurement_interval=200,
+        stability_percentage=50,
+    )
+
+    result = load_generator.measure(concurrency=4, request_rate=200)
+
+    assert result.throughput == pytest.approx(200, rel=0.2)
+    assert result.report_row()["Request Rate"] == 200
+
+
+def test_load_generator_raises_when_request_fails():
+    @contextlib.contextmanager
+    def _factory(worker_idx):
+        def _send():
+            raise RuntimeError("Connection refused")
+
+        yield _send
+
+    with pytest.raises(ModelNavigatorException, match="Connection refused"):
+        LoadGenerator(_factory, timeout=10).measure(concurrency=2)
+
+
+class _StubTritonHandler(BaseHTTPRequestHandler):
+    metadata = {
+        "name": "stub",
+        "versions": ["1"],
+        "platform": "stub",
+        "inputs": [{"name": "INPUT", "datatype": "FP32", "shape": [-1, 4]}],
+        "outputs": [{"name": "OUTPUT", "datatype": "FP32", "shape": [-1, 4]}],
+    }
+    config = {"name": "stub", "max_batch_size": 8}
+    requests = []
+
+    def do_GET(self):  # noqa: N802
+        self._respond(self.config if self.path.endswith("/config") else self.metadata)
+
+    def do_POST(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        header_length = int(self.headers.get("Inference-Header-Content-Length", len(body)))
+        request = json.loads(body[:header_length])
+        self.requests.append(request)
+        shape = request["inputs"][0]["shape"]
+        self._respond(
+            {
+                "model_name": "stub",
+                "outputs": [
+                    {"name": "OUTPUT", "datatype": "FP32", "shape": shape, "data": [0.0] * int(np.prod(shape))}
+                ],
+            }
+        )
+
+    def _respond(self, content):
+        data = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_perf_client_measures_model_on_stub_server():
+    pytest.importorskip("tritonclient.http")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubTritonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        perf_client = PerfClient(
+            f"http://127.0.0.1:{server.server_address[1]}",
+            model_name="stub",
+            batch_size=2,
+            measurement_request_count=10,
+            stability_percentage=100,
+            timeout=60,
+        )
+        result = perf_client.run(concurrency=2)
+    finally:
+        server.shutdown()
+
+    assert result.throughput > 0
+    assert len(result.latencies) >= 30
+    assert _StubTritonHandler.requests[-1]["inputs"][0]["shape"] == [2, 4]
@@ -0,0 +1,105 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from polygraphy.comparator import RunResults
+
+from model_navigator.converter.polygraphy import comparator
+from model_navigator.converter.polygraphy.comparator import OutputErrorStat, ToleranceParameterHelper
+
+
+def test_output_error_stat_return_statistics_equal_to_numpy_when_computed_in_chunks(monkeypatch):
+    monkeypatch.setattr(comparator, "_CHUNK_SIZE", 7)
+    random_state = np.random.RandomState(0)
+    out0 = random_state.uniform(-10, 10, size=(5, 11)).astype(np.float32)
+    out1 = out0 + random_state.normal(scale=0.1, size=out0.shape).astype(np.float32)
+    out1[0, 0] = out0[0, 0]
+
+    stat = OutputErrorStat(out0=out0, out1=out1)
+
+    absdiff = np.abs(out0 - out1)
+    reldiff = absdiff / np.abs(out1)
+    assert stat.mean_absdiff() == pytest.approx(np.mean(absdiff.astype(np.float64)))
+    assert stat.std_absdiff() == pytest.approx(np.std(absdiff.astype(np.float64)))
+    assert stat.max_absdiff() == pytest.approx(np.amax(absdiff))
+    assert stat.mean_reldiff() == pytest.approx(np.mean(reldiff.astype(np.float64)))
+    assert stat.std_reldiff() == pytest.approx(np.std(reldiff.astype(np.float64)))
+    assert stat.max_reldiff() == pytest.approx(np.amax(reldiff))
+    # diff arrays are computed once
+    assert stat.absdiff is stat.absdiff
+
+
+def test_output_error_stat_return_nan_max_when_output_contains_nan(monkeypatch):
+    monkeypatch.setattr(comparator, "_CHUNK_SIZE", 4)
+    out0 = np.arange(1, 13, dtype=np.float32)
+    out1 = out0 + 0.5
+    # NaN outside of the first chunk
+    out1[9] = np.nan
+
+    stat = OutputErrorStat(out0=out0, out1=out1)
+
+    assert np.isnan(stat.max_absdiff())
+    assert np.isnan(stat.max_reldiff())
+    assert np.isnan(stat.mean_absdiff())
+
+
+@pytest.mark.parametrize("std_coeff", [0, 1, 2, 5])
+def test_output_error_stat_return_max_reldiff_of_elements_above_atol(std_coeff):
+    random_state = np.random.RandomState(1)
+    out0 = random_state.uniform(-1, 1, size=(4, 50))
+    out1 = out0 + random_state.normal(scale=0.01, size=out0.shape)
+
+    stat = OutputErrorStat(out0=out0, out1=out1)
+    atol, rtol = stat.recommended_tolerance(std_coeff)
+
+    absdiff = np.abs(out0 - out1)
+    expected_atol = np.mean(absdiff) + std_coeff * np.std(absdiff)
+    above_atol = absdiff >= expected_atol
+    expected_rtol = (
+        np.amax((absdiff / np.abs(out1))[above_atol]) if above_atol.any() else comparator.DEFAULT_TOLERANCE_RTOL
+    )
+    assert atol == pytest.approx(expected_atol)
+    assert rtol == pytest.approx(expected_rtol)
+
+
+def test_output_error_stat_return_xor_diff_when_outputs_are_boolean():
+    stat = OutputErrorStat(out0=np.array([True, False, True, True]), out1=np.array([True, True, False, True]))
+
+    assert stat.mean_absdiff() == pytest.approx(0.5)
+    assert stat.max_absdiff() == pytest.approx(1.0)
+    assert stat.recommended_tolerance(0) == (pytest.approx(0.5), np.inf)
+
+
+def test_tolerance_parameter_helper_load_results_once_and_return_tolerances():
+    out0 = np.linspace(1.0, 2.0, 100)
+    out1 = out0 * 1.001
+    run_results = RunResults()
+    run_results.append(("runner0", [{"output": out0}]))
+    run_results.append(("runner1", [{"output": out1}]))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        outputs_path = Path(tmp_dir) / "outputs.json"
+        run_results.save(outputs_path.as_posix())
+        helper = ToleranceParameterHelper(Path(tmp_dir) / "inputs.json", outputs_path)
+
+        atol, rtol = helper.get_tolerance_parameters()
+        outputs_path.unlink()
+        value_ranges = helper.get_outputs_value_ranges()
+
+    assert atol == {"output": pytest.approx(0.002)}
+    assert rtol == {"output": pytest.approx(0.001)}
+    assert value_ranges == {"output": (pytest.approx(1.0), pytest.approx(2.002))}
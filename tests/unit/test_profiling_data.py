@@ -0,0 +1,95 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from model_navigator.exceptions import ModelNavigatorException
+from model_navigator.perf_analyzer.profiling_data import ProfilingDataFormat, create_profiling_data
+
+
+class _CountingDataloader:
+    def __init__(self, samples):
+        self.samples = samples
+        self.num_pulled = 0
+
+    def __iter__(self):
+        for sample in self.samples:
+            self.num_pulled += 1
+            yield sample
+
+
+def _samples(num_samples):
+    return [
+        {
+            "input__0": np.full((1, 2, 3), idx, dtype=np.float16),
+            "input__1": np.array([[idx % 2]], dtype=np.int64),
+        }
+        for idx in range(num_samples)
+    ]
+
+
+def test_create_profiling_data_writes_json_loadable_by_perf_analyzer(tmp_path):
+    output_path = tmp_path / "data.json"
+
+    create_profiling_data(_CountingDataloader(_samples(3)), output_path)
+
+    data = json.loads(output_path.read_text())["data"]
+    assert len(data) == 3
+    assert data[2]["input__0"]["shape"] == [2, 3]
+    content = np.frombuffer(base64.b64decode(data[2]["input__0"]["content"]["b64"]), dtype=np.float16)
+    np.testing.assert_array_equal(content, np.full((6,), 2, dtype=np.float16))
+
+
+def test_create_profiling_data_caps_samples_without_pulling_whole_dataloader(tmp_path):
+    output_path = tmp_path / "data.json"
+    dataloader = _CountingDataloader(_samples(10))
+
+    create_profiling_data(dataloader, output_path, max_samples=4)
+
+    assert len(json.loads(output_path.read_text())["data"]) == 4
+    assert dataloader.num_pulled == 4
+
+
+def test_create_profiling_data_skips_duplicated_samples(tmp_path):
+    output_path = tmp_path / "data.json"
+    samples = _samples(3)
+    samples = samples + samples[:2]
+
+    create_profiling_data(_CountingDataloader(samples), output_path, deduplicate=True)
+
+    data = json.loads(output_path.read_text())["data"]
+    assert len(data) == 3
+
+
+def test_create_profiling_data_writes_binary_files_for_first_sample(tmp_path):
+    output_path = tmp_path / "data"
+    samples = _samples(2)
+    samples[0]["input__2"] = np.array([[b"ab", b"c"]], dtype=np.object_)
+
+    create_profiling_data(_CountingDataloader(samples), output_path, data_format=ProfilingDataFormat.BINARY)
+
+    assert sorted(path.name for path in output_path.iterdir()) == ["input__0", "input__1", "input__2"]
+    assert (output_path / "input__0").read_bytes() == samples[0]["input__0"].tobytes()
+    # Perf Analyzer reads BYTES inputs from binary data directory as text with one element per line
+    assert (output_path / "input__2").read_bytes() == b"ab\nc"
+
+
+def test_create_profiling_data_rejects_multiline_bytes_inputs_in_binary_format(tmp_path):
+    samples = [{"input__0": np.array([[b"first line\nsecond line"]], dtype=np.object_)}]
+
+    with pytest.raises(ModelNavigatorException, match="input__0"):
+        create_profiling_data(_CountingDataloader(samples), tmp_path / "data", data_format=ProfilingDataFormat.BINARY)
@@ -0,0 +1,81 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import zipfile
+
+import numpy as np
+import pytest
+
+from model_navigator.utils.sample_store import SampleStore, SampleStoreWriter, write_samples
+
+
+def test_sample_store_returns_samples_in_order(tmp_path):
+    samples = [
+        {"input__0": np.random.random((i + 1, 3)).astype(np.float32), "input__1": np.array(i, dtype=np.int64)}
+        for i in range(5)
+    ]
+    write_samples(tmp_path, samples)
+
+    assert SampleStore.exists(tmp_path)
+    store = SampleStore(tmp_path)
+    assert len(store) == 5
+    assert store.tensor_names == ["input__0", "input__1"]
+    for sample, stored_sample in zip(samples, store):
+        assert stored_sample.keys() == sample.keys()
+        for name, tensor in sample.items():
+            assert stored_sample[name].dtype == tensor.dtype
+            np.testing.assert_array_equal(stored_sample[name], tensor)
+    np.testing.assert_array_equal(store[-1]["input__0"], samples[-1]["input__0"])
+    with pytest.raises(IndexError):
+        store[5]
+
+
+def test_sample_store_tensor_returns_view_of_all_samples(tmp_path):
+    samples = [{"output__0": np.full((2, 3), i, dtype=np.float16)} for i in range(4)]
+    write_samples(tmp_path, samples)
+
+    store = SampleStore(tmp_path)
+    tensor = store.tensor("output__0")
+    assert tensor.shape == (4, 2, 3)
+    assert isinstance(tensor.base, np.memmap)
+    np.testing.assert_array_equal(tensor, np.stack([sample["output__0"] for sample in samples]))
+
+
+def test_sample_store_tensor_raise_error_when_shapes_differ(tmp_path):
+    write_samples(tmp_path, [{"input__0": np.zeros((1,))}, {"input__0": np.zeros((2,))}])
+
+    with pytest.raises(ValueError):
+        SampleStore(tmp_path).tensor("input__0")
+
+
+def test_sample_store_writer_raise_error_when_samples_differ(tmp_path):
+    with pytest.raises(ValueError):
+        with SampleStoreWriter(tmp_path) as writer:
+            writer.append({"input__0": np.zeros((1,), dtype=np.float32)})
+            writer.append({"input__0": np.zeros((1,), dtype=np.float64)})
+
+    assert not SampleStore.exists(tmp_path)
+
+
+def test_sample_store_reads_from_zip_archive(tmp_path):
+    samples = [{"input__0": np.arange(i + 1, dtype=np.int32)} for i in range(3)]
+    write_samples(tmp_path / "model_input" / "profiling", samples)
+    archive_path = tmp_path / "package.nav"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for path in (tmp_path / "model_input" / "profiling").iterdir():
+            archive.write(path, path.relative_to(tmp_path).as_posix())
+
+    with zipfile.ZipFile(archive_path) as archive:
+        store = SampleStore("model_input/profiling", open_file=lambda name: archive.open(name))
+        for sample, stored_sample in zip(samples, store):
+            np.testing.assert_array_equal(stored_sample["input__0"], sample["input__0"])
@@ -0,0 +1,110 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from model_navigator.triton.client import ModelState, TritonClient
+
+pytest.importorskip("tritonclient.http")
+
+
+class StubRepositoryHandler(BaseHTTPRequestHandler):
+    """Repository endpoints of Triton HTTP API; unloaded models report UNLOADING state once."""
+
+    models = {}
+    config = {"name": "model", "max_batch_size": 8}
+
+    def do_GET(self):  # noqa: N802
+        path = self.path.split("?")[0].strip("/").split("/")
+        if path[:2] != ["v2", "models"] or path[-1] != "config":
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = json.dumps(self.config).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        content_length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(content_length)
+        path = self.path.split("?")[0].strip("/").split("/")
+        body = b""
+        if path == ["v2", "repository", "index"]:
+            body = json.dumps(
+                [{"name": name, "version": "1", "state": state} for name, state in self.models.items()]
+            ).encode()
+            for name, state in self.models.items():
+                if state == ModelState.UNLOADING.value:
+                    self.models[name] = ModelState.UNAVAILABLE.value
+        elif path[:3] == ["v2", "repository", "models"] and path[4] == "load":
+            self.models[path[3]] = ModelState.READY.value
+        elif path[:3] == ["v2", "repository", "models"] and path[4] == "unload":
+            self.models[path[3]] = ModelState.UNLOADING.value
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server_url():
+    StubRepositoryHandler.models = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRepositoryHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unload_model_wait_until_model_is_unloaded(stub_server_url):
+    client = TritonClient(stub_server_url)
+    client.load_model("model_a")
+    client.load_model("model_b")
+    assert client.get_model_state("model_a", "1") == ModelState.READY
+
+    client.unload_model("model_a", check_interval_s=0.01)
+
+    assert client.get_model_state("model_a", "1") == ModelState.UNAVAILABLE
+    assert client.get_model_state("model_b", "1") == ModelState.READY
+
+
+def test_unload_model_raise_error_when_model_is_not_unloaded_till_timeout(stub_server_url):
+    client = TritonClient(stub_server_url)
+    client.load_model("model_a")
+
+    with pytest.raises(RuntimeError):
+        client.unload_model("model_a", timeout_s=0, check_interval_s=0.01)
+
+
+def test_get_model_config_returns_model_configuration(stub_server_url):
+    client = TritonClient(stub_server_url)
+
+    assert client.get_model_config("model") == {"name": "model", "max_batch_size": 8}
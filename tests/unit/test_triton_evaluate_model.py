@@ -0,0 +1,68 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from model_navigator.cli.triton_evaluate_model import _search_concurrency
+
+
+def _fake_perf_analyzer(throughput_fn, latency_fn, calls):
+    def _measure(start, end, step):
+        calls.append((start, end, step))
+        return [
+            {
+                "Concurrency": str(concurrency),
+                "Inferences/Second": str(throughput_fn(concurrency)),
+                "p99 latency": str(int(latency_fn(concurrency) * 1000)),
+            }
+            for concurrency in range(start, end + 1, step)
+        ]
+
+    return _measure
+
+
+def test_search_concurrency_finds_throughput_knee_with_few_measurements():
+    calls = []
+    measure = _fake_perf_analyzer(lambda c: 100 * min(c, 24), lambda c: c, calls)
+
+    rows, result = _search_concurrency(measure, min_concurrency=1, max_concurrency=256)
+
+    # probes 1, 2, 4, 8, 16, 32, 64 and single refinement between 16 and 64
+    assert calls[:7] == [(c, c, 1) for c in (1, 2, 4, 8, 16, 32, 64)]
+    assert calls[7] == (25, 63, 9)
+    assert len(calls) == 8
+    assert result.knee_concurrency == 25
+    assert result.knee_throughput == 2400
+    assert result.max_concurrency_within_latency_budget is None
+    assert [int(row["Concurrency"]) for row in rows] == sorted(int(row["Concurrency"]) for row in rows)
+
+
+def test_search_concurrency_stops_probing_when_latency_budget_exceeded():
+    calls = []
+    measure = _fake_perf_analyzer(lambda c: 100 * c, lambda c: 2 * c, calls)
+
+    _, result = _search_concurrency(measure, min_concurrency=1, max_concurrency=256, latency_budget=50)
+
+    assert (64, 64, 1) not in calls
+    assert calls[-1] == (12, 31, 4)
+    assert result.max_concurrency_within_latency_budget == 24
+    assert result.knee_concurrency == 32
+
+
+def test_search_concurrency_stops_on_max_concurrency():
+    calls = []
+    measure = _fake_perf_analyzer(lambda c: 100 * c, lambda c: 1, calls)
+
+    _, result = _search_concurrency(measure, min_concurrency=1, max_concurrency=6, latency_budget=10)
+
+    assert calls == [(c, c, 1) for c in (1, 2, 4, 6)]
+    assert result.knee_concurrency == 6
+    assert result.max_concurrency_within_latency_budget == 6
@@ -0,0 +1,88 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import numpy as np
+import onnx
+from polygraphy.backend.onnxrt import OnnxrtRunner, SessionFromOnnx
+
+from model_navigator.tensor import TensorSpec
+from model_navigator.utils.formats.onnx import ONNXUtils, inspect_onnx_graph
+
+
+def _make_model(num_outputs: int = 1, weights_size: int = 3) -> onnx.ModelProto:
+    weights = onnx.numpy_helper.from_array(np.ones(weights_size, dtype=np.float32), "w")
+    nodes = [onnx.helper.make_node("Add", ["x", "w"], ["sum"])]
+    nodes += [onnx.helper.make_node("Relu", ["sum"], [f"y{i}"]) for i in range(num_outputs)]
+    graph = onnx.helper.make_graph(
+        nodes,
+        "add_relu",
+        # initializer listed among inputs as in models exported with older opsets
+        [
+            onnx.helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, ["batch", weights_size]),
+            onnx.helper.make_tensor_value_info("w", onnx.TensorProto.FLOAT, [weights_size]),
+        ],
+        [
+            onnx.helper.make_tensor_value_info(f"y{i}", onnx.TensorProto.FLOAT, ["batch", None])
+            for i in range(num_outputs)
+        ],
+        initializer=[weights],
+        value_info=[onnx.helper.make_tensor_value_info("sum", onnx.TensorProto.FLOAT, ["batch", weights_size])],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    return model
+
+
+def test_inspect_onnx_graph_returns_the_same_inputs_as_onnxruntime(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    onnx.save(_make_model(), model_path.as_posix())
+
+    graph_metadata = inspect_onnx_graph(model_path)
+
+    with OnnxrtRunner(SessionFromOnnx(model_path.as_posix())) as runner:
+        assert list(graph_metadata.inputs) == list(runner.get_input_metadata())
+    assert graph_metadata.inputs == {"x": TensorSpec("x", (-1, 3), np.dtype("float32"))}
+    assert graph_metadata.outputs == {"y0": TensorSpec("y0", (-1, -1), np.dtype("float32"))}
+    assert graph_metadata.value_info == {"sum": TensorSpec("sum", (-1, 3), np.dtype("float32"))}
+    assert graph_metadata.opset == 13
+
+    assert ONNXUtils.get_signature(model_path).inputs == graph_metadata.inputs
+    assert ONNXUtils.get_properties(model_path).onnx_opset == 13
+
+
+def test_inspect_onnx_graph_does_not_read_external_data(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    onnx.save(_make_model(weights_size=1024), model_path.as_posix(), save_as_external_data=True, size_threshold=0)
+    for data_path in tmp_path.iterdir():
+        if data_path != model_path:
+            os.remove(data_path)
+
+    graph_metadata = inspect_onnx_graph(model_path)
+
+    assert list(graph_metadata.inputs) == ["x"]
+
+
+def test_inspect_onnx_graph_is_cached_until_model_changes(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    onnx.save(_make_model(), model_path.as_posix())
+
+    graph_metadata = inspect_onnx_graph(model_path)
+    assert inspect_onnx_graph(model_path) is graph_metadata
+
+    onnx.save(_make_model(num_outputs=2), model_path.as_posix())
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(inspect_onnx_graph(model_path).outputs) == ["y0", "y1"]
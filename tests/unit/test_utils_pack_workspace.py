@@ -15,6 +15,7 @@ import pathlib
 from tempfile import TemporaryDirectory
 
 import pytest
+import yaml
 
 from model_navigator.configurator import TritonConfiguratorResult
 from model_navigator.converter import ConversionConfig, ConversionResult
@@ -23,6 +24,7 @@ from model_navigator.model import Format, Model, ModelConfig
 from model_navigator.results import ResultsStore, State, Status
 from model_navigator.utils import Workspace
 from model_navigator.utils.pack_workspace import pack_workspace
+from model_navigator.utils.triton_package import TritonPackage
 
 FILES_DIR = pathlib.Path(__file__).parent.parent.absolute() / "files"
 
@@ -136,3 +138,40 @@ def test_results_checkpoints_and_models_store_exists_in_workspace():
         pack_workspace(workspace, package_path=package_path, navigator_config={})
 
         assert package_path.is_file() is True
+
+
+def test_files_with_the_same_content_are_stored_once(tmp_path):
+    workspace = Workspace(tmp_path / "workspace")
+    package_path = tmp_path / "test.triton.nav"
+
+    conversion_result = ConversionResult(
+        status=Status(state=State.SUCCEEDED, message="Everything fine"),
+        source_model_config=ModelConfig(
+            model_name="test",
+            model_version="1",
+            model_path=FILES_DIR / "models" / "identity.onnx",
+        ),
+        conversion_config=ConversionConfig(target_format=Format.ONNX),
+    )
+    results_store = ResultsStore(workspace)
+    results_store.dump("convert_model", [conversion_result])
+    results_store.dump("configure_models_on_triton", [])
+
+    (workspace.path / "analyzer" / "results").mkdir(parents=True)
+    (workspace.path / "analyzer" / "checkpoints").mkdir(parents=True)
+    model_store_dir = workspace.path / "analyzer" / "model-store"
+    for variant, config in [("variant_a", b"config a"), ("variant_b", b"config b")]:
+        (model_store_dir / variant / "1").mkdir(parents=True)
+        (model_store_dir / variant / "config.pbtxt").write_bytes(config)
+        (model_store_dir / variant / "1" / "model.onnx").write_bytes(b"weights")
+
+    pack_workspace(workspace, package_path=package_path, navigator_config={})
+
+    package = TritonPackage(package_path)
+    symlinks = yaml.safe_load(package.arc.read("model-store/symlinks.yaml"))
+    assert symlinks == {"variant_b/1/model.onnx": "variant_a/1/model.onnx"}
+
+    output_repository = tmp_path / "repository"
+    package.copy_model_to_repository("variant_b", output_repository)
+    assert (output_repository / "variant_b" / "1" / "model.onnx").read_bytes() == b"weights"
+    assert (output_repository / "variant_b" / "config.pbtxt").read_bytes() == b"config b"
@@ -0,0 +1,61 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from model_navigator.framework_api.commands.convert.base import ConvertBase
+from model_navigator.framework_api.commands.core import CommandType
+from model_navigator.model import Format
+from model_navigator.utils.conversion_cache import ConversionCache
+
+
+class FakeConvert(ConvertBase):
+    def __init__(self):
+        super().__init__(name="Fake conversion", command_type=CommandType.CONVERT, target_format=Format.ONNX)
+        self.conversions = 0
+
+    def __call__(self, workdir, conversion_cache=None, **kwargs):
+        input_model_path = workdir / "model.pt"
+        converted_model_path = workdir / "converted" / "model.onnx"
+
+        def _convert():
+            self.conversions += 1
+            converted_model_path.parent.mkdir(parents=True, exist_ok=True)
+            converted_model_path.write_bytes(b"converted " + input_model_path.read_bytes())
+
+        self._run_conversion(
+            conversion_cache,
+            input_model_path,
+            converted_model_path,
+            params={"opset": 14},
+            packages=(),
+            convert_fn=_convert,
+        )
+
+
+def test_convert_reuses_models_from_conversion_cache_between_workdirs(tmp_path):
+    conversion_cache = ConversionCache(tmp_path / "cache")
+    command = FakeConvert()
+    for workdir_name in ("workdir_a", "workdir_b"):
+        workdir = tmp_path / workdir_name
+        workdir.mkdir()
+        (workdir / "model.pt").write_bytes(b"model")
+        command(workdir=workdir, conversion_cache=conversion_cache)
+
+        assert (workdir / "converted" / "model.onnx").read_bytes() == b"converted model"
+
+    assert command.conversions == 1
+
+    (tmp_path / "workdir_c").mkdir()
+    (tmp_path / "workdir_c" / "model.pt").write_bytes(b"changed model")
+    command(workdir=tmp_path / "workdir_c", conversion_cache=conversion_cache)
+
+    assert command.conversions == 2
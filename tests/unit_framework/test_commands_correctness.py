@@ -0,0 +1,96 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import numpy as np
+import pytest
+
+from model_navigator.framework_api.commands.correctness import correctness_script
+from model_navigator.framework_api.commands.correctness.correctness import TolerancePerOutputName
+from model_navigator.framework_api.commands.data_dump.samples import samples_to_store
+from model_navigator.framework_api.utils import Format
+
+
+class FakeRunner:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def infer(self, sample):
+        self.batch_sizes.append(sample["input__0"].shape[0])
+        return {"output__0": sample["input__0"] * 2.0}
+
+
+def _run_correctness(mocker, workdir, max_batch_size):
+    runner = FakeRunner()
+    runner_manager = mocker.MagicMock()
+    runner_manager.get_runner.return_value = runner
+    mocker.patch.object(correctness_script.RunnerManager, "from_dict", return_value=runner_manager)
+
+    results_path = workdir / f"results_{max_batch_size}.json"
+    correctness_script.correctness(
+        model_name="navigator_model",
+        output_names=["output__0"],
+        batch_dim=0,
+        results_path=results_path.as_posix(),
+        format=Format.ONNX.value,
+        precision=None,
+        jit_type=None,
+        runtime=None,
+        enable_xla=None,
+        jit_compile=None,
+        runner_manager_dict={},
+        navigator_workdir=workdir.as_posix(),
+        max_batch_size=max_batch_size,
+    )
+    with results_path.open() as f:
+        return runner.batch_sizes, TolerancePerOutputName.from_json(json.load(f))
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    rng = np.random.default_rng(0)
+    inputs = [{"input__0": rng.random((1, 4 if i % 3 else 6), dtype=np.float32)} for i in range(10)]
+    outputs = [{"output__0": sample["input__0"] * 2.0 + rng.random((1, 1), dtype=np.float32)} for sample in inputs]
+    # relative difference of this sample is NaN (0 / 0) and is not taken into account
+    inputs[0]["input__0"][...] = 0.0
+    outputs[0]["output__0"][...] = 0.0
+    samples_to_store(inputs, tmp_path / "model_input" / "correctness", batch_dim=0)
+    samples_to_store(outputs, tmp_path / "model_output" / "correctness", batch_dim=0)
+    return tmp_path
+
+
+def test_correctness_batched_results_match_per_sample_results(mocker, workdir):
+    batch_sizes, tolerance = _run_correctness(mocker, workdir, max_batch_size=None)
+    batched_batch_sizes, batched_tolerance = _run_correctness(mocker, workdir, max_batch_size=4)
+
+    assert batch_sizes == [1] * 10
+    # samples are grouped by shape - 6 samples of shape (4,) and 4 samples of shape (6,)
+    assert sorted(batched_batch_sizes) == [2, 4, 4]
+    assert np.isclose(batched_tolerance["output__0"].atol, tolerance["output__0"].atol)
+    assert np.isclose(batched_tolerance["output__0"].rtol, tolerance["output__0"].rtol)
+    assert tolerance["output__0"].atol > 0.0
+    assert not np.isnan(tolerance["output__0"].rtol)
+
+
+def test_per_sample_max_reduces_all_but_batch_dimension():
+    values = np.arange(24, dtype=np.float16).reshape(2, 3, 4)
+
+    np.testing.assert_array_equal(correctness_script._per_sample_max(values, 1, 3), [15.0, 19.0, 23.0])
+    np.testing.assert_array_equal(correctness_script._per_sample_max(values, None, 1), [23.0])
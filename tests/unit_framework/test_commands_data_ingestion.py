@@ -0,0 +1,147 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from polygraphy.backend.trt import Profile
+
+from model_navigator.framework_api.commands.data_dump.ingestion import AxisShapes, ingest_dataloader
+from model_navigator.framework_api.commands.data_dump.samples import FetchInputModelData
+from model_navigator.framework_api.commands.infer_metadata import InferInputMetadata
+from model_navigator.framework_api.utils import Framework
+
+
+class CountingDataloader:
+    def __init__(self, samples):
+        self.samples = samples
+        self.num_iterations = 0
+
+    def __iter__(self):
+        self.num_iterations += 1
+        return iter(self.samples)
+
+    def __len__(self):
+        return len(self.samples)
+
+
+def _make_samples():
+    # batch sizes and sequence lengths - first min/max samples are at known positions
+    shapes = [(2, 8), (4, 8), (1, 16), (4, 4), (1, 4), (3, 16), (2, 10), (4, 16)]
+    return [{"input__0": np.full(shape, i, dtype=np.float32)} for i, shape in enumerate(shapes)]
+
+
+def _sample_ids(samples):
+    return [int(sample["input__0"].flat[0]) for sample in samples]
+
+
+def test_axis_shapes_returns_same_statistics_as_numpy():
+    rng = np.random.default_rng(0)
+    for num_samples in (1, 2, 7, 100):
+        shapes = rng.integers(1, 20, size=num_samples).tolist()
+        axis_shapes = AxisShapes(shapes)
+
+        assert len(axis_shapes) == num_samples
+        assert axis_shapes.min == min(shapes)
+        assert axis_shapes.max == max(shapes)
+        assert axis_shapes.median == np.median(shapes)
+
+
+def test_ingest_dataloader_selects_correctness_samples_with_reservoir_sampling():
+    samples = [{"input__0": np.full((1, 2), i, dtype=np.float32)} for i in range(100)]
+
+    summary = ingest_dataloader(samples, ["input__0"], Framework.ONNX, 0, sample_count=10, seed=0)
+    ids = _sample_ids(summary.correctness_samples)
+
+    assert len(ids) == 10
+    assert ids == sorted(set(ids))
+    assert ids == _sample_ids(
+        ingest_dataloader(samples, ["input__0"], Framework.ONNX, 0, sample_count=10, seed=0).correctness_samples
+    )
+    assert ids != _sample_ids(
+        ingest_dataloader(samples, ["input__0"], Framework.ONNX, 0, sample_count=10, seed=1).correctness_samples
+    )
+    assert _sample_ids(
+        ingest_dataloader(samples, ["input__0"], Framework.ONNX, 0, sample_count=200, seed=0).correctness_samples
+    ) == list(range(100))
+
+
+def test_infer_input_metadata_and_fetch_input_model_data_iterate_dataloader_once():
+    dataloader = CountingDataloader(_make_samples())
+
+    input_metadata, trt_profile, max_batch_size, summary = InferInputMetadata()(
+        model=None,
+        framework=Framework.ONNX,
+        dataloader=dataloader,
+        sample_count=3,
+        seed=0,
+        _input_names=("input__0",),
+        batch_dim=0,
+    )
+    profiling_sample, correctness_samples, conversion_samples = FetchInputModelData()(
+        dataloader_summary=summary, trt_profile=trt_profile
+    )
+
+    # one iteration to get the first sample and one for the whole dataset
+    assert dataloader.num_iterations == 2
+    assert max_batch_size == 4
+    assert input_metadata["input__0"].shape == (-1, -1)
+    assert trt_profile["input__0"].min == (1, 4)
+    assert trt_profile["input__0"].opt == (2, 9)
+    assert trt_profile["input__0"].max == (4, 16)
+    # first samples with batch size 1 and 4 and sequence length 4 and 16
+    assert _sample_ids(conversion_samples) == [1, 2, 3]
+    assert _sample_ids([profiling_sample]) == [2]
+    assert len(correctness_samples) == 3
+    assert all(sample["input__0"].shape[0] == 1 for sample in conversion_samples + correctness_samples)
+
+
+def test_select_samples_uses_samples_inside_profile_narrower_than_data():
+    trt_profile = Profile().add("input__0", min=(2, 8), opt=(2, 8), max=(3, 10))
+    summary = ingest_dataloader(
+        _make_samples(), ["input__0"], Framework.ONNX, 0, sample_count=3, seed=0, trt_profile=trt_profile
+    )
+
+    profiling_sample, _, conversion_samples = summary.select_samples(trt_profile)
+
+    # first samples with batch size 2 and 3 and sequence length 8 and 10
+    assert _sample_ids(conversion_samples) == [0, 5, 6]
+    assert _sample_ids([profiling_sample]) == [6]
+
+
+def test_fetch_input_model_data_uses_samples_closest_to_user_profile_wider_than_data():
+    dataloader = CountingDataloader(_make_samples())
+
+    _, trt_profile, _, summary = InferInputMetadata()(
+        model=None,
+        framework=Framework.ONNX,
+        dataloader=dataloader,
+        sample_count=3,
+        seed=0,
+        _input_names=("input__0",),
+        batch_dim=0,
+        trt_dynamic_axes={"input__0": {0: (1, 2, 8), 1: (2, 8, 32)}},
+    )
+    profiling_sample, _, conversion_samples = FetchInputModelData()(dataloader_summary=summary, trt_profile=trt_profile)
+
+    assert trt_profile["input__0"].max == (8, 32)
+    # first samples with batch size 1 and 4 and sequence length 4 and 16
+    assert _sample_ids(conversion_samples) == [1, 2, 3]
+    assert _sample_ids([profiling_sample]) == [2]
+
+
+def test_ingest_dataloader_keeps_only_min_and_max_samples_of_each_axis():
+    samples = [{"input__0": np.full((1, length), length, dtype=np.float32)} for length in [5, 2, 9, 3, 9, 7, 2]]
+
+    summary = ingest_dataloader(samples, ["input__0"], Framework.ONNX, 0, sample_count=1, seed=0)
+
+    sequence_samples = summary.min_max_samples["input__0"][1]
+    assert {key: (idx, dim) for key, (idx, dim, _) in sequence_samples.items()} == {"min": (1, 2), "max": (2, 9)}
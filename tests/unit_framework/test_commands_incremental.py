@@ -0,0 +1,117 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+
+from model_navigator.converter.config import TensorRTPrecision
+from model_navigator.framework_api.commands.convert.base import ConvertBase
+from model_navigator.framework_api.commands.core import CommandType
+from model_navigator.framework_api.commands.export.base import ExportBase
+from model_navigator.framework_api.incremental import IncrementalState
+from model_navigator.framework_api.utils import Status
+from model_navigator.model import Format
+
+
+class FakeExport(ExportBase):
+    def __init__(self):
+        super().__init__(name="Fake export", command_type=CommandType.EXPORT, target_format=Format.ONNX)
+        self.executions = 0
+
+    def __call__(self, workdir, model, **kwargs):
+        self.executions += 1
+        exported_model_path = workdir / self.get_output_relative_path()
+        if not exported_model_path.exists():
+            exported_model_path.parent.mkdir(parents=True, exist_ok=True)
+            exported_model_path.write_bytes(b"exported " + model.read_bytes())
+        return self.get_output_relative_path()
+
+
+class FakeConvert(ConvertBase):
+    def __init__(self, target_precision):
+        super().__init__(name="Fake conversion", command_type=CommandType.CONVERT, target_format=Format.TENSORRT)
+        self.target_precision = target_precision
+        self.executions = 0
+
+    def get_input_relative_path(self):
+        return FakeExport().get_output_relative_path()
+
+    def __call__(self, workdir, max_workspace_size, **kwargs):
+        self.executions += 1
+        converted_model_path = workdir / self.get_output_relative_path()
+        if not converted_model_path.exists():
+            converted_model_path.parent.mkdir(parents=True, exist_ok=True)
+            converted_model_path.write_bytes((workdir / self.get_input_relative_path()).read_bytes())
+        return self.get_output_relative_path()
+
+
+def _run(workdir, model_path, precisions, max_workspace_size=1):
+    incremental_state = IncrementalState(workdir)
+    commands = [FakeExport()] + [FakeConvert(precision) for precision in precisions]
+    for command in commands:
+        command.execute(
+            workdir=workdir,
+            model=model_path,
+            max_workspace_size=max_workspace_size,
+            incremental_state=incremental_state,
+        )
+        assert command.status == Status.OK
+    incremental_state.save()
+    return commands
+
+
+def test_incremental_mode_executes_only_commands_with_changed_inputs(tmp_path):
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"model")
+
+    export, convert_fp32 = _run(workdir, model_path, [TensorRTPrecision.FP32])
+    assert (export.executions, convert_fp32.executions) == (1, 1)
+
+    export, convert_fp32, convert_fp16 = _run(workdir, model_path, [TensorRTPrecision.FP32, TensorRTPrecision.FP16])
+    assert (export.executions, convert_fp32.executions, convert_fp16.executions) == (0, 0, 1)
+    assert export.output == Path("onnx/model.onnx")
+    assert convert_fp32.output == Path("trt-fp32/model.plan")
+
+    export, convert_fp32, convert_fp16 = _run(
+        workdir, model_path, [TensorRTPrecision.FP32, TensorRTPrecision.FP16], max_workspace_size=2
+    )
+    assert (export.executions, convert_fp32.executions, convert_fp16.executions) == (0, 1, 1)
+
+
+def test_incremental_mode_replaces_outputs_of_changed_model(tmp_path):
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"model")
+    _run(workdir, model_path, [TensorRTPrecision.FP32])
+
+    model_path.write_bytes(b"changed model")
+    export, convert_fp32 = _run(workdir, model_path, [TensorRTPrecision.FP32])
+
+    assert (export.executions, convert_fp32.executions) == (1, 1)
+    assert (workdir / "trt-fp32" / "model.plan").read_bytes() == b"exported changed model"
+
+
+def test_incremental_mode_executes_command_when_output_was_removed(tmp_path):
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"model")
+    _run(workdir, model_path, [TensorRTPrecision.FP32])
+
+    (workdir / "trt-fp32" / "model.plan").unlink()
+    export, convert_fp32 = _run(workdir, model_path, [TensorRTPrecision.FP32])
+
+    assert (export.executions, convert_fp32.executions) == (0, 1)
+    assert (workdir / "trt-fp32" / "model.plan").exists()
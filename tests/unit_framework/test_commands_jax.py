@@ -26,6 +26,7 @@ import model_navigator as nav
 from model_navigator.framework_api.commands.data_dump.samples import DumpInputModelData, DumpOutputModelData
 
 from model_navigator.tensor import TensorSpec
+from model_navigator.utils.sample_store import SampleStore
 
 gpus = tensorflow.config.experimental.list_physical_devices("GPU")
 for gpu in gpus:
@@ -41,14 +42,7 @@ def predict(inputs, params):
 
 
 def _extract_dumped_samples(filepath: Path):
-    dumped_samples = []
-    for sample_path in filepath.iterdir():
-        sample = {}
-        with numpy.load(sample_path.as_posix()) as data:
-            for k, v in data.items():
-                sample[k] = v
-        dumped_samples.append(sample)
-    return dumped_samples
+    return list(SampleStore(filepath))
 
 
 def test_jax_dump_model_input():
@@ -0,0 +1,85 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from model_navigator.framework_api.commands.performance import OnnxSessionTuner, ProfilerConfig
+from model_navigator.framework_api.runners.onnx import (
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxSessionConfig,
+)
+
+
+class FakeOnnxSessionTuner(OnnxSessionTuner):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.measured = []
+
+    def _measure(self, session_config: OnnxSessionConfig) -> float:
+        self.measured.append(session_config)
+        throughput = 100.0
+        if session_config.intra_op_num_threads == 4:
+            throughput *= 1.5
+        if session_config.execution_mode == OnnxExecutionMode.PARALLEL:
+            throughput *= 1.1
+            if session_config.inter_op_num_threads == 2:
+                throughput *= 1.1
+        if session_config.graph_optimization_level == OnnxGraphOptimizationLevel.EXTENDED:
+            # gain within the noise is not taken into account
+            throughput *= 1.01
+        return throughput
+
+
+def test_onnx_session_tuner_return_best_options_when_tuned_one_at_a_time():
+    tuner = FakeOnnxSessionTuner(
+        get_runner=MagicMock(),
+        profiling_sample={"x": np.zeros((1, 3), dtype=np.float32)},
+        profiler_config=ProfilerConfig(batch_sizes=[1, 8, 4], concurrency=[1, 2]),
+        max_batch_size=16,
+        num_cores=4,
+    )
+
+    best_config = tuner.run()
+
+    assert best_config == OnnxSessionConfig(
+        intra_op_num_threads=4,
+        inter_op_num_threads=2,
+        execution_mode=OnnxExecutionMode.PARALLEL,
+        graph_optimization_level=OnnxGraphOptimizationLevel.ALL,
+        enable_cpu_mem_arena=True,
+        enable_mem_pattern=True,
+    )
+    # each option value is measured once - default, 3 intra-op threads, 1 mode, 3 inter-op threads, 3 levels, 2 flags
+    assert len(tuner.measured) == 1 + 3 + 1 + 3 + 3 + 2
+    assert tuner._profiler_config.batch_sizes == [8]
+    assert tuner._profiler_config.concurrency is None
+
+
+def test_onnx_session_tuner_skip_inter_op_threads_when_sequential_mode_is_best():
+    tuner = FakeOnnxSessionTuner(
+        get_runner=MagicMock(),
+        profiling_sample={"x": np.zeros((3,), dtype=np.float32)},
+        profiler_config=ProfilerConfig(),
+        batch_dim=None,
+        num_cores=1,
+    )
+    tuner._measure = lambda session_config: tuner.measured.append(session_config) or 100.0
+
+    best_config = tuner.run()
+
+    assert best_config.execution_mode == OnnxExecutionMode.SEQUENTIAL
+    assert all(session_config.inter_op_num_threads is None for session_config in tuner.measured)
+    assert tuner._profiler_config.batch_sizes is None
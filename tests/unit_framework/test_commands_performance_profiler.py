@@ -11,9 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+import time
 from unittest.mock import MagicMock
 
+import numpy as np
+import pytest
+
 from model_navigator.framework_api.commands.performance import Profiler, ProfilerConfig, ProfilingResults
+from model_navigator.framework_api.runners.base import INavigatorRunner
 
 
 def test_is_measurement_stable_return_false_when_window_is_empty():
@@ -81,3 +87,192 @@ def test_is_measurement_stable_return_true_when_avg_latencies_are_in_stability_r
     ]
 
     assert bool(profiler._is_measurement_stable(windows)) is True
+
+
+def test_from_measurements_return_throughput_based_on_duration_when_duration_is_provided():
+    batch_size = 2
+    profiling_results = ProfilingResults.from_measurements([10, 10, 10, 10], batch_size, concurrency=4, duration=10.0)
+
+    assert profiling_results.concurrency == 4
+    assert profiling_results.request_count == 4
+    assert profiling_results.throughput == 800.0
+    assert profiling_results.avg_latency == 10.0
+
+
+def test_from_measurements_trim_outliers_and_compute_confidence_interval():
+    measurements = [10.0] * 9 + [11.0] * 9 + [1000.0, 0.1]
+
+    profiling_results = ProfilingResults.from_measurements(
+        measurements, batch_size=1, trim_percentage=5.0, confidence_level=0.95
+    )
+
+    assert profiling_results.request_count == 20
+    assert profiling_results.avg_latency == 10.5
+    assert profiling_results.p99_latency < 11.0 + 1e-6
+    assert profiling_results.throughput == pytest.approx(1000 / 10.5)
+    assert profiling_results.avg_latency_ci_low < 10.5 < profiling_results.avg_latency_ci_high
+    assert profiling_results.avg_latency_ci_high - 10.5 == pytest.approx(
+        1.96 * np.std([10.0] * 9 + [11.0] * 9, ddof=1) / np.sqrt(18), rel=1e-3
+    )
+
+
+def test_run_compute_percentiles_over_pooled_windows_after_warmup():
+    latencies = iter([100.0] * 3 + [1.0, 1.0, 9.0] * 3)
+    runner = MagicMock()
+    runner.__enter__.return_value = runner
+    runner.is_inference_time_stabilized.return_value = False
+    current_latency = []
+    runner.infer.side_effect = lambda sample: current_latency.append(next(latencies))
+    runner.last_inference_time.side_effect = lambda: current_latency[-1] / 1000
+
+    profiler_config = ProfilerConfig(
+        batch_sizes=[1], warmup_request_count=3, measurement_request_count=3, stability_percentage=100.0
+    )
+    profiler = Profiler(
+        runner=runner,
+        profiling_sample={"input": np.zeros((1, 3))},
+        config=profiler_config,
+    )
+
+    results = profiler.run()
+
+    assert runner.infer.call_count == 12
+    assert results[0].request_count == 9
+    assert results[0].avg_latency == pytest.approx(11 / 3)
+    assert results[0].p50_latency == pytest.approx(1.0)
+    assert results[0].p90_latency == pytest.approx(9.0)
+
+
+def test_run_return_results_for_each_batch_size_and_concurrency():
+    runner = MagicMock()
+    runner.__enter__.return_value = runner
+    runner.is_inference_time_stabilized.return_value = False
+    runner.is_thread_safe.return_value = True
+    runner.infer.side_effect = lambda sample: time.sleep(0.001)
+    runner.last_inference_time.return_value = 0.001
+
+    profiler_config = ProfilerConfig(
+        batch_sizes=[1, 2], concurrency=[1, 2, 4], measurement_request_count=5, stability_percentage=100.0
+    )
+    profiler = Profiler(
+        runner=runner,
+        profiling_sample={"input": np.zeros((1, 3))},
+        config=profiler_config,
+    )
+
+    results = profiler.run()
+
+    assert [(result.batch_size, result.concurrency) for result in results] == [
+        (1, 1),
+        (1, 2),
+        (1, 4),
+        (2, 1),
+        (2, 2),
+        (2, 4),
+    ]
+    # requests from 3 stable windows are pooled
+    assert [result.request_count for result in results] == [15, 30, 60, 15, 30, 60]
+
+
+def test_run_serialize_requests_when_runner_is_not_thread_safe():
+    active_requests = []
+    max_active_requests = []
+    lock = threading.Lock()
+
+    def _infer(sample):
+        with lock:
+            active_requests.append(1)
+            max_active_requests.append(len(active_requests))
+        time.sleep(0.001)
+        with lock:
+            active_requests.pop()
+
+    runner = MagicMock()
+    runner.__enter__.return_value = runner
+    runner.is_inference_time_stabilized.return_value = False
+    runner.is_thread_safe.return_value = False
+    runner.infer.side_effect = _infer
+
+    profiler_config = ProfilerConfig(
+        batch_sizes=[1], concurrency=[4], measurement_request_count=5, stability_percentage=100.0
+    )
+    profiler = Profiler(
+        runner=runner,
+        profiling_sample={"input": np.zeros((1, 3))},
+        config=profiler_config,
+    )
+
+    results = profiler.run()
+
+    assert len(results) == 1
+    assert results[0].concurrency == 4
+    assert max(max_active_requests) == 1
+
+
+def test_from_measurements_average_phases_over_requests_kept_after_trimming():
+    measurements = [1.0, 2.0, 3.0, 100.0]
+    phase_measurements = [
+        {"compute": 0.5, "d2h": 0.5},
+        {"compute": 1.5, "d2h": 0.5},
+        {"compute": 2.5, "d2h": 0.5},
+        {"compute": 99.0, "d2h": 1.0},
+    ]
+
+    profiling_results = ProfilingResults.from_measurements(
+        measurements, batch_size=1, trim_percentage=25.0, phase_measurements=phase_measurements
+    )
+
+    assert profiling_results.phases_avg_latency == {"compute": pytest.approx(2.0), "d2h": pytest.approx(0.5)}
+
+
+def test_run_return_phases_breakdown_when_runner_measures_phases():
+    class FakeRunner(INavigatorRunner):
+        name = "fake-runner"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+        def infer(self, sample):
+            self.inference_time = 0.003
+            self.inference_phases = {"h2d": 0.001, "compute": 0.002}
+
+        def last_inference_time(self):
+            return self.inference_time
+
+    runner = FakeRunner()
+
+    profiler_config = ProfilerConfig(batch_sizes=[1], measurement_request_count=5, stability_percentage=100.0)
+    profiler = Profiler(
+        runner=runner,
+        profiling_sample={"input": np.zeros((1, 3))},
+        config=profiler_config,
+    )
+
+    results = profiler.run()
+
+    assert results[0].phases_avg_latency == {"h2d": pytest.approx(1.0), "compute": pytest.approx(2.0)}
+    assert "compute: 2.0000 [ms]" in str(results[0])
+
+
+@pytest.mark.parametrize("config", [{"trim_percentage": 50.0}, {"confidence_level": 1.0}])
+def test_profiler_raise_error_when_statistics_parameters_are_invalid(config):
+    profiler_config = ProfilerConfig(batch_sizes=[1], **config)
+    with pytest.raises(ValueError):
+        Profiler(
+            runner=MagicMock(),
+            profiling_sample=MagicMock(),
+            config=profiler_config,
+        )
+
+
+def test_profiler_raise_error_when_concurrency_is_not_positive():
+    profiler_config = ProfilerConfig(batch_sizes=[1], concurrency=[0, 1])
+    with pytest.raises(ValueError):
+        Profiler(
+            runner=MagicMock(),
+            profiling_sample=MagicMock(),
+            config=profiler_config,
+        )
@@ -27,7 +27,7 @@ from model_navigator.framework_api.commands.correctness import Correctness
 from model_navigator.framework_api.commands.data_dump.samples import (
     DumpInputModelData,
     DumpOutputModelData,
-    samples_to_npz,
+    samples_to_store,
 )
 from model_navigator.framework_api.commands.export.pyt import ExportPYT2ONNX, ExportPYT2TorchScript
 from model_navigator.framework_api.common import TensorMetadata
@@ -36,6 +36,7 @@ from model_navigator.framework_api.status import ModelStatus, NavigatorStatus
 from model_navigator.framework_api.utils import Framework, JitType
 from model_navigator.model import Format
 from model_navigator.tensor import TensorSpec
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -55,14 +56,7 @@ model = MyModule()
 
 
 def _extract_dumped_samples(filepath: Path):
-    dumped_samples = []
-    for sample_path in filepath.iterdir():
-        sample = {}
-        with numpy.load(sample_path.as_posix()) as data:
-            for k, v in data.items():
-                sample[k] = v
-        dumped_samples.append(sample)
-    return dumped_samples
+    return list(SampleStore(filepath))
 
 
 def test_pyt_dump_model_input():
@@ -158,8 +152,8 @@ def test_pyt_correctness():
         numpy_output = model(input_data).detach().cpu().numpy()
         batch_dim = None
 
-        samples_to_npz([{"input__1": numpy_input}], workdir / "model_input" / "correctness", batch_dim=batch_dim)
-        samples_to_npz([{"output__1": numpy_output}], workdir / "model_output" / "correctness", batch_dim=batch_dim)
+        samples_to_store([{"input__1": numpy_input}], workdir / "model_input" / "correctness", batch_dim=batch_dim)
+        samples_to_store([{"output__1": numpy_output}], workdir / "model_output" / "correctness", batch_dim=batch_dim)
 
         input_metadata = TensorMetadata({"input__1": TensorSpec("input__1", numpy_input.shape, numpy_input.dtype)})
         output_metadata = TensorMetadata({"output__1": TensorSpec("output__1", numpy_output.shape, numpy_output.dtype)})
@@ -216,7 +210,7 @@ def test_pyt_export_torchscript():
         export_cmd = ExportPYT2TorchScript(target_jit_type=JitType.SCRIPT)
         input_data = next(iter(dataloader))
         numpy_data = input_data.cpu().numpy()
-        samples_to_npz([{"input__1": numpy_data}], workdir / "model_input" / "profiling", None)
+        samples_to_store([{"input__1": numpy_data}], workdir / "model_input" / "profiling", None)
 
         exported_model_path = workdir / export_cmd(
             model=model,
@@ -243,7 +237,7 @@ def test_pyt_export_onnx():
 
         input_data = next(iter(dataloader_))
         sample = {"input": input_data.detach().cpu().numpy()}
-        samples_to_npz([sample], workdir / "model_input" / "profiling", None)
+        samples_to_store([sample], workdir / "model_input" / "profiling", None)
 
         export_cmd = ExportPYT2ONNX()
         exported_model_path = workdir / export_cmd(
@@ -29,7 +29,7 @@ from model_navigator.framework_api.commands.correctness import Correctness
 from model_navigator.framework_api.commands.data_dump.samples import (
     DumpInputModelData,
     DumpOutputModelData,
-    samples_to_npz,
+    samples_to_store,
 )
 from model_navigator.framework_api.commands.export.tf import ExportTF2SavedModel
 from model_navigator.framework_api.common import TensorMetadata
@@ -39,6 +39,7 @@ from model_navigator.framework_api.utils import Framework, get_default_max_works
 from model_navigator.model import Format
 from model_navigator.tensor import TensorSpec
 from model_navigator.utils.devices import get_gpus
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -65,14 +66,7 @@ model = tensorflow.keras.Model(inp, model_output)
 
 
 def _extract_dumped_samples(filepath: Path):
-    dumped_samples = []
-    for sample_path in filepath.iterdir():
-        sample = {}
-        with numpy.load(sample_path.as_posix()) as data:
-            for k, v in data.items():
-                sample[k] = v
-        dumped_samples.append(sample)
-    return dumped_samples
+    return list(SampleStore(filepath))
 
 
 def test_tf2_dump_model_input():
@@ -163,8 +157,8 @@ def test_tf2_correctness():
         numpy_input = input_data.numpy()
         batch_dim = None
 
-        samples_to_npz([{"input__1": numpy_input}], workdir / "model_input" / "correctness", batch_dim=batch_dim)
-        samples_to_npz([{"output__1": numpy_output}], workdir / "model_output" / "correctness", batch_dim=batch_dim)
+        samples_to_store([{"input__1": numpy_input}], workdir / "model_input" / "correctness", batch_dim=batch_dim)
+        samples_to_store([{"output__1": numpy_output}], workdir / "model_output" / "correctness", batch_dim=batch_dim)
 
         input_metadata = TensorMetadata({"input__1": TensorSpec("input__1", numpy_input.shape, numpy_input.dtype)})
         output_metadata = TensorMetadata({"output__1": TensorSpec("output__1", numpy_output.shape, numpy_output.dtype)})
@@ -244,7 +238,7 @@ def test_tf2_export_savedmodel():
     reason="GPU not available.",
 )
 def test_tf2_convert_tf_trt():
-    from model_navigator.framework_api.commands.data_dump.samples import samples_to_npz
+    from model_navigator.framework_api.commands.data_dump.samples import samples_to_store
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         model_name = "navigator_model"
@@ -257,7 +251,7 @@ def test_tf2_convert_tf_trt():
         tensorflow.keras.models.save_model(model=model, filepath=input_model_path, overwrite=True)
 
         input_data = next(iter(dataloader))
-        samples_to_npz([{"input__1": input_data.numpy()}], workdir / "model_input" / "conversion", None)
+        samples_to_store([{"input__1": input_data.numpy()}], workdir / "model_input" / "conversion", None)
 
         convert_cmd = ConvertSavedModel2TFTRT(target_precision=TensorRTPrecision.FP16)
 
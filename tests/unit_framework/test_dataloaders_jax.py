@@ -21,6 +21,7 @@ import numpy as np
 import tensorflow
 
 import model_navigator as nav
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -71,13 +72,9 @@ def test_np_dict_dataloader():
         )
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -107,13 +104,9 @@ def test_np_sequence_dataloader():
         )
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -148,13 +141,9 @@ def test_dataloader_with_nan_and_inf_in_and_valid_out():
         )
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -186,13 +175,9 @@ def test_dataloader_with_nan_and_inf_inout():
         )
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert [
-            path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()
-        ] == []
+        assert not any([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
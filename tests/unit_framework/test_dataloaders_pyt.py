@@ -20,6 +20,7 @@ import torch
 
 import model_navigator as nav
 from model_navigator.utils.devices import get_gpus
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -75,13 +76,9 @@ def test_pyt_tensor_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -121,13 +118,9 @@ def test_pyt_sequence_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -167,13 +160,9 @@ def test_pyt_dict_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -216,13 +205,9 @@ def test_pyt_dict_dataloader_with_kwargs():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -271,13 +256,9 @@ def test_onnx_sequence_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Source format copied to package
@@ -329,13 +310,9 @@ def test_onnx_dict_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Source format copied to package
@@ -378,13 +355,9 @@ def test_dataloader_with_nan_and_inf_in_and_valid_out():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -423,13 +396,9 @@ def test_dataloader_with_nan_and_inf_inout():
         )
 
         assert status_file.is_file()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert [
-            path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()
-        ] == []
+        assert not any([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
 
         assert navigator_log_file.is_file()
 
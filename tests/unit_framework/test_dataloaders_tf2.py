@@ -20,6 +20,7 @@ import tensorflow
 
 import model_navigator as nav
 from model_navigator.utils.devices import get_gpus
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -73,13 +74,9 @@ def test_tf2_tensor_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -123,13 +120,9 @@ def test_tf2_sequence_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -180,13 +173,9 @@ def test_tf2_dict_dataloader():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -223,13 +212,9 @@ def test_tf2_tensor_dataloader_nan_and_inf_in_and_valid_out():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -266,13 +251,9 @@ def test_tf2_tensor_dataloader_nan_and_inf_inout():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert [
-            path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()
-        ] == []
+        assert not any([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
 
         assert navigator_log_file.is_file()
 
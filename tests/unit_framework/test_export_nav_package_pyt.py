@@ -19,6 +19,7 @@ import torch
 
 import model_navigator as nav
 from model_navigator.utils.devices import get_gpus
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -76,13 +77,9 @@ def test_pyt_export_torchscript():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -120,13 +117,9 @@ def test_pyt_export_onnx():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -165,13 +158,9 @@ def test_pyt_export_torch_trt_script():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -223,13 +212,9 @@ def test_pyt_export_trt():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -275,13 +260,9 @@ def test_pyt_export_multi_input():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -331,13 +312,9 @@ def test_pyt_export_string_format():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -384,13 +361,9 @@ def test_pyt_export_onnx2trt():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Source format copied to package
@@ -442,13 +415,9 @@ def test_pyt_export_onnx_large():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
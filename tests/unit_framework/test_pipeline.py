@@ -0,0 +1,157 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pytest
+
+from model_navigator.framework_api.commands.core import Command, CommandType
+from model_navigator.framework_api.config import Config
+from model_navigator.framework_api.exceptions import UserError
+from model_navigator.framework_api.pipelines.pipeline import Pipeline
+from model_navigator.framework_api.utils import Framework, Status
+
+_lock = threading.Lock()
+
+
+class FakeCommand(Command):
+    def __init__(self, name, events, duration=0.0, exclusive=False, gpu=False, requires=()):
+        super().__init__(name=name, command_type=CommandType.CUSTOM, requires=requires)
+        self._events = events
+        self._duration = duration
+        self._exclusive = exclusive
+        self._gpu = gpu
+
+    def is_exclusive(self):
+        return self._exclusive
+
+    def uses_gpu(self, **kwargs):
+        return self._gpu
+
+    def get_output_name(self):
+        return self.name
+
+    def _update_package_descriptor(self, package_descriptor, **kwargs):
+        package_descriptor.append(self.name)
+
+    def __call__(self, **kwargs):
+        with _lock:
+            self._events.append(("start", self.name))
+        time.sleep(self._duration)
+        with _lock:
+            self._events.append(("end", self.name))
+        return [req.name for req in self.requires if req.name not in kwargs]
+
+
+def _config(tmp_path, max_concurrent_commands, max_concurrent_gpu_commands=1):
+    return Config(
+        framework=Framework.PYT,
+        model_name="navigator_model",
+        model=None,
+        dataloader=[0],
+        workdir=tmp_path,
+        override_workdir=True,
+        target_formats=(),
+        sample_count=1,
+        disable_git_info=True,
+        max_concurrent_commands=max_concurrent_commands,
+        max_concurrent_gpu_commands=max_concurrent_gpu_commands,
+    )
+
+
+def _max_running(events, names=None):
+    running, max_running = set(), 0
+    for event, name in events:
+        if names is not None and name not in names:
+            continue
+        if event == "start":
+            running.add(name)
+        else:
+            running.remove(name)
+        max_running = max(max_running, len(running))
+    return max_running
+
+
+def test_pipeline_concurrent_execution_respects_dependencies_and_order(tmp_path):
+    events = []
+    first = FakeCommand("first", events, duration=0.05)
+    slow = FakeCommand("slow", events, duration=0.2, requires=(first,))
+    fast = FakeCommand("fast", events, duration=0.01, requires=(first,))
+    last = FakeCommand("last", events, requires=(slow, fast))
+    pipeline = Pipeline(name="Test", commands=[first, slow, fast, last])
+
+    package_descriptor = []
+    params = pipeline(_config(tmp_path, max_concurrent_commands=4), package_descriptor)
+
+    assert all(command.status == Status.OK for command in pipeline.commands)
+    # results are collected in the order of commands
+    assert package_descriptor == ["first", "slow", "fast", "last"]
+    assert list(params) == ["first", "slow", "fast", "last"]
+    # outputs of required commands are passed to the following ones
+    assert params["last"] == []
+    assert events.index(("end", "first")) < events.index(("start", "slow"))
+    assert events.index(("end", "fast")) < events.index(("end", "slow")) < events.index(("start", "last"))
+    assert _max_running(events) == 2
+
+
+def test_pipeline_concurrent_execution_runs_exclusive_commands_alone(tmp_path):
+    events = []
+    commands = [
+        FakeCommand("a", events, duration=0.05),
+        FakeCommand("b", events, duration=0.05),
+        FakeCommand("exclusive", events, duration=0.05, exclusive=True),
+        FakeCommand("c", events, duration=0.05),
+        FakeCommand("d", events, duration=0.05),
+    ]
+    pipeline = Pipeline(name="Test", commands=commands)
+
+    package_descriptor = []
+    pipeline(_config(tmp_path, max_concurrent_commands=4), package_descriptor)
+
+    assert package_descriptor == ["a", "b", "exclusive", "c", "d"]
+    start, end = events.index(("start", "exclusive")), events.index(("end", "exclusive"))
+    assert end == start + 1
+    assert {name for _, name in events[:start]} == {"a", "b"}
+    assert _max_running(events) == 2
+
+
+def test_pipeline_concurrent_execution_limits_gpu_commands(tmp_path):
+    events = []
+    commands = [FakeCommand(f"gpu_{i}", events, duration=0.05, gpu=True) for i in range(3)]
+    commands += [FakeCommand(f"cpu_{i}", events, duration=0.05) for i in range(2)]
+    pipeline = Pipeline(name="Test", commands=commands)
+
+    package_descriptor = []
+    pipeline(_config(tmp_path, max_concurrent_commands=4), package_descriptor)
+
+    assert package_descriptor == ["gpu_0", "gpu_1", "gpu_2", "cpu_0", "cpu_1"]
+    assert _max_running(events, names={"gpu_0", "gpu_1", "gpu_2"}) == 1
+    assert _max_running(events) == 3
+
+
+def test_pipeline_sequential_execution(tmp_path):
+    events = []
+    commands = [FakeCommand(name, events, duration=0.01) for name in ("a", "b", "c")]
+    pipeline = Pipeline(name="Test", commands=commands)
+
+    package_descriptor = []
+    pipeline(_config(tmp_path, max_concurrent_commands=1), package_descriptor)
+
+    assert package_descriptor == ["a", "b", "c"]
+    assert _max_running(events) == 1
+
+
+def test_config_raise_error_when_incorrect_concurrency(tmp_path):
+    with pytest.raises(UserError):
+        _config(tmp_path, max_concurrent_commands=0)
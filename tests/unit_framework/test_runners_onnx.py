@@ -0,0 +1,94 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import onnx
+from polygraphy.backend.onnxrt import SessionFromOnnx
+
+from model_navigator.framework_api.runners.onnx import (
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxrtRunner,
+    OnnxSessionConfig,
+    SessionFromOnnxWithOptions,
+)
+
+
+def _save_relu_model(path: Path):
+    graph = onnx.helper.make_graph(
+        [onnx.helper.make_node("Relu", ["x"], ["y"])],
+        "relu",
+        [onnx.helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, ["batch", 3])],
+        [onnx.helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, ["batch", 3])],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, path.as_posix())
+
+
+def test_onnxrt_runner_return_same_outputs_when_buffers_are_reused():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "model.onnx"
+        _save_relu_model(model_path)
+        samples = [
+            {"x": np.array([[-1.0, 2.0, 3.0]], dtype=np.float32)},
+            {"x": np.array([[1.0, -2.0, 3.0]], dtype=np.float32)},
+            {"x": -np.ones((2, 3), dtype=np.float32)},
+        ]
+
+        outputs = {}
+        for reuse_buffers in (False, True):
+            runner = OnnxrtRunner(
+                SessionFromOnnx(model_path.as_posix(), providers=["CPUExecutionProvider"]), reuse_buffers=reuse_buffers
+            )
+            with runner:
+                # inputs not used by the model are ignored
+                outputs[reuse_buffers] = [runner.infer({**sample, "unused": sample["x"]})["y"] for sample in samples]
+                phases = runner.last_inference_phases()
+
+        for output, reused_buffers_output, sample in zip(outputs[False], outputs[True], samples):
+            assert np.array_equal(output, np.maximum(sample["x"], 0))
+            assert np.array_equal(reused_buffers_output, output)
+        assert set(phases) == {"h2d", "compute", "d2h", "output_conversion"}
+
+
+def test_onnxrt_runner_apply_session_options_when_session_config_is_provided():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "model.onnx"
+        _save_relu_model(model_path)
+        session_config = OnnxSessionConfig(
+            intra_op_num_threads=1,
+            execution_mode=OnnxExecutionMode.SEQUENTIAL,
+            graph_optimization_level=OnnxGraphOptimizationLevel.BASIC,
+            enable_cpu_mem_arena=False,
+        )
+        # session config is stored in the status file
+        session_config = OnnxSessionConfig.from_dict(session_config.to_dict(parse=True))
+
+        runner = OnnxrtRunner(
+            SessionFromOnnxWithOptions(
+                model_path.as_posix(), providers=["CPUExecutionProvider"], session_config=session_config
+            )
+        )
+        sample = {"x": np.array([[-1.0, 2.0, 3.0]], dtype=np.float32)}
+        with runner:
+            options = runner.sess.get_session_options()
+            output = runner.infer(sample)["y"]
+
+        assert options.intra_op_num_threads == 1
+        assert options.enable_cpu_mem_arena is False
+        assert str(options.graph_optimization_level) == "GraphOptimizationLevel.ORT_ENABLE_BASIC"
+        assert np.array_equal(output, np.maximum(sample["x"], 0))
@@ -0,0 +1,57 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pytype: disable=import-error
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import tensorflow
+
+from model_navigator.framework_api.common import TensorMetadata
+from model_navigator.framework_api.runners.tf import TFSavedModelRunner
+
+# pytype: enable=import-error
+
+
+def _save_model(path: Path):
+    inp = tensorflow.keras.layers.Input((3,), name="input__1")
+    output = tensorflow.keras.layers.Dense(2)(inp)
+    model = tensorflow.keras.Model(inp, output)
+    model.save(path.as_posix())
+
+
+def test_tf_saved_model_runner_return_same_outputs_with_cached_function():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "model.savedmodel"
+        _save_model(model_path)
+        input_metadata = TensorMetadata()
+        input_metadata.add("input__1", (-1, 3), np.float32)
+        samples = [{"input__1": np.random.rand(batch_size, 3).astype(np.float32)} for batch_size in (1, 2, 5)]
+
+        outputs = {}
+        for use_tf_function, jit_compile in ((False, False), (True, False), (True, True)):
+            runner = TFSavedModelRunner(
+                model_path, input_metadata, ["output__1"], use_tf_function=use_tf_function, jit_compile=jit_compile
+            )
+            with runner:
+                outputs[(use_tf_function, jit_compile)] = [runner.infer(sample)["output__1"] for sample in samples]
+                if use_tf_function:
+                    # relaxed input signature - single concrete function serves all batch sizes
+                    input_spec = runner._infer_fn.structured_input_signature[0][0]
+                    assert input_spec.shape.as_list() == [None, None]
+
+        for key, key_outputs in outputs.items():
+            for output, expected_output in zip(key_outputs, outputs[(False, False)]):
+                assert np.allclose(output, expected_output, atol=1e-5), key
@@ -0,0 +1,107 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from model_navigator.framework_api.exceptions import UserError
+from model_navigator.framework_api.execution_context import ExecutionContext
+from model_navigator.framework_api.runtime_workers import RuntimeWorkers, run_script
+from model_navigator.framework_api.utils import parse_kwargs_to_cmd
+from model_navigator.model import Format
+
+SCRIPT = """
+import os
+import sys
+
+import fire
+
+
+def run(exit_code: int, data, navigator_workdir=None):
+    print(f"{os.getcwd()} {data['name']} {data['values']}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
+"""
+
+
+def _prepare_script(workdir: Path) -> Path:
+    script_path = workdir / "script.py"
+    with script_path.open("w") as f:
+        f.write(SCRIPT)
+    return script_path
+
+
+def test_run_script_parse_args_the_same_way_as_shell():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workdir = Path(tmp_dir)
+        script_path = _prepare_script(workdir)
+        args = parse_kwargs_to_cmd({"exit_code": 0, "data": {"name": "x", "values": [1, None]}}, (list, dict, tuple))
+
+        return_code, output = run_script(script_path.as_posix(), args, workdir.as_posix())
+
+        assert return_code == 0
+        assert output == f"{workdir.as_posix()} x [1, None]\n"
+
+
+def test_run_script_return_exit_code_of_the_script():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workdir = Path(tmp_dir)
+        script_path = _prepare_script(workdir)
+        args = parse_kwargs_to_cmd({"exit_code": 3, "data": {"name": "x", "values": []}}, (list, dict, tuple))
+
+        return_code, _ = run_script(script_path.as_posix(), args, workdir.as_posix())
+
+        assert return_code == 3
+
+
+def test_execution_context_run_script_in_runtime_worker_and_save_reproduction_script():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workdir = Path(tmp_dir)
+        script_path = _prepare_script(workdir)
+
+        with RuntimeWorkers() as runtime_workers:
+            runtime_worker = runtime_workers.get_worker(Format.ONNX)
+            assert runtime_workers.get_worker(Format.ONNX) is runtime_worker
+
+            for exit_code in (0, 0):
+                args = parse_kwargs_to_cmd(
+                    {
+                        "navigator_workdir": workdir.as_posix(),
+                        "exit_code": exit_code,
+                        "data": {"name": "x", "values": []},
+                    },
+                    (list, dict, tuple),
+                )
+                with ExecutionContext(
+                    workdir=workdir, script_path=workdir / "reproduce.py", cmd_path=workdir / "reproduce.sh"
+                ) as context:
+                    context.execute_external_runtime_script(script_path, args, runtime_worker=runtime_worker)
+
+            args = parse_kwargs_to_cmd({"exit_code": 1, "data": {"name": "x", "values": []}}, (list, dict, tuple))
+            with pytest.raises(UserError):
+                with ExecutionContext(
+                    workdir=workdir, script_path=workdir / "reproduce.py", cmd_path=workdir / "reproduce.sh"
+                ) as context:
+                    context.execute_external_runtime_script(script_path, args, runtime_worker=runtime_worker)
+
+        assert (workdir / "reproduce.py").exists()
+        assert (
+            (workdir / "reproduce.sh")
+            .read_text()
+            .endswith('reproduce.py --exit_code 1 --data \'{"name": "x", "values": []}\'')
+        )
@@ -21,6 +21,7 @@ import numpy
 import tensorflow
 
 import model_navigator as nav
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -89,13 +90,9 @@ def test_jax_save_load_savedmodel():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file() is False
 
         # Output formats
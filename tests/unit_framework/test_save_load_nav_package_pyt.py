@@ -26,6 +26,7 @@ from model_navigator.converter.config import TensorRTPrecision, TensorRTPrecisio
 from model_navigator.framework_api.package_descriptor import PackageDescriptor
 from model_navigator.model import Format
 from model_navigator.utils.devices import get_gpus
+from model_navigator.utils.sample_store import SampleStore
 
 # pytype: enable=import-error
 
@@ -93,13 +94,9 @@ def test_pyt_save_load_no_retest():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file() is False
 
         # Exported formats
@@ -107,6 +104,41 @@ def test_pyt_save_load_no_retest():
         assert check_model_dir(model_dir=load_workdir / "torchscript-trace", format=nav.Format.TORCHSCRIPT)
 
 
+def test_pyt_save_load_lazy_extracts_members_when_accessed():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_name = "navigator_model"
+
+        workdir = Path(tmp_dir) / "navigator_workdir"
+        nav_package_path = Path(tmp_dir) / f"{model_name}.nav"
+        load_workdir = Path(tmp_dir) / "load_navigator_workdir"
+
+        pkg_desc = nav.torch.export(
+            model=model,
+            dataloader=dataloader,
+            override_workdir=True,
+            workdir=workdir,
+            model_name=model_name,
+            run_profiling=False,
+            target_formats=(nav.Format.TORCHSCRIPT,),
+        )
+        pkg_desc.set_verified(nav.Format.TORCHSCRIPT, nav.RuntimeProvider.PYT, jit_type=nav.JitType.TRACE)
+        nav.save(pkg_desc, nav_package_path)
+
+        loaded_pkg_desc = nav.load(nav_package_path, workdir=load_workdir, retest_conversions=False, lazy=True)
+
+        assert (load_workdir / "status.yaml").is_file()
+        assert not (load_workdir / "model_input").exists()
+        assert not (load_workdir / "torchscript-trace").exists()
+
+        assert loaded_pkg_desc.get_model(nav.Format.TORCHSCRIPT, jit_type=nav.JitType.TRACE) is not None
+        assert check_model_dir(model_dir=load_workdir / "torchscript-trace", format=nav.Format.TORCHSCRIPT)
+        assert not (load_workdir / "torchscript-script").exists()
+
+        # workdir holding members of the same package is reused
+        nav.load(nav_package_path, workdir=load_workdir, retest_conversions=False, lazy=True)
+        assert (load_workdir / "torchscript-trace" / "model.pt").is_file()
+
+
 def test_pyt_save_load_retest():
     with tempfile.TemporaryDirectory() as tmp_dir:
         model_name = "navigator_model"
@@ -141,13 +173,9 @@ def test_pyt_save_load_retest():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats
@@ -204,13 +232,9 @@ def test_onnx_save_load_retest():
 
         assert status_file.is_file()
         assert model_input_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_input_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_input_dir.iterdir()])
         assert model_output_dir.is_dir()
-        assert all(
-            [path.suffix == ".npz" for samples_dir in model_output_dir.iterdir() for path in samples_dir.iterdir()]
-        )
+        assert all([SampleStore.exists(samples_dir) for samples_dir in model_output_dir.iterdir()])
         assert navigator_log_file.is_file()
 
         # Output formats